@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark: PDF backends per operation
+
+Compares the PyPDF2/poppler backend ('pypdf') with the PyMuPDF backend
+('mupdf') on the generated test fixtures:
+- count:   open the document and count pages
+- text:    extract the text of every page
+- render:  render the first pages to images (thumbnail/OCR input)
+- split:   write every page to its own PDF
+
+Every measurement opens the document from scratch, so parsing is included.
+Operations a backend cannot run (e.g. rendering without poppler) are shown
+as n/a. Without fixtures, they are generated with scripts/generate_test_pdfs.py.
+
+Usage:
+    python benchmarks/bench_backends.py [--fixtures tests/fixtures] [--repeat 3]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src'))
+sys.path.insert(0, str(ROOT / 'scripts'))
+
+from pdftools.core.backends import MUPDF_AVAILABLE, get_backend  # noqa: E402
+
+BACKENDS = ('pypdf', 'mupdf')
+OPERATIONS = ('count', 'text', 'render', 'split')
+RENDER_PAGES = 3
+RENDER_DPI = 150
+
+
+def _op_count(backend, path: Path, tmp: Path) -> None:
+    backend.page_count(path)
+
+
+def _op_text(backend, path: Path, tmp: Path) -> None:
+    for page_num in range(1, backend.page_count(path) + 1):
+        backend.extract_text(path, page_num)
+
+
+def _op_render(backend, path: Path, tmp: Path) -> None:
+    pages = list(range(1, min(RENDER_PAGES, backend.page_count(path)) + 1))
+    for image in backend.render_pages(path, pages, dpi=RENDER_DPI):
+        image.close()
+
+
+def _op_split(backend, path: Path, tmp: Path) -> None:
+    for page_num in range(1, backend.page_count(path) + 1):
+        backend.write_pages(path, [page_num], tmp / f"page_{page_num}.pdf")
+
+
+OPERATION_FUNCS = {
+    'count': _op_count,
+    'text': _op_text,
+    'render': _op_render,
+    'split': _op_split,
+}
+
+
+def time_operation(backend_name: str, operation: str, path: Path, repeat: int):
+    """Best wall time in seconds, or None if the operation fails"""
+    from pdftools.core.document import open_document
+
+    backend = get_backend(backend_name)
+    func = OPERATION_FUNCS[operation]
+    best = None
+
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.perf_counter()
+            try:
+                # One fresh parse per run, shared by the calls of the operation
+                with open_document(path):
+                    func(backend, path, Path(tmp))
+            except Exception:
+                return None
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
+
+
+def ensure_fixtures(fixtures: Path) -> list:
+    """Readable PDFs in the fixture directory (generated if missing)"""
+    pdfs = sorted(fixtures.glob('*.pdf')) if fixtures.is_dir() else []
+    if not pdfs:
+        from generate_test_pdfs import TestPDFGenerator
+
+        print(f"Generating fixtures in {fixtures}...")
+        TestPDFGenerator(fixtures).generate_all()
+        pdfs = sorted(fixtures.glob('*.pdf'))
+    return pdfs
+
+
+def run(pdfs: list, repeat: int) -> None:
+    backends = [name for name in BACKENDS if name != 'mupdf' or MUPDF_AVAILABLE]
+    columns = [f"{op}/{name}" for op in OPERATIONS for name in backends]
+
+    print(f"\n{'Document':<32} {'Pages':>5} " + ' '.join(f"{c:>13}" for c in columns))
+    for path in pdfs:
+        try:
+            pages = get_backend('pypdf').page_count(path)
+        except Exception:
+            print(f"{path.name:<32} {'-':>5} (unreadable, skipped)")
+            continue
+
+        cells = []
+        for operation in OPERATIONS:
+            for name in backends:
+                elapsed = time_operation(name, operation, path, repeat)
+                cells.append('n/a' if elapsed is None else f"{elapsed * 1000:.1f} ms")
+
+        print(f"{path.name:<32} {pages:>5} " + ' '.join(f"{c:>13}" for c in cells))
+
+    if not MUPDF_AVAILABLE:
+        print("\nPyMuPDF is not installed; only the pypdf backend was measured.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark PDF backends per operation')
+    parser.add_argument(
+        '--fixtures',
+        type=Path,
+        default=ROOT / 'tests' / 'fixtures',
+        help='Directory with test PDFs (default: tests/fixtures, generated if empty)'
+    )
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per operation, best is reported')
+    args = parser.parse_args()
+
+    run(ensure_fixtures(args.fixtures), args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,214 @@
+"""
+Benchmark cases for every pdftools tool
+
+Each case gets the fixture set and a scratch directory and returns the
+number of pages it processed (used for throughput). Cases whose external
+requirements are missing (Tesseract, a page renderer) report a skip reason
+instead of failing, so the suite runs on a plain Linux box.
+"""
+
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import common  # noqa: F401  (puts src/ and scripts/ on sys.path)
+
+from generate_test_pdfs import TestPDFGenerator
+
+
+@dataclass
+class Fixtures:
+    """Paths of the generated benchmark fixtures"""
+    small: List[Path]      # 10 documents x 10 pages (merge target from the README)
+    large: Path            # Large text document
+    scanned: Path          # Image-only page without a text layer (OCR)
+    invoices: List[Path]   # Single-page invoices (renaming)
+
+    def to_dict(self) -> dict:
+        return {
+            'small': [str(p) for p in self.small],
+            'large': str(self.large),
+            'scanned': str(self.scanned),
+            'invoices': [str(p) for p in self.invoices],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Fixtures':
+        return cls(
+            small=[Path(p) for p in data['small']],
+            large=Path(data['large']),
+            scanned=Path(data['scanned']),
+            invoices=[Path(p) for p in data['invoices']],
+        )
+
+
+def build_fixtures(directory: Path, large_pages: int = 100, invoices: int = 20) -> Fixtures:
+    """
+    Generate the fixture set with scripts/generate_test_pdfs.py.
+
+    Existing fixtures with matching names are reused.
+
+    Args:
+        directory: Fixture directory
+        large_pages: Page count of the large document
+        invoices: Number of invoices
+
+    Returns:
+        Fixtures: Generated fixture paths
+    """
+    generator = TestPDFGenerator(directory)
+
+    multipage = directory / 'test_multipage_10p.pdf'
+    if not multipage.exists():
+        multipage = generator.generate_multipage_pdf(10)
+    small = []
+    for index in range(1, 11):
+        copy = directory / f'merge_input_{index:02d}.pdf'
+        if not copy.exists():
+            shutil.copyfile(multipage, copy)
+        small.append(copy)
+
+    large = directory / f'test_large_{large_pages}p.pdf'
+    if not large.exists():
+        large = generator.generate_large_pdf(large_pages)
+
+    scanned = directory / 'test_image_no_ocr.pdf'
+    if not scanned.exists():
+        scanned = generator.generate_pdf_with_image(include_ocr_text=False)
+
+    invoice_paths = []
+    for index in range(1, invoices + 1):
+        path = directory / f'invoice_{index:04d}.pdf'
+        if not path.exists():
+            generator.generate_invoice_pdf(
+                invoice_nr=f'INV-2024-{index:04d}',
+                date=f'2024-{(index % 12) + 1:02d}-{(index % 28) + 1:02d}',
+                vendor='Acme Corp',
+                filename=path.name
+            )
+        invoice_paths.append(path)
+
+    return Fixtures(small=small, large=large, scanned=scanned, invoices=invoice_paths)
+
+
+# --- Requirements ---------------------------------------------------------
+
+def _needs_renderer() -> Optional[str]:
+    from pdftools.core.backends import get_backend
+
+    if get_backend().name == 'mupdf' or shutil.which('pdftoppm'):
+        return None
+    return "no page renderer (install PyMuPDF or poppler-utils)"
+
+
+def _needs_tesseract() -> Optional[str]:
+    from pdftools.core.exceptions import TesseractNotFoundError
+    from pdftools.ocr.capabilities import get_tesseract_capabilities
+
+    try:
+        capabilities = get_tesseract_capabilities()
+    except TesseractNotFoundError:
+        return "Tesseract is not installed"
+    if not capabilities.has_language('eng'):
+        return "Tesseract language 'eng' is not installed"
+    return _needs_renderer()
+
+
+# --- Cases ----------------------------------------------------------------
+
+def _merge(fixtures: Fixtures, workdir: Path) -> int:
+    from pdftools.merge import merge_pdfs
+
+    result = merge_pdfs(fixtures.small, workdir / 'merged.pdf')
+    if not result.success:
+        raise RuntimeError(result.message)
+    return result.pages_merged
+
+
+def _split(fixtures: Fixtures, workdir: Path) -> int:
+    from pdftools.split import split_pdf, SplitMode
+
+    result = split_pdf(fixtures.large, workdir, mode=SplitMode.PAGES)
+    return result.metadata['total_pages']
+
+
+def _extract(fixtures: Fixtures, workdir: Path) -> int:
+    from pdftools.text_extraction import extract_text
+
+    result = extract_text(fixtures.large, workdir / 'text.txt')
+    return len(result.pages)
+
+
+def _protect(fixtures: Fixtures, workdir: Path) -> int:
+    from pdftools.core.document import open_document
+    from pdftools.protection import protect_pdf
+
+    result = protect_pdf(fixtures.large, workdir / 'protected.pdf', user_password='benchmark')
+    if not result.success:
+        raise RuntimeError(result.message)
+    with open_document(fixtures.large) as document:
+        return document.page_count
+
+
+def _thumbnails(fixtures: Fixtures, workdir: Path) -> int:
+    from pdftools.thumbnails import generate_thumbnails, ThumbnailSize
+
+    result = generate_thumbnails(fixtures.large, workdir, size=ThumbnailSize.SMALL, pages='1-10')
+    if not result.success:
+        raise RuntimeError(result.message)
+    return result.thumbnails_created
+
+
+def _ocr(fixtures: Fixtures, workdir: Path) -> int:
+    from pdftools.ocr import perform_ocr, OutputMode
+
+    result = perform_ocr(fixtures.scanned, workdir / 'ocr.txt', language='eng', output_mode=OutputMode.TXT)
+    if not result.success:
+        raise RuntimeError(result.message)
+    return result.pages_processed
+
+
+def _rename(fixtures: Fixtures, workdir: Path) -> int:
+    from pdftools.renaming import batch_rename
+
+    results = batch_rename(fixtures.invoices, output_dir=workdir, dry_run=True)
+    failed = [r for r in results if r.status == 'error']
+    if failed:
+        raise RuntimeError(failed[0].message)
+    return len(results)
+
+
+@dataclass
+class BenchmarkCase:
+    """
+    One benchmark case.
+
+    Attributes:
+        name: Case name (key in the results JSON)
+        tool: Tool under test
+        func: Callable(fixtures, workdir) -> pages processed
+        target_seconds: Documented performance target, if any
+        requires: Callable returning a skip reason, or None if runnable
+    """
+    name: str
+    tool: str
+    func: Callable[[Fixtures, Path], int]
+    target_seconds: Optional[float] = None
+    requires: Optional[Callable[[], Optional[str]]] = None
+
+
+CASES: List[BenchmarkCase] = [
+    # readme.md: "< 5s for 10 PDFs @ 10 pages each"
+    BenchmarkCase('merge_10x10', 'merge', _merge, target_seconds=5.0),
+    # REQ-002: medium PDFs (10-100 pages) < 5 s
+    BenchmarkCase('split_pages_large', 'split', _split, target_seconds=5.0),
+    # REQ-005: medium PDFs (10-100 pages) < 3 s
+    BenchmarkCase('extract_text_large', 'text_extraction', _extract, target_seconds=3.0),
+    BenchmarkCase('protect_large', 'protection', _protect),
+    BenchmarkCase('thumbnails_10', 'thumbnails', _thumbnails, requires=_needs_renderer),
+    BenchmarkCase('ocr_scanned_page', 'ocr', _ocr, requires=_needs_tesseract),
+    BenchmarkCase('rename_invoices', 'renaming', _rename),
+]
+
+CASES_BY_NAME: Dict[str, BenchmarkCase] = {case.name: case for case in CASES}
@@ -0,0 +1,83 @@
+"""
+Shared helpers for the benchmark scripts
+
+Benchmarks run their measurements in fresh (spawned) processes, so peak
+memory is measured per case and imports/caches of one case cannot skew
+another. Memory counters come from /proc/self/status; ru_maxrss would
+include the parent's peak on Linux because it survives exec.
+"""
+
+import multiprocessing
+import queue as queue_module
+import resource
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+ROOT = Path(__file__).resolve().parent.parent
+
+for _path in (ROOT / 'src', ROOT / 'scripts'):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+
+def proc_status_mb() -> Dict[str, float]:
+    """Memory counters (VmHWM, VmRSS, RssAnon) of this process in MB, Linux only"""
+    counters = {}
+    try:
+        with open('/proc/self/status', encoding='ascii') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key in ('VmHWM', 'VmRSS', 'RssAnon'):
+                    counters[key] = int(value.split()[0]) / 1024
+    except OSError:
+        pass
+    return counters
+
+
+def peak_rss_mb() -> float:
+    """Peak resident memory of this process in MB"""
+    status = proc_status_mb()
+    if 'VmHWM' in status:
+        return status['VmHWM']
+    # Fallback for platforms without /proc (KB on Linux, bytes on macOS)
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / (1024 * 1024) if sys.platform == 'darwin' else maxrss / 1024
+
+
+def _child(func: Callable[..., Any], args: tuple, queue) -> None:
+    try:
+        queue.put(('ok', func(*args)))
+    except BaseException as e:  # Report everything, the parent decides
+        queue.put(('error', f"{type(e).__name__}: {e}"))
+
+
+def run_isolated(func: Callable[..., Any], *args) -> Any:
+    """
+    Run func(*args) in a freshly spawned process and return its result.
+
+    func and its arguments must be picklable (module-level function).
+
+    Raises:
+        RuntimeError: If the function raised or the process died
+    """
+    ctx = multiprocessing.get_context('spawn')
+    queue = ctx.Queue()
+    process = ctx.Process(target=_child, args=(func, args, queue))
+    process.start()
+    try:
+        while True:
+            try:
+                status, value = queue.get(timeout=1)
+                break
+            except queue_module.Empty:
+                if not process.is_alive():
+                    raise RuntimeError(
+                        f"Benchmark process died (exit code {process.exitcode})"
+                    )
+    finally:
+        process.join()
+
+    if status != 'ok':
+        raise RuntimeError(value)
+    return value
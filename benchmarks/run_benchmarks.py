@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for all pdftools tools with regression tracking
+
+Builds fixtures with scripts/generate_test_pdfs.py, times merge, split,
+text extraction, protection, thumbnails, OCR and renaming (each case in a
+fresh process) and records wall time, throughput and peak RSS as JSON.
+Results can be compared against a stored baseline; the run fails (exit
+code 1) if a case got slower or bigger than the configured thresholds.
+
+Cases needing Tesseract or a page renderer are skipped when those are not
+installed; everything else runs offline on a plain Linux box.
+
+Usage:
+    # Record a baseline on the reference machine
+    python benchmarks/run_benchmarks.py --save-baseline
+
+    # Compare against it (e.g. in CI)
+    python benchmarks/run_benchmarks.py --output results.json
+
+    # Only some cases, 25% time tolerance, per-case limits from the baseline
+    python benchmarks/run_benchmarks.py --cases merge_10x10,split_pages_large \\
+        --time-threshold 0.25
+
+Baseline file format (thresholds are optional and override the defaults):
+    {
+      "results": {"merge_10x10": {"seconds": 0.21, "peak_rss_mb": 61.0, ...}},
+      "thresholds": {"ocr_scanned_page": {"time": 0.5, "rss": 0.3}}
+    }
+"""
+
+import argparse
+import importlib
+import json
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from common import ROOT, peak_rss_mb, run_isolated  # noqa: E402
+from cases import CASES, CASES_BY_NAME, Fixtures, build_fixtures  # noqa: E402
+
+DEFAULT_BASELINE = ROOT / 'benchmarks' / 'baseline.json'
+DEFAULT_FIXTURES = ROOT / 'benchmarks' / '.fixtures'
+SCHEMA_VERSION = 1
+
+
+def measure_case(name: str, fixtures: dict, repeat: int) -> dict:
+    """Run one case `repeat` times (in a spawned process) and report the best run"""
+    case = CASES_BY_NAME[name]
+    fixture_set = Fixtures.from_dict(fixtures)
+
+    # Import the tool up front so the first run does not pay for it
+    importlib.import_module(f'pdftools.{case.tool}')
+
+    best = None
+    pages = 0
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as workdir:
+            start = time.perf_counter()
+            pages = case.func(fixture_set, Path(workdir))
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return {
+        'seconds': round(best, 4),
+        'pages': pages,
+        'pages_per_second': round(pages / best, 2) if best else None,
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+    }
+
+
+def run_suite(case_names: List[str], fixtures: Fixtures, repeat: int) -> Dict[str, dict]:
+    """Run the selected cases and collect their results"""
+    results = {}
+    for name in case_names:
+        case = CASES_BY_NAME[name]
+        entry = {'tool': case.tool, 'target_seconds': case.target_seconds}
+
+        reason = case.requires() if case.requires else None
+        if reason:
+            entry.update(status='skipped', message=reason)
+        else:
+            try:
+                entry.update(status='ok', **run_isolated(measure_case, name, fixtures.to_dict(), repeat))
+            except RuntimeError as e:
+                entry.update(status='error', message=str(e))
+
+        results[name] = entry
+        _print_result(name, entry)
+
+    return results
+
+
+def compare(
+    results: Dict[str, dict],
+    baseline: dict,
+    time_threshold: float,
+    rss_threshold: float,
+    min_delta: float
+) -> List[str]:
+    """
+    Compare results with a baseline.
+
+    Args:
+        results: Current results by case name
+        baseline: Baseline document ('results' and optional 'thresholds')
+        time_threshold: Allowed relative slowdown (0.2 = 20%)
+        rss_threshold: Allowed relative peak RSS growth
+        min_delta: Slowdowns below this many seconds are ignored (noise)
+
+    Returns:
+        List[str]: Human-readable regression descriptions
+    """
+    regressions = []
+    base_results = baseline.get('results', {})
+    overrides = baseline.get('thresholds', {})
+
+    for name, current in results.items():
+        base = base_results.get(name)
+        if current.get('status') != 'ok' or not base or base.get('status') != 'ok':
+            continue
+
+        limits = overrides.get(name, {})
+        max_time = limits.get('time', time_threshold)
+        max_rss = limits.get('rss', rss_threshold)
+
+        slower = current['seconds'] - base['seconds']
+        if slower > min_delta and current['seconds'] > base['seconds'] * (1 + max_time):
+            regressions.append(
+                f"{name}: {current['seconds']:.3f}s vs {base['seconds']:.3f}s "
+                f"(+{slower / base['seconds']:.0%}, limit {max_time:.0%})"
+            )
+
+        if current['peak_rss_mb'] > base['peak_rss_mb'] * (1 + max_rss):
+            growth = current['peak_rss_mb'] / base['peak_rss_mb'] - 1
+            regressions.append(
+                f"{name}: peak RSS {current['peak_rss_mb']:.1f} MB vs "
+                f"{base['peak_rss_mb']:.1f} MB (+{growth:.0%}, limit {max_rss:.0%})"
+            )
+
+    return regressions
+
+
+def missed_targets(results: Dict[str, dict]) -> List[str]:
+    """Cases slower than their documented target"""
+    return [
+        f"{name}: {entry['seconds']:.3f}s exceeds target {entry['target_seconds']}s"
+        for name, entry in results.items()
+        if entry.get('status') == 'ok' and entry.get('target_seconds')
+        and entry['seconds'] > entry['target_seconds']
+    ]
+
+
+def _print_result(name: str, entry: dict) -> None:
+    if entry['status'] != 'ok':
+        print(f"{name:<22} {entry['status']:<8} {entry.get('message', '')}")
+        return
+    print(
+        f"{name:<22} {'ok':<8} {entry['seconds']:>8.3f}s {entry['pages']:>6} pages "
+        f"{entry['pages_per_second'] or 0:>9.1f} pages/s {entry['peak_rss_mb']:>8.1f} MB"
+    )
+
+
+def _load_json(path: Path) -> Optional[dict]:
+    if not path.exists():
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, document: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description='Benchmark all pdftools tools and check for regressions',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__.split('Usage:', 1)[1]
+    )
+    parser.add_argument('--cases', help=f"Comma-separated cases (default: all of {', '.join(CASES_BY_NAME)})")
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per case, best is reported (default: 3)')
+    parser.add_argument('--large-pages', type=int, default=100, help='Pages of the large fixture (default: 100)')
+    parser.add_argument('--fixtures', type=Path, default=DEFAULT_FIXTURES, help='Fixture directory (reused between runs)')
+    parser.add_argument('--output', type=Path, help='Write results JSON to this file')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE, help='Baseline JSON to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='Store the results as the new baseline')
+    parser.add_argument('--time-threshold', type=float, default=0.2, help='Allowed slowdown vs baseline (default: 0.2 = 20%%)')
+    parser.add_argument('--rss-threshold', type=float, default=0.2, help='Allowed peak RSS growth vs baseline (default: 0.2)')
+    parser.add_argument('--min-delta', type=float, default=0.05, help='Ignore slowdowns below this many seconds (default: 0.05)')
+    parser.add_argument('--check-targets', action='store_true', help='Also fail if a documented performance target is missed')
+    args = parser.parse_args()
+
+    case_names = [c.strip() for c in args.cases.split(',')] if args.cases else [c.name for c in CASES]
+    unknown = [name for name in case_names if name not in CASES_BY_NAME]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}")
+
+    print(f"Building fixtures in {args.fixtures} ...")
+    fixtures = build_fixtures(args.fixtures, large_pages=args.large_pages)
+
+    results = run_suite(case_names, fixtures, args.repeat)
+    document = {
+        'schema': SCHEMA_VERSION,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'large_pages': args.large_pages,
+        'results': results,
+    }
+
+    if args.output:
+        _write_json(args.output, document)
+        print(f"\nResults written to {args.output}")
+
+    failures = []
+    baseline = _load_json(args.baseline)
+    if args.save_baseline:
+        if baseline and 'thresholds' in baseline:
+            document['thresholds'] = baseline['thresholds']
+        _write_json(args.baseline, document)
+        print(f"Baseline saved to {args.baseline}")
+    elif baseline:
+        failures += compare(
+            results, baseline, args.time_threshold, args.rss_threshold, args.min_delta
+        )
+    else:
+        print(f"\nNo baseline at {args.baseline} (create one with --save-baseline)")
+
+    if args.check_targets:
+        failures += missed_targets(results)
+
+    if failures:
+        print("\nRegressions:")
+        for failure in failures:
+            print(f"  ✗ {failure}")
+        return 1
+
+    print("\n✓ No regressions")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -30,6 +30,11 @@ export const pdfOcrTool = {
         enum: ['txt', 'pdf', 'json'],
         default: 'txt',
       },
+      resume: {
+        type: 'boolean',
+        description: 'Checkpoint each page so a timed-out run can be continued by calling again with the same parameters',
+        default: false,
+      },
     },
     required: ['input_file', 'output_file'],
   },
@@ -40,6 +45,7 @@ export async function handlePdfOcr(params: {
   output_file: string;
   language?: string;
   output_mode?: string;
+  resume?: boolean;
 }): Promise<{ content: Array<{ type: string; text: string }> }> {
   const requiredValidation = validateRequired(params, ['input_file', 'output_file']);
   if (!requiredValidation.valid) {
@@ -81,6 +87,10 @@ export async function handlePdfOcr(params: {
     args.push('--output-mode', params.output_mode);
   }
 
+  if (params.resume) {
+    args.push('--resume');
+  }
+
   try {
     const result = await executeTool('ocrutil', args);
 
@@ -10,13 +10,26 @@ Generates various types of PDF files for testing purposes:
 - Large PDFs for performance testing
 - Encrypted/protected PDFs
 - Corrupted PDFs
+
+and seeded, reproducible benchmark corpora (generated in parallel):
+- invoices: varied vendors, dates, number formats and labels (renaming)
+- scans:    image-only pages with ground-truth text (OCR accuracy)
+- outlines: deep bookmark trees with a shared embedded font (merging)
+- huge:     multi-GB documents written in a streaming fashion
+
+Every corpus directory gets a manifest.json with the generated values.
 """
 
 import argparse
+import json
 import logging
+import os
+import random
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter, A4
@@ -34,6 +47,40 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Corpus vocabulary; with a fixed seed, every corpus is identical across runs
+VENDORS = [
+    "Acme Corp", "Globex GmbH", "Initech", "Umbrella Ltd", "Stark Industries",
+    "Wayne Enterprises", "Hooli", "Vandelay Industries", "Soylent AG", "Cyberdyne Systems",
+    "Tyrell Corporation", "Wonka Industries", "Oceanic Airlines", "Gringotts Bank", "Nakatomi Trading",
+]
+VENDOR_LABELS = ["Vendor", "From", "Supplier", "Von", "Seller"]
+NUMBER_LABELS = ["Invoice Number", "Invoice Nr.", "Invoice #", "Rechnung Nr.", "Bill ID"]
+NUMBER_FORMATS = ["INV-{year}-{n:04d}", "RE{year}{n:05d}", "{year}/{n:04d}", "F-{n:06d}"]
+DATE_FORMATS = ["%Y-%m-%d", "%d.%m.%Y", "%m/%d/%Y", "%d %B %Y"]
+WORDS = (
+    "the quick brown fox jumps over lazy dog invoice payment total amount due "
+    "customer order delivery service contract period account balance tax net "
+    "gross document page report summary annual quarterly review meeting project"
+).split()
+
+CORPUS_KINDS = ('invoices', 'scans', 'outlines', 'huge')
+
+# TrueType fonts for scans and the shared outline font (first match wins)
+FONT_CANDIDATES = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/dejavu/DejaVuSans.ttf",
+    "/Library/Fonts/Arial.ttf",
+    "C:/Windows/Fonts/arial.ttf",
+]
+
+
+def find_truetype_font() -> Optional[str]:
+    """Path of a TrueType font on this system, or None"""
+    for candidate in FONT_CANDIDATES:
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
 
 class TestPDFGenerator:
     """Generator for test PDF files"""
@@ -184,6 +231,247 @@ class TestPDFGenerator:
         logger.info(f"Created: {output_path} ({num_pages} pages)")
         return output_path
 
+    def generate_invoice_pdf(
+        self,
+        invoice_nr: str = "INV-2024-001",
+        date: str = "2024-03-15",
+        vendor: str = "Acme Corp",
+        filename: str = None,
+        vendor_label: str = "Vendor",
+        number_label: str = "Invoice Number",
+        amount: str = "1.250,00 EUR",
+        invariant: bool = False
+    ) -> Path:
+        """
+        Generate a single-page invoice for renaming tests
+
+        Args:
+            invoice_nr: Invoice number printed on the invoice
+            date: Invoice date (any format the renaming patterns accept)
+            vendor: Vendor name
+            filename: Output filename (default: invoice_{invoice_nr}.pdf)
+            vendor_label: Label in front of the vendor name
+            number_label: Label in front of the invoice number
+            amount: Line item and total amount
+            invariant: Omit timestamps and IDs so output is byte-reproducible
+        """
+        output_path = self.output_dir / (filename or f"invoice_{invoice_nr}.pdf")
+
+        c = canvas.Canvas(str(output_path), pagesize=A4, invariant=int(invariant))
+        c.setFont("Helvetica-Bold", 16)
+        c.drawString(100, 800, "INVOICE")
+
+        c.setFont("Helvetica", 12)
+        c.drawString(100, 760, f"{vendor_label}: {vendor}")
+        c.drawString(100, 740, f"{number_label}: {invoice_nr}")
+        c.drawString(100, 720, f"Date: {date}")
+        c.drawString(100, 680, "Description                          Amount")
+        c.drawString(100, 660, f"Consulting services                  {amount}")
+        c.drawString(100, 620, f"Total                                {amount}")
+        c.showPage()
+        c.save()
+
+        logger.debug(f"Created: {output_path}")
+        return output_path
+
+    def generate_scanned_pdf(
+        self,
+        lines: List[str],
+        filename: str = "test_scanned.pdf",
+        dpi: int = 200,
+        skew: float = 0.0,
+        noise: float = 0.0,
+        seed: int = 0,
+        invariant: bool = False
+    ) -> Path:
+        """
+        Generate an image-only A4 page (no text layer) showing the given lines
+
+        Args:
+            lines: Text lines rendered onto the page (the OCR ground truth)
+            filename: Output filename
+            dpi: Scan resolution of the embedded image
+            skew: Rotation in degrees, simulating a crooked scan
+            noise: Fraction of pixels replaced by speckles (0.0 - 1.0)
+            seed: Seed for the speckle pattern
+            invariant: Omit timestamps and IDs so output is byte-reproducible
+        """
+        output_path = self.output_dir / filename
+
+        width, height = int(8.27 * dpi), int(11.69 * dpi)
+        img = Image.new('L', (width, height), color=255)
+        draw = ImageDraw.Draw(img)
+
+        font_path = find_truetype_font()
+        font_size = max(12, dpi // 6)  # ~12 pt
+        font = ImageFont.truetype(font_path, font_size) if font_path else ImageFont.load_default()
+
+        y = dpi  # 1 inch margin
+        for line in lines:
+            draw.text((dpi, y), line, fill=0, font=font)
+            y += int(font_size * 1.6)
+
+        if noise > 0:
+            rng = random.Random(seed)
+            pixels = img.load()
+            for _ in range(int(width * height * noise)):
+                pixels[rng.randrange(width), rng.randrange(height)] = rng.choice((0, 96, 160))
+
+        if skew:
+            img = img.rotate(skew, resample=Image.BILINEAR, fillcolor=255)
+
+        img_buffer = io.BytesIO()
+        img.save(img_buffer, format='JPEG', quality=75)
+        img_buffer.seek(0)
+
+        page_width, page_height = A4
+        c = canvas.Canvas(str(output_path), pagesize=A4, invariant=int(invariant))
+        c.drawImage(ImageReader(img_buffer), 0, 0, width=page_width, height=page_height)
+        c.showPage()
+        c.save()
+
+        logger.debug(f"Created: {output_path}")
+        return output_path
+
+    def generate_outlined_pdf(
+        self,
+        depth: int = 4,
+        breadth: int = 2,
+        filename: Optional[str] = None,
+        title: str = "Outlined Document",
+        invariant: bool = False
+    ) -> Path:
+        """
+        Generate a PDF with a nested outline (one page per bookmark)
+
+        Text uses an embedded TrueType font registered under the same name
+        in every file, so merged corpora share a font (Helvetica if no
+        TrueType font is available).
+
+        Args:
+            depth: Outline nesting depth
+            breadth: Children per outline entry
+            filename: Output filename (default: test_outline_d{depth}_b{breadth}.pdf)
+            title: Title of the top-level entries
+            invariant: Omit timestamps and IDs so output is byte-reproducible
+
+        Returns:
+            Path: Created file (outline_page_count(depth, breadth) pages)
+        """
+        output_path = self.output_dir / (filename or f"test_outline_d{depth}_b{breadth}.pdf")
+        font_name = _register_shared_font()
+
+        c = canvas.Canvas(str(output_path), pagesize=A4, invariant=int(invariant))
+        c.setTitle(title)
+        counter = [0]
+
+        def add_level(prefix: str, level: int) -> None:
+            for index in range(1, breadth + 1):
+                label = f"{prefix}{index}"
+                counter[0] += 1
+                key = f"node{counter[0]}"
+
+                c.setFont(font_name, 16)
+                c.drawString(100, 800, f"{title} - Section {label}")
+                c.setFont(font_name, 10)
+                c.drawString(100, 770, f"Outline level {level + 1} of {depth}, page {counter[0]}")
+                c.bookmarkPage(key)
+                c.addOutlineEntry(f"Section {label}", key, level=level)
+                c.showPage()
+
+                if level + 1 < depth:
+                    add_level(f"{label}.", level + 1)
+
+        add_level("", 0)
+        c.save()
+
+        logger.debug(f"Created: {output_path} ({counter[0]} pages, outline depth {depth})")
+        return output_path
+
+    def generate_huge_pdf(
+        self,
+        size_mb: int = 1024,
+        filename: Optional[str] = None,
+        seed: int = 0
+    ) -> Path:
+        """
+        Generate a PDF of roughly the given size for streaming tests
+
+        The file is written object by object (not through reportlab, which
+        keeps the whole document in memory): every page holds a ~1 MB
+        incompressible JPEG and a line of text, so size grows with the page
+        count and memory use stays flat.
+
+        Args:
+            size_mb: Target file size in MB
+            filename: Output filename (default: test_huge_{size_mb}mb.pdf)
+            seed: Seed for the image content
+        """
+        output_path = self.output_dir / (filename or f"test_huge_{size_mb}mb.pdf")
+
+        rng = random.Random(seed)
+        side = 1024
+        noise = Image.frombytes('L', (side, side), rng.randbytes(side * side))
+        jpeg_buffer = io.BytesIO()
+        noise.save(jpeg_buffer, format='JPEG', quality=90)
+        jpeg = jpeg_buffer.getvalue()
+
+        num_pages = max(1, -(-size_mb * 1024 * 1024 // len(jpeg)))
+        page_width, page_height = (int(v) for v in A4)
+        offsets: Dict[int, int] = {}
+
+        with open(output_path, 'wb') as f:
+            def write_object(number: int, body: bytes, stream: Optional[bytes] = None) -> None:
+                offsets[number] = f.tell()
+                f.write(b"%d 0 obj\n" % number + body)
+                if stream is not None:
+                    f.write(b"\nstream\n" + stream + b"\nendstream")
+                f.write(b"\nendobj\n")
+
+            f.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+            write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+            write_object(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+            page_objects = []
+            for page_num in range(1, num_pages + 1):
+                image_obj, content_obj, page_obj = (4 + (page_num - 1) * 3 + i for i in range(3))
+                write_object(
+                    image_obj,
+                    b"<< /Type /XObject /Subtype /Image /Width %d /Height %d "
+                    b"/ColorSpace /DeviceGray /BitsPerComponent 8 /Filter /DCTDecode /Length %d >>"
+                    % (side, side, len(jpeg)),
+                    jpeg
+                )
+                content = (
+                    b"q %d 0 0 %d 0 0 cm /Im0 Do Q "
+                    b"BT /F1 24 Tf 1 1 1 rg 72 800 Td (Page %d of %d) Tj ET"
+                    % (page_width, page_height, page_num, num_pages)
+                )
+                write_object(content_obj, b"<< /Length %d >>" % len(content), content)
+                write_object(
+                    page_obj,
+                    b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+                    b"/Resources << /Font << /F1 3 0 R >> /XObject << /Im0 %d 0 R >> >> "
+                    b"/Contents %d 0 R >>" % (page_width, page_height, image_obj, content_obj)
+                )
+                page_objects.append(page_obj)
+
+                if page_num % 500 == 0:
+                    logger.info(f"  Written {page_num}/{num_pages} pages...")
+
+            kids = b" ".join(b"%d 0 R" % number for number in page_objects)
+            write_object(2, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, num_pages))
+
+            xref_offset = f.tell()
+            size = max(offsets) + 1
+            f.write(b"xref\n0 %d\n0000000000 65535 f \n" % size)
+            for number in range(1, size):
+                f.write(b"%010d 00000 n \n" % offsets[number])
+            f.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref_offset))
+
+        logger.info(f"Created: {output_path} ({num_pages} pages, {output_path.stat().st_size / 1024 / 1024:.0f} MB)")
+        return output_path
+
     def generate_empty_pdf(self) -> Path:
         """Generate an empty PDF (no content)"""
         output_path = self.output_dir / "test_empty.pdf"
@@ -274,6 +562,154 @@ class TestPDFGenerator:
         return created_files
 
 
+_SHARED_FONT = 'CorpusSans'
+
+
+def _register_shared_font() -> str:
+    """Register the shared TrueType font with reportlab (Helvetica if none)"""
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+
+    if _SHARED_FONT in pdfmetrics.getRegisteredFontNames():
+        return _SHARED_FONT
+    font_path = find_truetype_font()
+    if not font_path:
+        return "Helvetica"
+    pdfmetrics.registerFont(TTFont(_SHARED_FONT, font_path))
+    return _SHARED_FONT
+
+
+def _random_sentence(rng: random.Random, min_words: int = 4, max_words: int = 9) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))]
+    return " ".join(words).capitalize()
+
+
+def outline_page_count(depth: int, breadth: int) -> int:
+    """Pages of generate_outlined_pdf: one per entry, breadth^level entries per level"""
+    return sum(breadth ** level for level in range(1, depth + 1))
+
+
+def _corpus_item(kind: str, output_dir: str, index: int, seed: int, options: dict) -> dict:
+    """
+    Generate one corpus file (runs in a worker process)
+
+    Values depend only on (seed, kind, index), so the corpus is identical
+    regardless of worker count and scheduling.
+    """
+    rng = random.Random(f"{seed}:{kind}:{index}")
+    generator = TestPDFGenerator(output_dir)
+
+    if kind == 'invoices':
+        invoice_date = date(2020, 1, 1) + timedelta(days=rng.randrange(5 * 365))
+        vendor = rng.choice(VENDORS)
+        invoice_nr = rng.choice(NUMBER_FORMATS).format(year=invoice_date.year, n=rng.randrange(1, 100000))
+        date_text = invoice_date.strftime(rng.choice(DATE_FORMATS))
+        amount = f"{rng.randrange(10, 50000)},{rng.randrange(100):02d} EUR"
+        path = generator.generate_invoice_pdf(
+            invoice_nr=invoice_nr,
+            date=date_text,
+            vendor=vendor,
+            filename=f"invoice_{index:05d}.pdf",
+            vendor_label=rng.choice(VENDOR_LABELS),
+            number_label=rng.choice(NUMBER_LABELS),
+            amount=amount,
+            invariant=True
+        )
+        values = {
+            'vendor': vendor,
+            'invoice_nr': invoice_nr,
+            'date': invoice_date.isoformat(),
+            'date_text': date_text,
+            'amount': amount,
+        }
+
+    elif kind == 'scans':
+        lines = [_random_sentence(rng) for _ in range(rng.randint(5, 15))]
+        skew = round(rng.uniform(-2.0, 2.0), 2) if options.get('skew', True) else 0.0
+        noise = options.get('noise', 0.002)
+        path = generator.generate_scanned_pdf(
+            lines,
+            filename=f"scan_{index:05d}.pdf",
+            dpi=options.get('dpi', 200),
+            skew=skew,
+            noise=noise,
+            seed=rng.randrange(2 ** 32),
+            invariant=True
+        )
+        ground_truth = "\n".join(lines) + "\n"
+        path.with_suffix('.gt.txt').write_text(ground_truth, encoding='utf-8')
+        values = {'ground_truth': ground_truth, 'skew': skew, 'noise': noise}
+
+    elif kind == 'outlines':
+        depth = options.get('depth', 4)
+        breadth = rng.randint(2, 3) if options.get('breadth') is None else options['breadth']
+        path = generator.generate_outlined_pdf(
+            depth=depth,
+            breadth=breadth,
+            filename=f"outline_{index:05d}.pdf",
+            title=f"Manual {index}",
+            invariant=True
+        )
+        values = {'depth': depth, 'breadth': breadth, 'pages': outline_page_count(depth, breadth)}
+
+    elif kind == 'huge':
+        size_mb = options.get('size_mb', 1024)
+        path = generator.generate_huge_pdf(size_mb, filename=f"huge_{index:03d}.pdf", seed=rng.randrange(2 ** 32))
+        values = {'size_mb': size_mb}
+
+    else:
+        raise ValueError(f"Unknown corpus kind: {kind}")
+
+    return {'file': path.name, **values}
+
+
+def generate_corpus(
+    output_dir: Path,
+    kind: str,
+    count: int,
+    seed: int = 0,
+    workers: Optional[int] = None,
+    **options
+) -> List[dict]:
+    """
+    Generate a reproducible corpus of test PDFs in parallel
+
+    Args:
+        output_dir: Corpus directory (manifest.json is written here)
+        kind: One of CORPUS_KINDS
+        count: Number of files
+        seed: Corpus seed; the same seed always produces the same corpus
+        workers: Worker processes (default: CPU count, 1 = in-process)
+        **options: Kind-specific options (scans: dpi, skew, noise;
+                   outlines: depth, breadth; huge: size_mb)
+
+    Returns:
+        List of manifest entries, one per file in index order
+    """
+    if kind not in CORPUS_KINDS:
+        raise ValueError(f"Unknown corpus kind: {kind} (choose from {', '.join(CORPUS_KINDS)})")
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    args = [(kind, str(output_dir), index, seed, options) for index in range(1, count + 1)]
+
+    logger.info(f"Generating {count} {kind} with seed {seed} ({workers} workers)...")
+    if workers == 1:
+        entries = [_corpus_item(*item) for item in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, count // (workers * 8))
+            entries = list(executor.map(_corpus_item, *zip(*args), chunksize=chunksize))
+
+    manifest = {'kind': kind, 'seed': seed, 'count': count, 'options': options, 'files': entries}
+    with open(output_dir / 'manifest.json', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    logger.info(f"Generated {count} {kind} in: {output_dir}")
+    return entries
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
@@ -327,8 +763,34 @@ def main():
         help='Generate corrupted PDF'
     )
 
+    corpus = parser.add_argument_group('benchmark corpora')
+    corpus.add_argument(
+        '--corpus',
+        choices=CORPUS_KINDS,
+        help='Generate a seeded corpus into OUTPUT/<kind> (with manifest.json)'
+    )
+    corpus.add_argument('--count', type=int, default=100, help='Number of corpus files (default: 100)')
+    corpus.add_argument('--seed', type=int, default=0, help='Corpus seed (default: 0)')
+    corpus.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    corpus.add_argument('--size-mb', type=int, default=1024, help='Size of each huge PDF in MB (default: 1024)')
+    corpus.add_argument('--outline-depth', type=int, default=4, help='Outline depth of outlines corpus (default: 4)')
+    corpus.add_argument('--dpi', type=int, default=200, help='Scan resolution of scans corpus (default: 200)')
+
     args = parser.parse_args()
 
+    if args.corpus:
+        options = {
+            'invoices': {},
+            'scans': {'dpi': args.dpi},
+            'outlines': {'depth': args.outline_depth},
+            'huge': {'size_mb': args.size_mb},
+        }[args.corpus]
+        generate_corpus(
+            Path(args.output) / args.corpus, args.corpus, args.count,
+            seed=args.seed, workers=args.workers, **options
+        )
+        return
+
     # Initialize generator
     generator = TestPDFGenerator(args.output)
 
@@ -61,6 +61,12 @@ setup(
             "sphinx>=6.0.0",
             "sphinx-rtd-theme>=1.2.0",
         ],
+        "tesserocr": [
+            "tesserocr>=2.6.0",
+        ],
+        "yaml": [
+            "PyYAML>=5.4",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -72,6 +78,7 @@ setup(
             "pdfprotect=pdftools.protection.cli:main",
             "pdfthumbnails=pdftools.thumbnails.cli:main",
             "pdfrename=pdftools.renaming.cli:main",
+            "pdfpipe=pdftools.pipeline.cli:main",
         ],
     },
     include_package_data=True,
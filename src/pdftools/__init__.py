@@ -13,6 +13,7 @@ from . import protection
 from . import text_extraction
 from . import thumbnails
 from . import renaming
+from . import aio
 
 __all__ = [
     'core',
@@ -23,4 +24,5 @@ __all__ = [
     'text_extraction',
     'thumbnails',
     'renaming',
+    'aio',
 ]
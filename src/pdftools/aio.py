@@ -0,0 +1,380 @@
+"""
+Asyncio API for all tools
+
+Awaitable versions of the tool entry points for asyncio applications. The
+blocking calls run on a shared executor (threads by default, or worker
+processes), and a per-event-loop semaphore bounds how many run at once,
+so the event loop is never blocked and a burst of requests queues in
+asyncio instead of in the executor. Concurrent threads working on the same
+file are safe because every thread opens its own document handles (see
+pdftools.core.document):
+
+    >>> from pdftools import aio
+    >>> aio.configure(max_workers=4, max_concurrency=8)
+    >>> result = await aio.merge_pdfs([Path("a.pdf"), Path("b.pdf")])
+
+Cancelling a call that has not started yet removes it from the queue. A
+running call cannot be interrupted from outside; it finishes in the
+background and keeps its executor slot until then. Operations started with
+track() report their progress as an async iterator and stop at the next
+page (or file) when cancelled:
+
+    >>> operation = aio.track(aio.perform_ocr, Path("scan.pdf"))
+    >>> async for progress in operation:
+    ...     print(f"{progress.current}/{progress.total}")
+    >>> result = await operation
+
+The tools themselves parallelize too (batch OCR starts a worker per CPU,
+Tesseract its OpenMP threads), so max_concurrency of 1-2 is usually enough
+for OCR-heavy workloads.
+"""
+
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any, AsyncIterator, Callable, Dict, Generator, Optional, Tuple
+import asyncio
+import functools
+import inspect
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import weakref
+
+from pdftools.core.exceptions import InvalidParameterError
+from pdftools.merge import MergeConfig, merge_pdfs as _merge_pdfs
+from pdftools.ocr import OCRConfig, ocr_pages as _ocr_pages, perform_ocr as _perform_ocr
+from pdftools.ocr import perform_batch_ocr as _perform_batch_ocr
+from pdftools.pipeline import run_pipeline as _run_pipeline
+from pdftools.protection import protect_pdf as _protect_pdf
+from pdftools.protection import protect_pdf_with_config as _protect_pdf_with_config
+from pdftools.renaming import batch_rename as _batch_rename, rename_invoice as _rename_invoice
+from pdftools.split import split_pdf as _split_pdf
+from pdftools.text_extraction import extract_text as _extract_text
+from pdftools.thumbnails import generate_thumbnails as _generate_thumbnails
+
+logger = logging.getLogger(__name__)
+
+# Seconds between checks for new progress of a tracked operation
+PROGRESS_POLL_SECONDS = 0.05
+
+
+@dataclass(frozen=True)
+class Progress:
+    """
+    Progress of a tracked operation
+
+    Attributes:
+        current: Pages (files for merge_pdfs) done, including the current one
+        total: Pages (files) to process
+    """
+    current: int
+    total: int
+
+
+# Shared executor settings (see configure)
+_settings: Dict[str, Any] = {'max_workers': None, 'processes': False, 'max_concurrency': None}
+_executor: Optional[Executor] = None
+_manager = None
+_lock = threading.Lock()
+
+# Concurrency semaphores by event loop (asyncio primitives are bound to one loop)
+_semaphores: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]' = \
+    weakref.WeakKeyDictionary()
+
+
+def configure(
+    max_workers: Optional[int] = None,
+    processes: bool = False,
+    max_concurrency: Optional[int] = None
+) -> None:
+    """
+    Configure the shared executor of the asyncio API.
+
+    The previous executor is shut down (calls already running finish).
+
+    Args:
+        max_workers: Executor threads or processes (None = CPU count)
+        processes: Run calls in worker processes instead of threads.
+                   Arguments, results and progress callbacks must then be
+                   picklable.
+        max_concurrency: Calls running at once per event loop
+                         (None = max_workers)
+
+    Raises:
+        InvalidParameterError: If max_workers or max_concurrency is less than 1
+    """
+    if max_workers is not None and max_workers < 1:
+        raise InvalidParameterError("max_workers", max_workers, "Must be at least 1")
+    if max_concurrency is not None and max_concurrency < 1:
+        raise InvalidParameterError("max_concurrency", max_concurrency, "Must be at least 1")
+
+    shutdown(wait=False)
+    with _lock:
+        _settings.update(max_workers=max_workers, processes=processes, max_concurrency=max_concurrency)
+        _semaphores.clear()
+
+
+def shutdown(wait: bool = True) -> None:
+    """
+    Shut down the shared executor (a new one is created on next use).
+
+    Args:
+        wait: Wait for running calls to finish
+    """
+    global _executor, _manager
+    with _lock:
+        executor, _executor = _executor, None
+        manager, _manager = _manager, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
+    if manager is not None:
+        manager.shutdown()
+
+
+async def run(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a blocking function on the shared executor.
+
+    Args:
+        func: Function to call (module-level if the executor uses processes)
+        *args: Positional arguments
+        **kwargs: Keyword arguments
+
+    Returns:
+        Any: Return value of func
+    """
+    future = await _submit(functools.partial(func, *args, **kwargs))
+    return await asyncio.wrap_future(future)
+
+
+class Operation:
+    """
+    A tracked tool call (see track)
+
+    Awaiting the operation returns the tool's result; iterating over it
+    with ``async for`` yields Progress until the call has finished.
+    """
+
+    def __init__(self, call: Callable[[], Any], progress: '_ProgressReporter'):
+        self._progress = progress
+        self._task = asyncio.ensure_future(self._run(call))
+
+    def __await__(self) -> Generator[Any, None, Any]:
+        return self._task.__await__()
+
+    def __aiter__(self) -> AsyncIterator[Progress]:
+        return self._iter_progress()
+
+    def cancel(self) -> bool:
+        """
+        Cancel the operation; a running call stops at its next progress report.
+
+        Returns:
+            bool: False if the operation had already finished
+        """
+        if self._task.done():
+            return False
+        # Set before the task handles its cancellation, so the call cannot
+        # pass further progress reports in the meantime
+        self._progress.cancelled.set()
+        return self._task.cancel()
+
+    def done(self) -> bool:
+        """Whether the operation has finished (also if it failed or was cancelled)"""
+        return self._task.done()
+
+    async def _run(self, call: Callable[[], Any]) -> Any:
+        try:
+            return await run(call)
+        except asyncio.CancelledError:
+            self._progress.cancelled.set()
+            raise
+
+    async def _iter_progress(self) -> AsyncIterator[Progress]:
+        while True:
+            finished = self._task.done()
+            reported = False
+            while True:
+                try:
+                    current, total = self._progress.queue.get_nowait()
+                except queue.Empty:
+                    break
+                reported = True
+                yield Progress(current, total)
+            if finished:
+                return
+            if not reported:
+                await asyncio.sleep(PROGRESS_POLL_SECONDS)
+
+
+def track(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Operation:
+    """
+    Start a tool call that reports progress and can be cancelled between pages.
+
+    Must be called from a coroutine; the call starts immediately. Progress
+    is reported through the config's progress_callback (a callback already
+    set in the config is still called, from the executor).
+
+    Args:
+        func: merge_pdfs, perform_ocr or perform_batch_ocr (from this module
+              or the tool packages)
+        *args: Positional arguments of func
+        **kwargs: Keyword arguments of func
+
+    Returns:
+        Operation: Awaitable, async-iterable operation
+
+    Raises:
+        InvalidParameterError: If func does not report progress
+
+    Note:
+        With a progress callback, perform_ocr skips pages that fail instead
+        of failing the whole document.
+    """
+    target = func if func in _PROGRESS_CONFIGS else getattr(func, '__wrapped__', func)
+    if target not in _PROGRESS_CONFIGS:
+        raise InvalidParameterError(
+            "func", getattr(func, '__name__', func),
+            f"Progress is reported by {', '.join(f.__name__ for f in _PROGRESS_CONFIGS)} only"
+        )
+
+    bound = inspect.signature(target).bind(*args, **kwargs)
+    config = bound.arguments.get('config') or _PROGRESS_CONFIGS[target]()
+    progress = _ProgressReporter(*_progress_channel(), callback=config.progress_callback)
+    bound.arguments['config'] = replace(config, progress_callback=progress)
+
+    return Operation(functools.partial(target, *bound.args, **bound.kwargs), progress)
+
+
+class _ProgressReporter:
+    """Progress callback passing reports to an Operation and stopping cancelled calls"""
+
+    def __init__(self, queue, cancelled, callback: Optional[Callable[[int, int], None]] = None):
+        self.queue = queue
+        self.cancelled = cancelled
+        self.callback = callback
+
+    def __call__(self, current: int, total: int) -> None:
+        # CancelledError is a BaseException, so the tools' per-page error
+        # handling does not swallow it
+        if self.cancelled.is_set():
+            raise asyncio.CancelledError()
+        self.queue.put((current, total))
+        if self.callback is not None:
+            self.callback(current, total)
+
+
+def _progress_channel() -> Tuple[Any, Any]:
+    """Queue and cancellation event reachable from the executor's workers"""
+    global _manager
+    if not _settings['processes']:
+        return queue.Queue(), threading.Event()
+    with _lock:
+        if _manager is None:
+            _manager = multiprocessing.Manager()
+        return _manager.Queue(), _manager.Event()
+
+
+def _get_executor() -> Executor:
+    """The shared executor (created on first use)"""
+    global _executor
+    with _lock:
+        if _executor is None:
+            workers = _settings['max_workers'] or os.cpu_count() or 1
+            if _settings['processes']:
+                _executor = ProcessPoolExecutor(max_workers=workers)
+            else:
+                _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='pdftools-aio')
+            logger.debug(f"Started {type(_executor).__name__} with {workers} workers")
+        return _executor
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Concurrency semaphore of the running event loop"""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        semaphore = _semaphores.get(loop)
+        if semaphore is None:
+            limit = _settings['max_concurrency'] or _settings['max_workers'] or os.cpu_count() or 1
+            semaphore = _semaphores[loop] = asyncio.Semaphore(limit)
+        return semaphore
+
+
+async def _submit(call: Callable[[], Any]) -> Future:
+    """
+    Submit a call once a concurrency slot is free.
+
+    The slot is released when the call has finished, not when the awaiting
+    task is cancelled, so calls still running in the background count.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _get_semaphore()
+    await semaphore.acquire()
+    try:
+        future = _get_executor().submit(call)
+    except BaseException:
+        semaphore.release()
+        raise
+
+    def release(_: Future) -> None:
+        try:
+            loop.call_soon_threadsafe(semaphore.release)
+        except RuntimeError:  # Event loop already closed
+            pass
+
+    future.add_done_callback(release)
+    return future
+
+
+def _awaitable(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Awaitable version of a tool entry point, run with run()"""
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return await run(func, *args, **kwargs)
+
+    wrapper.__doc__ = f"Awaitable {func.__module__}.{func.__name__} (see there)."
+    return wrapper
+
+
+merge_pdfs = _awaitable(_merge_pdfs)
+split_pdf = _awaitable(_split_pdf)
+extract_text = _awaitable(_extract_text)
+perform_ocr = _awaitable(_perform_ocr)
+ocr_pages = _awaitable(_ocr_pages)
+perform_batch_ocr = _awaitable(_perform_batch_ocr)
+generate_thumbnails = _awaitable(_generate_thumbnails)
+protect_pdf = _awaitable(_protect_pdf)
+protect_pdf_with_config = _awaitable(_protect_pdf_with_config)
+rename_invoice = _awaitable(_rename_invoice)
+batch_rename = _awaitable(_batch_rename)
+run_pipeline = _awaitable(_run_pipeline)
+
+# Tools reporting progress, with their config class
+_PROGRESS_CONFIGS = {
+    _merge_pdfs: MergeConfig,
+    _perform_ocr: OCRConfig,
+    _perform_batch_ocr: OCRConfig,
+}
+
+__all__ = [
+    'configure',
+    'shutdown',
+    'run',
+    'track',
+    'Operation',
+    'Progress',
+    'merge_pdfs',
+    'split_pdf',
+    'extract_text',
+    'perform_ocr',
+    'ocr_pages',
+    'perform_batch_ocr',
+    'generate_thumbnails',
+    'protect_pdf',
+    'protect_pdf_with_config',
+    'rename_invoice',
+    'batch_rename',
+    'run_pipeline',
+]
@@ -9,6 +9,10 @@ from pdftools.cli.common import (
     setup_logging,
     handle_keyboard_interrupt,
     create_stub_message,
+    add_stats_argument,
+    print_stats,
+    add_profile_argument,
+    profile_main,
 )
 
 __all__ = [
@@ -18,4 +22,8 @@ __all__ = [
     'setup_logging',
     'handle_keyboard_interrupt',
     'create_stub_message',
+    'add_stats_argument',
+    'print_stats',
+    'add_profile_argument',
+    'profile_main',
 ]
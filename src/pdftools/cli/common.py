@@ -2,9 +2,13 @@
 Common utilities for all CLI tools
 """
 
+import argparse
 import sys
 import logging
-from typing import Optional
+import time
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, TextIO
 
 # ANSI Color Codes
 GREEN = '\033[92m'
@@ -81,6 +85,196 @@ def setup_logging(verbose: bool) -> None:
     )
 
 
+def add_stats_argument(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the --stats option (print stage timings and I/O after the run)
+
+    Args:
+        parser: Argument parser of the CLI tool
+    """
+    parser.add_argument(
+        '--stats',
+        action='store_true',
+        help='Print per-stage timings, bytes read/written and peak memory'
+    )
+
+
+PROFILERS = ('cprofile', 'tracemalloc')
+PROFILE_SUFFIXES = {'cprofile': '.prof', 'tracemalloc': '.tracemalloc'}
+
+
+def add_profile_argument(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the --profile and --profile-top options (handled by profile_main)
+
+    Args:
+        parser: Argument parser of the CLI tool
+    """
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='cprofile',
+        choices=PROFILERS,
+        help='Profile the run with cProfile (default) or tracemalloc; the profile '
+             'is written next to the output and the top hotspots are printed'
+    )
+    parser.add_argument(
+        '--profile-top',
+        type=int,
+        default=20,
+        metavar='N',
+        help='Number of hotspots to print with --profile (default: 20)'
+    )
+
+
+def profile_main(main: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Decorator running a CLI's main under the profiler selected by --profile
+
+    Without --profile, main runs unchanged. With it, the profile is written
+    to the output's directory (-o/--output/--output-dir, else the current
+    directory) as <tool>-<timestamp>.prof (load with pstats or snakeviz) or
+    .tracemalloc (load with tracemalloc.Snapshot.load), and the top hotspots
+    are printed to stderr - also when main exits via sys.exit().
+
+    The arguments are taken from main's first argument if it is an argv
+    list, else from sys.argv. The tool's parser must accept the options
+    too (see add_profile_argument).
+
+    Example:
+        >>> @profile_main
+        ... def main():
+        ...     ...
+    """
+    module = main.__module__
+    if module == '__main__':  # python -m pdftools.<tool>.cli
+        spec = getattr(sys.modules['__main__'], '__spec__', None)
+        module = spec.name if spec else module
+    parts = module.split('.')
+    tool = parts[1] if len(parts) > 2 and parts[0] == 'pdftools' else Path(sys.argv[0]).stem
+
+    @wraps(main)
+    def wrapper(*args, **kwargs):
+        argv = args[0] if args and isinstance(args[0], (list, tuple)) else sys.argv[1:]
+        options = _parse_profile_options(argv)
+        if options.profile is None:
+            return main(*args, **kwargs)
+
+        name = f"{tool}-{time.strftime('%Y%m%d-%H%M%S')}{PROFILE_SUFFIXES[options.profile]}"
+        runner = _run_cprofile if options.profile == 'cprofile' else _run_tracemalloc
+        # Resolved after the run, when the output directory exists
+        return runner(lambda: main(*args, **kwargs), lambda: _profile_dir(options) / name,
+                      options.profile_top)
+
+    return wrapper
+
+
+class _QuietParser(argparse.ArgumentParser):
+    """Parser raising ArgumentError instead of printing usage and exiting"""
+
+    def error(self, message):
+        raise argparse.ArgumentError(None, message)
+
+
+def _parse_profile_options(argv: Sequence[str]) -> argparse.Namespace:
+    """Pick --profile and the output location out of a tool's arguments"""
+    parser = _QuietParser(add_help=False, allow_abbrev=False)
+    add_profile_argument(parser)
+    parser.add_argument('-o', '--output')
+    parser.add_argument('--output-dir')
+    try:
+        options, _ = parser.parse_known_args(list(argv))
+    except argparse.ArgumentError:
+        # Invalid usage; the tool's own parser reports it
+        return argparse.Namespace(profile=None)
+    return options
+
+
+def _profile_dir(options: argparse.Namespace) -> Path:
+    """Directory of the run's output (output files: their parent)"""
+    output = options.output_dir or options.output
+    if output:
+        path = Path(output)
+        directory = path if options.output_dir or path.is_dir() else path.parent
+        if directory.is_dir():
+            return directory
+    return Path.cwd()
+
+
+def _run_cprofile(run: Callable[[], Any], target: Callable[[], Path], top: int) -> Any:
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(run)
+    finally:
+        path = target()
+        profiler.dump_stats(str(path))
+        print(f"\nProfile written to {path}", file=sys.stderr)
+        stats = pstats.Stats(profiler, stream=sys.stderr)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+
+
+def _run_tracemalloc(run: Callable[[], Any], target: Callable[[], Path], top: int) -> Any:
+    import tracemalloc
+
+    tracemalloc.start(25)
+    try:
+        return run()
+    finally:
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        path = target()
+        snapshot.dump(str(path))
+
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        ])
+        print(f"\nAllocation snapshot written to {path}", file=sys.stderr)
+        print(f"Peak traced memory: {peak / 1024 / 1024:.1f} MB", file=sys.stderr)
+        print(f"Top {top} allocation sites still held:", file=sys.stderr)
+        for stat in snapshot.statistics('lineno')[:top]:
+            print(f"  {stat}", file=sys.stderr)
+
+
+def print_stats(metrics: Optional[Dict[str, Any]], file: TextIO = None) -> None:
+    """
+    Print metrics collected by pdftools.core.metrics (to stderr by default)
+
+    Args:
+        metrics: Metrics dict from result.metadata['metrics'] (None = nothing to print)
+        file: Output stream (default: sys.stderr)
+
+    Example:
+        >>> print_stats(result.metadata.get('metrics'))
+        Stats:
+          total        0.412s
+          parse        0.031s    8%
+          ...
+    """
+    if not metrics:
+        return
+    file = file or sys.stderr
+
+    total = metrics.get('total_seconds', 0.0)
+    print("Stats:", file=file)
+    print(f"  {'total':<12} {total:8.3f}s", file=file)
+    for name, seconds in metrics.get('stages', {}).items():
+        share = f"{seconds / total:5.0%}" if total else ''
+        print(f"  {name:<12} {seconds:8.3f}s {share}", file=file)
+    if metrics.get('pages'):
+        rate = f" {metrics['pages'] / total:8.1f} pages/s" if total else ''
+        print(f"  {'pages':<12} {metrics['pages']:8d}{rate}", file=file)
+    print(f"  {'read':<12} {metrics.get('bytes_read', 0) / 1024 / 1024:8.2f} MB", file=file)
+    print(f"  {'written':<12} {metrics.get('bytes_written', 0) / 1024 / 1024:8.2f} MB", file=file)
+    if metrics.get('peak_rss_mb') is not None:
+        print(f"  {'peak RSS':<12} {metrics['peak_rss_mb']:8.1f} MB", file=file)
+
+
 def handle_keyboard_interrupt() -> None:
     """
     Handle Ctrl+C gracefully and exit with code 130
@@ -5,6 +5,14 @@ Core utilities and shared functionality for PDF Tools
 from .exceptions import PDFToolsError, PDFNotFoundError, PDFProcessingError
 from .validators import validate_pdf_path, validate_output_path
 from .utils import normalize_path, ensure_directory_exists
+from .document import open_document, DocumentHandle
+from .backends import get_backend, PDFBackend
+from .metrics import Metrics, collect_metrics, record_metrics
+from .telemetry import MetricsRegistry, enable_telemetry, disable_telemetry
+from .probe import PDFProbe, probe_pdf
+from .content import PageContent, classify_pages
+from .images import iter_page_images
+from .blank import find_blank_pages
 
 __all__ = [
     'PDFToolsError',
@@ -14,4 +22,20 @@ __all__ = [
     'validate_output_path',
     'normalize_path',
     'ensure_directory_exists',
+    'open_document',
+    'DocumentHandle',
+    'get_backend',
+    'PDFBackend',
+    'Metrics',
+    'collect_metrics',
+    'record_metrics',
+    'MetricsRegistry',
+    'enable_telemetry',
+    'disable_telemetry',
+    'PDFProbe',
+    'probe_pdf',
+    'PageContent',
+    'classify_pages',
+    'iter_page_images',
+    'find_blank_pages',
 ]
@@ -0,0 +1,275 @@
+"""
+PDF backends for page counting, text extraction, rendering and splitting
+
+Two implementations are available:
+
+- ``pypdf``: PyPDF2 for parsing/text/splitting, poppler's pdftoppm for
+  rendering (streamed through a pipe, see pdftools.core.raster)
+- ``mupdf``: PyMuPDF (fitz) for everything, in-process and without poppler
+
+The backend is chosen by name (``get_backend('mupdf')``), by the
+``PDFTOOLS_BACKEND`` environment variable or automatically (``auto``:
+MuPDF if PyMuPDF is installed, else PyPDF2). Documents are opened through
+the shared document pool, so one operation parses a file once per backend.
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Type, Union
+import logging
+import os
+
+from PIL import Image
+
+try:
+    import fitz
+    MUPDF_AVAILABLE = True
+except ImportError:
+    fitz = None
+    MUPDF_AVAILABLE = False
+
+from .document import open_document
+from .exceptions import InvalidParameterError, PDFProcessingError
+from .raster import iter_poppler_pages, page_runs
+
+logger = logging.getLogger('pdftools.core.backends')
+
+BACKEND_ENV = 'PDFTOOLS_BACKEND'
+
+PathLike = Union[str, Path]
+
+
+class PDFBackend(ABC):
+    """
+    Interface for PDF backends.
+
+    Page numbers are 1-indexed throughout.
+    """
+
+    name: str = ''
+
+    @abstractmethod
+    def page_count(self, path: PathLike) -> int:
+        """Number of pages in the document"""
+
+    @abstractmethod
+    def extract_text(self, path: PathLike, page_num: int) -> str:
+        """Text of one page"""
+
+    @abstractmethod
+    def page_size(self, path: PathLike, page_num: int) -> Tuple[float, float]:
+        """Page (width, height) in PDF points"""
+
+    @abstractmethod
+    def metadata(self, path: PathLike) -> Dict[str, str]:
+        """Document info (keys like 'Title', 'Author', 'Producer')"""
+
+    @abstractmethod
+    def iter_pages(
+        self,
+        path: PathLike,
+        pages: Optional[List[int]] = None,
+        dpi: int = 200
+    ) -> Iterator[Tuple[int, Image.Image]]:
+        """Render pages (None = all) one at a time as (page number, RGB image)"""
+
+    def render_pages(
+        self,
+        path: PathLike,
+        pages: Optional[List[int]] = None,
+        dpi: int = 200
+    ) -> List[Image.Image]:
+        """Render pages (None = all) to RGB images"""
+        return [image for _, image in self.iter_pages(path, pages, dpi)]
+
+    @abstractmethod
+    def write_pages(
+        self,
+        path: PathLike,
+        pages: List[int],
+        output_path: PathLike
+    ) -> None:
+        """Write the given pages, in order, to a new PDF"""
+
+
+class PyPDFBackend(PDFBackend):
+    """Backend using PyPDF2 and poppler (the original implementation)"""
+
+    name = 'pypdf'
+
+    def page_count(self, path: PathLike) -> int:
+        with open_document(path) as document:
+            return document.page_count
+
+    def extract_text(self, path: PathLike, page_num: int) -> str:
+        with open_document(path) as document:
+            return document.reader.pages[page_num - 1].extract_text()
+
+    def page_size(self, path: PathLike, page_num: int) -> Tuple[float, float]:
+        with open_document(path) as document:
+            mediabox = document.reader.pages[page_num - 1].mediabox
+            return float(mediabox.width), float(mediabox.height)
+
+    def metadata(self, path: PathLike) -> Dict[str, str]:
+        with open_document(path) as document:
+            info = document.reader.metadata or {}
+            return {key.lstrip('/'): str(value) for key, value in info.items()}
+
+    def iter_pages(
+        self,
+        path: PathLike,
+        pages: Optional[List[int]] = None,
+        dpi: int = 200
+    ) -> Iterator[Tuple[int, Image.Image]]:
+        return iter_poppler_pages(path, pages, dpi=dpi)
+
+    def write_pages(
+        self,
+        path: PathLike,
+        pages: List[int],
+        output_path: PathLike
+    ) -> None:
+        from PyPDF2 import PdfWriter
+
+        with open_document(path) as document:
+            writer = PdfWriter()
+            for page_num in pages:
+                writer.add_page(document.reader.pages[page_num - 1])
+
+            with open(output_path, 'wb') as output_file:
+                writer.write(output_file)
+
+
+class MuPDFBackend(PDFBackend):
+    """Backend using PyMuPDF (fitz); renders in-process without poppler"""
+
+    name = 'mupdf'
+
+    # fitz metadata keys -> PDF Info dictionary names
+    METADATA_KEYS = {
+        'title': 'Title',
+        'author': 'Author',
+        'subject': 'Subject',
+        'keywords': 'Keywords',
+        'creator': 'Creator',
+        'producer': 'Producer',
+        'creationDate': 'CreationDate',
+        'modDate': 'ModDate',
+    }
+
+    def __init__(self):
+        if not MUPDF_AVAILABLE:
+            raise ImportError(
+                "PyMuPDF is not installed. Install it with: pip install PyMuPDF"
+            )
+
+    def _document(self, handle):
+        """MuPDF document cached on the shared document handle"""
+        return handle.get_extra('mupdf', lambda path: fitz.open(str(path)))
+
+    def page_count(self, path: PathLike) -> int:
+        with open_document(path) as handle:
+            return self._document(handle).page_count
+
+    def extract_text(self, path: PathLike, page_num: int) -> str:
+        with open_document(path) as handle:
+            return self._document(handle)[page_num - 1].get_text()
+
+    def page_size(self, path: PathLike, page_num: int) -> Tuple[float, float]:
+        with open_document(path) as handle:
+            rect = self._document(handle)[page_num - 1].rect
+            return float(rect.width), float(rect.height)
+
+    def metadata(self, path: PathLike) -> Dict[str, str]:
+        with open_document(path) as handle:
+            info = self._document(handle).metadata or {}
+            return {
+                self.METADATA_KEYS[key]: value
+                for key, value in info.items()
+                if key in self.METADATA_KEYS and value
+            }
+
+    def iter_pages(
+        self,
+        path: PathLike,
+        pages: Optional[List[int]] = None,
+        dpi: int = 200
+    ) -> Iterator[Tuple[int, Image.Image]]:
+        with open_document(path) as handle:
+            document = self._document(handle)
+            if not pages:
+                pages = list(range(1, document.page_count + 1))
+
+            for page_num in pages:
+                pixmap = document[page_num - 1].get_pixmap(dpi=dpi, alpha=False)
+                yield page_num, Image.frombytes(
+                    'RGB', (pixmap.width, pixmap.height), pixmap.samples
+                )
+
+    def write_pages(
+        self,
+        path: PathLike,
+        pages: List[int],
+        output_path: PathLike
+    ) -> None:
+        with open_document(path) as handle:
+            source = self._document(handle)
+            output = fitz.open()
+            try:
+                for start, end in page_runs(pages):
+                    output.insert_pdf(source, from_page=start - 1, to_page=end - 1)
+                output.save(str(output_path), garbage=1, deflate=True)
+            finally:
+                output.close()
+
+
+_BACKENDS: Dict[str, Type[PDFBackend]] = {
+    PyPDFBackend.name: PyPDFBackend,
+    MuPDFBackend.name: MuPDFBackend,
+}
+
+
+def list_backends() -> List[str]:
+    """
+    Get names of selectable backends.
+
+    Returns:
+        List[str]: 'auto' followed by all backend names
+    """
+    return ['auto', *_BACKENDS]
+
+
+def get_backend(name: Optional[str] = None) -> PDFBackend:
+    """
+    Get a PDF backend by name.
+
+    Args:
+        name: 'pypdf', 'mupdf' or 'auto' (default: $PDFTOOLS_BACKEND or 'auto')
+
+    Returns:
+        PDFBackend: Backend instance
+
+    Raises:
+        InvalidParameterError: If the backend name is unknown
+        PDFProcessingError: If the requested backend is not installed
+    """
+    if isinstance(name, PDFBackend):
+        return name
+
+    name = (name or os.environ.get(BACKEND_ENV) or 'auto').lower()
+
+    if name == 'auto':
+        name = MuPDFBackend.name if MUPDF_AVAILABLE else PyPDFBackend.name
+
+    backend_class = _BACKENDS.get(name)
+    if backend_class is None:
+        raise InvalidParameterError(
+            "backend",
+            name,
+            f"Unknown PDF backend. Valid options: {', '.join(list_backends())}"
+        )
+
+    try:
+        return backend_class()
+    except ImportError as e:
+        raise PDFProcessingError(str(e)) from e
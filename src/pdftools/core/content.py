@@ -0,0 +1,332 @@
+"""
+Per-page content classification from the page content streams
+
+Deciding whether a page needs OCR does not require extracting its text:
+it is enough to know whether the page shows text at all. The classifier
+decodes each page's content streams (and the form XObjects they draw) and
+scans them for text-showing operators (``Tj``, ``TJ``, ``'``, ``"``) and
+font selections (``Tf``), without mapping glyphs to Unicode. Pages without
+text are additionally checked for being a single image covering the page,
+the typical scanned page.
+
+Like the probe, the classifier reads objects straight from the file
+through the cross-reference table, so no full parse is needed; encrypted
+documents and streams with unsupported filters (e.g. LZW) are read through
+the shared PyPDF2 document instead:
+
+    >>> [page.page_number for page in classify_pages(Path("mixed.pdf")) if page.needs_ocr]
+    [3, 4, 7]
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Set, Tuple, Union
+import logging
+import re
+
+from .document import open_document
+from .exceptions import PDFCorruptedError
+from .probe import _ProbeError, _Ref, _Stream, _decode_stream, _open_xref_document
+
+logger = logging.getLogger('pdftools.core.content')
+
+# An image covering this share of the page counts as a full-page image
+FULL_PAGE_COVERAGE = 0.9
+
+# Nesting limit for form XObjects (guards against self-referencing forms)
+MAX_FORM_DEPTH = 8
+
+Matrix = Tuple[float, float, float, float, float, float]
+IDENTITY: Matrix = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+# A text-showing operator follows a string or an array of strings
+_TEXT_SHOW = re.compile(rb'[)>\]]\s*(?:Tj|TJ|\'|")')
+_FONT = re.compile(rb'/([^\s/\[\]()<>{}%]+)\s+[-+.\d]+\s+Tf(?![^\s/\[(<%])')
+# Path painting and shading operators (anything else drawn on a page)
+_PAINT = re.compile(rb'(?<![^\s\]>)])(?:[fFSsBb]\*?|sh)(?![^\s/\[(<%])')
+_GRAPHICS = re.compile(
+    rb'(?<![^\s\]>)])'
+    rb'(?:(?P<cm>(?:[-+.\d]+\s+){6})cm'
+    rb'|/(?P<name>[^\s/\[\]()<>{}%]+)\s+Do'
+    rb'|(?P<op>q|Q|BI))'
+    rb'(?![^\s/\[(<%])'
+)
+
+# (subtype, matrix, content loader, resources, stream object) of an XObject
+XObject = Tuple[str, Matrix, Callable[[], bytes], Any, Any]
+XObjectLookup = Callable[[Any, str], Optional[XObject]]
+
+# (page coverage, CTM, image stream object or None for inline images)
+DrawnImage = Tuple[float, Matrix, Any]
+
+# (page number, content, resources, page box, rotation) of a page
+RawPage = Tuple[int, bytes, Any, List[float], int]
+
+
+@dataclass
+class PageContent:
+    """
+    What a page draws, as far as text recognition is concerned.
+
+    Attributes:
+        page_number: Page number (1-indexed)
+        text_operators: Number of text-showing operators (incl. form XObjects)
+        fonts: Names of the font resources selected on the page
+        image_only: The page shows no text, only a single image covering it
+        images: Number of images drawn (only counted on pages without text)
+        paint_operators: Number of path painting and shading operators
+    """
+    page_number: int
+    text_operators: int = 0
+    fonts: Set[str] = field(default_factory=set)
+    image_only: bool = False
+    images: int = 0
+    paint_operators: int = 0
+
+    @property
+    def has_text(self) -> bool:
+        """Whether the page has a text layer"""
+        return self.text_operators > 0
+
+    @property
+    def needs_ocr(self) -> bool:
+        """Whether text can only be obtained by OCR"""
+        return not self.has_text
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether the page draws nothing at all"""
+        return not self.has_text and not self.images and not self.paint_operators
+
+
+def classify_pages(
+    path: Union[str, Path],
+    pages: Optional[List[int]] = None
+) -> List[PageContent]:
+    """
+    Classify pages by scanning their content streams.
+
+    Args:
+        path: Path to PDF file
+        pages: Pages to classify (1-indexed, None = all pages)
+
+    Returns:
+        List[PageContent]: One entry per page, in page order
+                           (pages beyond the end of the document are skipped)
+
+    Raises:
+        PDFCorruptedError: If the document cannot be read
+    """
+    path = Path(path)
+    wanted = sorted(set(pages)) if pages else None
+
+    try:
+        with _open_xref_document(path) as document:
+            if document.encrypted:
+                raise _ProbeError("encrypted streams")
+            lookup = _RawLookup(document)
+            return [
+                _scan_page(page, lookup)[0]
+                for page in _iter_raw_pages(document, wanted)
+            ]
+    except _ProbeError as e:
+        logger.debug(f"Reading {path} through PyPDF2 for classification: {e}")
+
+    try:
+        with open_document(path) as handle:
+            return [
+                _scan_page(page, _pypdf_lookup)[0]
+                for page in _iter_pypdf_pages(handle.reader, wanted)
+            ]
+    except Exception as e:
+        raise PDFCorruptedError(str(path), f"Cannot classify pages: {e}")
+
+
+def _scan_page(raw: RawPage, lookup: XObjectLookup) -> Tuple[PageContent, List[DrawnImage]]:
+    """Classify a page; also returns the images drawn on pages without text"""
+    number, content, resources, box, _ = raw
+    page = PageContent(page_number=number)
+    images: List[DrawnImage] = []
+    _scan(page, images, content, resources, lookup, IDENTITY, box, 0)
+    page.images = len(images)
+    page.image_only = not page.has_text and len(images) == 1 and images[0][0] >= FULL_PAGE_COVERAGE
+    return page, images
+
+
+def _scan(
+    page: PageContent,
+    images: List[DrawnImage],
+    content: bytes,
+    resources: Any,
+    lookup: XObjectLookup,
+    ctm: Matrix,
+    box: List[float],
+    depth: int
+) -> None:
+    """Count text operators and fonts; on pages without text, find image draws"""
+    page.text_operators += len(_TEXT_SHOW.findall(content))
+    page.fonts.update(name.decode('latin-1') for name in _FONT.findall(content))
+    page.paint_operators += len(_PAINT.findall(content))
+
+    stack: List[Matrix] = []
+    for match in _GRAPHICS.finditer(content):
+        if page.has_text:
+            # Image layout only matters for pages without text
+            return
+        if match.group('cm'):
+            ctm = _multiply(tuple(float(v) for v in match.group('cm').split()), ctm)
+        elif match.group('name'):
+            xobject = lookup(resources, match.group('name').decode('latin-1'))
+            if xobject is None:
+                continue
+            subtype, matrix, load, form_resources, stream = xobject
+            if subtype == 'Image':
+                images.append((_coverage(ctm, box), ctm, stream))
+            elif subtype == 'Form' and depth < MAX_FORM_DEPTH:
+                _scan(page, images, load(), form_resources or resources, lookup,
+                      _multiply(matrix, ctm), box, depth + 1)
+        elif match.group('op') == b'q':
+            stack.append(ctm)
+        elif match.group('op') == b'Q':
+            ctm = stack.pop() if stack else ctm
+        else:
+            # Inline image, drawn into the unit square like an image XObject
+            images.append((_coverage(ctm, box), ctm, None))
+
+
+def _multiply(m: Matrix, n: Matrix) -> Matrix:
+    """Matrix product m x n (m applied first)"""
+    a, b, c, d, e, f = m
+    A, B, C, D, E, F = n
+    return (
+        a * A + b * C, a * B + b * D,
+        c * A + d * C, c * B + d * D,
+        e * A + f * C + E, e * B + f * D + F,
+    )
+
+
+def _coverage(ctm: Matrix, box: List[float]) -> float:
+    """Share of the page box covered by the unit square under ctm"""
+    a, b, c, d, e, f = ctm
+    xs = (e, a + e, c + e, a + c + e)
+    ys = (f, b + f, d + f, b + d + f)
+    x0, y0, x1, y1 = min(box[0], box[2]), min(box[1], box[3]), max(box[0], box[2]), max(box[1], box[3])
+    area = (x1 - x0) * (y1 - y0)
+    if area <= 0:
+        return 0.0
+    width = min(max(xs), x1) - max(min(xs), x0)
+    height = min(max(ys), y1) - max(min(ys), y0)
+    return max(width, 0.0) * max(height, 0.0) / area
+
+
+def _selected(wanted: Optional[List[int]], first: int, count: int) -> bool:
+    """Whether a page in first..first+count-1 is wanted"""
+    if wanted is None:
+        return True
+    index = bisect_left(wanted, first)
+    return index < len(wanted) and wanted[index] < first + count
+
+
+def _iter_raw_pages(document, wanted: Optional[List[int]]) -> Iterator[RawPage]:
+    """Walk the page tree in document order, skipping subtrees without wanted pages"""
+    resolve = document.resolve
+    catalog = resolve(document.trailer.get('Root'))
+    if not isinstance(catalog, dict):
+        raise _ProbeError("no document catalog")
+
+    stack: List[Tuple[Any, dict]] = [(catalog.get('Pages'), {})]
+    seen = set()
+    number = 0
+    while stack:
+        ref, inherited = stack.pop()
+        if isinstance(ref, _Ref):
+            if ref in seen:
+                raise _ProbeError("page tree cycle")
+            seen.add(ref)
+        node = resolve(ref)
+        if not isinstance(node, dict):
+            raise _ProbeError("malformed page tree")
+
+        kids = resolve(node.get('Kids'))
+        if isinstance(kids, list):
+            count = resolve(node.get('Count'))
+            if isinstance(count, int) and not _selected(wanted, number + 1, count):
+                number += count
+                continue
+            inherited = dict(inherited)
+            for key in ('Resources', 'MediaBox', 'CropBox', 'Rotate'):
+                if key in node:
+                    inherited[key] = node[key]
+            stack.extend((kid, inherited) for kid in reversed(kids))
+            continue
+
+        number += 1
+        if not _selected(wanted, number, 1):
+            continue
+        attrs = dict(inherited, **node)
+        box = resolve(attrs.get('CropBox') or attrs.get('MediaBox'))
+        box = [float(resolve(v)) for v in box] if isinstance(box, list) and len(box) == 4 else [0, 0, 612, 792]
+        rotate = resolve(attrs.get('Rotate'))
+        yield (number, _raw_contents(document, attrs.get('Contents')), attrs.get('Resources'), box,
+               rotate % 360 if isinstance(rotate, int) else 0)
+
+
+def _raw_contents(document, contents: Any) -> bytes:
+    contents = document.resolve(contents)
+    if contents is None:
+        return b''
+    if isinstance(contents, _Stream):
+        return _decode_stream(contents)
+    return b'\n'.join(_decode_stream(document.resolve(part)) for part in contents)
+
+
+class _RawLookup:
+    """XObject lookup on the raw document"""
+
+    def __init__(self, document):
+        self.document = document
+
+    def __call__(self, resources: Any, name: str) -> Optional[XObject]:
+        resolve = self.document.resolve
+        resources = resolve(resources)
+        xobjects = resolve(resources.get('XObject')) if isinstance(resources, dict) else None
+        if not isinstance(xobjects, dict):
+            return None
+        stream = resolve(xobjects.get(name))
+        if not isinstance(stream, _Stream):
+            return None
+        matrix = resolve(stream.attrs.get('Matrix'))
+        matrix = tuple(float(resolve(v)) for v in matrix) if isinstance(matrix, list) and len(matrix) == 6 else IDENTITY
+        return (stream.attrs.get('Subtype'), matrix, lambda: _decode_stream(stream),
+                stream.attrs.get('Resources'), stream)
+
+
+def _iter_pypdf_pages(reader, wanted: Optional[List[int]]) -> Iterator[RawPage]:
+    numbers = wanted if wanted is not None else range(1, len(reader.pages) + 1)
+    for number in numbers:
+        if number > len(reader.pages):
+            break
+        page = reader.pages[number - 1]
+        contents = page.get_contents()
+        box = page.cropbox
+        yield (
+            number,
+            contents.get_data() if contents is not None else b'',
+            page.get('/Resources'),
+            [float(box.left), float(box.bottom), float(box.right), float(box.top)],
+            page.rotation % 360
+        )
+
+
+def _pypdf_lookup(resources: Any, name: str) -> Optional[XObject]:
+    resources = resources.get_object() if resources is not None else None
+    xobjects = resources.get('/XObject') if resources is not None else None
+    xobjects = xobjects.get_object() if xobjects is not None else None
+    if xobjects is None or f'/{name}' not in xobjects:
+        return None
+    xobject = xobjects[f'/{name}'].get_object()
+    matrix = xobject.get('/Matrix')
+    matrix = tuple(float(v) for v in matrix) if matrix is not None and len(matrix) == 6 else IDENTITY
+    return (str(xobject.get('/Subtype', '')).lstrip('/'), matrix, xobject.get_data,
+            xobject.get('/Resources'), xobject)
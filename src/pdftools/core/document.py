@@ -0,0 +1,196 @@
+"""
+Shared, reference-counted PDF document handles
+
+Validators, extractors, splitters and mergers often need the same parsed
+document within one operation. Instead of each of them creating its own
+PdfReader, they ask this module for a handle. Handles are cached while at
+least one user holds them, keyed by resolved path, modification time and
+size, so a file that changes on disk is parsed again.
+
+Handles are not thread-safe: a PdfReader reads from a single seekable
+stream, and MuPDF documents must not be used from several threads at
+once. The pool therefore keeps one handle per file *and thread*; threads
+working on the same file each parse it once (from the shared memory
+mapping, see pdf_input). Do not pass handles or their readers to other
+threads.
+
+Typical use wraps a whole operation, so that nested calls reuse the parse:
+
+    >>> with open_document(Path("report.pdf")) as doc:
+    ...     check_text_layer(doc.path)   # reuses doc.reader
+    ...     doc.page_count
+    12
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+import logging
+import os
+import threading
+
+from PyPDF2 import PdfReader
+
+from .metrics import add_bytes_read, stage
+from .pdf_input import open_pdf_input
+
+logger = logging.getLogger('pdftools.core.document')
+
+DocumentKey = Tuple[str, int, int]
+
+
+class DocumentHandle:
+    """
+    Cached handle to a PDF document.
+
+    The PdfReader is created lazily on first access and shared by all
+    holders of the handle, which all run in the thread that acquired it.
+    A reader stays usable after its handle has been released; it is only
+    dropped from the cache.
+
+    Attributes:
+        path: Path to the PDF file
+        key: Cache key (resolved path, mtime in ns, size in bytes)
+        thread: Identifier of the thread owning the handle
+        refcount: Number of current holders
+    """
+
+    def __init__(self, path: Path, key: DocumentKey, thread: Optional[int] = None):
+        self.path = path
+        self.key = key
+        self.thread = threading.get_ident() if thread is None else thread
+        self.refcount = 0
+        self._reader: Optional[PdfReader] = None
+        self._extras: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def reader(self) -> PdfReader:
+        """Parsed document (created on first access)"""
+        with self._lock:
+            if self._reader is None:
+                logger.debug(f"Parsing PDF: {self.path}")
+                with stage('parse'):
+                    self._reader = PdfReader(open_pdf_input(self.path))
+                add_bytes_read(self.size)
+            return self._reader
+
+    def get_extra(self, name: str, factory: Callable[[Path], Any]) -> Any:
+        """
+        Get another representation of the document, created once per handle.
+
+        Used by alternative PDF backends (e.g., a MuPDF document) so they
+        share the handle's caching and lifetime.
+
+        Args:
+            name: Cache slot name (e.g., 'mupdf')
+            factory: Callable creating the object from the document path
+
+        Returns:
+            The cached object
+        """
+        with self._lock:
+            if name not in self._extras:
+                with stage('parse'):
+                    self._extras[name] = factory(self.path)
+                if self._reader is None:
+                    add_bytes_read(self.size)
+            return self._extras[name]
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages in the document"""
+        return len(self.reader.pages)
+
+    @property
+    def size(self) -> int:
+        """File size in bytes"""
+        return self.key[2]
+
+    def __repr__(self) -> str:
+        return f"DocumentHandle({str(self.path)!r}, refcount={self.refcount})"
+
+
+# Handles by (document key, thread identifier)
+_handles: Dict[Tuple[DocumentKey, int], DocumentHandle] = {}
+_pool_lock = threading.Lock()
+
+
+def _document_key(path: Path) -> DocumentKey:
+    """Build the cache key for a file"""
+    resolved = path.resolve()
+    stat = os.stat(resolved)
+    return str(resolved), stat.st_mtime_ns, stat.st_size
+
+
+def acquire_document(path: Union[str, Path]) -> DocumentHandle:
+    """
+    Get a handle for a PDF file, reusing a cached one if the file is unchanged.
+
+    Handles are shared within the calling thread only (see module docs).
+
+    Every call must be paired with release_document(); prefer open_document().
+
+    Args:
+        path: Path to PDF file
+
+    Returns:
+        DocumentHandle: Shared document handle
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    path = Path(path)
+    key = _document_key(path)
+    pool_key = (key, threading.get_ident())
+
+    with _pool_lock:
+        handle = _handles.get(pool_key)
+        if handle is None:
+            handle = DocumentHandle(path, key, pool_key[1])
+            _handles[pool_key] = handle
+        handle.refcount += 1
+        return handle
+
+
+def release_document(handle: DocumentHandle) -> None:
+    """
+    Release a handle obtained from acquire_document().
+
+    The handle is removed from the cache when its last holder releases it.
+
+    Args:
+        handle: Document handle
+    """
+    with _pool_lock:
+        handle.refcount -= 1
+        pool_key = (handle.key, handle.thread)
+        if handle.refcount <= 0 and _handles.get(pool_key) is handle:
+            del _handles[pool_key]
+
+
+@contextmanager
+def open_document(path: Union[str, Path]) -> Iterator[DocumentHandle]:
+    """
+    Context manager yielding a shared document handle.
+
+    Args:
+        path: Path to PDF file
+
+    Yields:
+        DocumentHandle: Shared document handle
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    handle = acquire_document(path)
+    try:
+        yield handle
+    finally:
+        release_document(handle)
+
+
+def open_documents_count() -> int:
+    """Number of documents currently cached (for diagnostics and tests)"""
+    with _pool_lock:
+        return len(_handles)
@@ -0,0 +1,296 @@
+"""
+Direct decoding of embedded scan images
+
+A scanned page is usually a single JPEG (DCTDecode) or fax (CCITTFaxDecode)
+image stretched over the page. Rasterizing such a page decodes the image
+and then resamples it onto a new canvas; decoding the embedded image
+directly gives the same picture without the renderer, and JPEG images can
+be decoded at 1/2, 1/4 or 1/8 of their size (draft mode) when only a small
+result is needed, e.g. for thumbnails.
+
+``iter_page_images`` yields page images like ``PDFBackend.iter_pages``:
+pages the content classifier finds to be a single full-page image in a
+supported format are decoded directly, all other pages (and pages whose
+image cannot be decoded) are rendered by the backend:
+
+    >>> for page_num, image in iter_page_images(Path("scan.pdf"), dpi=300):
+    ...     ocr(image)
+"""
+
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+import logging
+import math
+import struct
+
+from PIL import Image
+
+from .backends import PDFBackend, get_backend
+from .content import Matrix, _RawLookup, _iter_raw_pages, _scan_page
+from .probe import _ProbeError, _Stream, _decode_stream, _open_xref_document
+
+logger = logging.getLogger('pdftools.core.images')
+
+# Image filters decoded without the renderer
+EMBEDDED_FILTERS = ('DCTDecode', 'CCITTFaxDecode')
+
+_COLOR_SPACES = ('DeviceGray', 'DeviceRGB', 'DeviceCMYK')
+
+# Page rotation (clockwise, as in /Rotate) -> PIL transpose
+_ROTATIONS = {
+    90: Image.Transpose.ROTATE_270,
+    180: Image.Transpose.ROTATE_180,
+    270: Image.Transpose.ROTATE_90,
+}
+
+
+class _EmbeddedImage(NamedTuple):
+    """Where a page's image is stored and how it is placed on the page"""
+    filters: List[str]
+    params: List[Dict[str, Any]]
+    start: int
+    end: int
+    width: int
+    height: int
+    inverted: bool
+    ctm: Matrix
+    rotate: int
+
+
+def iter_page_images(
+    path: Union[str, Path],
+    pages: Optional[List[int]] = None,
+    dpi: int = 200,
+    backend: Optional[Union[str, PDFBackend]] = None,
+    size_hint: Optional[Tuple[int, int]] = None
+) -> Iterator[Tuple[int, Image.Image]]:
+    """
+    Yield page images, decoding embedded scan images where possible.
+
+    Directly decoded images are scaled to the size the image has on the
+    page at the given resolution, so they match rendered pages.
+
+    Args:
+        path: Path to PDF file
+        pages: Pages in this order (1-indexed, None = all pages)
+        dpi: Resolution of the images
+        backend: PDF backend rendering the remaining pages (default: auto)
+        size_hint: (width, height) box the caller downscales the images to
+                   fit; images are then decoded at the smallest size that
+                   still covers the box instead of at the resolution
+
+    Yields:
+        Tuple[int, Image.Image]: Page number and RGB image
+
+    Raises:
+        PDFProcessingError: If rendering fails
+    """
+    path = Path(path)
+    backend = get_backend(backend)
+
+    try:
+        with _open_xref_document(path) as document:
+            numbers, embedded = _find_embedded_images(document, pages)
+    except _ProbeError as e:
+        logger.debug(f"Rendering all pages of {path}: {e}")
+        yield from backend.iter_pages(path, pages, dpi=dpi)
+        return
+
+    if not embedded:
+        yield from backend.iter_pages(path, pages, dpi=dpi)
+        return
+
+    logger.debug(f"Decoding embedded images of {len(embedded)} page(s) of {path}")
+    order = pages if pages is not None else numbers
+
+    # Runs of pages without a decodable image go to the renderer in one call
+    pending: List[int] = []
+    with open(path, 'rb') as f:
+        for page_num in order:
+            image = _decode(f, embedded[page_num], dpi, size_hint) if page_num in embedded else None
+            if image is None:
+                pending.append(page_num)
+                continue
+            if pending:
+                yield from backend.iter_pages(path, pending, dpi=dpi)
+                pending = []
+            yield page_num, image
+    if pending:
+        yield from backend.iter_pages(path, pending, dpi=dpi)
+
+
+def _find_embedded_images(
+    document,
+    pages: Optional[List[int]]
+) -> Tuple[List[int], Dict[int, _EmbeddedImage]]:
+    """Page numbers walked and the pages showing a single decodable image"""
+    if document.encrypted:
+        raise _ProbeError("encrypted streams")
+
+    lookup = _RawLookup(document)
+    numbers: List[int] = []
+    embedded: Dict[int, _EmbeddedImage] = {}
+    for raw in _iter_raw_pages(document, sorted(set(pages)) if pages else None):
+        numbers.append(raw[0])
+        try:
+            page, images = _scan_page(raw, lookup)
+        except _ProbeError as e:
+            logger.debug(f"Page {raw[0]}: {e}")
+            continue
+        if page.image_only and isinstance(images[0][2], _Stream):
+            image = _embedded_image(document, images[0][2], images[0][1], raw[4])
+            if image is not None:
+                embedded[raw[0]] = image
+    return numbers, embedded
+
+
+def _embedded_image(document, stream: _Stream, ctm: Matrix, rotate: int) -> Optional[_EmbeddedImage]:
+    """Describe an image XObject, None if it must be rendered"""
+    resolve = document.resolve
+    attrs = {key: resolve(value) for key, value in stream.attrs.items()}
+
+    filters = attrs.get('Filter')
+    filters = [resolve(name) for name in filters] if isinstance(filters, list) else [filters]
+    params = attrs.get('DecodeParms')
+    params = [resolve(param) for param in params] if isinstance(params, list) else [params] * len(filters)
+    params = [param if isinstance(param, dict) else {} for param in params]
+    params = [{key: resolve(value) for key, value in param.items()} for param in params]
+
+    # Only axis-aligned placements; masks and color mapping need the renderer
+    a, b, c, d, _, _ = ctm
+    if b or c or not a or not d or rotate not in (0, 90, 180, 270):
+        return None
+    if attrs.get('ImageMask') or 'SMask' in attrs or 'Mask' in attrs:
+        return None
+    if filters[-1] not in EMBEDDED_FILTERS or len(params) != len(filters):
+        return None
+
+    width, height = attrs.get('Width'), attrs.get('Height')
+    if not isinstance(width, int) or not isinstance(height, int) or width <= 0 or height <= 0:
+        return None
+
+    color_space = attrs.get('ColorSpace')
+    if isinstance(color_space, list) and len(color_space) == 2 and color_space[0] == 'ICCBased':
+        icc = resolve(color_space[1])
+        color_space = {1: 'DeviceGray', 3: 'DeviceRGB', 4: 'DeviceCMYK'}.get(
+            resolve(icc.attrs.get('N')) if isinstance(icc, _Stream) else None
+        )
+    if color_space not in _COLOR_SPACES:
+        return None
+
+    decode = attrs.get('Decode')
+    inverted = decode == [1, 0]
+    if filters[-1] == 'DCTDecode':
+        if decode is not None:
+            return None
+    elif color_space != 'DeviceGray' or attrs.get('BitsPerComponent') != 1:
+        return None
+    elif decode not in (None, [0, 1], [1, 0]):
+        return None
+
+    start, end = stream.start, stream.end
+    return _EmbeddedImage(filters, params, start, end, width, height, inverted, ctm, rotate)
+
+
+def _decode(
+    f,
+    embedded: _EmbeddedImage,
+    dpi: int,
+    size_hint: Optional[Tuple[int, int]]
+) -> Optional[Image.Image]:
+    """Decode, orient and scale a page's image, None if that fails"""
+    f.seek(embedded.start)
+    data = f.read(embedded.end - embedded.start)
+    try:
+        if len(embedded.filters) > 1:
+            leading = {'Filter': embedded.filters[:-1], 'DecodeParms': embedded.params[:-1]}
+            data = _decode_stream(_Stream(leading, data, 0, len(data)))
+
+        a, _, _, d, _, _ = embedded.ctm
+        # Size of the image on the (rotated) page at the requested resolution
+        target = (round(abs(a) * dpi / 72), round(abs(d) * dpi / 72))
+        if embedded.rotate in (90, 270):
+            target = target[::-1]
+
+        if embedded.filters[-1] == 'DCTDecode':
+            image = Image.open(BytesIO(data))
+            draft = _scale(image.size, embedded.rotate, target, size_hint)
+            if draft < 1:
+                image.draft('RGB', (math.ceil(image.width * draft), math.ceil(image.height * draft)))
+        else:
+            image = Image.open(BytesIO(_ccitt_tiff(data, embedded)))
+        image.load()
+    except Exception as e:
+        logger.debug(f"Cannot decode embedded image, rendering instead: {e}")
+        return None
+
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+
+    # Image rows run top to bottom; flip where the placement mirrors them
+    if a < 0:
+        image = image.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+    if d < 0:
+        image = image.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
+    if embedded.rotate:
+        image = image.transpose(_ROTATIONS[embedded.rotate])
+
+    if size_hint is None and image.size != target and min(target) > 0:
+        image = image.resize(target, Image.Resampling.LANCZOS)
+    return image
+
+
+def _scale(
+    size: Tuple[int, int],
+    rotate: int,
+    target: Tuple[int, int],
+    size_hint: Optional[Tuple[int, int]]
+) -> float:
+    """Smallest scale of the decoded image still covering the output"""
+    width, height = size[::-1] if rotate in (90, 270) else size
+    if size_hint is not None:
+        return min(size_hint[0] / width, size_hint[1] / height)
+    return max(target[0] / width, target[1] / height)
+
+
+def _ccitt_tiff(data: bytes, embedded: _EmbeddedImage) -> bytes:
+    """Wrap CCITT fax data in a single-strip TIFF"""
+    params = embedded.params[-1]
+    k = params.get('K', 0)
+    if k < 0:
+        compression, options = 4, None  # Group 4
+    else:
+        compression, options = 3, 1 if k > 0 else 0  # Group 3, 2D or 1D
+    if params.get('EncodedByteAlign'):
+        if options is None:
+            raise _ProbeError("byte-aligned Group 4 data")
+        options |= 4
+
+    width = params.get('Columns', 1728)
+    height = params.get('Rows') or embedded.height
+    # The decoder writes black as 1 (WhiteIsZero); PDF's BlackIs1 and an
+    # inverted Decode array each swap black and white
+    photometric = int(bool(params.get('BlackIs1')) != embedded.inverted)
+
+    tags = [
+        (256, 4, width),           # ImageWidth
+        (257, 4, height),          # ImageLength
+        (258, 3, 1),               # BitsPerSample
+        (259, 3, compression),     # Compression
+        (262, 3, photometric),     # PhotometricInterpretation
+        (273, 4, 0),               # StripOffsets (patched below)
+        (277, 3, 1),               # SamplesPerPixel
+        (278, 4, height),          # RowsPerStrip
+        (279, 4, len(data)),       # StripByteCounts
+    ]
+    if options is not None:
+        tags.append((292, 4, options))  # T4Options
+
+    header_size = 8 + 2 + 12 * len(tags) + 4
+    ifd = struct.pack('<H', len(tags))
+    for tag, kind, value in tags:
+        value = header_size if tag == 273 else value
+        # SHORT values are left-justified in the 4-byte value field
+        ifd += struct.pack('<HHIHH' if kind == 3 else '<HHII', tag, kind, 1, value, *([0] if kind == 3 else []))
+    return b'II*\x00' + struct.pack('<I', 8) + ifd + struct.pack('<I', 0) + data
@@ -0,0 +1,353 @@
+"""
+Lightweight per-stage timing for PDF operations
+
+Tool entry points are wrapped with ``record_metrics``, which collects the
+time spent in named stages (validate, parse, render, recognize, encode,
+write, ...), bytes read and written and the process' peak memory, and
+stores them in ``result.metadata['metrics']``.
+
+Code below the entry points records into the active collector through the
+module-level helpers, which do nothing when no collector is active:
+
+    >>> with stage('render'):
+    ...     images = backend.render_pages(path, pages)
+    >>> record_output(output_path)
+
+Stage times are exclusive: time spent in a nested stage (e.g. a lazy
+'parse' while writing) is only counted for the nested stage, so the stages
+add up to (at most) the total time. The collector is bound to the current
+context; work handed to other threads or processes is not recorded.
+
+When an observer is installed (see ``core.telemetry``), ``record_metrics``
+also hands every finished operation to it; without one the only cost is a
+single ``None`` check per operation.
+"""
+
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar, Union
+import logging
+import sys
+import threading
+import time
+
+T = TypeVar('T')
+
+
+class Metrics:
+    """
+    Stage timings and I/O counters of one operation.
+
+    Attributes:
+        stages: Exclusive seconds per stage name, in first-use order
+        bytes_read: Bytes of input documents read
+        bytes_written: Bytes of output files written
+        pages: Pages processed
+        error: Class name of the exception that failed the operation, if any
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.pages = 0
+        self.error: Optional[str] = None
+        self._started = time.perf_counter()
+        self._finished: Optional[float] = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Time a block as the given stage (accumulates over repeated use).
+
+        Args:
+            name: Stage name (e.g., 'parse', 'render', 'write')
+        """
+        stack: List[List[float]] = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        nested = [0.0]
+        stack.append(nested)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1][0] += elapsed
+            self.add_time(name, elapsed - nested[0])
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """Add seconds to a stage"""
+        with self._lock:
+            self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def timed_iter(self, iterable: Iterable[T], name: str) -> Iterator[T]:
+        """
+        Iterate, timing only the production of each item as a stage.
+
+        Used for streaming producers (e.g. page rendering), whose consumers
+        run between items and must not be counted.
+        """
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def add_bytes_read(self, count: int) -> None:
+        """Count bytes of input read"""
+        with self._lock:
+            self.bytes_read += count
+
+    def add_bytes_written(self, count: int) -> None:
+        """Count bytes of output written"""
+        with self._lock:
+            self.bytes_written += count
+
+    def add_pages(self, count: int) -> None:
+        """Count pages processed"""
+        with self._lock:
+            self.pages += count
+
+    def finish(self) -> None:
+        """Stop the total timer (called when collection ends)"""
+        if self._finished is None:
+            self._finished = time.perf_counter()
+
+    @property
+    def total_seconds(self) -> float:
+        end = self._finished if self._finished is not None else time.perf_counter()
+        return end - self._started
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializable summary.
+
+        Returns:
+            dict: total_seconds, stages (seconds per stage), bytes_read,
+                  bytes_written, pages, error (exception class name or None)
+                  and peak_rss_mb (None if unavailable)
+        """
+        with self._lock:
+            return {
+                'total_seconds': round(self.total_seconds, 6),
+                'stages': {name: round(seconds, 6) for name, seconds in self.stages.items()},
+                'bytes_read': self.bytes_read,
+                'bytes_written': self.bytes_written,
+                'pages': self.pages,
+                'error': self.error,
+                'peak_rss_mb': peak_rss_mb(),
+            }
+
+
+_active: ContextVar[Optional[Metrics]] = ContextVar('pdftools_metrics', default=None)
+
+# Called as observer(tool, result, metrics_dict) after each recorded
+# operation; result is None if the operation raised
+Observer = Callable[[str, Any, Dict[str, Any]], None]
+_observer: Optional[Observer] = None
+
+
+def set_observer(observer: Optional[Observer]) -> Optional[Observer]:
+    """
+    Install the callback receiving every finished operation (None removes it).
+
+    Returns:
+        The previously installed observer
+    """
+    global _observer
+    previous, _observer = _observer, observer
+    return previous
+
+
+def current_metrics() -> Optional[Metrics]:
+    """The active collector, or None"""
+    return _active.get()
+
+
+@contextmanager
+def collect_metrics() -> Iterator[Metrics]:
+    """
+    Make a new collector active for the enclosed block.
+
+    Nested collections are independent; the outer one sees the inner
+    block's time in whatever stage encloses it.
+
+    Yields:
+        Metrics: The active collector
+    """
+    metrics = Metrics()
+    token = _active.set(metrics)
+    try:
+        yield metrics
+    finally:
+        metrics.finish()
+        _active.reset(token)
+
+
+def stage(name: str):
+    """Context manager timing a stage of the active collector (no-op if none)"""
+    metrics = _active.get()
+    return metrics.stage(name) if metrics is not None else nullcontext()
+
+
+def timed_iter(iterable: Iterable[T], name: str) -> Iterable[T]:
+    """Metrics.timed_iter on the active collector (returns iterable if none)"""
+    metrics = _active.get()
+    return metrics.timed_iter(iterable, name) if metrics is not None else iterable
+
+
+def add_bytes_read(count: int) -> None:
+    """Count input bytes on the active collector"""
+    metrics = _active.get()
+    if metrics is not None:
+        metrics.add_bytes_read(count)
+
+
+def record_pages(count: int) -> None:
+    """Count processed pages on the active collector"""
+    metrics = _active.get()
+    if metrics is not None:
+        metrics.add_pages(count)
+
+
+def record_error(error: BaseException) -> None:
+    """
+    Note the exception an operation is failing with on the active collector.
+
+    Used where tools turn exceptions into error results, so the error class
+    is not lost. The first recorded error wins.
+    """
+    metrics = _active.get()
+    if metrics is not None and metrics.error is None:
+        metrics.error = type(error).__name__
+
+
+def record_output(path: Union[str, Path]) -> None:
+    """Count the size of a written file on the active collector"""
+    metrics = _active.get()
+    if metrics is not None:
+        try:
+            metrics.add_bytes_written(Path(path).stat().st_size)
+        except OSError:
+            pass
+
+
+def record_metrics(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Decorator collecting metrics for an operation into its result.
+
+    The returned result's ``metadata['metrics']`` is set to the collected
+    Metrics.to_dict(); results without a metadata dict are returned as-is.
+    The tool name passed to the observer is the pdftools subpackage the
+    function lives in (e.g. 'merge').
+    """
+    parts = func.__module__.split('.')
+    tool = parts[1] if len(parts) > 1 and parts[0] == 'pdftools' else func.__name__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with collect_metrics() as metrics:
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if _observer is not None:
+                    record_error(e)
+                    metrics.finish()
+                    report_operation(tool, None, metrics.to_dict())
+                raise
+        data = metrics.to_dict()
+        metadata = getattr(result, 'metadata', None)
+        if isinstance(metadata, dict):
+            metadata['metrics'] = data
+        if _observer is not None:
+            report_operation(tool, result, data)
+        return result
+
+    return wrapper
+
+
+def report_operation(tool: str, result: Any, metrics: Optional[Dict[str, Any]]) -> None:
+    """
+    Hand a finished operation to the observer, if one is installed.
+
+    ``record_metrics`` does this automatically; code assembling results
+    itself (e.g. batch OCR) calls it directly. Observer errors are logged,
+    never raised.
+
+    Args:
+        tool: Tool name (e.g. 'ocr')
+        result: The operation's result, None if it raised
+        metrics: Its metrics dict
+    """
+    observer = _observer
+    if observer is None or metrics is None:
+        return
+    try:
+        observer(tool, result, metrics)
+    except Exception:
+        logging.getLogger(__name__).exception("Metrics observer failed")
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Peak resident memory of this process in MB (high-water mark since start).
+
+    Returns:
+        float or None: Peak RSS, None if the platform does not report it
+    """
+    try:
+        with open('/proc/self/status', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, KB elsewhere
+    return round(maxrss / (1024 * 1024) if sys.platform == 'darwin' else maxrss / 1024, 1)
+
+
+def merge_metrics(items: Iterable[Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+    """
+    Sum the metrics dicts of several results (e.g. a batch).
+
+    Args:
+        items: Metrics dicts (None entries are skipped)
+
+    Returns:
+        dict or None: Combined metrics (max of peak_rss_mb), None if empty
+    """
+    combined: Optional[Dict[str, Any]] = None
+    for item in items:
+        if not item:
+            continue
+        if combined is None:
+            combined = {'total_seconds': 0.0, 'stages': {}, 'bytes_read': 0,
+                        'bytes_written': 0, 'pages': 0, 'error': None,
+                        'peak_rss_mb': None}
+        combined['total_seconds'] += item.get('total_seconds', 0.0)
+        for name, seconds in item.get('stages', {}).items():
+            combined['stages'][name] = combined['stages'].get(name, 0.0) + seconds
+        combined['bytes_read'] += item.get('bytes_read', 0)
+        combined['bytes_written'] += item.get('bytes_written', 0)
+        combined['pages'] += item.get('pages', 0)
+        combined['error'] = combined.get('error') or item.get('error')
+        peaks = [p for p in (combined['peak_rss_mb'], item.get('peak_rss_mb')) if p is not None]
+        combined['peak_rss_mb'] = max(peaks) if peaks else None
+    return combined
@@ -0,0 +1,184 @@
+"""
+Memory-mapped PDF input for PyPDF2 readers
+
+PyPDF2 given a path copies the whole file into a BytesIO; given a file
+object it issues many small seeks and reads through an open descriptor.
+For large local files this module memory-maps the file read-only instead:
+readers get a seekable mmap object whose reads are served from the page
+cache, nothing is copied up front and data is loaded lazily by the OS.
+Every stream is its own mapping with its own position, so several readers
+(also in different threads) can read the same file concurrently while the
+kernel shares the underlying pages.
+
+Memory mapping is skipped (the file is read into memory as before) for
+small files, non-regular files (pipes, devices), network file systems and
+when ``PDFTOOLS_MMAP=0`` is set.
+
+Note: a mapped file must not be truncated while it is being read.
+"""
+
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+import io
+import logging
+import mmap
+import os
+import stat
+import sys
+
+logger = logging.getLogger('pdftools.core.pdf_input')
+
+MMAP_ENV = 'PDFTOOLS_MMAP'
+
+# Below this size reading the file into memory is as fast as mapping it
+MMAP_MIN_SIZE = 1024 * 1024
+
+NETWORK_FILESYSTEMS = {
+    '9p', 'afs', 'ceph', 'cifs', 'davfs', 'fuse.rclone', 'fuse.sshfs',
+    'glusterfs', 'ncpfs', 'nfs', 'nfs4', 'smb3', 'smbfs', 'sshfs',
+}
+
+
+class MappedPDF:
+    """
+    Read-only memory mapping of a PDF file.
+
+    Example:
+        >>> mapped = MappedPDF(Path("scan.pdf"))
+        >>> reader = PdfReader(mapped.open())        # one stream per reader
+        >>> other = PdfReader(mapped.open())         # e.g. in another thread
+        >>> view = mapped.buffer()                   # zero-copy bytes access
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Prepare a file for mapping.
+
+        Args:
+            path: Path to PDF file
+
+        Raises:
+            OSError: If the file cannot be accessed
+            ValueError: If the file is empty (empty files cannot be mapped)
+        """
+        self.path = Path(path)
+        self.size = os.path.getsize(self.path)
+        if self.size == 0:
+            raise ValueError(f"Cannot map empty file: {self.path}")
+
+    def open(self) -> mmap.mmap:
+        """
+        Map the file into memory as a new read-only stream.
+
+        Every call returns a separate mapping with an independent position;
+        the kernel shares the underlying pages between them.
+
+        Returns:
+            mmap.mmap: Seekable, read-only mapping positioned at 0
+
+        Raises:
+            OSError: If the file cannot be mapped
+        """
+        with open(self.path, 'rb') as f:
+            # The mapping keeps its own duplicate of the descriptor
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def buffer(self) -> memoryview:
+        """
+        Zero-copy view of the whole file.
+
+        Returns:
+            memoryview: Read-only view (keep it alive as long as it is used)
+        """
+        return memoryview(self.open())
+
+
+def open_pdf_input(
+    path: Union[str, Path],
+    use_mmap: Optional[bool] = None
+) -> BinaryIO:
+    """
+    Open a PDF file as a seekable in-memory stream for PdfReader.
+
+    Args:
+        path: Path to PDF file
+        use_mmap: Force (True) or disable (False) memory mapping
+                  (default: automatic, see module docstring)
+
+    Returns:
+        BinaryIO: mmap object if the file is mapped, else BytesIO
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    path = Path(path)
+
+    if use_mmap is None:
+        use_mmap = should_mmap(path)
+
+    if use_mmap:
+        try:
+            return MappedPDF(path).open()
+        except (OSError, ValueError) as e:
+            logger.debug(f"Memory mapping failed for {path}, reading instead: {e}")
+
+    with open(path, 'rb') as f:
+        return io.BytesIO(f.read())
+
+
+def should_mmap(path: Path) -> bool:
+    """
+    Decide whether a file should be memory-mapped.
+
+    Args:
+        path: Path to file
+
+    Returns:
+        bool: True for large regular files on local file systems
+    """
+    if os.environ.get(MMAP_ENV, '1').lower() in ('0', 'false', 'no', 'off'):
+        return False
+
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+
+    if not stat.S_ISREG(st.st_mode) or st.st_size < MMAP_MIN_SIZE:
+        return False
+
+    return not is_network_path(path)
+
+
+def is_network_path(path: Path) -> bool:
+    """
+    Check whether a path is on a network file system.
+
+    Detects UNC paths on Windows and network mounts listed in /proc/mounts
+    on Linux. Other platforms are assumed to be local.
+
+    Args:
+        path: Path to check
+
+    Returns:
+        bool: True if the path is (probably) on a network file system
+    """
+    path_str = str(path)
+    if sys.platform == 'win32':
+        return path_str.startswith('\\\\') or path_str.startswith('//')
+
+    try:
+        with open('/proc/mounts', 'r', encoding='utf-8') as f:
+            mounts = [line.split()[1:3] for line in f if line.strip()]
+    except OSError:
+        return False
+
+    resolved = os.path.realpath(path)
+    best_mount, best_type = '', ''
+    for mount_point, fs_type in mounts:
+        mount_point = mount_point.replace('\\040', ' ')
+        prefix = mount_point.rstrip('/') + '/'
+        if (resolved == mount_point or resolved.startswith(prefix)) and len(mount_point) > len(best_mount):
+            best_mount, best_type = mount_point, fs_type
+
+    return best_type in NETWORK_FILESYSTEMS
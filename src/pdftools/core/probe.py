@@ -0,0 +1,702 @@
+"""
+Fast document probe: page count, metadata and encryption from the file tail
+
+Validation only needs a few facts about a PDF: is it one, how many pages
+does it have, is it encrypted, what does its Info dictionary say. Parsing
+the whole document for that (PdfReader, MuPDF or pdfinfo) costs time and
+memory proportional to the file. The probe instead reads the header, the
+``startxref`` offset at the end of the file, the cross-reference sections
+(classic tables and xref streams, following ``/Prev`` and ``/XRefStm``),
+the trailer and the handful of objects it needs: the catalog, the page-tree
+root's ``/Count`` and the Info dictionary. Objects stored in object streams
+are resolved as well.
+
+Files the probe cannot read this way (broken offsets, repaired files,
+encrypted object streams, exotic filters) fall back to a full parse through
+the shared document pool, so callers always get an answer for readable
+PDFs:
+
+    >>> probe = probe_pdf(Path("scan.pdf"))
+    >>> probe.page_count, probe.encrypted, probe.info.get('Producer')
+    (12, False, 'ScanSoft PDF Create!')
+
+Results are cached by resolved path, modification time and size.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+import base64
+import logging
+import mmap
+import re
+import zlib
+
+from .document import _document_key, open_document
+from .exceptions import PDFCorruptedError
+
+logger = logging.getLogger('pdftools.core.probe')
+
+# The header must start within the first KiB, startxref within the last KiBs
+HEADER_WINDOW = 1024
+TAIL_WINDOWS = (1024, 64 * 1024)
+
+# Guards against reference cycles and malicious /Prev chains
+MAX_XREF_SECTIONS = 256
+MAX_REFERENCE_DEPTH = 32
+
+_WHITESPACE = b'\x00\t\n\x0c\r '
+_SPACE = re.compile(rb'(?:[\x00\t\n\x0c\r ]+|%[^\r\n]*)*')
+_REGULAR = re.compile(rb'[^\x00\t\n\x0c\r ()<>\[\]{}/%]*')
+_NUMBER_CHARS = b'+-.0123456789'
+_XREF_ROW = re.compile(rb'(\d{10}) (\d{5}) ([nf])[\r\n ]{2}')
+_STARTXREF = re.compile(rb'startxref\s+(\d+)')
+_OBJECT_HEADER = re.compile(rb'\s*(\d+)\s+(\d+)\s+obj\b')
+_VERSION = re.compile(rb'%PDF-(\d\.\d)')
+_REFERENCE = re.compile(rb'\s+(\d+)\s+R(?![^\x00\t\n\x0c\r ()<>\[\]{}/%])')
+
+
+@dataclass
+class PDFProbe:
+    """
+    Facts about a PDF read without parsing the document.
+
+    Attributes:
+        path: Probed file
+        size: File size in bytes
+        version: PDF version ('1.7'; the catalog's /Version if newer)
+        page_count: Number of pages (None if it cannot be determined,
+                    e.g. encrypted with a user password)
+        encrypted: Whether the document is encrypted
+        info: Document info (keys like 'Title', 'Producer'); empty for
+              encrypted documents, whose strings are encrypted too
+        method: 'xref' (read from the file tail) or 'parse' (full parse)
+    """
+    path: Path
+    size: int
+    version: Optional[str] = None
+    page_count: Optional[int] = None
+    encrypted: bool = False
+    info: Dict[str, str] = field(default_factory=dict)
+    method: str = 'xref'
+
+
+def probe_pdf(path: Union[str, Path], fallback: bool = True) -> PDFProbe:
+    """
+    Probe a PDF file for its page count, metadata and encryption.
+
+    Args:
+        path: Path to PDF file
+        fallback: Parse the whole document if the fast path fails
+                  (False: raise PDFCorruptedError instead)
+
+    Returns:
+        PDFProbe: Probe result (cached while the file is unchanged)
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        PDFCorruptedError: If the file is not a readable PDF
+    """
+    key = _document_key(Path(path))
+    return _probe_cached(key, fallback)
+
+
+def probe_page_count(path: Union[str, Path], backend: Optional[str] = None) -> int:
+    """
+    Number of pages, read from the page tree without parsing the document.
+
+    Falls back to the given PDF backend if the probe cannot tell (e.g. an
+    encrypted document), so the result matches ``backend.page_count``.
+
+    Args:
+        path: Path to PDF file
+        backend: PDF backend name for the fallback (default: auto)
+
+    Returns:
+        int: Number of pages
+
+    Raises:
+        PDFCorruptedError: If the file is not a readable PDF
+    """
+    try:
+        page_count = probe_pdf(path, fallback=False).page_count
+    except PDFCorruptedError as e:
+        logger.debug(f"Probe failed for {path}, counting pages with backend: {e.reason}")
+        page_count = None
+
+    if page_count is None:
+        from .backends import get_backend
+        try:
+            page_count = get_backend(backend).page_count(path)
+        except Exception as e:
+            raise PDFCorruptedError(str(path), str(e))
+    return page_count
+
+
+def clear_probe_cache() -> None:
+    """Forget all cached probe results (for tests)"""
+    _probe_cached.cache_clear()
+
+
+@lru_cache(maxsize=256)
+def _probe_cached(key: Tuple[str, int, int], fallback: bool) -> PDFProbe:
+    path = Path(key[0])
+    try:
+        return _probe_xref(path, key[2])
+    except _ProbeError as e:
+        if not fallback:
+            raise PDFCorruptedError(str(path), str(e))
+        logger.debug(f"Fast probe failed for {path} ({e}), parsing document")
+        return _probe_parse(path, key[2])
+
+
+class _ProbeError(Exception):
+    """The fast path cannot read this file"""
+
+
+class _Ref(NamedTuple):
+    num: int
+    gen: int
+
+
+class _Stream(NamedTuple):
+    """Stream object; its data is only read from the file when used"""
+    attrs: Dict[str, Any]
+    source: Any
+    start: int
+    end: int
+
+    @property
+    def data(self) -> bytes:
+        return self.source[self.start:self.end]
+
+
+@contextmanager
+def _open_xref_document(path: Path) -> Iterator['_XrefDocument']:
+    """
+    Map a file and read its cross-reference sections and trailer.
+
+    Objects and streams of the document must not be used after the block.
+
+    Raises:
+        _ProbeError: If the file cannot be read this way (also for parse
+                     errors raised inside the block)
+    """
+    with open(path, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            data = f.read()
+
+    try:
+        header = _VERSION.search(data[:HEADER_WINDOW])
+        if header is None:
+            raise _ProbeError("no %PDF header")
+        yield _XrefDocument(data, header.group(1).decode('ascii'))
+    except (IndexError, ValueError, KeyError, TypeError, RecursionError, zlib.error) as e:
+        raise _ProbeError(f"malformed structure: {e}")
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+
+def _probe_xref(path: Path, size: int) -> PDFProbe:
+    """Fast path: read only header, xref sections, trailer and a few objects"""
+    with _open_xref_document(path) as document:
+        trailer = document.trailer
+        encrypted = document.encrypted
+        version = document.version
+
+        catalog = document.resolve(trailer.get('Root'))
+        if not isinstance(catalog, dict):
+            raise _ProbeError("no document catalog")
+        catalog_version = document.resolve(catalog.get('Version'))
+        if isinstance(catalog_version, str) and catalog_version > version:
+            version = catalog_version
+
+        pages = document.resolve(catalog.get('Pages'))
+        page_count = document.resolve(pages.get('Count')) if isinstance(pages, dict) else None
+        if not isinstance(page_count, int) or isinstance(page_count, bool) or page_count < 0:
+            raise _ProbeError("no page count in page tree")
+
+        info: Dict[str, str] = {}
+        if not encrypted:
+            raw_info = document.resolve(trailer.get('Info'))
+            if isinstance(raw_info, dict):
+                for key, value in raw_info.items():
+                    value = document.resolve(value)
+                    if isinstance(value, (bytes, str)):
+                        info[key] = _decode_text(value)
+
+        return PDFProbe(
+            path=path,
+            size=size,
+            version=version,
+            page_count=page_count,
+            encrypted=encrypted,
+            info=info
+        )
+
+
+def _probe_parse(path: Path, size: int) -> PDFProbe:
+    """Slow path: full parse through the shared document pool"""
+    try:
+        with open_document(path) as document:
+            reader = document.reader
+            encrypted = reader.is_encrypted
+            try:
+                page_count: Optional[int] = len(reader.pages)
+            except Exception:
+                # Needs a user password
+                page_count = None
+            info: Dict[str, str] = {}
+            if not encrypted:
+                metadata = reader.metadata or {}
+                info = {key.lstrip('/'): str(value) for key, value in metadata.items()}
+            version = None
+            header = _VERSION.match(reader.pdf_header.encode('latin-1'))
+            if header is not None:
+                version = header.group(1).decode('ascii')
+    except FileNotFoundError:
+        raise
+    except Exception as e:
+        raise PDFCorruptedError(str(path), str(e))
+
+    return PDFProbe(
+        path=path,
+        size=size,
+        version=version,
+        page_count=page_count,
+        encrypted=encrypted,
+        info=info,
+        method='parse'
+    )
+
+
+def _decode_text(value: Union[bytes, str]) -> str:
+    """Decode a PDF text string (UTF-16 with BOM, UTF-8 with BOM, else PDFDocEncoding)"""
+    if isinstance(value, str):
+        return value
+    if value.startswith(b'\xfe\xff'):
+        return value[2:].decode('utf-16-be', errors='replace')
+    if value.startswith(b'\xef\xbb\xbf'):
+        return value[3:].decode('utf-8', errors='replace')
+    # PDFDocEncoding matches Latin-1 for all common characters
+    return value.decode('latin-1')
+
+
+class _XrefDocument:
+    """
+    Lazy cross-reference lookup and object resolution over the raw file.
+
+    Classic xref tables are not read row by row: their rows have a fixed
+    width of 20 bytes, so an object's row is located arithmetically. Xref
+    streams are decoded once per section.
+    """
+
+    def __init__(self, data, version: str):
+        self.data = data
+        self.version = version
+        # Newest first: ('table', [(first, count, offset)]) or ('stream', (rows, widths, index))
+        self.sections: List[Tuple[str, Any]] = []
+        self.trailer: Dict[str, Any] = {}
+        self._object_streams: Dict[int, Tuple[Dict[int, int], bytes]] = {}
+        self._read_sections(self._startxref())
+        self.encrypted = 'Encrypt' in self.trailer
+
+    def _startxref(self) -> int:
+        for window in TAIL_WINDOWS:
+            tail = self.data[-window:]
+            matches = list(_STARTXREF.finditer(tail))
+            if matches:
+                return int(matches[-1].group(1))
+        raise _ProbeError("no startxref")
+
+    def _read_sections(self, offset: int) -> None:
+        pending = [offset]
+        seen = set()
+        while pending:
+            offset = pending.pop(0)
+            if offset in seen or len(seen) >= MAX_XREF_SECTIONS:
+                continue
+            seen.add(offset)
+            if offset >= len(self.data):
+                raise _ProbeError(f"xref offset {offset} beyond end of file")
+
+            lexer = _Lexer(self.data, offset)
+            lexer.skip_whitespace()
+            if self.data[lexer.pos:lexer.pos + 4] == b'xref':
+                lexer.pos += 4
+                trailer = self._read_table(lexer)
+            else:
+                trailer = self._read_stream_section(offset)
+
+            for key, value in trailer.items():
+                self.trailer.setdefault(key, value)
+
+            # A hybrid file's xref stream comes before the table's /Prev
+            follow = []
+            if isinstance(trailer.get('XRefStm'), int):
+                follow.append(trailer['XRefStm'])
+            if isinstance(trailer.get('Prev'), int):
+                follow.append(trailer['Prev'])
+            pending = follow + pending
+
+    def _read_table(self, lexer: '_Lexer') -> Dict[str, Any]:
+        subsections = []
+        while True:
+            lexer.skip_whitespace()
+            if self.data[lexer.pos:lexer.pos + 7] == b'trailer':
+                lexer.pos += 7
+                break
+            first = lexer.read_object()
+            count = lexer.read_object()
+            if not isinstance(first, int) or not isinstance(count, int):
+                raise _ProbeError("malformed xref table")
+            lexer.skip_whitespace()
+            start = lexer.pos
+            # Check the first row; the rest is located by its fixed width
+            if count and not _XREF_ROW.match(self.data[start:start + 20]):
+                raise _ProbeError("xref rows are not 20 bytes")
+            subsections.append((first, count, start))
+            lexer.pos = start + 20 * count
+
+        self.sections.append(('table', subsections))
+        trailer = lexer.read_object()
+        if not isinstance(trailer, dict):
+            raise _ProbeError("malformed trailer")
+        return trailer
+
+    def _read_stream_section(self, offset: int) -> Dict[str, Any]:
+        obj = self._parse_indirect(offset)
+        if not isinstance(obj, _Stream) or obj.attrs.get('Type') != 'XRef':
+            raise _ProbeError(f"no xref section at offset {offset}")
+
+        widths = obj.attrs.get('W')
+        size = obj.attrs.get('Size')
+        if not isinstance(widths, list) or len(widths) != 3 or not isinstance(size, int):
+            raise _ProbeError("malformed xref stream")
+        index = obj.attrs.get('Index', [0, size])
+        rows = _decode_stream(obj)
+        self.sections.append(('stream', (rows, widths, index)))
+        return obj.attrs
+
+    def lookup(self, num: int) -> Optional[Tuple[int, int, int]]:
+        """Newest xref entry for an object: (type, field 2, field 3)"""
+        for kind, section in self.sections:
+            if kind == 'table':
+                for first, count, start in section:
+                    if first <= num < first + count:
+                        row = _XREF_ROW.match(self.data[start + 20 * (num - first):][:20])
+                        if row is None:
+                            raise _ProbeError(f"malformed xref row for object {num}")
+                        if row.group(3) == b'f':
+                            return (0, 0, 0)
+                        return (1, int(row.group(1)), int(row.group(2)))
+            else:
+                rows, widths, index = section
+                row_size = sum(widths)
+                position = 0
+                for i in range(0, len(index) - 1, 2):
+                    first, count = index[i], index[i + 1]
+                    if first <= num < first + count:
+                        offset = (position + num - first) * row_size
+                        row = rows[offset:offset + row_size]
+                        fields = []
+                        for width in widths:
+                            fields.append(int.from_bytes(row[:width], 'big') if width else None)
+                            row = row[width:]
+                        kind_field = 1 if fields[0] is None else fields[0]
+                        return (kind_field, fields[1] or 0, fields[2] or 0)
+                    position += count
+        return None
+
+    def resolve(self, obj: Any, depth: int = 0) -> Any:
+        """Follow indirect references to the object they point to"""
+        while isinstance(obj, _Ref):
+            if depth > MAX_REFERENCE_DEPTH:
+                raise _ProbeError("reference chain too deep")
+            depth += 1
+            obj = self._object(obj.num)
+        return obj
+
+    def _object(self, num: int) -> Any:
+        entry = self.lookup(num)
+        if entry is None or entry[0] == 0:
+            return None
+        kind, field2, field3 = entry
+        if kind == 1:
+            return self._parse_indirect(field2, num)
+        if kind == 2:
+            if self.encrypted:
+                raise _ProbeError("object streams of encrypted documents are encrypted")
+            offsets, data = self._object_stream(field2)
+            if num not in offsets:
+                raise _ProbeError(f"object {num} missing from object stream {field2}")
+            return _Lexer(data, offsets[num]).read_object()
+        raise _ProbeError(f"unknown xref entry type {kind}")
+
+    def _object_stream(self, num: int) -> Tuple[Dict[int, int], bytes]:
+        if num not in self._object_streams:
+            stream = self.resolve(_Ref(num, 0))
+            if not isinstance(stream, _Stream):
+                raise _ProbeError(f"object {num} is not an object stream")
+            data = _decode_stream(stream)
+            count = self.resolve(stream.attrs.get('N'))
+            first = self.resolve(stream.attrs.get('First'))
+            if not isinstance(count, int) or not isinstance(first, int):
+                raise _ProbeError("malformed object stream")
+            lexer = _Lexer(data, 0)
+            offsets = {}
+            for _ in range(count):
+                obj_num = lexer.read_object()
+                obj_offset = lexer.read_object()
+                offsets[obj_num] = first + obj_offset
+            self._object_streams[num] = (offsets, data)
+        return self._object_streams[num]
+
+    def _parse_indirect(self, offset: int, expected: Optional[int] = None) -> Any:
+        header = _OBJECT_HEADER.match(self.data[offset:offset + 64])
+        if header is None:
+            raise _ProbeError(f"no object at offset {offset}")
+        if expected is not None and int(header.group(1)) != expected:
+            raise _ProbeError(f"object {expected} not at offset {offset}")
+
+        lexer = _Lexer(self.data, offset + header.end())
+        obj = lexer.read_object()
+        if isinstance(obj, dict):
+            lexer.skip_whitespace()
+            if self.data[lexer.pos:lexer.pos + 6] == b'stream':
+                return _Stream(obj, self.data, *self._stream_range(obj, lexer.pos + 6))
+        return obj
+
+    def _stream_range(self, attrs: Dict[str, Any], pos: int) -> Tuple[int, int]:
+        # Data starts after the EOL following the keyword
+        if self.data[pos:pos + 2] == b'\r\n':
+            pos += 2
+        elif self.data[pos:pos + 1] in (b'\n', b'\r'):
+            pos += 1
+        length = attrs.get('Length')
+        if isinstance(length, _Ref):
+            length = self.resolve(length)
+        if not isinstance(length, int):
+            end = self.data.find(b'endstream', pos)
+            if end < 0:
+                raise _ProbeError("unterminated stream")
+            while end > pos and self.data[end - 1] in b'\r\n':
+                end -= 1
+            return pos, end
+        return pos, pos + length
+
+
+def _decode_stream(stream: _Stream) -> bytes:
+    """Apply the stream's filters (FlateDecode with PNG predictors, ASCII85, ASCIIHex)"""
+    filters = stream.attrs.get('Filter')
+    params = stream.attrs.get('DecodeParms')
+    if not isinstance(filters, list):
+        filters = [filters] if filters else []
+    if not isinstance(params, list):
+        params = [params] * len(filters)
+
+    data = stream.data
+    for name, param in zip(filters, params + [None] * len(filters)):
+        if name == 'FlateDecode':
+            # decompressobj tolerates trailing garbage after the zlib data
+            data = zlib.decompressobj().decompress(data)
+            predictor = param.get('Predictor', 1) if isinstance(param, dict) else 1
+            if predictor >= 10:
+                data = _png_unpredict(data, param.get('Columns', 1))
+            elif predictor != 1:
+                raise _ProbeError(f"unsupported predictor {predictor}")
+        elif name == 'ASCII85Decode':
+            data = data.translate(None, _WHITESPACE)
+            data = base64.a85decode(data[:-2] if data.endswith(b'~>') else data)
+        elif name == 'ASCIIHexDecode':
+            digits = data.split(b'>')[0].translate(None, _WHITESPACE)
+            data = bytes.fromhex((digits + b'0' * (len(digits) % 2)).decode('ascii'))
+        else:
+            raise _ProbeError(f"unsupported stream filter {name}")
+    return data
+
+
+def _png_unpredict(data: bytes, columns: int) -> bytes:
+    """Undo PNG row filters (one byte per sample, as used by xref streams)"""
+    row_size = columns + 1
+    previous = bytearray(columns)
+    output = bytearray()
+    for start in range(0, len(data) - columns, row_size):
+        kind = data[start]
+        row = bytearray(data[start + 1:start + row_size])
+        if kind == 1:
+            for i in range(1, len(row)):
+                row[i] = (row[i] + row[i - 1]) & 0xFF
+        elif kind == 2:
+            for i in range(len(row)):
+                row[i] = (row[i] + previous[i]) & 0xFF
+        elif kind == 3:
+            for i in range(len(row)):
+                left = row[i - 1] if i else 0
+                row[i] = (row[i] + ((left + previous[i]) >> 1)) & 0xFF
+        elif kind == 4:
+            for i in range(len(row)):
+                left = row[i - 1] if i else 0
+                upper_left = previous[i - 1] if i else 0
+                estimate = left + previous[i] - upper_left
+                distances = (abs(estimate - left), abs(estimate - previous[i]), abs(estimate - upper_left))
+                if distances[0] <= distances[1] and distances[0] <= distances[2]:
+                    best = left
+                elif distances[1] <= distances[2]:
+                    best = previous[i]
+                else:
+                    best = upper_left
+                row[i] = (row[i] + best) & 0xFF
+        elif kind != 0:
+            raise _ProbeError(f"unknown PNG filter {kind}")
+        output += row
+        previous = row
+    return bytes(output)
+
+
+class _Lexer:
+    """
+    Minimal PDF object parser.
+
+    Names are returned as str (without '/'), strings as bytes, indirect
+    references as _Ref, dictionaries as dict and arrays as list.
+    """
+
+    def __init__(self, data, pos: int):
+        self.data = data
+        self.pos = pos
+
+    def skip_whitespace(self) -> None:
+        self.pos = _SPACE.match(self.data, self.pos).end()
+
+    def read_object(self, depth: int = 0) -> Any:
+        if depth > MAX_REFERENCE_DEPTH:
+            raise _ProbeError("objects nested too deeply")
+        self.skip_whitespace()
+        data = self.data
+        char = data[self.pos:self.pos + 1]
+
+        if char == b'/':
+            self.pos += 1
+            return self._read_name()
+        if char == b'<':
+            if data[self.pos:self.pos + 2] == b'<<':
+                self.pos += 2
+                return self._read_dict(depth)
+            self.pos += 1
+            return self._read_hex_string()
+        if char == b'[':
+            self.pos += 1
+            items = []
+            while True:
+                self.skip_whitespace()
+                if data[self.pos:self.pos + 1] == b']':
+                    self.pos += 1
+                    return items
+                items.append(self.read_object(depth + 1))
+        if char == b'(':
+            self.pos += 1
+            return self._read_literal_string()
+        if char and char[0] in _NUMBER_CHARS:
+            return self._read_number_or_ref()
+
+        token = self._read_token()
+        if token == b'true':
+            return True
+        if token == b'false':
+            return False
+        if token == b'null':
+            return None
+        raise _ProbeError(f"unexpected token {token[:20]!r}")
+
+    def _read_token(self) -> bytes:
+        start = self.pos
+        self.pos = _REGULAR.match(self.data, start).end()
+        if self.pos == start:
+            raise _ProbeError(f"unexpected data at offset {start}")
+        return self.data[start:self.pos]
+
+    def _read_name(self) -> str:
+        start = self.pos
+        self.pos = _REGULAR.match(self.data, start).end()
+        raw = self.data[start:self.pos]
+        if b'#' in raw:
+            raw = re.sub(rb'#([0-9A-Fa-f]{2})', lambda m: bytes([int(m.group(1), 16)]), raw)
+        return raw.decode('latin-1')
+
+    def _read_dict(self, depth: int) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        while True:
+            self.skip_whitespace()
+            if self.data[self.pos:self.pos + 2] == b'>>':
+                self.pos += 2
+                return result
+            if self.data[self.pos:self.pos + 1] != b'/':
+                raise _ProbeError(f"dictionary key expected at offset {self.pos}")
+            self.pos += 1
+            key = self._read_name()
+            result[key] = self.read_object(depth + 1)
+
+    def _read_number_or_ref(self) -> Any:
+        token = self._read_token()
+        if b'.' in token:
+            return float(token)
+        number = int(token)
+
+        # "num gen R" is a reference
+        match = _REFERENCE.match(self.data[self.pos:self.pos + 32])
+        if match and number >= 0:
+            self.pos += match.end()
+            return _Ref(number, int(match.group(1)))
+        return number
+
+    def _read_hex_string(self) -> bytes:
+        end = self.data.find(b'>', self.pos)
+        if end < 0:
+            raise _ProbeError("unterminated hex string")
+        digits = self.data[self.pos:end].translate(None, _WHITESPACE)
+        self.pos = end + 1
+        if len(digits) % 2:
+            digits += b'0'
+        return bytes.fromhex(digits.decode('ascii'))
+
+    def _read_literal_string(self) -> bytes:
+        data = self.data
+        output = bytearray()
+        nesting = 1
+        escapes = {ord('n'): 10, ord('r'): 13, ord('t'): 9, ord('b'): 8, ord('f'): 12}
+        while self.pos < len(data):
+            char = data[self.pos]
+            self.pos += 1
+            if char == 0x5C:  # backslash
+                char = data[self.pos]
+                self.pos += 1
+                if char in escapes:
+                    output.append(escapes[char])
+                elif 0x30 <= char <= 0x37:
+                    octal = bytes([char])
+                    while len(octal) < 3 and 0x30 <= data[self.pos] <= 0x37:
+                        octal += bytes([data[self.pos]])
+                        self.pos += 1
+                    output.append(int(octal, 8) & 0xFF)
+                elif char == 0x0D:  # line continuation
+                    if data[self.pos] == 0x0A:
+                        self.pos += 1
+                elif char != 0x0A:
+                    output.append(char)
+            elif char == 0x28:
+                nesting += 1
+                output.append(char)
+            elif char == 0x29:
+                nesting -= 1
+                if nesting == 0:
+                    return bytes(output)
+                output.append(char)
+            else:
+                output.append(char)
+        raise _ProbeError("unterminated string")
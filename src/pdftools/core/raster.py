@@ -0,0 +1,199 @@
+"""
+In-memory page rasterization with poppler's pdftoppm
+
+pdf2image runs ``pdftoppm -v`` and ``pdfinfo`` before every conversion and
+buffers the complete pdftoppm output before decoding it, so a whole page
+range is held twice in memory. This module starts a single ``pdftoppm``
+per contiguous page range and decodes the PPM stream from its stdout pipe
+while it is being produced: pages are yielded one at a time, nothing is
+written to disk and only the current page is buffered.
+
+The MuPDF backend renders in-process and does not need this module.
+"""
+
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
+import logging
+import os
+import subprocess
+import threading
+
+from PIL import Image
+
+from .exceptions import PDFProcessingError
+
+logger = logging.getLogger('pdftools.core.raster')
+
+POPPLER_NOT_INSTALLED = (
+    "poppler-utils is not installed. Please install it:\n"
+    "  Ubuntu/Debian: sudo apt-get install poppler-utils\n"
+    "  macOS: brew install poppler\n"
+    "  Windows: Download from https://github.com/oschwartz10612/poppler-windows/releases"
+)
+
+_WHITESPACE = b' \t\r\n\x0b\x0c'
+
+
+def iter_poppler_pages(
+    pdf_path: Union[str, Path],
+    pages: Optional[List[int]] = None,
+    dpi: int = 200,
+    grayscale: bool = False,
+    poppler_path: Optional[Union[str, Path]] = None
+) -> Iterator[Tuple[int, Image.Image]]:
+    """
+    Render PDF pages with pdftoppm, streaming images from its stdout.
+
+    Args:
+        pdf_path: Path to PDF file
+        pages: Pages to render in this order (1-indexed, None = all pages)
+        dpi: Rendering resolution
+        grayscale: Render 8-bit grayscale ('L') instead of RGB
+        poppler_path: Directory containing pdftoppm (default: PATH)
+
+    Yields:
+        Tuple[int, Image.Image]: Page number and rendered image
+
+    Raises:
+        PDFProcessingError: If pdftoppm is missing or fails
+    """
+    if pages is None:
+        yield from _run_pdftoppm(pdf_path, 1, None, dpi, grayscale, poppler_path)
+        return
+
+    for start, end in page_runs(pages):
+        yield from _run_pdftoppm(pdf_path, start, end, dpi, grayscale, poppler_path)
+
+
+def page_runs(pages: List[int]) -> List[Tuple[int, int]]:
+    """
+    Group pages into (start, end) runs of consecutive ascending pages.
+
+    Args:
+        pages: Page numbers in the requested order
+
+    Returns:
+        List[Tuple[int, int]]: Inclusive page runs, in the same order
+    """
+    runs: List[Tuple[int, int]] = []
+    for page in pages:
+        if runs and page == runs[-1][1] + 1:
+            runs[-1] = (runs[-1][0], page)
+        else:
+            runs.append((page, page))
+    return runs
+
+
+def _run_pdftoppm(
+    pdf_path: Union[str, Path],
+    first_page: int,
+    last_page: Optional[int],
+    dpi: int,
+    grayscale: bool,
+    poppler_path: Optional[Union[str, Path]]
+) -> Iterator[Tuple[int, Image.Image]]:
+    """Render one contiguous page range (last_page None = to the end)"""
+    executable = 'pdftoppm'
+    if poppler_path:
+        executable = os.path.join(str(poppler_path), executable)
+
+    # Without an output root, pdftoppm writes all pages to stdout
+    cmd = [executable, '-r', str(dpi), '-f', str(first_page)]
+    if last_page is not None:
+        cmd += ['-l', str(last_page)]
+    if grayscale:
+        cmd.append('-gray')
+    cmd.append(str(pdf_path))
+
+    logger.debug(f"Rendering pages {first_page}-{last_page or 'end'} of {pdf_path} at {dpi} DPI")
+
+    try:
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except FileNotFoundError as e:
+        raise PDFProcessingError(POPPLER_NOT_INSTALLED) from e
+
+    # Drain stderr concurrently so warnings cannot block the pipe
+    stderr_chunks: List[bytes] = []
+    stderr_thread = threading.Thread(
+        target=lambda: stderr_chunks.append(process.stderr.read()),
+        daemon=True
+    )
+    stderr_thread.start()
+
+    try:
+        page_number = first_page
+        while True:
+            image = read_pnm(process.stdout)
+            if image is None:
+                break
+            yield page_number, image
+            page_number += 1
+
+        returncode = process.wait()
+        stderr_thread.join()
+        if returncode != 0:
+            message = b''.join(stderr_chunks).decode('utf-8', 'replace').strip()
+            raise PDFProcessingError(
+                f"pdftoppm failed on {pdf_path} (exit code {returncode}): {message}"
+            )
+    finally:
+        # Also reached when the consumer stops iterating early
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+
+
+def read_pnm(stream: BinaryIO) -> Optional[Image.Image]:
+    """
+    Read one binary PPM (P6) or PGM (P5) image from a stream.
+
+    Args:
+        stream: Binary stream positioned at an image header
+
+    Returns:
+        Image.Image or None: Decoded image, None at end of stream
+
+    Raises:
+        PDFProcessingError: If the stream does not contain a valid image
+    """
+    magic = stream.read(2)
+    if not magic:
+        return None
+    if magic not in (b'P5', b'P6'):
+        raise PDFProcessingError(f"Unexpected rasterizer output (header {magic!r})")
+
+    try:
+        width, height, maxval = (int(_read_token(stream)) for _ in range(3))
+    except ValueError as e:
+        raise PDFProcessingError(f"Invalid image header from rasterizer: {e}") from e
+    if maxval != 255:
+        raise PDFProcessingError(f"Unsupported image depth from rasterizer: {maxval}")
+
+    mode = 'RGB' if magic == b'P6' else 'L'
+    data = bytearray(width * height * len(mode))
+    view = memoryview(data)
+    filled = 0
+    while filled < len(data):
+        count = stream.readinto(view[filled:])
+        if not count:
+            raise PDFProcessingError("Truncated image data from rasterizer")
+        filled += count
+
+    return Image.frombuffer(mode, (width, height), data, 'raw', mode, 0, 1)
+
+
+def _read_token(stream: BinaryIO) -> bytes:
+    """Read a whitespace-delimited header token (consumes one trailing byte)"""
+    token = b''
+    while True:
+        char = stream.read(1)
+        if not char:
+            return token
+        if char == b'#' and not token:
+            stream.readline()  # Comment until end of line
+        elif char in _WHITESPACE:
+            if token:
+                return token
+        else:
+            token += char
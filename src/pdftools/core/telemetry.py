@@ -0,0 +1,329 @@
+"""
+Prometheus metrics for long-running pdftools processes
+
+An optional registry aggregating the per-operation metrics collected by
+``core.metrics`` into counters and histograms: documents per tool and
+status, pages processed, errors by exception class (``core.exceptions``
+names such as 'PDFCorruptedError'), bytes read/written, and operation and
+stage latencies. It is exposed in the Prometheus text format, either over
+a local HTTP endpoint or as a file for node_exporter's textfile collector.
+
+Telemetry is off until ``enable_telemetry()`` is called; while off, each
+operation pays a single ``None`` check and nothing is recorded.
+
+    >>> from pdftools.core.telemetry import enable_telemetry, start_http_server
+    >>> enable_telemetry()
+    >>> server = start_http_server(9464)     # http://127.0.0.1:9464/metrics
+
+    >>> # Or, e.g. at the end of each cron run:
+    >>> write_textfile('/var/lib/node_exporter/textfile/pdftools.prom')
+
+No third-party client library is needed; the registry renders the text
+format itself.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import logging
+import math
+import os
+import tempfile
+import threading
+
+from .metrics import set_observer
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Seconds; covers single-page merges up to multi-minute OCR batches
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+LabelValues = Tuple[str, ...]
+
+
+class Counter:
+    """Monotonic counter family with fixed label names"""
+
+    type_name = 'counter'
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """
+        Increase the counter of the given label values.
+
+        Raises:
+            ValueError: If amount is negative or labels do not match
+        """
+        if amount < 0:
+            raise ValueError(f"Counter {self.name} can only increase")
+        key = _label_values(self, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels: str) -> float:
+        """Current value for the given label values (0 if never increased)"""
+        with self._lock:
+            return self._values.get(_label_values(self, labels), 0)
+
+    def samples(self) -> Iterator[Tuple[str, Dict[str, str], float]]:
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            yield self.name, dict(zip(self.labels, key)), value
+
+
+class Histogram:
+    """Histogram family with cumulative buckets, sum and count"""
+
+    type_name = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        # Per label values: [count per bucket (non-cumulative) + overflow, sum]
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation for the given label values"""
+        key = _label_values(self, labels)
+        index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+        with self._lock:
+            counts, total = self._values.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[index] += 1
+            total[0] += value
+
+    def count(self, **labels: str) -> int:
+        """Number of observations for the given label values"""
+        with self._lock:
+            entry = self._values.get(_label_values(self, labels))
+            return sum(entry[0]) if entry else 0
+
+    def samples(self) -> Iterator[Tuple[str, Dict[str, str], float]]:
+        with self._lock:
+            values = sorted((key, (list(counts), total[0])) for key, (counts, total) in self._values.items())
+        for key, (counts, total) in values:
+            labels = dict(zip(self.labels, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                yield f"{self.name}_bucket", {**labels, 'le': _format_value(bound)}, cumulative
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, cumulative
+
+
+class MetricsRegistry:
+    """
+    The pdftools metric families, fed from finished operations.
+
+    Attributes:
+        documents: Documents processed, by tool and result status
+        pages: Pages processed, by tool
+        errors: Failed operations, by tool and exception class name
+        bytes_read: Input bytes read, by tool
+        bytes_written: Output bytes written, by tool
+        duration: Operation latency, by tool
+        stage_duration: Stage latency, by tool and stage
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.documents = Counter(
+            'pdftools_documents_total', 'Documents processed', ('tool', 'status'))
+        self.pages = Counter(
+            'pdftools_pages_total', 'Pages processed', ('tool',))
+        self.errors = Counter(
+            'pdftools_errors_total', 'Failed operations by exception class', ('tool', 'error'))
+        self.bytes_read = Counter(
+            'pdftools_read_bytes_total', 'Input bytes read', ('tool',))
+        self.bytes_written = Counter(
+            'pdftools_written_bytes_total', 'Output bytes written', ('tool',))
+        self.duration = Histogram(
+            'pdftools_operation_duration_seconds', 'Operation latency', ('tool',), buckets)
+        self.stage_duration = Histogram(
+            'pdftools_stage_duration_seconds', 'Stage latency per operation', ('tool', 'stage'), buckets)
+
+    @property
+    def families(self) -> List[Union[Counter, Histogram]]:
+        return [self.documents, self.pages, self.errors, self.bytes_read,
+                self.bytes_written, self.duration, self.stage_duration]
+
+    def observe(self, tool: str, result: Any, metrics: Dict[str, Any]) -> None:
+        """
+        Record a finished operation (the ``core.metrics`` observer signature).
+
+        Args:
+            tool: Tool name (e.g. 'merge')
+            result: The operation's result (None if it raised)
+            metrics: Its metrics dict (Metrics.to_dict())
+        """
+        status = 'error' if result is None else getattr(result, 'status', 'success')
+        self.documents.inc(tool=tool, status=status)
+        if status == 'error':
+            self.errors.inc(tool=tool, error=metrics.get('error') or 'unknown')
+
+        self.pages.inc(metrics.get('pages', 0), tool=tool)
+        self.bytes_read.inc(metrics.get('bytes_read', 0), tool=tool)
+        self.bytes_written.inc(metrics.get('bytes_written', 0), tool=tool)
+        self.duration.observe(metrics.get('total_seconds', 0.0), tool=tool)
+        for name, seconds in metrics.get('stages', {}).items():
+            self.stage_duration.observe(seconds, tool=tool, stage=name)
+
+    def render(self) -> str:
+        """The registry in the Prometheus text exposition format"""
+        lines = []
+        for family in self.families:
+            lines.append(f"# HELP {family.name} {family.documentation}")
+            lines.append(f"# TYPE {family.name} {family.type_name}")
+            for name, labels, value in family.samples():
+                if labels:
+                    rendered = ','.join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+                    name = f"{name}{{{rendered}}}"
+                lines.append(f"{name} {_format_value(value)}")
+        return '\n'.join(lines) + '\n'
+
+
+_registry: Optional[MetricsRegistry] = None
+
+
+def enable_telemetry(registry: Optional[MetricsRegistry] = None) -> MetricsRegistry:
+    """
+    Start recording every pdftools operation into a registry.
+
+    Args:
+        registry: Registry to record into (default: a new one, or the one
+                  already enabled)
+
+    Returns:
+        MetricsRegistry: The active registry
+    """
+    global _registry
+    if registry is None:
+        registry = _registry or MetricsRegistry()
+    _registry = registry
+    set_observer(registry.observe)
+    return registry
+
+
+def disable_telemetry() -> None:
+    """Stop recording (the registry keeps its values)"""
+    set_observer(None)
+
+
+def get_registry() -> Optional[MetricsRegistry]:
+    """The registry last enabled, or None"""
+    return _registry
+
+
+def start_http_server(
+    port: int,
+    addr: str = '127.0.0.1',
+    registry: Optional[MetricsRegistry] = None
+) -> ThreadingHTTPServer:
+    """
+    Serve the registry at http://addr:port/metrics from a daemon thread.
+
+    Args:
+        port: TCP port (0 picks a free one, see server.server_address)
+        addr: Interface to bind (default: localhost only)
+        registry: Registry to serve (default: the enabled one)
+
+    Returns:
+        ThreadingHTTPServer: The running server (call shutdown() to stop)
+
+    Raises:
+        ValueError: If no registry is given or enabled
+    """
+    registry = _require_registry(registry)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+                self.send_error(404)
+                return
+            body = registry.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug("metrics endpoint: " + format, *args)
+
+    server = ThreadingHTTPServer((addr, port), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name='pdftools-metrics', daemon=True)
+    thread.start()
+    logger.info(f"Serving metrics on http://{addr}:{server.server_address[1]}/metrics")
+    return server
+
+
+def write_textfile(path: Union[str, Path], registry: Optional[MetricsRegistry] = None) -> None:
+    """
+    Write the registry for node_exporter's textfile collector.
+
+    The file is replaced atomically, so the collector never reads a
+    partial file.
+
+    Args:
+        path: Target file (should end in .prom)
+        registry: Registry to write (default: the enabled one)
+
+    Raises:
+        ValueError: If no registry is given or enabled
+    """
+    registry = _require_registry(registry)
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(registry.render())
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _require_registry(registry: Optional[MetricsRegistry]) -> MetricsRegistry:
+    registry = registry or _registry
+    if registry is None:
+        raise ValueError("Telemetry is not enabled (call enable_telemetry() first)")
+    return registry
+
+
+def _label_values(family: Union[Counter, Histogram], labels: Dict[str, str]) -> LabelValues:
+    if set(labels) != set(family.labels):
+        raise ValueError(f"{family.name} expects labels {family.labels}, got {tuple(labels)}")
+    return tuple(str(labels[name]) for name in family.labels)
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
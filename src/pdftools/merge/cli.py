@@ -10,8 +10,10 @@ import logging
 from .core import merge_pdfs
 from .models import MergeConfig
 from ..core.utils import setup_logger
+from ..cli.common import add_profile_argument, add_stats_argument, print_stats, profile_main
 
 
+@profile_main
 def main():
     """
     Main entry point for pdftools-merge CLI
@@ -52,6 +54,9 @@ def main():
         help='Skip corrupted files instead of aborting'
     )
 
+    add_stats_argument(parser)
+    add_profile_argument(parser)
+
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -100,6 +105,9 @@ def main():
             config=config
         )
 
+        if args.stats:
+            print_stats(result.metadata.get('metrics'))
+
         # Print result
         if result.success:
             print(f"✓ {result.message}")
@@ -2,6 +2,7 @@
 Core PDF merge functionality
 """
 
+from contextlib import ExitStack
 from pathlib import Path
 from typing import List, Optional
 import logging
@@ -11,6 +12,8 @@ from .models import MergeResult, MergeConfig
 from .validators import validate_input_files
 from .processors import PDFMerger
 from ..core.validators import validate_output_path
+from ..core.document import open_document
+from ..core.metrics import record_error, record_metrics, record_output, record_pages, stage
 from ..core.utils import generate_output_path
 from ..core.exceptions import PDFNotFoundError, PDFCorruptedError, PDFProcessingError
 
@@ -18,6 +21,7 @@ from ..core.exceptions import PDFNotFoundError, PDFCorruptedError, PDFProcessing
 logger = logging.getLogger('pdftools.merge')
 
 
+@record_metrics
 def merge_pdfs(
     files: List[Path],
     output_path: Optional[Path] = None,
@@ -62,22 +66,23 @@ def merge_pdfs(
     logger.info(f"Starting PDF merge of {len(files)} files")
 
     try:
-        # Validate input files
-        validated_files = validate_input_files(files, must_exist=True)
-
-        # Determine output path
-        if output_path is None:
-            output_path = generate_output_path(
-                validated_files[0],
-                suffix="_merged",
-                extension=".pdf"
-            )
-        else:
-            output_path = validate_output_path(
-                output_path,
-                create_dirs=True,
-                overwrite=True
-            )
+        with stage('validate'):
+            # Validate input files
+            validated_files = validate_input_files(files, must_exist=True)
+
+            # Determine output path
+            if output_path is None:
+                output_path = generate_output_path(
+                    validated_files[0],
+                    suffix="_merged",
+                    extension=".pdf"
+                )
+            else:
+                output_path = validate_output_path(
+                    output_path,
+                    create_dirs=True,
+                    overwrite=True
+                )
 
         logger.info(f"Output path: {output_path}")
 
@@ -88,29 +93,35 @@ def merge_pdfs(
         files_processed = 0
         skipped_files = []
 
-        for idx, file_path in enumerate(validated_files, 1):
-            try:
-                # Progress callback
-                if config.progress_callback:
-                    config.progress_callback(idx, len(validated_files))
+        with ExitStack() as documents:
+            # Hold one shared handle per file, so files listed twice are parsed once
+            for file_path in set(validated_files):
+                documents.enter_context(open_document(file_path))
 
-                logger.info(f"Processing {idx}/{len(validated_files)}: {file_path.name}")
+            for idx, file_path in enumerate(validated_files, 1):
+                try:
+                    # Progress callback
+                    if config.progress_callback:
+                        config.progress_callback(idx, len(validated_files))
 
-                # Add PDF to merger
-                pages_added = merger.add_pdf(
-                    file_path,
-                    keep_bookmarks=config.keep_bookmarks
-                )
+                    logger.info(f"Processing {idx}/{len(validated_files)}: {file_path.name}")
+
+                    # Add PDF to merger
+                    with stage('merge'):
+                        pages_added = merger.add_pdf(
+                            file_path,
+                            keep_bookmarks=config.keep_bookmarks
+                        )
 
-                files_processed += 1
-                logger.debug(f"Added {pages_added} pages from {file_path.name}")
+                    files_processed += 1
+                    logger.debug(f"Added {pages_added} pages from {file_path.name}")
 
-            except PDFCorruptedError as e:
-                if config.skip_on_error:
-                    logger.warning(f"Skipping corrupted file: {file_path.name}")
-                    skipped_files.append(str(file_path))
-                else:
-                    raise
+                except PDFCorruptedError as e:
+                    if config.skip_on_error:
+                        logger.warning(f"Skipping corrupted file: {file_path.name}")
+                        skipped_files.append(str(file_path))
+                    else:
+                        raise
 
         # Check if any files were successfully processed
         if files_processed == 0:
@@ -121,7 +132,10 @@ def merge_pdfs(
             )
 
         # Write merged PDF
-        merger.write(output_path)
+        with stage('write'):
+            merger.write(output_path)
+        record_output(output_path)
+        record_pages(merger.total_pages)
 
         # Calculate elapsed time
         elapsed_time = time.time() - start_time
@@ -150,12 +164,14 @@ def merge_pdfs(
         )
 
     except (PDFNotFoundError, PDFCorruptedError, PDFProcessingError) as e:
+        record_error(e)
         logger.error(f"Merge failed: {e}")
         return MergeResult(
             status="error",
             message=str(e)
         )
     except Exception as e:
+        record_error(e)
         logger.error(f"Unexpected error during merge: {e}", exc_info=True)
         return MergeResult(
             status="error",
@@ -8,6 +8,7 @@ import logging
 
 from PyPDF2 import PdfReader, PdfWriter
 
+from ..core.document import open_document
 from ..core.exceptions import PDFProcessingError, PDFCorruptedError
 
 
@@ -23,7 +24,12 @@ class PDFReaderInterface(Protocol):
 
 
 class DefaultPDFReader:
-    """Default PDF reader implementation using PyPDF2"""
+    """
+    Default PDF reader implementation using PyPDF2
+
+    Readers come from the shared document pool, so a file that was already
+    parsed in the current operation (e.g., listed twice) is not parsed again.
+    """
 
     def read(self, path: Path) -> PdfReader:
         """
@@ -39,7 +45,8 @@ class DefaultPDFReader:
             PDFCorruptedError: If PDF is corrupted or invalid
         """
         try:
-            return PdfReader(str(path))
+            with open_document(path) as document:
+                return document.reader
         except Exception as e:
             raise PDFCorruptedError(str(path), str(e))
 
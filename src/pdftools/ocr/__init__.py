@@ -5,10 +5,14 @@ This module provides OCR functionality for scanned PDF documents using Tesseract
 
 Public API:
     - perform_ocr: Main function to perform OCR on PDFs
+    - ocr_pages: Recognize pages in memory (no output file)
+    - perform_batch_ocr: OCR many PDFs with page-level parallelism
     - OCRLanguage: Enum of supported languages
     - OutputMode: Enum of output formats
     - OCRConfig: Configuration dataclass
     - OCRResult: Result dataclass
+    - OCREngine: Engine interface for pluggable OCR backends
+    - get_engine / register_engine / list_engines: Engine registry
 
 Example:
     >>> from pdftools.ocr import perform_ocr, OCRLanguage, OutputMode
@@ -19,18 +23,31 @@ Example:
     ... )
 """
 
-from pdftools.ocr.core import perform_ocr
+from pdftools.ocr.core import perform_ocr, ocr_pages
+from pdftools.ocr.batch import perform_batch_ocr
 from pdftools.ocr.models import (
     OCRLanguage,
     OutputMode,
     OCRConfig,
     OCRResult,
 )
+from pdftools.ocr.registry import (
+    OCREngine,
+    get_engine,
+    register_engine,
+    list_engines,
+)
 
 __all__ = [
     'perform_ocr',
+    'ocr_pages',
+    'perform_batch_ocr',
     'OCRLanguage',
     'OutputMode',
     'OCRConfig',
     'OCRResult',
+    'OCREngine',
+    'get_engine',
+    'register_engine',
+    'list_engines',
 ]
\ No newline at end of file
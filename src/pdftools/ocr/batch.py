@@ -0,0 +1,461 @@
+"""
+Batch OCR over directories with cross-document page parallelism
+
+All documents of a batch are split into page tasks that are load-balanced
+across one worker pool, so a long document does not leave the other
+workers idle. Each worker process creates its OCR engine once and reuses
+it for every page it receives. Page results are collected per document and
+the document's output is written as soon as its last page finishes.
+
+Workers and OpenMP threads per worker are balanced against the CPU count
+(see pdftools.ocr.threads), so parallel Tesseract runs do not oversubscribe
+the CPU.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Optional, List, Dict, Union, Iterator, Tuple
+import multiprocessing.util
+import os
+import time
+import logging
+
+from pdftools.ocr.models import OCRConfig, OCRResult, OCRLanguage, OutputMode
+from pdftools.ocr.validators import (
+    validate_pdf,
+    validate_language,
+    validate_pages,
+    check_engine_languages,
+)
+from pdftools.ocr.registry import get_engine
+from pdftools.ocr.core import (
+    _adaptive_metadata,
+    _detect_languages,
+    _ocr_page,
+    _render_pages,
+    _generate_output_path,
+    _known_results,
+    _write_output,
+)
+from pdftools.ocr.checkpoint import PageCheckpoint
+from pdftools.ocr.langdetect import is_auto_language
+from pdftools.ocr.threads import apply_thread_limit, choose_thread_policy
+from pdftools.core.exceptions import InvalidParameterError
+from pdftools.core.metrics import collect_metrics, merge_metrics, record_pages, report_operation
+from pdftools.core.probe import probe_page_count
+
+logger = logging.getLogger(__name__)
+
+# Pending page tasks per worker; bounds memory for very large batches
+TASKS_PER_WORKER = 4
+
+
+@dataclass
+class _DocumentJob:
+    """Scheduling state of one document in a batch"""
+    input_path: Path
+    output_path: Path
+    pages: List[int]
+    language_code: str
+    detection: dict = field(default_factory=dict)
+    started: float = field(default_factory=time.time)
+    results: Dict[int, dict] = field(default_factory=dict)
+    metrics: List[dict] = field(default_factory=list)
+    error: Optional[str] = None
+    checkpoint: Optional[PageCheckpoint] = None
+
+    @property
+    def done(self) -> bool:
+        return len(self.results) == len(self.pages)
+
+
+def find_pdfs(input_dir: Path, recursive: bool = False) -> List[Path]:
+    """
+    Find PDF files in a directory.
+
+    Args:
+        input_dir: Directory to scan
+        recursive: Include subdirectories
+
+    Returns:
+        List[Path]: Sorted PDF paths
+
+    Raises:
+        InvalidParameterError: If input_dir is not a directory
+    """
+    if not input_dir.is_dir():
+        raise InvalidParameterError(
+            "input_dir",
+            str(input_dir),
+            "Path is not a directory"
+        )
+
+    pattern = '**/*' if recursive else '*'
+    return sorted(
+        path for path in input_dir.glob(pattern)
+        if path.is_file() and path.suffix.lower() == '.pdf'
+    )
+
+
+def perform_batch_ocr(
+    input_paths: Union[Path, List[Path]],
+    output_dir: Optional[Path] = None,
+    language: Union[OCRLanguage, List[OCRLanguage], str, List[str]] = OCRLanguage.GERMAN,
+    output_mode: OutputMode = OutputMode.TXT,
+    config: Optional[OCRConfig] = None,
+    workers: Optional[int] = None,
+    recursive: bool = False,
+    threads: Optional[int] = None
+) -> List[OCRResult]:
+    """
+    Perform OCR on many PDF documents using a shared page-level worker pool.
+
+    Args:
+        input_paths: Directory to scan or list of PDF files
+        output_dir: Directory for output files (default: next to each input).
+                    Inputs from several directories (e.g. recursive
+                    scans) keep their directories relative to the
+                    common input directory, so same-named files do not
+                    overwrite each other's output.
+        language: OCR language(s) - single or multiple (default: German),
+                  or 'auto' to detect them per document
+        output_mode: Output format (TXT, PDF, JSON, HOCR, ALTO, JSONL)
+                     (default: TXT). Pages of a document finish out of
+                     order, so every format is written once the document
+                     is complete.
+        config: Optional configuration (pages, DPI, engine, etc.).
+                progress_callback receives (pages_done, pages_total) for the
+                whole batch.
+        workers: Number of worker processes (default: auto, see
+                 pdftools.ocr.threads)
+        recursive: Scan subdirectories when input_paths is a directory
+        threads: OpenMP threads per worker (OMP_THREAD_LIMIT, default: auto)
+
+    Returns:
+        List[OCRResult]: One result per document, in input order. Documents
+                         that fail do not stop the batch; their result has
+                         status 'error'.
+
+    Raises:
+        InvalidParameterError: If parameters are invalid
+        TesseractNotFoundError: If the OCR engine is not available
+        LanguageNotAvailableError: If language data not found
+
+    Example:
+        >>> results = perform_batch_ocr(Path("scans/"), output_dir=Path("text/"))
+        >>> sum(r.success for r in results)
+        42
+    """
+    if config is None:
+        config = OCRConfig()
+
+    if isinstance(input_paths, Path):
+        input_paths = find_pdfs(input_paths, recursive=recursive)
+
+    if workers is not None and workers < 1:
+        raise InvalidParameterError("workers", workers, "Must be at least 1")
+    if threads is not None and threads < 1:
+        raise InvalidParameterError("threads", threads, "Must be at least 1")
+
+    auto_language = is_auto_language(language)
+    languages = None if auto_language else validate_language(language)
+
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    results: List[Optional[OCRResult]] = [None] * len(input_paths)
+    jobs: Dict[int, _DocumentJob] = {}
+    output_dirs = _output_dirs(input_paths, output_dir)
+
+    # Check the engine and its languages once, not in every worker; with
+    # 'auto', the engine also detects each document's language here
+    engine = get_engine(config.engine)
+    try:
+        if languages is not None:
+            check_engine_languages(engine, languages)
+
+        for index, input_path in enumerate(input_paths):
+            try:
+                job = _plan_document(input_path, output_dirs[index], output_mode, engine, languages, config)
+            except Exception as e:
+                logger.error(f"Skipping {input_path}: {e}")
+                results[index] = OCRResult(status='error', message=f"OCR failed: {e}")
+                continue
+
+            if job.done:
+                # Fully checkpointed by an earlier run, or all pages have text
+                results[index] = _finish_document(job, output_mode, config)
+            else:
+                jobs[index] = job
+    finally:
+        engine.close()
+
+    total_pages = sum(len(job.pages) - len(job.results) for job in jobs.values())
+    if total_pages == 0:
+        return results
+    policy = choose_thread_policy(total_pages, workers, threads)
+    workers = policy.workers
+
+    logger.info(
+        f"Batch OCR: {len(jobs)} documents, {total_pages} pages, "
+        f"{workers} workers x {policy.threads} threads, engine {config.engine}"
+    )
+
+    tasks = _page_tasks(jobs)
+    pages_done = 0
+    # The progress callback stays in this process (it may not be picklable)
+    worker_config = replace(config, progress_callback=None)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(config.engine, policy.threads)
+    ) as pool:
+        pending = {}
+
+        def submit_next() -> bool:
+            task = next(tasks, None)
+            if task is None:
+                return False
+            index, page_number = task
+            job = jobs[index]
+            future = pool.submit(
+                _ocr_page_task,
+                str(job.input_path),
+                page_number,
+                job.language_code,
+                worker_config
+            )
+            pending[future] = task
+            return True
+
+        while len(pending) < workers * TASKS_PER_WORKER and submit_next():
+            pass
+
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in finished:
+                index, page_number = pending.pop(future)
+                job = jobs[index]
+
+                try:
+                    job.results[page_number], page_metrics = future.result()
+                    job.metrics.append(page_metrics)
+                    if job.checkpoint is not None:
+                        job.checkpoint.save(job.results[page_number])
+                except Exception as e:
+                    logger.error(f"Failed to process page {page_number} of {job.input_path}: {e}")
+                    job.results[page_number] = None
+                    job.metrics.append({'error': type(e).__name__})
+                    if job.error is None:
+                        job.error = f"OCR failed on page {page_number}: {e}"
+
+                pages_done += 1
+                if config.progress_callback:
+                    config.progress_callback(pages_done, total_pages)
+
+                if job.done:
+                    results[index] = _finish_document(job, output_mode, config)
+                    del jobs[index]
+
+                submit_next()
+
+    return results
+
+
+def _plan_document(
+    input_path: Path,
+    output_dir: Optional[Path],
+    output_mode: OutputMode,
+    engine,
+    languages: Optional[List[str]],
+    config: OCRConfig
+) -> _DocumentJob:
+    """Validate a document and determine its language(s), pages, output path and checkpoint"""
+    input_path = validate_pdf(input_path)
+
+    total_pages = probe_page_count(input_path, config.backend)
+    if total_pages == 0:
+        raise InvalidParameterError("input_path", str(input_path), "PDF has no pages")
+    pages = validate_pages(config.pages or [], total_pages)
+
+    output_path = _generate_output_path(input_path, output_mode)
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_path = output_dir / output_path.name
+
+    detection = {}
+    if languages is None:
+        languages, detection = _detect_languages(engine, input_path, config)
+        check_engine_languages(engine, languages)
+
+    job = _DocumentJob(
+        input_path=input_path,
+        output_path=output_path,
+        pages=pages,
+        language_code='+'.join(languages),
+        detection=detection
+    )
+
+    if config.resume:
+        job.checkpoint = PageCheckpoint(
+            input_path,
+            job.language_code,
+            config.dpi,
+            config.engine,
+            config.tesseract_config,
+            config.checkpoint_dir / input_path.name if config.checkpoint_dir else None,
+            config.adaptive_dpi,
+            config.min_confidence
+        )
+        done = job.checkpoint.load()
+        job.results = {page: done[page] for page in pages if page in done}
+
+    if config.skip_text or config.skip_blank:
+        job.results.update(_known_results(
+            input_path, [page for page in pages if page not in job.results], config
+        ))
+
+    return job
+
+
+def _output_dirs(input_paths: List[Path], output_dir: Optional[Path]) -> List[Optional[Path]]:
+    """
+    Output directory of every input.
+
+    Inputs are placed at their path relative to the deepest directory
+    common to all inputs, e.g. 'scans/a/x.pdf' and 'scans/b/x.pdf' go to
+    'out/a/' and 'out/b/'; inputs from a single directory go to output_dir.
+
+    Args:
+        input_paths: Input PDF paths
+        output_dir: Base output directory (None = next to each input)
+
+    Returns:
+        List[Optional[Path]]: Output directories in input order
+    """
+    if output_dir is None or not input_paths:
+        return [None] * len(input_paths)
+
+    parents = [Path(path).resolve().parent for path in input_paths]
+    try:
+        root = Path(os.path.commonpath(parents))
+    except ValueError:  # Different drives (Windows)
+        return [output_dir / parent.name for parent in parents]
+    return [output_dir / parent.relative_to(root) for parent in parents]
+
+
+def _page_tasks(jobs: Dict[int, _DocumentJob]) -> Iterator[Tuple[int, int]]:
+    """Yield (document index, page number) tasks in document order"""
+    for index, job in list(jobs.items()):
+        for page_number in job.pages:
+            if page_number not in job.results:
+                yield index, page_number
+
+
+def _finish_document(
+    job: _DocumentJob,
+    output_mode: OutputMode,
+    config: OCRConfig
+) -> OCRResult:
+    """Write a completed document's output in page order and build its result"""
+    if job.error is not None:
+        result = OCRResult(
+            status='error',
+            message=job.error,
+            total_pages=len(job.pages),
+            pages_processed=sum(1 for r in job.results.values() if r is not None)
+        )
+        report_operation('ocr', result, merge_metrics(job.metrics))
+        return result
+
+    ocr_results = [job.results[page] for page in job.pages]
+
+    try:
+        with collect_metrics() as write_metrics:
+            _write_output(ocr_results, job.output_path, output_mode, job.input_path)
+    except Exception as e:
+        result = OCRResult(status='error', message=str(e), total_pages=len(job.pages))
+        report_operation('ocr', result, merge_metrics(job.metrics + [{'error': type(e).__name__}]))
+        return result
+
+    if job.checkpoint is not None:
+        job.checkpoint.clear()
+
+    processing_time = time.time() - job.started
+
+    # Stage times are summed over the page tasks (worker time, not wall time)
+    metrics = merge_metrics(job.metrics + [write_metrics.to_dict()])
+    metrics['total_seconds'] = processing_time
+
+    avg_confidence = sum(r['confidence'] for r in ocr_results) / len(ocr_results)
+    metadata = {
+        'avg_confidence': avg_confidence,
+        'processing_time_seconds': processing_time,
+        'total_words': sum(r['word_count'] for r in ocr_results),
+        'language': job.language_code,
+        'dpi': config.dpi,
+        'engine': config.engine,
+        'metrics': metrics,
+    }
+    metadata.update(job.detection)
+    if config.initial_dpi != config.dpi:
+        metadata.update(_adaptive_metadata(ocr_results, config))
+
+    logger.info(
+        f"OCR completed: {job.input_path} ({len(ocr_results)} pages, "
+        f"avg confidence: {avg_confidence:.2%})"
+    )
+
+    result = OCRResult(
+        status='success',
+        output_path=job.output_path,
+        message=f"OCR completed successfully for {len(ocr_results)} pages",
+        pages_processed=len(ocr_results),
+        total_pages=len(ocr_results),
+        metadata=metadata
+    )
+    report_operation('ocr', result, metrics)
+    return result
+
+
+# Engine of the current worker process (created once by _init_worker)
+_worker_engine = None
+
+
+def _init_worker(engine_name: str, threads: int) -> None:
+    """Create the worker's OCR engine and release it when the worker exits"""
+    global _worker_engine
+    apply_thread_limit(threads)
+    _worker_engine = get_engine(engine_name)
+    # atexit handlers do not run in pool workers; multiprocessing finalizers do
+    multiprocessing.util.Finalize(None, _worker_engine.close, exitpriority=10)
+
+
+def _ocr_page_task(
+    pdf_path: str,
+    page_number: int,
+    language_code: str,
+    config: OCRConfig
+) -> Tuple[dict, dict]:
+    """Render and recognize one page in a worker process (returns result and metrics)"""
+    with collect_metrics() as metrics:
+        images = _render_pages(
+            _worker_engine, Path(pdf_path), config.initial_dpi, [page_number], config.backend
+        )
+        image = images[0]
+        try:
+            result = _ocr_page(
+                _worker_engine,
+                image,
+                Path(pdf_path),
+                page_number,
+                language_code,
+                config
+            )
+        finally:
+            image.close()
+        record_pages(1)
+    return result, metrics.to_dict()
@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness comparing OCR engines on a shared fixture set
+
+Every fixture is rendered once up front, so engines are compared on
+recognition alone: the same page images go through each engine's
+process_image() and throughput and confidence are recorded per engine.
+
+With --adaptive-dpi, each engine instead runs complete OCR (rendering
+included) at a fixed DPI and in adaptive mode, comparing throughput and
+how closely the adaptive text matches the fixed-DPI text.
+
+With --thread-policies, each engine runs batch OCR of all fixtures with
+several workers x OpenMP threads splits of the CPUs, including the one
+batch OCR chooses automatically, and compares their throughput.
+
+Usage:
+    python -m pdftools.ocr.benchmark tests/fixtures/*.pdf -e tesseract -e tesserocr
+    python -m pdftools.ocr.benchmark tests/fixtures/*.pdf -e tesseract --adaptive-dpi 150
+    python -m pdftools.ocr.benchmark tests/fixtures/*.pdf -e tesseract --thread-policies
+"""
+
+import sys
+import json
+import time
+import argparse
+import logging
+from dataclasses import dataclass, asdict
+from difflib import SequenceMatcher
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Dict, List, Optional
+
+from PIL import Image
+
+from pdftools.core.backends import get_backend
+from pdftools.core.exceptions import PDFToolsError
+from pdftools.core.probe import probe_page_count
+from pdftools.ocr.batch import perform_batch_ocr
+from pdftools.ocr.core import ocr_pages
+from pdftools.ocr.models import OCRConfig
+from pdftools.ocr.registry import get_engine, list_engines
+from pdftools.ocr.threads import MAX_OMP_THREADS, ThreadPolicy, available_cpus, choose_thread_policy
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EngineBenchmark:
+    """
+    Benchmark result for a single OCR engine
+
+    Attributes:
+        engine: Registered engine name
+        documents: Number of fixture documents processed
+        pages: Number of pages recognized
+        seconds: Total recognition time (excluding rendering and startup)
+        startup_seconds: Time to create the engine
+        pages_per_second: Recognition throughput
+        avg_confidence: Mean page confidence (0.0 - 1.0)
+        error: Error message if the engine could not run
+    """
+    engine: str
+    documents: int = 0
+    pages: int = 0
+    seconds: float = 0.0
+    startup_seconds: float = 0.0
+    pages_per_second: float = 0.0
+    avg_confidence: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class AdaptiveBenchmark:
+    """
+    Adaptive-DPI OCR compared with OCR at a fixed DPI for one engine
+
+    Attributes:
+        engine: Registered engine name
+        dpi: Fixed DPI (also the re-rendering DPI of adaptive mode)
+        adaptive_dpi: First-pass DPI of adaptive mode
+        min_confidence: Re-rendering threshold of adaptive mode
+        pages: Number of pages recognized
+        fixed_seconds: OCR time at the fixed DPI (rendering included)
+        adaptive_seconds: OCR time in adaptive mode (rendering included)
+        speedup: fixed_seconds / adaptive_seconds
+        escalated_pages: Pages re-rendered at the fixed DPI
+        fixed_confidence: Mean page confidence at the fixed DPI
+        adaptive_confidence: Mean page confidence in adaptive mode
+        agreement: Mean word-level similarity of adaptive to fixed-DPI
+                   text (0.0 - 1.0; accuracy relative to the fixed DPI)
+        error: Error message if the engine could not run
+    """
+    engine: str
+    dpi: int
+    adaptive_dpi: int
+    min_confidence: float
+    pages: int = 0
+    fixed_seconds: float = 0.0
+    adaptive_seconds: float = 0.0
+    speedup: float = 0.0
+    escalated_pages: int = 0
+    fixed_confidence: float = 0.0
+    adaptive_confidence: float = 0.0
+    agreement: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class ThreadBenchmark:
+    """
+    Batch OCR throughput of one workers x OpenMP threads policy
+
+    Attributes:
+        engine: Registered engine name
+        workers: Worker processes
+        threads: OMP_THREAD_LIMIT per worker
+        chosen: Whether batch OCR picks this policy automatically
+        pages: Number of pages recognized
+        seconds: Batch OCR time (rendering and output included)
+        pages_per_second: Throughput
+        error: Error message if the run failed
+    """
+    engine: str
+    workers: int
+    threads: int
+    chosen: bool = False
+    pages: int = 0
+    seconds: float = 0.0
+    pages_per_second: float = 0.0
+    error: Optional[str] = None
+
+
+def render_fixtures(
+    pdf_paths: List[Path],
+    dpi: int = 300
+) -> Dict[Path, List[Image.Image]]:
+    """
+    Render all fixture pages once so every engine sees identical input.
+
+    Args:
+        pdf_paths: Fixture PDF files
+        dpi: Rendering resolution
+
+    Returns:
+        Dict mapping each fixture path to its page images
+    """
+    backend = get_backend()
+    return {path: backend.render_pages(path, dpi=dpi) for path in pdf_paths}
+
+
+def benchmark_engines(
+    pdf_paths: List[Path],
+    engines: Optional[List[str]] = None,
+    language: str = 'deu',
+    dpi: int = 300,
+    config: Optional[str] = None
+) -> List[EngineBenchmark]:
+    """
+    Compare OCR engines on the same fixture set.
+
+    Args:
+        pdf_paths: Fixture PDF files
+        engines: Engine names to compare (default: all registered except 'auto')
+        language: Tesseract language code
+        dpi: Rendering resolution
+        config: Optional Tesseract configuration string
+
+    Returns:
+        List[EngineBenchmark]: One result per engine, in the given order
+    """
+    if engines is None:
+        engines = [name for name in list_engines() if name != 'auto']
+
+    fixtures = render_fixtures(pdf_paths, dpi=dpi)
+    results = []
+
+    for name in engines:
+        bench = EngineBenchmark(engine=name)
+
+        try:
+            started = time.perf_counter()
+            engine = get_engine(name)
+            bench.startup_seconds = time.perf_counter() - started
+        except PDFToolsError as e:
+            bench.error = str(e)
+            logger.warning(f"Skipping engine '{name}': {e}")
+            results.append(bench)
+            continue
+
+        confidences = []
+        try:
+            for path, images in fixtures.items():
+                for image in images:
+                    started = time.perf_counter()
+                    result = engine.process_image(image, language, config)
+                    bench.seconds += time.perf_counter() - started
+                    confidences.append(result['confidence'])
+                bench.documents += 1
+        except Exception as e:
+            bench.error = str(e)
+            logger.error(f"Engine '{name}' failed: {e}")
+        finally:
+            engine.close()
+
+        bench.pages = len(confidences)
+        if bench.seconds > 0:
+            bench.pages_per_second = bench.pages / bench.seconds
+        if confidences:
+            bench.avg_confidence = sum(confidences) / len(confidences)
+
+        results.append(bench)
+
+    for images in fixtures.values():
+        for image in images:
+            image.close()
+
+    return results
+
+
+def benchmark_adaptive(
+    pdf_paths: List[Path],
+    engine: str = 'auto',
+    language: str = 'deu',
+    adaptive_dpi: int = 150,
+    dpi: int = 300,
+    min_confidence: float = 0.7
+) -> AdaptiveBenchmark:
+    """
+    Compare adaptive-DPI OCR with OCR at a fixed DPI.
+
+    Both modes run the complete OCR of every fixture through ocr_pages(),
+    so the timings include rendering.
+
+    Args:
+        pdf_paths: Fixture PDF files
+        engine: Engine name
+        language: Tesseract language code
+        adaptive_dpi: First-pass DPI of adaptive mode
+        dpi: Fixed DPI
+        min_confidence: Re-rendering threshold of adaptive mode
+
+    Returns:
+        AdaptiveBenchmark: Comparison of both modes
+    """
+    bench = AdaptiveBenchmark(
+        engine=engine, dpi=dpi, adaptive_dpi=adaptive_dpi, min_confidence=min_confidence
+    )
+    fixed_config = OCRConfig(dpi=dpi, engine=engine)
+    adaptive_config = OCRConfig(
+        dpi=dpi, engine=engine, adaptive_dpi=adaptive_dpi, min_confidence=min_confidence
+    )
+
+    fixed_results, adaptive_results = [], []
+    try:
+        for path in pdf_paths:
+            started = time.perf_counter()
+            fixed_results += ocr_pages(path, language, fixed_config)
+            bench.fixed_seconds += time.perf_counter() - started
+
+            started = time.perf_counter()
+            adaptive_results += ocr_pages(path, language, adaptive_config)
+            bench.adaptive_seconds += time.perf_counter() - started
+    except PDFToolsError as e:
+        bench.error = str(e)
+        logger.warning(f"Skipping engine '{engine}': {e}")
+        return bench
+
+    bench.pages = len(fixed_results)
+    if bench.adaptive_seconds > 0:
+        bench.speedup = bench.fixed_seconds / bench.adaptive_seconds
+    bench.escalated_pages = sum(1 for r in adaptive_results if r.get('escalated'))
+    if bench.pages:
+        bench.fixed_confidence = sum(r['confidence'] for r in fixed_results) / bench.pages
+        bench.adaptive_confidence = sum(r['confidence'] for r in adaptive_results) / bench.pages
+        bench.agreement = sum(
+            SequenceMatcher(None, fixed['text'].split(), adaptive['text'].split()).ratio()
+            for fixed, adaptive in zip(fixed_results, adaptive_results)
+        ) / bench.pages
+    return bench
+
+
+def thread_policies(pages: int, cpus: Optional[int] = None) -> List[ThreadPolicy]:
+    """
+    Policies compared by benchmark_thread_policies.
+
+    The automatic choice plus every split of the CPUs into workers with
+    1, 2, 4, ... threads (up to MAX_OMP_THREADS), at most one worker per page.
+
+    Args:
+        pages: Number of pages to recognize
+        cpus: Available CPUs (None = detect)
+
+    Returns:
+        List[ThreadPolicy]: Distinct policies, automatic choice first
+    """
+    cpus = cpus or available_cpus()
+    policies = [choose_thread_policy(pages, cpus=cpus)]
+    threads = 1
+    while threads <= min(cpus, MAX_OMP_THREADS):
+        policy = choose_thread_policy(pages, threads=threads, cpus=cpus)
+        if policy not in policies:
+            policies.append(policy)
+        threads *= 2
+    return policies
+
+
+def benchmark_thread_policies(
+    pdf_paths: List[Path],
+    engine: str = 'auto',
+    language: str = 'deu',
+    dpi: int = 300,
+    policies: Optional[List[ThreadPolicy]] = None
+) -> List[ThreadBenchmark]:
+    """
+    Compare workers x OpenMP threads policies for batch OCR.
+
+    Every policy runs perform_batch_ocr() over all fixtures, writing text
+    output to a temporary directory.
+
+    Args:
+        pdf_paths: Fixture PDF files
+        engine: Engine name
+        language: Tesseract language code
+        dpi: Rendering DPI
+        policies: Policies to compare (default: thread_policies())
+
+    Returns:
+        List[ThreadBenchmark]: One result per policy, in the given order
+    """
+    pages = sum(probe_page_count(path) for path in pdf_paths)
+    chosen = choose_thread_policy(pages)
+    if policies is None:
+        policies = thread_policies(pages)
+
+    config = OCRConfig(dpi=dpi, engine=engine)
+    results = []
+    for policy in policies:
+        bench = ThreadBenchmark(
+            engine=engine, workers=policy.workers, threads=policy.threads, chosen=policy == chosen
+        )
+        try:
+            with TemporaryDirectory() as output_dir:
+                started = time.perf_counter()
+                ocr_results = perform_batch_ocr(
+                    pdf_paths, Path(output_dir), language, config=config,
+                    workers=policy.workers, threads=policy.threads
+                )
+                bench.seconds = time.perf_counter() - started
+        except PDFToolsError as e:
+            bench.error = str(e)
+            logger.warning(f"Skipping engine '{engine}': {e}")
+            results.append(bench)
+            continue
+
+        bench.pages = sum(r.pages_processed for r in ocr_results if r.success)
+        failed = [r.message for r in ocr_results if not r.success]
+        if failed:
+            bench.error = failed[0]
+        if bench.seconds > 0:
+            bench.pages_per_second = bench.pages / bench.seconds
+        results.append(bench)
+    return results
+
+
+def main():
+    """Main entry point for the OCR engine benchmark"""
+    parser = argparse.ArgumentParser(
+        description='Compare OCR engines on a set of PDF fixtures'
+    )
+    parser.add_argument('files', type=Path, nargs='+', help='Fixture PDF files')
+    parser.add_argument(
+        '-e', '--engine',
+        action='append',
+        choices=list_engines(),
+        help='Engine to benchmark (repeatable, default: all)'
+    )
+    parser.add_argument('-l', '--language', default='deu', help='OCR language (default: deu)')
+    parser.add_argument('--dpi', type=int, default=300, help='Rendering DPI (default: 300)')
+    parser.add_argument(
+        '--adaptive-dpi',
+        type=int,
+        metavar='DPI',
+        help='Compare adaptive OCR starting at this DPI with OCR at --dpi'
+    )
+    parser.add_argument(
+        '--min-confidence',
+        type=float,
+        default=0.7,
+        help='Re-rendering threshold for --adaptive-dpi (default: 0.7)'
+    )
+    parser.add_argument(
+        '--thread-policies',
+        action='store_true',
+        help='Compare workers x OpenMP threads policies for batch OCR'
+    )
+    parser.add_argument('--json', type=Path, help='Write results as JSON to this file')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+
+    if args.adaptive_dpi:
+        sys.exit(_main_adaptive(args))
+    if args.thread_policies:
+        sys.exit(_main_thread_policies(args))
+
+    results = benchmark_engines(
+        args.files,
+        engines=args.engine,
+        language=args.language,
+        dpi=args.dpi
+    )
+
+    print(f"\n{'Engine':<12} {'Pages':>6} {'Time (s)':>9} {'Pages/s':>8} {'Conf.':>7} {'Startup':>8}")
+    for bench in results:
+        if bench.error and not bench.pages:
+            print(f"{bench.engine:<12} skipped: {bench.error}")
+            continue
+        print(
+            f"{bench.engine:<12} {bench.pages:>6} {bench.seconds:>9.2f} "
+            f"{bench.pages_per_second:>8.2f} {bench.avg_confidence:>7.2%} "
+            f"{bench.startup_seconds:>8.2f}"
+        )
+
+    if args.json:
+        args.json.write_text(
+            json.dumps([asdict(b) for b in results], indent=2),
+            encoding='utf-8'
+        )
+
+    sys.exit(0)
+
+
+def _main_adaptive(args) -> int:
+    """Run and print the adaptive-DPI comparison for each engine"""
+    results = [
+        benchmark_adaptive(
+            args.files,
+            engine=name,
+            language=args.language,
+            adaptive_dpi=args.adaptive_dpi,
+            dpi=args.dpi,
+            min_confidence=args.min_confidence
+        )
+        for name in args.engine or ['auto']
+    ]
+
+    print(
+        f"\n{'Engine':<12} {'Pages':>6} {f'{args.dpi} DPI (s)':>13} {'Adaptive (s)':>13} "
+        f"{'Speedup':>8} {'Escalated':>10} {'Agreement':>10}"
+    )
+    for bench in results:
+        if bench.error:
+            print(f"{bench.engine:<12} skipped: {bench.error}")
+            continue
+        print(
+            f"{bench.engine:<12} {bench.pages:>6} {bench.fixed_seconds:>13.2f} "
+            f"{bench.adaptive_seconds:>13.2f} {bench.speedup:>7.2f}x "
+            f"{bench.escalated_pages:>10} {bench.agreement:>10.2%}"
+        )
+
+    if args.json:
+        args.json.write_text(
+            json.dumps([asdict(b) for b in results], indent=2),
+            encoding='utf-8'
+        )
+    return 0
+
+
+def _main_thread_policies(args) -> int:
+    """Run and print the thread policy comparison for each engine"""
+    results = []
+    for name in args.engine or ['auto']:
+        results += benchmark_thread_policies(
+            args.files,
+            engine=name,
+            language=args.language,
+            dpi=args.dpi
+        )
+
+    print(f"\n{available_cpus()} CPUs, * = chosen automatically")
+    print(f"{'Engine':<12} {'Workers':>8} {'Threads':>8} {'Pages':>6} {'Time (s)':>9} {'Pages/s':>8}")
+    for bench in results:
+        marker = '*' if bench.chosen else ' '
+        if bench.error and not bench.pages:
+            print(f"{bench.engine:<12} {bench.workers:>8} {bench.threads:>8}{marker} skipped: {bench.error}")
+            continue
+        print(
+            f"{bench.engine:<12} {bench.workers:>8} {bench.threads:>8}{marker}"
+            f"{bench.pages:>6} {bench.seconds:>9.2f} {bench.pages_per_second:>8.2f}"
+        )
+
+    if args.json:
+        args.json.write_text(
+            json.dumps([asdict(b) for b in results], indent=2),
+            encoding='utf-8'
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,216 @@
+"""
+Cached Tesseract environment probing
+
+Checking the Tesseract version and installed languages spawns
+``tesseract --version`` / ``--list-langs``. The probe runs once per process
+and binary; the result is memoized and optionally persisted to an on-disk
+cache so batch runs and repeated CLI invocations skip the subprocesses.
+
+The on-disk cache is disabled by default. Set ``PDFTOOLS_TESSERACT_CACHE_TTL``
+to a lifetime in seconds to enable it; ``PDFTOOLS_CACHE_DIR`` overrides the
+cache directory (default: ``$XDG_CACHE_HOME/pdftools`` or ``~/.cache/pdftools``).
+"""
+
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+
+from pdftools.core.exceptions import TesseractNotFoundError
+
+logger = logging.getLogger(__name__)
+
+CACHE_TTL_ENV = 'PDFTOOLS_TESSERACT_CACHE_TTL'
+CACHE_DIR_ENV = 'PDFTOOLS_CACHE_DIR'
+CACHE_FILENAME = 'tesseract-capabilities.json'
+
+
+@dataclass(frozen=True)
+class TesseractCapabilities:
+    """
+    Probed Tesseract environment
+
+    Attributes:
+        tesseract_cmd: Tesseract binary the probe ran against
+        version: Tesseract version string (e.g., '5.3.0')
+        languages: Installed language codes
+        tesserocr_available: Whether the in-process tesserocr binding is importable
+        probed_at: Unix timestamp of the probe
+    """
+    tesseract_cmd: str
+    version: str
+    languages: Tuple[str, ...]
+    tesserocr_available: bool
+    probed_at: float
+
+    def has_language(self, language: str) -> bool:
+        """Returns True if the language is installed"""
+        return language in self.languages
+
+
+_cache: Dict[str, TesseractCapabilities] = {}
+_lock = threading.Lock()
+
+
+def get_tesseract_capabilities(
+    tesseract_cmd: Optional[str] = None,
+    refresh: bool = False
+) -> TesseractCapabilities:
+    """
+    Get the Tesseract capabilities, probing only on first use.
+
+    Args:
+        tesseract_cmd: Tesseract binary (default: pytesseract's configured binary)
+        refresh: Ignore memoized and on-disk results and probe again
+
+    Returns:
+        TesseractCapabilities: Probed environment
+
+    Raises:
+        TesseractNotFoundError: If Tesseract is not installed or not working
+    """
+    try:
+        import pytesseract
+    except ImportError as e:
+        raise TesseractNotFoundError() from e
+
+    cmd = tesseract_cmd or pytesseract.pytesseract.tesseract_cmd
+
+    with _lock:
+        if not refresh and cmd in _cache:
+            return _cache[cmd]
+
+        capabilities = None if refresh else _load_disk_cache(cmd)
+        if capabilities is None:
+            capabilities = _probe(pytesseract, cmd)
+            _store_disk_cache(capabilities)
+
+        _cache[cmd] = capabilities
+        return capabilities
+
+
+def clear_capabilities_cache(disk: bool = False) -> None:
+    """
+    Forget memoized probe results.
+
+    Args:
+        disk: Also delete the on-disk cache file
+    """
+    with _lock:
+        _cache.clear()
+
+    if disk:
+        try:
+            _cache_file().unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _probe(pytesseract, cmd: str) -> TesseractCapabilities:
+    """Run Tesseract to determine version and installed languages"""
+    previous_cmd = pytesseract.pytesseract.tesseract_cmd
+    pytesseract.pytesseract.tesseract_cmd = cmd
+    try:
+        version = str(pytesseract.get_tesseract_version())
+        languages = tuple(pytesseract.get_languages(config=''))
+    except Exception as e:
+        logger.error(f"Tesseract not found: {e}")
+        raise TesseractNotFoundError() from e
+    finally:
+        pytesseract.pytesseract.tesseract_cmd = previous_cmd
+
+    from pdftools.ocr.ocr_engine import TESSEROCR_AVAILABLE
+
+    logger.debug(f"Tesseract version: {version}, languages: {list(languages)}")
+    return TesseractCapabilities(
+        tesseract_cmd=cmd,
+        version=version,
+        languages=languages,
+        tesserocr_available=TESSEROCR_AVAILABLE,
+        probed_at=time.time()
+    )
+
+
+def _cache_ttl() -> float:
+    """On-disk cache lifetime in seconds (0 = disabled)"""
+    try:
+        return max(float(os.environ.get(CACHE_TTL_ENV, 0)), 0.0)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {CACHE_TTL_ENV} value")
+        return 0.0
+
+
+def cache_dir() -> Path:
+    """Directory of the on-disk pdftools caches"""
+    directory = os.environ.get(CACHE_DIR_ENV)
+    if not directory:
+        base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+        directory = Path(base) / 'pdftools'
+    return Path(directory)
+
+
+def _cache_file() -> Path:
+    """Location of the on-disk cache"""
+    return cache_dir() / CACHE_FILENAME
+
+
+def _binary_fingerprint(cmd: str) -> Optional[str]:
+    """Identify the installed binary so upgrades invalidate the cache"""
+    resolved = shutil.which(cmd)
+    if resolved is None:
+        return None
+    stat = os.stat(resolved)
+    return f"{os.path.realpath(resolved)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _load_disk_cache(cmd: str) -> Optional[TesseractCapabilities]:
+    """Load a fresh cache entry for the binary, if any"""
+    ttl = _cache_ttl()
+    if not ttl:
+        return None
+
+    try:
+        entries = json.loads(_cache_file().read_text(encoding='utf-8'))
+        entry = entries[cmd]
+        if entry['fingerprint'] != _binary_fingerprint(cmd):
+            return None
+        if time.time() - entry['probed_at'] > ttl:
+            return None
+        entry.pop('fingerprint')
+        entry['languages'] = tuple(entry['languages'])
+        capabilities = TesseractCapabilities(**entry)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    logger.debug(f"Using cached Tesseract capabilities from {_cache_file()}")
+    return capabilities
+
+
+def _store_disk_cache(capabilities: TesseractCapabilities) -> None:
+    """Persist a probe result (best effort)"""
+    if not _cache_ttl():
+        return
+
+    path = _cache_file()
+    try:
+        entries = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        entries = {}
+
+    entry = asdict(capabilities)
+    entry['languages'] = list(capabilities.languages)
+    entry['fingerprint'] = _binary_fingerprint(capabilities.tesseract_cmd)
+    entries[capabilities.tesseract_cmd] = entry
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_path.write_text(json.dumps(entries, indent=2), encoding='utf-8')
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Could not write Tesseract capability cache: {e}")
@@ -0,0 +1,138 @@
+"""
+Per-page OCR checkpoints for resumable runs
+
+Every recognized page is stored as one small JSON file in a sidecar
+directory next to the input PDF (``.{name}.ocr-checkpoint/{key}/``). The key
+covers the input file (size and modification time) and every setting that
+affects recognition, so a changed file or different language/DPI never
+reuses stale pages.
+"""
+
+from pathlib import Path
+from typing import Dict, Optional
+import hashlib
+import json
+import logging
+import os
+import shutil
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_SUFFIX = '.ocr-checkpoint'
+
+
+class PageCheckpoint:
+    """
+    Checkpoint store for the page results of one OCR run.
+
+    Example:
+        >>> checkpoint = PageCheckpoint(Path("scan.pdf"), "deu", 300, "auto")
+        >>> done = checkpoint.load()        # {page_number: page_result}
+        >>> checkpoint.save(page_result)    # after each recognized page
+        >>> checkpoint.clear()              # once the output is written
+    """
+
+    def __init__(
+        self,
+        input_path: Path,
+        language_code: str,
+        dpi: int,
+        engine: str,
+        tesseract_config: Optional[str] = None,
+        checkpoint_dir: Optional[Path] = None,
+        adaptive_dpi: Optional[int] = None,
+        min_confidence: Optional[float] = None
+    ):
+        """
+        Initialize checkpoint store.
+
+        Args:
+            input_path: Input PDF path
+            language_code: Tesseract language code (e.g., 'deu+eng')
+            dpi: Rendering DPI
+            engine: OCR engine name
+            tesseract_config: Optional Tesseract configuration string
+            checkpoint_dir: Base directory for checkpoints
+                          (default: sidecar directory next to the input)
+            adaptive_dpi: First-pass DPI of adaptive OCR (None = fixed DPI)
+            min_confidence: Re-rendering threshold of adaptive OCR
+        """
+        self.input_path = input_path
+        self.base_dir = checkpoint_dir or (
+            input_path.parent / f".{input_path.name}{CHECKPOINT_SUFFIX}"
+        )
+        self.key = _checkpoint_key(
+            input_path, language_code, dpi, engine, tesseract_config,
+            adaptive_dpi, min_confidence
+        )
+        self.path = self.base_dir / self.key
+
+    def load(self) -> Dict[int, dict]:
+        """
+        Load all checkpointed pages.
+
+        Unreadable checkpoint files (e.g., from a crash during writing)
+        are ignored, so those pages are processed again.
+
+        Returns:
+            Dict[int, dict]: Page results keyed by page number
+        """
+        pages = {}
+        if not self.path.is_dir():
+            return pages
+
+        for page_file in self.path.glob('page-*.json'):
+            try:
+                result = json.loads(page_file.read_text(encoding='utf-8'))
+                pages[int(result['page_number'])] = result
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Ignoring damaged checkpoint {page_file}: {e}")
+
+        if pages:
+            logger.info(f"Resuming from checkpoint: {len(pages)} pages already done")
+        return pages
+
+    def save(self, page_result: dict) -> None:
+        """
+        Store the result of one page atomically.
+
+        Args:
+            page_result: Page result with at least 'page_number'
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        page_file = self.path / f"page-{page_result['page_number']:05d}.json"
+        tmp_file = page_file.with_suffix('.tmp')
+        tmp_file.write_text(json.dumps(page_result, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp_file, page_file)
+
+    def clear(self) -> None:
+        """Remove the checkpoint (and the sidecar directory once empty)"""
+        shutil.rmtree(self.path, ignore_errors=True)
+        try:
+            self.base_dir.rmdir()
+        except OSError:
+            pass  # Not empty (other runs) or already gone
+
+
+def _checkpoint_key(
+    input_path: Path,
+    language_code: str,
+    dpi: int,
+    engine: str,
+    tesseract_config: Optional[str],
+    adaptive_dpi: Optional[int] = None,
+    min_confidence: Optional[float] = None
+) -> str:
+    """Fingerprint of the input file and recognition settings"""
+    stat = input_path.stat()
+    fingerprint = '|'.join([
+        str(input_path.resolve()),
+        str(stat.st_size),
+        str(stat.st_mtime_ns),
+        language_code,
+        str(dpi),
+        engine,
+        tesseract_config or '',
+    ] + ([f'adaptive:{adaptive_dpi}<{min_confidence}'] if adaptive_dpi else []))
+    return hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()[:16]
@@ -10,7 +10,12 @@ from pathlib import Path
 from typing import List
 
 from pdftools.ocr.core import perform_ocr
+from pdftools.ocr.batch import perform_batch_ocr, find_pdfs
 from pdftools.ocr.models import OCRLanguage, OutputMode, OCRConfig
+from pdftools.ocr.registry import list_engines
+from pdftools.cli.common import add_profile_argument, add_stats_argument, print_stats, profile_main
+from pdftools.core.backends import list_backends
+from pdftools.core.metrics import merge_metrics
 from pdftools.core.exceptions import (
     PDFToolsError,
     TesseractNotFoundError,
@@ -66,6 +71,36 @@ def setup_logging(verbose: bool) -> None:
     )
 
 
+def _print_batch_summary(input_dir: Path, pdf_files: List[Path], results: list) -> int:
+    """
+    Print batch results and return the exit code.
+
+    Args:
+        input_dir: Batch input directory
+        pdf_files: Processed PDF files
+        results: OCRResult per file
+
+    Returns:
+        int: 0 if all documents succeeded, 1 otherwise
+    """
+    failed = 0
+    pages = sum(r.pages_processed for r in results)
+
+    print(f"\n{'='*60}")
+    print(f"Batch OCR: {input_dir}")
+    print(f"{'='*60}")
+    for pdf_file, result in zip(pdf_files, results):
+        if not result.success:
+            failed += 1
+            print(f"FAILED: {pdf_file}: {result.message}", file=sys.stderr)
+    print(f"Documents:        {len(results) - failed}/{len(results)} successful")
+    print(f"Pages processed:  {pages}")
+    print(f"{'='*60}\n")
+
+    return 1 if failed else 0
+
+
+@profile_main
 def main():
     """Main entry point for OCR CLI"""
     parser = argparse.ArgumentParser(
@@ -79,15 +114,31 @@ Examples:
   # Multiple languages, PDF output
   %(prog)s -f document.pdf -l deu+eng --output-mode pdf -o searchable.pdf
 
+  # Detect the language from a small sample, then OCR with it only
+  %(prog)s -f letter.pdf -l auto
+
   # Specific pages only
   %(prog)s -f contract.pdf --pages "1-5,10"
 
   # JSON output for processing
   %(prog)s -f receipt.pdf --output-mode json -o result.json
 
+  # Word boxes as ALTO XML, written page by page (scan_ocr.xml)
+  %(prog)s -f scan.pdf --output-mode alto
+
+  # Use Tesseract from the ocrmypdf Docker image
+  %(prog)s -f scan.pdf --engine ocrmypdf
+
+  # Long scan: re-running the same command continues after a crash/timeout
+  %(prog)s -f book.pdf --resume
+
+  # Batch mode: all PDFs in a directory, pages spread over 8 workers
+  %(prog)s --batch scans/ -o text/ --workers 8
+
 Supported languages:
   deu (German), eng (English), fra (French), ita (Italian), spa (Spanish)
   Use '+' to combine multiple languages: deu+eng
+  Use 'auto' to detect the language(s) of each document
 
 Note:
   This tool requires Tesseract OCR to be installed.
@@ -97,32 +148,41 @@ Note:
         """
     )
 
-    parser.add_argument(
+    input_group = parser.add_mutually_exclusive_group(required=True)
+
+    input_group.add_argument(
         '-f', '--file',
         type=Path,
-        required=True,
         help='Input PDF file path'
     )
 
+    input_group.add_argument(
+        '--batch',
+        type=Path,
+        metavar='DIR',
+        help='Process all PDF files in a directory'
+    )
+
     parser.add_argument(
         '-o', '--output',
         type=Path,
-        help='Output file path (default: {filename}_ocr.{ext})'
+        help='Output file path (default: {filename}_ocr.{ext}); '
+             'output directory in batch mode'
     )
 
     parser.add_argument(
         '-l', '--language',
         type=str,
         default='deu',
-        help='OCR language(s) - single or multiple with + (default: deu)'
+        help="OCR language(s) - single or multiple with +, or 'auto' to detect (default: deu)"
     )
 
     parser.add_argument(
         '--output-mode',
         type=str,
-        choices=['txt', 'pdf', 'json'],
+        choices=[mode.value for mode in OutputMode],
         default='txt',
-        help='Output format (default: txt)'
+        help='Output format; hocr, alto and jsonl are written page by page (default: txt)'
     )
 
     parser.add_argument(
@@ -138,6 +198,73 @@ Note:
         help='DPI for PDF to image conversion (default: 300)'
     )
 
+    parser.add_argument(
+        '--adaptive-dpi',
+        type=int,
+        metavar='DPI',
+        help='OCR at this lower DPI first; re-render only low-confidence pages at --dpi'
+    )
+
+    parser.add_argument(
+        '--min-confidence',
+        type=float,
+        default=0.7,
+        help='Confidence below which --adaptive-dpi re-renders a page (default: 0.7)'
+    )
+
+    parser.add_argument(
+        '--engine',
+        type=str,
+        choices=list_engines(),
+        default='auto',
+        help='OCR engine (default: auto - tesserocr if installed, else tesseract)'
+    )
+
+    parser.add_argument(
+        '--backend',
+        choices=list_backends(),
+        help='PDF rendering backend (default: $PDFTOOLS_BACKEND or auto)'
+    )
+
+    parser.add_argument(
+        '--skip-text',
+        action='store_true',
+        help='Only OCR pages without a text layer (others keep their text)'
+    )
+
+    parser.add_argument(
+        '--skip-blank',
+        action='store_true',
+        help='Do not OCR blank pages (they are written as empty pages)'
+    )
+
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Checkpoint each page and continue an interrupted run'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Worker processes in batch mode (default: auto from CPU and page count)'
+    )
+
+    parser.add_argument(
+        '--threads',
+        type=int,
+        help='OpenMP threads per worker in batch mode (OMP_THREAD_LIMIT, default: auto)'
+    )
+
+    parser.add_argument(
+        '--recursive',
+        action='store_true',
+        help='Include subdirectories in batch mode'
+    )
+
+    add_stats_argument(parser)
+    add_profile_argument(parser)
+
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -169,9 +296,32 @@ Note:
         config = OCRConfig(
             pages=pages,
             dpi=args.dpi,
-            verbose=args.verbose
+            verbose=args.verbose,
+            engine=args.engine,
+            resume=args.resume,
+            backend=args.backend,
+            skip_text=args.skip_text,
+            skip_blank=args.skip_blank,
+            adaptive_dpi=args.adaptive_dpi,
+            min_confidence=args.min_confidence
         )
 
+        if args.batch:
+            pdf_files = find_pdfs(args.batch, recursive=args.recursive)
+            logger.info(f"Starting batch OCR: {len(pdf_files)} files in {args.batch}")
+            results = perform_batch_ocr(
+                pdf_files,
+                output_dir=args.output,
+                language=languages,
+                output_mode=output_mode,
+                config=config,
+                workers=args.workers,
+                threads=args.threads
+            )
+            if args.stats:
+                print_stats(merge_metrics(r.metadata.get('metrics') for r in results))
+            sys.exit(_print_batch_summary(args.batch, pdf_files, results))
+
         # Perform OCR
         logger.info(f"Starting OCR processing: {args.file}")
         result = perform_ocr(
@@ -182,6 +332,9 @@ Note:
             config=config
         )
 
+        if args.stats:
+            print_stats(result.metadata.get('metrics'))
+
         # Display result
         if result.success:
             print(f"\n{'='*60}")
@@ -191,6 +344,8 @@ Note:
             print(f"Pages processed:  {result.pages_processed}/{result.total_pages}")
             print(f"Average confidence: {result.metadata.get('avg_confidence', 0):.2%}")
             print(f"Total words:      {result.metadata.get('total_words', 0)}")
+            if 'detected_languages' in result.metadata:
+                print(f"Detected language: {result.metadata['language']}")
             print(f"Processing time:  {result.metadata.get('processing_time_seconds', 0):.2f}s")
             print(f"{'='*60}\n")
             sys.exit(0)
@@ -2,8 +2,9 @@
 Core OCR processing logic
 """
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, List, Union
+from typing import Callable, Dict, Optional, List, Union, Tuple, Iterator
 import json
 import time
 import logging
@@ -12,10 +13,27 @@ from pdftools.ocr.models import OCRConfig, OCRResult, OCRLanguage, OutputMode
 from pdftools.ocr.validators import (
     validate_pdf,
     validate_language,
-    check_tesseract,
-    check_language_available,
+    validate_pages,
+    check_engine_languages,
 )
-from pdftools.ocr.ocr_engine import TesseractEngine
+from pdftools.ocr.registry import get_engine
+from pdftools.ocr.checkpoint import PageCheckpoint
+from pdftools.ocr.writers import open_page_writer
+from pdftools.ocr.langdetect import (
+    SAMPLE_DPI,
+    FALLBACK_LANGUAGE,
+    candidate_languages,
+    detect_from_text,
+    is_auto_language,
+    sample_pages,
+    sample_region,
+)
+from pdftools.core.backends import get_backend
+from pdftools.core.blank import find_blank_pages
+from pdftools.core.content import classify_pages
+from pdftools.core.document import open_document
+from pdftools.core.metrics import record_error, record_metrics, record_output, record_pages, stage
+from pdftools.core.probe import probe_page_count
 from pdftools.core.exceptions import (
     PDFNotFoundError,
     OCRProcessingError,
@@ -23,7 +41,11 @@ from pdftools.core.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Pages rendered at once when resuming (bounds work lost on interruption)
+RESUME_CHUNK_PAGES = 10
+
 
+@record_metrics
 def perform_ocr(
     input_path: Path,
     output_path: Optional[Path] = None,
@@ -37,8 +59,12 @@ def perform_ocr(
     Args:
         input_path: Path to input PDF file
         output_path: Output path. If None, creates '{filename}_ocr.{ext}'
-        language: OCR language(s) - single or multiple (default: German)
-        output_mode: Output format (TXT, PDF, JSON) (default: TXT)
+        language: OCR language(s) - single or multiple (default: German),
+                  or 'auto' to detect them from a sample of the pages
+        output_mode: Output format (TXT, PDF, JSON, HOCR, ALTO, JSONL)
+                     (default: TXT). HOCR, ALTO and JSONL output is
+                     written page by page as pages are recognized
+                     (except when resuming).
         config: Optional configuration (pages, DPI, etc.)
 
     Returns:
@@ -67,88 +93,132 @@ def perform_ocr(
             config = OCRConfig()
 
         # Validate input
-        input_path = validate_pdf(input_path)
-
-        # Check Tesseract availability
-        check_tesseract()
-
-        # Validate and normalize language
-        languages = validate_language(language)
-        language_code = '+'.join(languages)  # Tesseract format for multiple languages
-
-        # Check language availability
-        for lang in languages:
-            check_language_available(lang)
-
-        # Generate output path if not provided
-        if output_path is None:
-            output_path = _generate_output_path(input_path, output_mode)
-
-        # Log start
-        logger.info(f"Starting OCR: {input_path} -> {output_path}")
-        logger.info(f"Language: {language_code}, Mode: {output_mode.value}")
-
-        # Initialize OCR engine
-        engine = TesseractEngine()
-
-        # Convert PDF to images
-        logger.info("Converting PDF to images...")
-        images = engine.pdf_to_images(
-            input_path,
-            dpi=config.dpi,
-            pages=config.pages
-        )
-
-        total_pages = len(images)
-        logger.info(f"Processing {total_pages} pages")
-
-        # Process each page
-        ocr_results = []
-        for i, image in enumerate(images, start=1):
-            try:
-                if config.verbose:
-                    logger.info(f"Processing page {i}/{total_pages}...")
-
-                # Progress callback
-                if config.progress_callback:
-                    config.progress_callback(i, total_pages)
-
-                # Process image
-                result = engine.process_image(
-                    image,
+        with stage('validate'):
+            input_path = validate_pdf(input_path)
+
+            # Validate and normalize language ('auto' is resolved by the engine)
+            auto_language = is_auto_language(language)
+            languages = [] if auto_language else validate_language(language)
+
+        # Initialize OCR engine (verifies that its backend is available)
+        engine = get_engine(config.engine)
+        checkpoint = None
+        detection_metadata = {}
+        streamed = output_mode.streaming and not config.resume
+
+        try:
+            if auto_language:
+                languages, detection_metadata = _detect_languages(engine, input_path, config)
+            language_code = '+'.join(languages)  # Tesseract format for multiple languages
+
+            # Check language availability
+            with stage('validate'):
+                check_engine_languages(engine, languages)
+
+            # Generate output path if not provided
+            if output_path is None:
+                output_path = _generate_output_path(input_path, output_mode)
+
+            # Log start
+            logger.info(f"Starting OCR: {input_path} -> {output_path}")
+            logger.info(f"Language: {language_code}, Mode: {output_mode.value}")
+            logger.info(f"Engine: {config.engine} ({type(engine).__name__})")
+
+            if config.resume:
+                ocr_results, checkpoint = _ocr_resumable(
+                    engine,
+                    input_path,
                     language_code,
-                    config.tesseract_config
+                    config
                 )
-
-                ocr_results.append({
-                    'page_number': i,
-                    'text': result['text'],
-                    'confidence': result['confidence'],
-                    'word_count': len(result['text'].split())
-                })
-
-                # Log low confidence warning
-                if result['confidence'] < 0.7:
-                    logger.warning(
-                        f"Low OCR confidence on page {i}: {result['confidence']:.2%}"
+                total_pages = len(ocr_results)
+            else:
+                page_numbers, text_results = _select_pages(input_path, config)
+
+                # Convert PDF to images
+                logger.info("Converting PDF to images...")
+                images = _render_pages(
+                    engine,
+                    input_path,
+                    config.initial_dpi,
+                    page_numbers,
+                    config.backend
+                ) if page_numbers != [] else []
+
+                total_pages = len(images)
+                logger.info(f"Processing {total_pages} pages")
+
+                # Process each page
+                ocr_results = []
+                with _page_stream(streamed, output_mode, output_path, input_path, text_results) as write_page:
+                    for i, image in enumerate(images, start=1):
+                        try:
+                            if config.verbose:
+                                logger.info(f"Processing page {i}/{total_pages}...")
+
+                            # Progress callback
+                            if config.progress_callback:
+                                config.progress_callback(i, total_pages)
+
+                            # Process image
+                            ocr_results.append(_ocr_page(
+                                engine,
+                                image,
+                                input_path,
+                                page_numbers[i - 1] if page_numbers else i,
+                                language_code,
+                                config
+                            ))
+
+                            # Clean up image
+                            image.close()
+
+                        except Exception as e:
+                            logger.error(f"Failed to process page {i}: {e}")
+                            if not config.progress_callback:
+                                raise OCRProcessingError(f"OCR failed on page {i}: {e}") from e
+                            continue
+
+                        if write_page is not None:
+                            write_page(ocr_results[-1])
+
+                if text_results:
+                    ocr_results = sorted(
+                        ocr_results + list(text_results.values()),
+                        key=lambda result: result['page_number']
                     )
+                    total_pages = len(ocr_results)
 
-                # Clean up image
-                image.close()
+        finally:
+            engine.close()
 
-            except Exception as e:
-                logger.error(f"Failed to process page {i}: {e}")
-                if not config.progress_callback:
-                    raise OCRProcessingError(f"OCR failed on page {i}: {e}") from e
+        # Write output (streamed output is complete already)
+        if streamed:
+            record_output(output_path)
+        else:
+            logger.info(f"Writing output to {output_path}...")
+            _write_output(ocr_results, output_path, output_mode, input_path)
+
+        if checkpoint is not None:
+            checkpoint.clear()
 
-        # Write output
-        logger.info(f"Writing output to {output_path}...")
-        _write_output(ocr_results, output_path, output_mode, input_path)
+        record_pages(total_pages)
 
         # Calculate metadata
         processing_time = time.time() - start_time
         avg_confidence = sum(r['confidence'] for r in ocr_results) / len(ocr_results)
         total_words = sum(r['word_count'] for r in ocr_results)
+        metadata = {
+            'avg_confidence': avg_confidence,
+            'processing_time_seconds': processing_time,
+            'total_words': total_words,
+            'language': language_code,
+            'dpi': config.dpi,
+            'engine': config.engine,
+        }
+        metadata.update(detection_metadata)
+        if config.initial_dpi != config.dpi:
+            metadata.update(_adaptive_metadata(ocr_results, config))
 
         # Create result
         result = OCRResult(
@@ -157,13 +227,7 @@ def perform_ocr(
             message=f"OCR completed successfully for {total_pages} pages",
             pages_processed=total_pages,
             total_pages=total_pages,
-            metadata={
-                'avg_confidence': avg_confidence,
-                'processing_time_seconds': processing_time,
-                'total_words': total_words,
-                'language': language_code,
-                'dpi': config.dpi,
-            }
+            metadata=metadata
         )
 
         logger.info(
@@ -176,6 +240,7 @@ def perform_ocr(
     except (PDFNotFoundError, OCRProcessingError):
         raise
     except Exception as e:
+        record_error(e)
         logger.error(f"OCR processing failed: {e}", exc_info=True)
         return OCRResult(
             status='error',
@@ -185,6 +250,447 @@ def perform_ocr(
         )
 
 
+def ocr_pages(
+    input_path: Path,
+    language: Union[OCRLanguage, List[OCRLanguage], str, List[str]] = OCRLanguage.GERMAN,
+    config: Optional[OCRConfig] = None
+) -> List[dict]:
+    """
+    Recognize the pages of a PDF in memory, without writing any output.
+
+    Used by callers that process the recognized text further themselves
+    (e.g. the pipeline runner).
+
+    Args:
+        input_path: Path to input PDF file
+        language: OCR language(s) - single or multiple (default: German),
+                  or 'auto' to detect them from a sample of the pages
+        config: Optional configuration (pages, DPI, engine, backend)
+
+    Returns:
+        List[dict]: Page results (page_number, text, confidence, word_count)
+
+    Raises:
+        PDFNotFoundError: If input file doesn't exist
+        TesseractNotFoundError: If Tesseract is not installed
+        LanguageNotAvailableError: If language data not found
+        OCRProcessingError: If OCR fails
+    """
+    if config is None:
+        config = OCRConfig()
+
+    with stage('validate'):
+        input_path = validate_pdf(input_path)
+        auto_language = is_auto_language(language)
+        languages = [] if auto_language else validate_language(language)
+
+    engine = get_engine(config.engine)
+    try:
+        if auto_language:
+            languages, _ = _detect_languages(engine, input_path, config)
+        language_code = '+'.join(languages)
+
+        with stage('validate'):
+            check_engine_languages(engine, languages)
+
+        page_numbers, text_results = _select_pages(input_path, config)
+        results = list(text_results.values())
+        images = _render_pages(
+            engine, input_path, config.initial_dpi, page_numbers, config.backend
+        ) if page_numbers != [] else []
+        for i, image in enumerate(images):
+            page_number = page_numbers[i] if page_numbers else i + 1
+            try:
+                results.append(_ocr_page(
+                    engine, image, input_path, page_number, language_code, config
+                ))
+            except Exception as e:
+                raise OCRProcessingError(f"OCR failed on page {page_number}: {e}") from e
+            finally:
+                image.close()
+        record_pages(len(results))
+        return sorted(results, key=lambda result: result['page_number'])
+    finally:
+        engine.close()
+
+
+def _ocr_resumable(
+    engine,
+    input_path: Path,
+    language_code: str,
+    config: OCRConfig
+) -> Tuple[List[dict], PageCheckpoint]:
+    """
+    Run OCR page by page, checkpointing every recognized page.
+
+    Pages found in an existing checkpoint are skipped. Missing pages are
+    rendered in small chunks so an interruption loses at most the page in
+    progress and memory stays bounded for long documents.
+
+    Args:
+        engine: OCR engine instance
+        input_path: Input PDF path
+        language_code: Tesseract language code
+        config: OCR configuration
+
+    Returns:
+        Tuple of (page results in page order, checkpoint store)
+
+    Raises:
+        OCRProcessingError: If a page fails (completed pages stay checkpointed)
+    """
+    checkpoint = PageCheckpoint(
+        input_path,
+        language_code,
+        config.dpi,
+        config.engine,
+        config.tesseract_config,
+        config.checkpoint_dir,
+        config.adaptive_dpi,
+        config.min_confidence
+    )
+    done = checkpoint.load()
+
+    page_count = probe_page_count(input_path, config.backend)
+    pages = validate_pages(config.pages or [], page_count)
+    if config.skip_text or config.skip_blank:
+        # Text-layer and blank pages are cheap to redo, so they are not checkpointed
+        done.update(_known_results(input_path, [page for page in pages if page not in done], config))
+    missing = [page for page in pages if page not in done]
+
+    logger.info(f"Processing {len(missing)} of {len(pages)} pages")
+
+    for chunk in _contiguous_chunks(missing, RESUME_CHUNK_PAGES):
+        images = _render_pages(engine, input_path, config.initial_dpi, chunk, config.backend)
+
+        for page_number, image in zip(chunk, images):
+            try:
+                if config.verbose:
+                    logger.info(f"Processing page {page_number}/{page_count}...")
+
+                result = _ocr_page(
+                    engine,
+                    image,
+                    input_path,
+                    page_number,
+                    language_code,
+                    config
+                )
+            except Exception as e:
+                logger.error(f"Failed to process page {page_number}: {e}")
+                raise OCRProcessingError(f"OCR failed on page {page_number}: {e}") from e
+            finally:
+                image.close()
+
+            checkpoint.save(result)
+            done[page_number] = result
+
+            if config.progress_callback:
+                config.progress_callback(len(done), len(pages))
+
+    return [done[page] for page in pages], checkpoint
+
+
+def _detect_languages(engine, input_path: Path, config: OCRConfig) -> Tuple[List[str], dict]:
+    """
+    Detect the language(s) of a document from a small sample.
+
+    A band of a few pages, rendered at a low resolution, is recognized once
+    with every supported language the engine has installed; the full pass
+    then only needs the detected ones.
+
+    Args:
+        engine: OCR engine instance
+        input_path: Input PDF path
+        config: OCR configuration (pages, backend, Tesseract config)
+
+    Returns:
+        Tuple of (detected language codes, result metadata)
+    """
+    page_count = probe_page_count(input_path, config.backend)
+    pages = sample_pages(validate_pages(config.pages or [], page_count))
+    candidates = candidate_languages(engine.get_available_languages()) or [FALLBACK_LANGUAGE]
+
+    texts = []
+    with stage('detect'):
+        for image in _render_pages(engine, input_path, SAMPLE_DPI, pages, config.backend):
+            try:
+                result = engine.process_image(
+                    sample_region(image), '+'.join(candidates), config.tesseract_config
+                )
+                texts.append(result['text'])
+            finally:
+                image.close()
+        detection = detect_from_text('\n'.join(texts), candidates)
+
+    logger.info(f"Detected language: {'+'.join(detection.languages)} (sample pages: {pages})")
+    return detection.languages, {
+        'detected_languages': detection.languages,
+        'language_scores': detection.scores,
+        'language_sample_pages': pages,
+    }
+
+
+def _select_pages(input_path: Path, config: OCRConfig) -> Tuple[Optional[List[int]], Dict[int, dict]]:
+    """
+    Decide which pages to OCR.
+
+    Args:
+        input_path: Input PDF path
+        config: OCR configuration
+
+    Returns:
+        Tuple of (pages to render and recognize, None = all pages;
+        results for pages needing no OCR, by page number)
+    """
+    if not (config.skip_text or config.skip_blank):
+        return config.pages, {}
+
+    pages = validate_pages(config.pages or [], probe_page_count(input_path, config.backend))
+    known_results = _known_results(input_path, pages, config)
+    return [page for page in pages if page not in known_results], known_results
+
+
+def _known_results(input_path: Path, pages: List[int], config: OCRConfig) -> Dict[int, dict]:
+    """
+    Results of pages needing no OCR.
+
+    Args:
+        input_path: Input PDF path
+        pages: Candidate pages
+        config: OCR configuration (skip_text: text-layer pages,
+                skip_blank: blank pages)
+
+    Returns:
+        Dict[int, dict]: Page results by page number
+    """
+    results = _text_layer_results(input_path, pages, config) if config.skip_text else {}
+    if config.skip_blank:
+        results.update(_blank_page_results(
+            input_path, [page for page in pages if page not in results], config
+        ))
+    return results
+
+
+def _text_layer_results(input_path: Path, pages: List[int], config: OCRConfig) -> Dict[int, dict]:
+    """
+    Page results from the text layer for the given pages that have one.
+
+    Pages are classified by their content streams; only pages with text
+    operators are extracted, so pages needing OCR cost no extraction.
+
+    Args:
+        input_path: Input PDF path
+        pages: Candidate pages
+        config: OCR configuration (backend)
+
+    Returns:
+        Dict[int, dict]: Page results (confidence 1.0) by page number
+    """
+    if not pages:
+        return {}
+
+    with stage('validate'):
+        text_pages = [page.page_number for page in classify_pages(input_path, pages) if page.has_text]
+
+    results = {}
+    if text_pages:
+        backend = get_backend(config.backend)
+        with open_document(input_path), stage('extract'):
+            for page_number in text_pages:
+                text = backend.extract_text(input_path, page_number) or ''
+                results[page_number] = {
+                    'page_number': page_number,
+                    'text': text,
+                    'confidence': 1.0,
+                    'word_count': len(text.split())
+                }
+        logger.info(f"Skipping OCR for {len(results)} of {len(pages)} pages with a text layer")
+
+    return results
+
+
+def _blank_page_results(input_path: Path, pages: List[int], config: OCRConfig) -> Dict[int, dict]:
+    """
+    Empty page results (confidence 1.0, 'blank': True) for the blank pages among pages.
+
+    Args:
+        input_path: Input PDF path
+        pages: Candidate pages
+        config: OCR configuration (backend)
+
+    Returns:
+        Dict[int, dict]: Page results by page number
+    """
+    if not pages:
+        return {}
+
+    blank_pages = find_blank_pages(input_path, pages, config.backend)
+    if blank_pages:
+        logger.info(f"Skipping OCR for {len(blank_pages)} blank pages")
+    return {
+        page_number: {
+            'page_number': page_number,
+            'text': '',
+            'confidence': 1.0,
+            'word_count': 0,
+            'blank': True
+        }
+        for page_number in blank_pages
+    }
+
+
+def _contiguous_chunks(pages: List[int], size: int) -> Iterator[List[int]]:
+    """Split sorted page numbers into runs of consecutive pages of at most size"""
+    chunk: List[int] = []
+    for page in pages:
+        if chunk and (page != chunk[-1] + 1 or len(chunk) == size):
+            yield chunk
+            chunk = []
+        chunk.append(page)
+    if chunk:
+        yield chunk
+
+
+def _render_pages(
+    engine,
+    pdf_path: Path,
+    dpi: int,
+    pages: Optional[List[int]],
+    backend: Optional[str] = None
+) -> list:
+    """
+    Render PDF pages with the engine, using an explicitly configured backend.
+
+    The backend is only passed when set, so engines implementing the plain
+    OCREngine protocol keep working (they render with their own default).
+
+    Args:
+        engine: OCR engine instance
+        pdf_path: Path to PDF file
+        dpi: Rendering DPI
+        pages: Pages to render (None = all pages)
+        backend: PDF backend name (None = engine default)
+
+    Returns:
+        list: PIL images in page order
+    """
+    with stage('render'):
+        if backend:
+            return engine.pdf_to_images(pdf_path, dpi=dpi, pages=pages, backend=backend)
+        return engine.pdf_to_images(pdf_path, dpi=dpi, pages=pages)
+
+
+def _ocr_page(
+    engine,
+    image,
+    input_path: Path,
+    page_number: int,
+    language_code: str,
+    config: OCRConfig
+) -> dict:
+    """
+    Recognize a page rendered at config.initial_dpi.
+
+    In adaptive mode, a page recognized with less than config.min_confidence
+    is rendered again at config.dpi and recognized once more; the more
+    confident of the two results is kept and marked 'escalated'.
+
+    Args:
+        engine: OCR engine instance
+        image: Page image rendered at config.initial_dpi
+        input_path: Input PDF path (for re-rendering)
+        page_number: Page number (1-indexed)
+        language_code: Tesseract language code
+        config: OCR configuration
+
+    Returns:
+        dict: Page result (see _recognize_page)
+    """
+    dpi = config.initial_dpi
+    result = _recognize_page(
+        engine, image, page_number, language_code, config.tesseract_config,
+        dpi=dpi, warn=dpi == config.dpi
+    )
+    if dpi == config.dpi or result['confidence'] >= config.min_confidence:
+        return result
+
+    logger.info(
+        f"Page {page_number}: confidence {result['confidence']:.2%} at {dpi} DPI, "
+        f"re-rendering at {config.dpi} DPI"
+    )
+    images = _render_pages(engine, input_path, config.dpi, [page_number], config.backend)
+    try:
+        retry = _recognize_page(
+            engine, images[0], page_number, language_code, config.tesseract_config, dpi=config.dpi
+        )
+    finally:
+        images[0].close()
+    kept = retry if retry['confidence'] >= result['confidence'] else result
+    kept['escalated'] = True
+    return kept
+
+
+def _recognize_page(
+    engine,
+    image,
+    page_number: int,
+    language_code: str,
+    tesseract_config: Optional[str] = None,
+    dpi: Optional[int] = None,
+    warn: bool = True
+) -> dict:
+    """
+    Run OCR on a single page image.
+
+    Args:
+        engine: OCR engine instance
+        image: Rendered page image
+        page_number: Page number reported in the result
+        language_code: Tesseract language code (e.g., 'deu+eng')
+        tesseract_config: Optional Tesseract configuration string
+        dpi: Resolution the image was rendered at (recorded in the result)
+        warn: Log a warning for low confidence
+
+    Returns:
+        dict: Page result with page_number, text, confidence, word_count,
+              dpi (if given), and words and image_size (if the engine
+              reports word boxes)
+    """
+    with stage('recognize'):
+        result = engine.process_image(image, language_code, tesseract_config)
+
+    # Log low confidence warning
+    if warn and result['confidence'] < 0.7:
+        logger.warning(
+            f"Low OCR confidence on page {page_number}: {result['confidence']:.2%}"
+        )
+
+    page_result = {
+        'page_number': page_number,
+        'text': result['text'],
+        'confidence': result['confidence'],
+        'word_count': len(result['text'].split())
+    }
+    if dpi is not None:
+        page_result['dpi'] = dpi
+    if result.get('words') is not None:
+        page_result['words'] = result['words']
+        page_result['image_size'] = list(image.size)
+    return page_result
+
+
+def _adaptive_metadata(ocr_results: List[dict], config: OCRConfig) -> dict:
+    """Result metadata of an adaptive run (escalated: pages re-rendered at dpi)"""
+    return {
+        'adaptive_dpi': config.initial_dpi,
+        'min_confidence': config.min_confidence,
+        'escalated_pages': [
+            result['page_number'] for result in ocr_results if result.get('escalated')
+        ],
+    }
+
+
 def _generate_output_path(input_path: Path, output_mode: OutputMode) -> Path:
     """
     Generate output path based on input path and output mode.
@@ -197,7 +703,7 @@ def _generate_output_path(input_path: Path, output_mode: OutputMode) -> Path:
         Path: Generated output path
     """
     base_name = input_path.stem
-    extension = output_mode.value
+    extension = output_mode.extension
     output_path = input_path.parent / f"{base_name}_ocr.{extension}"
 
     logger.debug(f"Generated output path: {output_path}")
@@ -223,20 +729,79 @@ def _write_output(
         OCRProcessingError: If writing fails
     """
     try:
-        if output_mode == OutputMode.TXT:
-            _write_txt_output(ocr_results, output_path)
-        elif output_mode == OutputMode.JSON:
-            _write_json_output(ocr_results, output_path, input_path)
-        elif output_mode == OutputMode.PDF:
-            _write_pdf_output(ocr_results, output_path, input_path)
-        else:
-            raise OCRProcessingError(f"Unsupported output mode: {output_mode}")
+        with stage('write'):
+            if output_mode == OutputMode.TXT:
+                _write_txt_output(ocr_results, output_path)
+            elif output_mode == OutputMode.JSON:
+                _write_json_output(ocr_results, output_path, input_path)
+            elif output_mode == OutputMode.PDF:
+                _write_pdf_output(ocr_results, output_path, input_path)
+            elif output_mode.streaming:
+                with open_page_writer(output_mode, output_path, input_path) as writer:
+                    for result in ocr_results:
+                        writer.write_page(result)
+            else:
+                raise OCRProcessingError(f"Unsupported output mode: {output_mode}")
+        record_output(output_path)
 
     except Exception as e:
         logger.error(f"Failed to write output: {e}")
         raise OCRProcessingError(f"Failed to write output: {e}") from e
 
 
+@contextmanager
+def _page_stream(
+    streamed: bool,
+    output_mode: OutputMode,
+    output_path: Path,
+    input_path: Path,
+    known_results: Dict[int, dict]
+) -> Iterator[Optional[Callable[[dict], None]]]:
+    """
+    Write the pages of a streaming output mode as they are recognized.
+
+    Yields a function to call with every recognized page result, in page
+    order. Pages in known_results (text-layer and blank pages) are written
+    in between at their place in the document. Yields None if the output is
+    not streamed (it is written by _write_output at the end).
+
+    Args:
+        streamed: Whether the output is streamed
+        output_mode: Streaming output mode
+        output_path: Output file path
+        input_path: Original input PDF path
+        known_results: Results of pages needing no OCR, by page number
+
+    Raises:
+        OCRProcessingError: If writing fails
+    """
+    if not streamed:
+        yield None
+        return
+
+    pending = dict(known_results)
+
+    def write_pages(writer, before: Optional[int] = None) -> None:
+        with stage('write'):
+            for page_number in sorted(pending):
+                if before is not None and page_number >= before:
+                    break
+                writer.write_page(pending.pop(page_number))
+
+    logger.info(f"Streaming output to {output_path}...")
+    try:
+        with open_page_writer(output_mode, output_path, input_path) as writer:
+            def write_page(result: dict) -> None:
+                pending[result['page_number']] = result
+                write_pages(writer, before=result['page_number'] + 1)
+
+            yield write_page
+            write_pages(writer)
+    except OSError as e:
+        logger.error(f"Failed to write output: {e}")
+        raise OCRProcessingError(f"Failed to write output: {e}") from e
+
+
 def _write_txt_output(ocr_results: List[dict], output_path: Path) -> None:
     """Write OCR results as plain text file"""
     with open(output_path, 'w', encoding='utf-8') as f:
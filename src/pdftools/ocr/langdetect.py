@@ -0,0 +1,188 @@
+"""
+Automatic OCR language detection
+
+Every additional Tesseract language slows down recognition of every page,
+so passing ``deu+eng+fra`` "to be safe" is expensive. With the language
+``auto``, a small sample is recognized first: a downscaled band of up to
+SAMPLE_PAGES pages spread over the document, recognized once with all
+candidate languages. The sample text is scored by frequent function words
+and characters specific to each language, and the full pass then runs
+with only the detected language(s):
+
+    >>> detect_from_text("Rechnung für die Lieferung und Montage", ['deu', 'eng'])
+    LanguageDetection(languages=['deu'], scores={'deu': 1.0, 'eng': 0.0})
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Union
+import logging
+import re
+
+from PIL import Image
+
+from pdftools.ocr.models import OCRLanguage
+
+logger = logging.getLogger(__name__)
+
+# Language argument that enables detection
+AUTO_LANGUAGE = 'auto'
+
+# Pages sampled, spread evenly over the pages to recognize
+SAMPLE_PAGES = 3
+
+# Resolution of the sample renders
+SAMPLE_DPI = 100
+
+# Sampled band of each page (left, top, right, bottom as page fractions),
+# skipping headers and footers that often hold names and numbers only
+SAMPLE_REGION = (0.05, 0.2, 0.95, 0.6)
+
+# Languages with at least this share of the evidence are used
+MIN_SHARE = 0.3
+
+# At most this many languages are detected
+MAX_LANGUAGES = 2
+
+# Used when the sample holds no evidence (e.g. blank or numeric pages)
+FALLBACK_LANGUAGE = OCRLanguage.GERMAN.value
+
+# Frequent words that are (nearly) unique to one of the supported languages
+_FUNCTION_WORDS = {
+    'deu': {'der', 'die', 'das', 'und', 'ist', 'nicht', 'mit', 'von', 'zu', 'den', 'dem',
+            'ein', 'eine', 'für', 'auf', 'im', 'sich', 'auch', 'wir', 'sie', 'bei', 'oder'},
+    'eng': {'the', 'and', 'of', 'to', 'is', 'that', 'for', 'with', 'are', 'this', 'be',
+            'by', 'from', 'at', 'your', 'you', 'we', 'or', 'have', 'will'},
+    'fra': {'le', 'les', 'et', 'est', 'une', 'pour', 'dans', 'qui', 'sur', 'du', 'au',
+            'pas', 'avec', 'vous', 'nous', 'par', 'ce', 'aux', 'ou', 'être'},
+    'ita': {'di', 'che', 'della', 'sono', 'gli', 'nella', 'alla', 'questo',
+            'anche', 'sul', 'ed', 'dei', 'delle', 'nel', 'è'},
+    'spa': {'el', 'los', 'las', 'por', 'para', 'como', 'pero', 'este', 'y', 'más', 'muy',
+            'está', 'sus', 'ha', 'también', 'esta'},
+}
+
+# Characters that are (nearly) unique to one of the supported languages
+_CHARACTERS = {
+    'deu': 'äöüß',
+    'fra': 'çêâîûëœ',
+    'ita': 'ìò',
+    'spa': 'ñ¿¡áíóú',
+}
+
+# A language-specific character counts as much as this many function words
+_CHARACTER_WEIGHT = 0.5
+
+_WORD = re.compile(r'[^\W\d_]+')
+
+
+@dataclass
+class LanguageDetection:
+    """
+    Result of language detection
+
+    Attributes:
+        languages: Detected language codes, most likely first
+        scores: Share of the evidence per candidate language (0.0 - 1.0)
+    """
+    languages: List[str]
+    scores: Dict[str, float] = field(default_factory=dict)
+
+
+def is_auto_language(language: Union[OCRLanguage, List[OCRLanguage], str, List[str]]) -> bool:
+    """
+    Check whether a language argument requests detection.
+
+    Args:
+        language: Language argument of the OCR functions
+
+    Returns:
+        bool: True for 'auto' (alone or as the only list entry)
+    """
+    if isinstance(language, list) and len(language) == 1:
+        language = language[0]
+    return isinstance(language, str) and not isinstance(language, OCRLanguage) \
+        and language.lower() == AUTO_LANGUAGE
+
+
+def candidate_languages(available: List[str]) -> List[str]:
+    """
+    Supported languages an engine can recognize.
+
+    Args:
+        available: Languages installed for the engine
+
+    Returns:
+        List[str]: Candidate language codes (OCRLanguage order)
+    """
+    return [lang.value for lang in OCRLanguage if lang.value in available]
+
+
+def sample_pages(pages: List[int], count: int = SAMPLE_PAGES) -> List[int]:
+    """
+    Pick pages spread evenly over a document.
+
+    Args:
+        pages: Pages to recognize
+        count: Number of pages to sample
+
+    Returns:
+        List[int]: Sampled pages in ascending order
+    """
+    if len(pages) <= count:
+        return list(pages)
+    step = len(pages) / count
+    return [pages[int(i * step + step / 2)] for i in range(count)]
+
+
+def sample_region(image: Image.Image) -> Image.Image:
+    """
+    Crop the sampled band of a page image.
+
+    Args:
+        image: Page image
+
+    Returns:
+        Image.Image: Cropped band
+    """
+    left, top, right, bottom = SAMPLE_REGION
+    width, height = image.size
+    return image.crop((
+        round(left * width), round(top * height), round(right * width), round(bottom * height)
+    ))
+
+
+def detect_from_text(text: str, candidates: List[str]) -> LanguageDetection:
+    """
+    Detect the language(s) of a text sample.
+
+    Args:
+        text: Recognized sample text
+        candidates: Candidate language codes
+
+    Returns:
+        LanguageDetection: Languages with at least MIN_SHARE of the evidence
+                           (at most MAX_LANGUAGES), or FALLBACK_LANGUAGE
+                           (or the first candidate) if there is none
+    """
+    text = text.lower()
+    words = _WORD.findall(text)
+
+    raw = {}
+    for language in candidates:
+        function_words = _FUNCTION_WORDS.get(language, set())
+        raw[language] = sum(1 for word in words if word in function_words)
+        raw[language] += _CHARACTER_WEIGHT * sum(text.count(c) for c in _CHARACTERS.get(language, ''))
+
+    total = sum(raw.values())
+    if not total:
+        fallback = FALLBACK_LANGUAGE if FALLBACK_LANGUAGE in candidates or not candidates else candidates[0]
+        logger.debug(f"No language evidence in sample, using {fallback}")
+        return LanguageDetection(languages=[fallback], scores={lang: 0.0 for lang in candidates})
+
+    scores = {lang: round(score / total, 3) for lang, score in raw.items()}
+    ranked = sorted(candidates, key=lambda lang: raw[lang], reverse=True)
+    languages = ranked[:1] + [
+        lang for lang in ranked[1:MAX_LANGUAGES] if raw[lang] / total >= MIN_SHARE
+    ]
+
+    logger.debug(f"Detected language(s) {'+'.join(languages)} (scores: {scores})")
+    return LanguageDetection(languages=languages, scores=scores)
@@ -34,10 +34,26 @@ class OutputMode(str, Enum):
         TXT: Plain text output
         PDF: PDF with searchable text layer
         JSON: Structured JSON output
+        HOCR: hOCR (HTML) with word boxes, written page by page
+        ALTO: ALTO XML with word boxes, written page by page
+        JSONL: JSON Lines, one page per line, written page by page
     """
     TXT = "txt"
     PDF = "pdf"
     JSON = "json"
+    HOCR = "hocr"
+    ALTO = "alto"
+    JSONL = "jsonl"
+
+    @property
+    def extension(self) -> str:
+        """File extension of the output format"""
+        return 'xml' if self is OutputMode.ALTO else self.value
+
+    @property
+    def streaming(self) -> bool:
+        """Whether pages are written as soon as they are recognized"""
+        return self in (OutputMode.HOCR, OutputMode.ALTO, OutputMode.JSONL)
 
 
 @dataclass
@@ -51,12 +67,43 @@ class OCRConfig:
         tesseract_config: Additional Tesseract configuration string
         progress_callback: Optional callback function(current, total)
         verbose: Enable verbose logging
+        engine: Registered OCR engine name ('auto', 'tesseract',
+                'tesserocr', 'ocrmypdf', ...)
+        resume: Checkpoint every page and skip pages completed by an
+                earlier, interrupted run
+        checkpoint_dir: Base directory for checkpoints
+                        (default: '.{filename}.ocr-checkpoint' next to the input)
+        backend: PDF backend for page rendering ('pypdf', 'mupdf',
+                 None = $PDFTOOLS_BACKEND or auto)
+        skip_text: Only OCR pages without a text layer; pages with one
+                   take their text from it
+        adaptive_dpi: Render pages at this lower DPI first and re-render
+                      only pages recognized with less than min_confidence
+                      at dpi (None = every page at dpi)
+        min_confidence: Confidence (0.0 - 1.0) below which a page is
+                        re-rendered in adaptive mode
+        skip_blank: Do not OCR blank pages; they get an empty result
     """
     pages: Optional[List[int]] = None
     dpi: int = 300
     tesseract_config: Optional[str] = None
     progress_callback: Optional[Callable[[int, int], None]] = None
     verbose: bool = False
+    engine: str = 'auto'
+    resume: bool = False
+    checkpoint_dir: Optional[Path] = None
+    backend: Optional[str] = None
+    skip_text: bool = False
+    adaptive_dpi: Optional[int] = None
+    min_confidence: float = 0.7
+    skip_blank: bool = False
+
+    @property
+    def initial_dpi(self) -> int:
+        """DPI pages are first rendered at"""
+        if self.adaptive_dpi and 0 < self.adaptive_dpi < self.dpi:
+            return self.adaptive_dpi
+        return self.dpi
 
 
 @dataclass
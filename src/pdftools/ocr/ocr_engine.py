@@ -3,14 +3,26 @@ Tesseract OCR Engine implementation
 """
 
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from PIL import Image
 import logging
-
+import shlex
+import threading
+
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    tesserocr = None
+    TESSEROCR_AVAILABLE = False
+
+from pdftools.core.backends import get_backend
+from pdftools.core.images import iter_page_images
 from pdftools.core.exceptions import (
     TesseractNotFoundError,
     ImageConversionError,
 )
+from pdftools.ocr.capabilities import get_tesseract_capabilities
 
 logger = logging.getLogger(__name__)
 
@@ -55,13 +67,8 @@ class TesseractEngine:
         Raises:
             TesseractNotFoundError: If Tesseract is not installed or not working
         """
-        try:
-            import pytesseract
-            version = pytesseract.get_tesseract_version()
-            logger.info(f"Tesseract OCR version: {version}")
-        except Exception as e:
-            logger.error(f"Tesseract verification failed: {e}")
-            raise TesseractNotFoundError() from e
+        capabilities = get_tesseract_capabilities(self.tesseract_cmd)
+        logger.info(f"Tesseract OCR version: {capabilities.version}")
 
     def process_image(
         self,
@@ -78,9 +85,10 @@ class TesseractEngine:
             config: Optional Tesseract configuration string
 
         Returns:
-            dict: Dictionary with 'text' and 'confidence' keys
+            dict: Dictionary with 'text', 'confidence' and 'words' keys
                 - text (str): Extracted text
                 - confidence (float): Average confidence score (0.0 - 1.0)
+                - words (list): Word boxes (see tesseract_words)
 
         Raises:
             TesseractNotFoundError: If pytesseract is not available
@@ -95,7 +103,7 @@ class TesseractEngine:
                 config=config or ''
             )
 
-            # Get detailed data for confidence calculation
+            # Get detailed data for confidence calculation and word boxes
             data = pytesseract.image_to_data(
                 image,
                 lang=language,
@@ -110,7 +118,8 @@ class TesseractEngine:
 
             return {
                 'text': text,
-                'confidence': avg_confidence
+                'confidence': avg_confidence,
+                'words': tesseract_words(data)
             }
 
         except ImportError as e:
@@ -123,15 +132,22 @@ class TesseractEngine:
         self,
         pdf_path: Path,
         dpi: int = 300,
-        pages: Optional[List[int]] = None
+        pages: Optional[List[int]] = None,
+        backend: Optional[str] = None
     ) -> List[Image.Image]:
         """
         Convert PDF pages to images.
 
+        Pages that are a single embedded JPEG or CCITT scan are decoded
+        directly instead of being rendered.
+
         Args:
             pdf_path: Path to PDF file
             dpi: DPI for image conversion (default: 300)
             pages: Specific pages to convert (None = all pages)
+            backend: PDF backend used for rendering ('pypdf' streams pages
+                     from poppler's pdftoppm, 'mupdf' renders in-process;
+                     default: auto)
 
         Returns:
             List[Image.Image]: List of PIL Image objects
@@ -140,36 +156,18 @@ class TesseractEngine:
             ImageConversionError: If conversion fails
         """
         try:
-            from pdf2image import convert_from_path
-
-            logger.debug(f"Converting PDF to images: {pdf_path} (DPI: {dpi})")
-
-            # Convert PDF to images
-            if pages:
-                # pdf2image uses 1-indexed pages
-                images = convert_from_path(
-                    pdf_path,
-                    dpi=dpi,
-                    first_page=min(pages),
-                    last_page=max(pages)
-                )
-                # Filter only requested pages
-                page_set = set(pages)
-                images = [
-                    img for i, img in enumerate(images, start=min(pages))
-                    if i in page_set
-                ]
-            else:
-                images = convert_from_path(pdf_path, dpi=dpi)
+            pdf_backend = get_backend(backend)
+            logger.debug(
+                f"Converting PDF to images: {pdf_path} (DPI: {dpi}, backend: {pdf_backend.name})"
+            )
+
+            images = [
+                image for _, image in iter_page_images(pdf_path, pages, dpi=dpi, backend=pdf_backend)
+            ]
 
             logger.info(f"Converted {len(images)} pages to images")
             return images
 
-        except ImportError as e:
-            raise ImageConversionError(
-                0,
-                "pdf2image not installed. Please install pdf2image package."
-            ) from e
         except Exception as e:
             logger.error(f"PDF to image conversion failed: {e}")
             raise ImageConversionError(0, str(e)) from e
@@ -230,15 +228,329 @@ class TesseractEngine:
             List[str]: List of language codes (e.g., ['deu', 'eng', 'fra'])
 
         Raises:
-            TesseractNotFoundError: If pytesseract is not available
+            TesseractNotFoundError: If Tesseract is not available
+        """
+        languages = list(get_tesseract_capabilities(self.tesseract_cmd).languages)
+        logger.debug(f"Available languages: {languages}")
+        return languages
+
+    def close(self) -> None:
+        """Release engine resources (nothing to release for subprocess Tesseract)"""
+        pass
+
+
+class TesserocrEngine(TesseractEngine):
+    """
+    Tesseract OCR Engine using the in-process tesserocr API binding.
+
+    pytesseract forks a ``tesseract`` process per call and reloads the
+    traineddata every time. This engine keeps one ``PyTessBaseAPI`` handle
+    per thread and language/config combination instead, so language data
+    is loaded once per worker and pages are recognized without spawning
+    processes or writing temporary images.
+
+    PDF to image conversion is inherited from TesseractEngine.
+    """
+
+    def __init__(self, tessdata_path: Optional[str] = None):
+        """
+        Initialize tesserocr engine.
+
+        Args:
+            tessdata_path: Optional tessdata directory
+                         (uses the binding's default if not provided)
+
+        Raises:
+            TesseractNotFoundError: If tesserocr is not installed or not working
+        """
+        self.tesseract_cmd = None
+        self.tessdata_path = tessdata_path
+        self._local = threading.local()
+        self._handles = []
+        self._handles_lock = threading.Lock()
+        self._verify_tesseract()
+
+    def _verify_tesseract(self) -> None:
+        """
+        Verify that the tesserocr binding is available.
+
+        Raises:
+            TesseractNotFoundError: If tesserocr is not installed or not working
         """
+        if not TESSEROCR_AVAILABLE:
+            raise TesseractNotFoundError()
+
         try:
-            import pytesseract
-            languages = pytesseract.get_languages(config='')
+            version = tesserocr.tesseract_version().splitlines()[0]
+            logger.info(f"Tesseract API binding: {version}")
+        except Exception as e:
+            logger.error(f"tesserocr verification failed: {e}")
+            raise TesseractNotFoundError() from e
+
+    def _get_api(self, language: str, config: Optional[str]):
+        """
+        Get the calling thread's API handle for a language/config pair.
+
+        Handles are created lazily and reused, so each worker thread
+        loads the traineddata for a language only once.
+
+        Args:
+            language: Tesseract language code (e.g., 'deu', 'deu+eng')
+            config: Optional Tesseract configuration string
+
+        Returns:
+            tesserocr.PyTessBaseAPI: Initialized API handle
+        """
+        handles = getattr(self._local, 'handles', None)
+        if handles is None:
+            handles = self._local.handles = {}
+
+        key = (language, config or '')
+        api = handles.get(key)
+        if api is None:
+            psm, oem, variables = _parse_tesseract_config(config)
+            kwargs = {'lang': language, 'variables': variables}
+            if self.tessdata_path:
+                kwargs['path'] = self.tessdata_path
+            if psm is not None:
+                kwargs['psm'] = psm
+            if oem is not None:
+                kwargs['oem'] = oem
+
+            api = tesserocr.PyTessBaseAPI(**kwargs)
+            handles[key] = api
+            with self._handles_lock:
+                self._handles.append(api)
+
+            logger.debug(
+                f"Created Tesseract API handle for '{language}' "
+                f"in thread {threading.current_thread().name}"
+            )
+
+        return api
+
+    def process_image(
+        self,
+        image: Image.Image,
+        language: str,
+        config: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Process a single image with OCR.
+
+        Args:
+            image: PIL Image object to process
+            language: Tesseract language code (e.g., 'deu', 'eng')
+            config: Optional Tesseract configuration string
+
+        Returns:
+            dict: Dictionary with 'text', 'confidence' and 'words' keys
+                - text (str): Extracted text
+                - confidence (float): Average confidence score (0.0 - 1.0)
+                - words (list): Word boxes (see tesseract_words)
+
+        Raises:
+            TesseractNotFoundError: If the language data cannot be loaded
+        """
+        try:
+            _parse_tesseract_config(config)
+        except ValueError as e:
+            # Options the binding cannot express go through the CLI instead
+            logger.debug(f"Falling back to subprocess Tesseract: {e}")
+            return super().process_image(image, language, config)
+
+        try:
+            api = self._get_api(language, config)
+        except RuntimeError as e:
+            logger.error(f"Failed to initialize Tesseract API: {e}")
+            raise TesseractNotFoundError() from e
+
+        try:
+            api.SetImage(image)
+            text = api.GetUTF8Text()
+
+            confidences = [c for c in api.AllWordConfidences() if c != -1]
+            avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+            avg_confidence = avg_confidence / 100.0  # Normalize to 0-1
+
+            return {
+                'text': text,
+                'confidence': avg_confidence,
+                'words': _iterator_words(api)
+            }
+
+        except Exception as e:
+            logger.error(f"OCR processing failed: {e}")
+            raise
+        finally:
+            api.Clear()
+
+    def get_available_languages(self) -> List[str]:
+        """
+        Get list of installed Tesseract languages.
+
+        Returns:
+            List[str]: List of language codes (e.g., ['deu', 'eng', 'fra'])
+
+        Raises:
+            TesseractNotFoundError: If the binding is not available
+        """
+        try:
+            if self.tessdata_path:
+                _, languages = tesserocr.get_languages(self.tessdata_path)
+            else:
+                _, languages = tesserocr.get_languages()
             logger.debug(f"Available languages: {languages}")
             return languages
-        except ImportError as e:
-            raise TesseractNotFoundError() from e
         except Exception as e:
             logger.error(f"Failed to get available languages: {e}")
             raise TesseractNotFoundError() from e
+
+    def close(self) -> None:
+        """Release all API handles created by this engine"""
+        with self._handles_lock:
+            handles, self._handles = self._handles, []
+        for api in handles:
+            api.End()
+        self._local = threading.local()
+
+
+def tesseract_words(data: Dict[str, list]) -> List[Dict[str, Any]]:
+    """
+    Word boxes from Tesseract's word-level data (``image_to_data``/TSV).
+
+    Args:
+        data: Tesseract data columns (block_num, par_num, line_num, left,
+              top, width, height, conf, text)
+
+    Returns:
+        List[dict]: Recognized words in reading order, each with
+            - text (str): Word text
+            - confidence (float): Word confidence (0.0 - 1.0)
+            - bbox (list): [left, top, right, bottom] in image pixels
+            - block (int): Text block, numbered from 1 per page
+            - line (int): Text line, numbered from 1 per page
+    """
+    words = []
+    blocks: Dict[Any, int] = {}
+    lines: Dict[Any, int] = {}
+
+    for i, text in enumerate(data['text']):
+        conf = float(data['conf'][i])
+        text = str(text)
+        if conf == -1 or not text.strip():
+            continue
+
+        block_key = data['block_num'][i]
+        line_key = (block_key, data['par_num'][i], data['line_num'][i])
+        left, top = int(data['left'][i]), int(data['top'][i])
+        words.append({
+            'text': text,
+            'confidence': round(conf / 100.0, 3),
+            'bbox': [left, top, left + int(data['width'][i]), top + int(data['height'][i])],
+            'block': blocks.setdefault(block_key, len(blocks) + 1),
+            'line': lines.setdefault(line_key, len(lines) + 1),
+        })
+
+    return words
+
+
+def _iterator_words(api) -> List[Dict[str, Any]]:
+    """Word boxes (see tesseract_words) of the last recognition of a tesserocr API"""
+    words: List[Dict[str, Any]] = []
+    iterator = api.GetIterator()
+    if iterator is None:
+        return words
+
+    block = line = 0
+    for word in tesserocr.iterate_level(iterator, tesserocr.RIL.WORD):
+        if word.IsAtBeginningOf(tesserocr.RIL.BLOCK):
+            block += 1
+        if word.IsAtBeginningOf(tesserocr.RIL.TEXTLINE):
+            line += 1
+
+        text = word.GetUTF8Text(tesserocr.RIL.WORD)
+        box = word.BoundingBox(tesserocr.RIL.WORD)
+        if not text or not text.strip() or box is None:
+            continue
+        words.append({
+            'text': text,
+            'confidence': round(word.Confidence(tesserocr.RIL.WORD) / 100.0, 3),
+            'bbox': list(box),
+            'block': max(block, 1),
+            'line': max(line, 1),
+        })
+
+    return words
+
+
+def _parse_tesseract_config(
+    config: Optional[str]
+) -> Tuple[Optional[int], Optional[int], Dict[str, str]]:
+    """
+    Translate a Tesseract CLI config string into API binding settings.
+
+    Args:
+        config: Tesseract configuration string (e.g., '--psm 6 -c key=value')
+
+    Returns:
+        Tuple of (page segmentation mode, engine mode, variables)
+
+    Raises:
+        ValueError: If the config contains options the binding cannot express
+    """
+    psm = None
+    oem = None
+    variables = {}
+
+    tokens = shlex.split(config or '')
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        value = tokens[i + 1] if i + 1 < len(tokens) else None
+
+        if token in ('--psm', '--oem') and value is not None and value.isdigit():
+            if token == '--psm':
+                psm = int(value)
+            else:
+                oem = int(value)
+            i += 2
+        elif token == '-c' and value is not None and '=' in value:
+            name, _, var_value = value.partition('=')
+            variables[name] = var_value
+            i += 2
+        else:
+            raise ValueError(f"Unsupported Tesseract option for API binding: {token}")
+
+    return psm, oem, variables
+
+
+def create_engine(
+    tesseract_cmd: Optional[str] = None,
+    prefer_api: bool = True
+) -> TesseractEngine:
+    """
+    Create the fastest available Tesseract engine.
+
+    Uses the in-process TesserocrEngine when the tesserocr binding is
+    installed and falls back to the subprocess-based TesseractEngine
+    otherwise.
+
+    Args:
+        tesseract_cmd: Optional path to tesseract binary. A custom binary
+                     always selects the subprocess engine.
+        prefer_api: Use the API binding if available (default: True)
+
+    Returns:
+        TesseractEngine: Engine instance
+
+    Raises:
+        TesseractNotFoundError: If no Tesseract engine is available
+    """
+    if prefer_api and TESSEROCR_AVAILABLE and not tesseract_cmd:
+        try:
+            return TesserocrEngine()
+        except TesseractNotFoundError:
+            logger.warning("tesserocr binding not usable, falling back to subprocess Tesseract")
+
+    return TesseractEngine(tesseract_cmd)
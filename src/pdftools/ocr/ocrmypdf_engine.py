@@ -0,0 +1,248 @@
+"""
+OCR engine running in the ocrmypdf Docker container
+"""
+
+from typing import Optional, List, Dict, Any, Tuple
+from PIL import Image
+import io
+import logging
+import shlex
+import shutil
+import subprocess
+
+from pdftools.core.exceptions import TesseractNotFoundError
+from pdftools.ocr.ocr_engine import TesseractEngine, tesseract_words
+
+logger = logging.getLogger(__name__)
+
+
+class OCRmyPDFEngine(TesseractEngine):
+    """
+    OCR engine backed by the ocrmypdf Docker image.
+
+    This is the image behind the ``ocrmypdf`` docker-compose service. It
+    bundles Tesseract with all language packs, so no local Tesseract
+    installation is needed. One container is started per engine and kept
+    alive; every page is recognized with a single ``docker exec`` of the
+    bundled Tesseract in TSV mode, which returns text and word confidences
+    in one call (ocrmypdf itself only emits whole PDFs without confidences).
+
+    PDF to image conversion is inherited from TesseractEngine and runs locally.
+    """
+
+    DEFAULT_IMAGE = "jbarlow83/ocrmypdf"
+
+    def __init__(
+        self,
+        image: str = DEFAULT_IMAGE,
+        container: Optional[str] = None,
+        docker_cmd: str = "docker",
+        timeout: int = 300
+    ):
+        """
+        Initialize container engine.
+
+        Args:
+            image: Docker image providing ocrmypdf/Tesseract
+            container: Name or ID of an already running container to use
+                     (default: start a private container)
+            docker_cmd: Docker CLI binary
+            timeout: Timeout in seconds per Docker call
+
+        Raises:
+            TesseractNotFoundError: If Docker or the container is not available
+        """
+        self.tesseract_cmd = None
+        self.image = image
+        self.docker_cmd = docker_cmd
+        self.timeout = timeout
+        self.container = container
+        self._owns_container = container is None
+        self._verify_tesseract()
+
+    def _verify_tesseract(self) -> None:
+        """
+        Verify that Tesseract is reachable inside the container.
+
+        Raises:
+            TesseractNotFoundError: If Docker or the container is not available
+        """
+        if shutil.which(self.docker_cmd) is None:
+            logger.error(f"Docker CLI not found: {self.docker_cmd}")
+            raise TesseractNotFoundError()
+
+        try:
+            if self.container is None:
+                self.container = self._start_container()
+
+            output = self._exec(['tesseract', '--version']).decode('utf-8', 'replace')
+            version = output.splitlines()[0] if output else 'unknown'
+            logger.info(f"Tesseract OCR version (container {self.container[:12]}): {version}")
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.error(f"ocrmypdf container verification failed: {e}")
+            self.close()
+            raise TesseractNotFoundError() from e
+
+    def _start_container(self) -> str:
+        """Start a long-lived container and return its ID"""
+        completed = subprocess.run(
+            [
+                self.docker_cmd, 'run', '-d', '--rm',
+                '--entrypoint', 'sleep',
+                self.image, 'infinity'
+            ],
+            capture_output=True,
+            timeout=self.timeout,
+            check=True
+        )
+        container_id = completed.stdout.decode().strip()
+        logger.debug(f"Started ocrmypdf container: {container_id[:12]}")
+        return container_id
+
+    def _exec(self, args: List[str], stdin: Optional[bytes] = None) -> bytes:
+        """Run a command in the container and return its stdout"""
+        completed = subprocess.run(
+            [self.docker_cmd, 'exec', '-i', self.container, *args],
+            input=stdin,
+            capture_output=True,
+            timeout=self.timeout,
+            check=True
+        )
+        return completed.stdout
+
+    def process_image(
+        self,
+        image: Image.Image,
+        language: str,
+        config: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Process a single image with OCR.
+
+        Args:
+            image: PIL Image object to process
+            language: Tesseract language code (e.g., 'deu', 'eng')
+            config: Optional Tesseract configuration string
+
+        Returns:
+            dict: Dictionary with 'text', 'confidence' and 'words' keys
+                - text (str): Extracted text
+                - confidence (float): Average confidence score (0.0 - 1.0)
+                - words (list): Word boxes (see tesseract_words)
+        """
+        buffer = io.BytesIO()
+        image.save(buffer, format='PNG')
+
+        try:
+            output = self._exec(
+                ['tesseract', 'stdin', 'stdout', '-l', language,
+                 *shlex.split(config or ''), 'tsv'],
+                stdin=buffer.getvalue()
+            )
+        except subprocess.CalledProcessError as e:
+            message = e.stderr.decode('utf-8', 'replace').strip()
+            logger.error(f"OCR processing failed: {message}")
+            raise
+
+        tsv = output.decode('utf-8', 'replace')
+        text, confidence = parse_tesseract_tsv(tsv)
+        return {
+            'text': text,
+            'confidence': confidence,
+            'words': tesseract_words(tsv_columns(tsv))
+        }
+
+    def get_available_languages(self) -> List[str]:
+        """
+        Get list of languages installed in the container.
+
+        Returns:
+            List[str]: List of language codes (e.g., ['deu', 'eng', 'fra'])
+
+        Raises:
+            TesseractNotFoundError: If the container is not available
+        """
+        try:
+            output = self._exec(['tesseract', '--list-langs']).decode('utf-8', 'replace')
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.error(f"Failed to get available languages: {e}")
+            raise TesseractNotFoundError() from e
+
+        # First line is a header ("List of available languages ...")
+        languages = [line.strip() for line in output.splitlines()[1:] if line.strip()]
+        logger.debug(f"Available languages: {languages}")
+        return languages
+
+    def close(self) -> None:
+        """Stop the container if this engine started it"""
+        if self._owns_container and self.container:
+            subprocess.run(
+                [self.docker_cmd, 'rm', '-f', self.container],
+                capture_output=True,
+                timeout=self.timeout
+            )
+            logger.debug(f"Stopped ocrmypdf container: {self.container[:12]}")
+            self.container = None
+
+
+def parse_tesseract_tsv(tsv: str) -> Tuple[str, float]:
+    """
+    Rebuild text and average word confidence from Tesseract TSV output.
+
+    Args:
+        tsv: Output of ``tesseract ... tsv``
+
+    Returns:
+        Tuple of (text, confidence) with confidence normalized to 0.0 - 1.0
+    """
+    paragraphs: List[List[str]] = []
+    current_par = None
+    current_line = None
+    confidences = []
+
+    for row in tsv.splitlines()[1:]:
+        fields = row.split('\t')
+        if len(fields) < 12:
+            continue
+
+        conf = float(fields[10])
+        word = fields[11]
+        if conf == -1 or not word.strip():
+            continue
+
+        confidences.append(conf)
+        par_key = tuple(fields[1:4])   # page, block, paragraph
+        line_key = tuple(fields[1:5])  # ... + line
+
+        if par_key != current_par:
+            paragraphs.append([])
+            current_par = par_key
+            current_line = None
+        if line_key != current_line:
+            paragraphs[-1].append(word)
+            current_line = line_key
+        else:
+            paragraphs[-1][-1] += ' ' + word
+
+    text = '\n\n'.join('\n'.join(lines) for lines in paragraphs)
+    avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+
+    return text, avg_confidence / 100.0  # Normalize to 0-1
+
+
+def tsv_columns(tsv: str) -> Dict[str, list]:
+    """
+    Split Tesseract TSV output into columns named by its header row.
+
+    Args:
+        tsv: Output of ``tesseract ... tsv``
+
+    Returns:
+        Dict[str, list]: Column values (strings) by column name
+    """
+    rows = [row.split('\t') for row in tsv.splitlines()]
+    if not rows:
+        return {'text': []}
+    header = rows[0]
+    rows = [row for row in rows[1:] if len(row) == len(header)]
+    return {name: [row[i] for row in rows] for i, name in enumerate(header)}
@@ -0,0 +1,130 @@
+"""
+OCR engine interface and registry
+"""
+
+from pathlib import Path
+from typing import Protocol, Callable, Dict, Any, List, Optional
+from PIL import Image
+import logging
+
+from pdftools.core.exceptions import InvalidParameterError
+
+logger = logging.getLogger(__name__)
+
+
+class OCREngine(Protocol):
+    """
+    Interface for OCR engines (enables pluggable backends and mocking).
+
+    An engine renders PDF pages to images and recognizes text on them.
+    process_image() reports the recognition confidence alongside the text.
+    """
+
+    def pdf_to_images(
+        self,
+        pdf_path: Path,
+        dpi: int = 300,
+        pages: Optional[List[int]] = None
+    ) -> List[Image.Image]:
+        """Render PDF pages (1-indexed) to PIL images"""
+        ...
+
+    def process_image(
+        self,
+        image: Image.Image,
+        language: str,
+        config: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Recognize an image, returning 'text' and 'confidence' (0.0 - 1.0)"""
+        ...
+
+    def get_available_languages(self) -> List[str]:
+        """Return the language codes the engine can recognize"""
+        ...
+
+    def close(self) -> None:
+        """Release engine resources"""
+        ...
+
+
+EngineFactory = Callable[..., OCREngine]
+
+_ENGINES: Dict[str, EngineFactory] = {}
+
+
+def register_engine(
+    name: str,
+    factory: EngineFactory,
+    overwrite: bool = False
+) -> None:
+    """
+    Register an OCR engine factory under a name.
+
+    Args:
+        name: Engine name used in OCRConfig.engine (e.g., 'tesseract')
+        factory: Callable returning an OCREngine instance
+        overwrite: Replace an existing registration with the same name
+
+    Raises:
+        InvalidParameterError: If the name is already registered
+    """
+    key = name.lower()
+    if key in _ENGINES and not overwrite:
+        raise InvalidParameterError(
+            "name",
+            name,
+            "OCR engine already registered"
+        )
+
+    _ENGINES[key] = factory
+    logger.debug(f"Registered OCR engine: {key}")
+
+
+def list_engines() -> List[str]:
+    """
+    Get names of all registered OCR engines.
+
+    Returns:
+        List[str]: Registered engine names
+    """
+    return sorted(_ENGINES)
+
+
+def get_engine(name: str = 'auto', **kwargs) -> OCREngine:
+    """
+    Create an OCR engine by registered name.
+
+    Args:
+        name: Engine name (default: 'auto')
+        **kwargs: Passed through to the engine factory
+
+    Returns:
+        OCREngine: Engine instance
+
+    Raises:
+        InvalidParameterError: If no engine is registered under the name
+        TesseractNotFoundError: If the engine's backend is not available
+    """
+    factory = _ENGINES.get(name.lower())
+    if factory is None:
+        raise InvalidParameterError(
+            "engine",
+            name,
+            f"Unknown OCR engine. Valid options: {', '.join(list_engines())}"
+        )
+
+    return factory(**kwargs)
+
+
+def _register_builtin_engines() -> None:
+    """Register the engines shipped with pdftools"""
+    from pdftools.ocr.ocr_engine import TesseractEngine, TesserocrEngine, create_engine
+    from pdftools.ocr.ocrmypdf_engine import OCRmyPDFEngine
+
+    register_engine('auto', create_engine)
+    register_engine('tesseract', TesseractEngine)
+    register_engine('tesserocr', TesserocrEngine)
+    register_engine('ocrmypdf', OCRmyPDFEngine)
+
+
+_register_builtin_engines()
@@ -0,0 +1,133 @@
+"""
+Worker/thread scheduling for parallel Tesseract
+
+Tesseract parallelizes recognition of a single page with OpenMP and by
+default starts one thread per core. Running one Tesseract per core on top
+of that (batch OCR) starts cores x cores threads that thrash the CPU, so
+every worker process is given an ``OMP_THREAD_LIMIT`` and the product of
+workers and threads is kept at the core count:
+
+- Many pages: one single-threaded worker per core. Pages are independent,
+  so this scales almost linearly.
+- Fewer pages than cores: one worker per page, each with a share of the
+  remaining cores. Tesseract's OpenMP code stops scaling beyond a few
+  threads, so the share is capped at MAX_OMP_THREADS.
+
+    >>> choose_thread_policy(pages=200, cpus=16)
+    ThreadPolicy(workers=16, threads=1)
+    >>> choose_thread_policy(pages=3, cpus=16)
+    ThreadPolicy(workers=3, threads=4)
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+import logging
+import os
+
+from pdftools.core.exceptions import InvalidParameterError
+
+logger = logging.getLogger(__name__)
+
+OMP_THREAD_LIMIT_ENV = 'OMP_THREAD_LIMIT'
+
+# Tesseract gains little from more OpenMP threads per page than this
+MAX_OMP_THREADS = 4
+
+
+@dataclass(frozen=True)
+class ThreadPolicy:
+    """
+    Worker processes and OpenMP threads of a parallel OCR run
+
+    Attributes:
+        workers: Number of worker processes
+        threads: OMP_THREAD_LIMIT of every worker
+    """
+    workers: int
+    threads: int
+
+    @property
+    def name(self) -> str:
+        """'pages' (single-threaded workers) or 'threads' (multi-threaded workers)"""
+        return 'pages' if self.threads == 1 else 'threads'
+
+
+def available_cpus() -> int:
+    """Number of CPUs this process may run on (respects affinity/cgroup pinning)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS/Windows
+        return os.cpu_count() or 1
+
+
+def choose_thread_policy(
+    pages: int,
+    workers: Optional[int] = None,
+    threads: Optional[int] = None,
+    cpus: Optional[int] = None
+) -> ThreadPolicy:
+    """
+    Choose worker processes and OpenMP threads for an OCR run.
+
+    Explicit values are kept; the others are derived from the CPU and page
+    count so that workers x threads does not exceed the CPUs. An
+    ``OMP_THREAD_LIMIT`` already set in the environment counts as explicit
+    threads.
+
+    Args:
+        pages: Number of pages to recognize
+        workers: Worker processes (None = auto)
+        threads: OpenMP threads per worker (None = auto)
+        cpus: Available CPUs (None = detect)
+
+    Returns:
+        ThreadPolicy: Workers (at most one per page) and threads per worker
+
+    Raises:
+        InvalidParameterError: If workers or threads are less than 1
+    """
+    if workers is not None and workers < 1:
+        raise InvalidParameterError("workers", workers, "Must be at least 1")
+    if threads is not None and threads < 1:
+        raise InvalidParameterError("threads", threads, "Must be at least 1")
+
+    cpus = cpus or available_cpus()
+    if threads is None:
+        threads = _environment_threads()
+
+    if workers is None:
+        workers = cpus // threads if threads else cpus
+    workers = max(1, min(workers, pages))
+
+    if threads is None:
+        threads = max(1, min(MAX_OMP_THREADS, cpus // workers))
+
+    return ThreadPolicy(workers=workers, threads=threads)
+
+
+def apply_thread_limit(threads: int) -> None:
+    """
+    Limit the OpenMP threads of Tesseract runs started by this process.
+
+    Tesseract subprocesses inherit the limit. In-process engines only honor
+    it if their OpenMP runtime is loaded after this call.
+
+    Args:
+        threads: OpenMP threads per Tesseract run
+    """
+    os.environ[OMP_THREAD_LIMIT_ENV] = str(threads)
+
+
+def _environment_threads() -> Optional[int]:
+    """OMP_THREAD_LIMIT set by the user, if valid"""
+    value = os.environ.get(OMP_THREAD_LIMIT_ENV)
+    if value is None:
+        return None
+    try:
+        threads = int(value)
+    except ValueError:
+        threads = 0
+    if threads < 1:
+        logger.warning(f"Ignoring invalid {OMP_THREAD_LIMIT_ENV} value: {value!r}")
+        return None
+    return threads
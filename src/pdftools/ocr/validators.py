@@ -9,10 +9,10 @@ import logging
 from pdftools.core.exceptions import (
     PDFNotFoundError,
     InvalidParameterError,
-    TesseractNotFoundError,
     LanguageNotAvailableError,
 )
 from pdftools.ocr.models import OCRLanguage
+from pdftools.ocr.capabilities import get_tesseract_capabilities
 
 logger = logging.getLogger(__name__)
 
@@ -114,14 +114,9 @@ def check_tesseract() -> bool:
     Raises:
         TesseractNotFoundError: If Tesseract is not installed
     """
-    try:
-        import pytesseract
-        version = pytesseract.get_tesseract_version()
-        logger.debug(f"Tesseract version: {version}")
-        return True
-    except Exception as e:
-        logger.error(f"Tesseract not found: {e}")
-        raise TesseractNotFoundError() from e
+    capabilities = get_tesseract_capabilities()
+    logger.debug(f"Tesseract version: {capabilities.version}")
+    return True
 
 
 def check_language_available(language: str) -> bool:
@@ -136,21 +131,37 @@ def check_language_available(language: str) -> bool:
 
     Raises:
         LanguageNotAvailableError: If language is not installed
+        TesseractNotFoundError: If Tesseract is not installed
+    """
+    capabilities = get_tesseract_capabilities()
+
+    if not capabilities.has_language(language):
+        raise LanguageNotAvailableError(language)
+
+    return True
+
+
+def check_engine_languages(engine, languages: List[str]) -> bool:
+    """
+    Check that an OCR engine can recognize all requested languages.
+
+    Args:
+        engine: OCR engine instance
+        languages: Language codes (e.g., ['deu', 'eng'])
+
+    Returns:
+        bool: True if all languages are available
+
+    Raises:
+        LanguageNotAvailableError: If a language is not installed
     """
-    try:
-        import pytesseract
-        available_languages = pytesseract.get_languages(config='')
-        logger.debug(f"Available Tesseract languages: {available_languages}")
+    available_languages = engine.get_available_languages()
 
+    for language in languages:
         if language not in available_languages:
             raise LanguageNotAvailableError(language)
 
-        return True
-    except LanguageNotAvailableError:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to check language availability: {e}")
-        raise TesseractNotFoundError() from e
+    return True
 
 
 def validate_pages(pages: List[int], total_pages: int) -> List[int]:
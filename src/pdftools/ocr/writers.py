@@ -0,0 +1,295 @@
+"""
+Streaming page writers for structured OCR output
+
+hOCR, ALTO XML and JSON Lines output is written one page at a time, as
+soon as the page is recognized, and flushed after every page, so
+downstream consumers (indexers, ``tail -f``) can read finished pages while
+OCR of the document continues:
+
+    >>> with open_page_writer(OutputMode.JSONL, Path("scan_ocr.jsonl"), Path("scan.pdf")) as writer:
+    ...     for result in page_results:
+    ...         writer.write_page(result)
+
+Word boxes are taken from the 'words' of a page result (see
+pdftools.ocr.ocr_engine.tesseract_words), coordinates are pixels of the
+rendered page image ('image_size'). Pages without words (text-layer and
+blank pages, engines not reporting words) are written as lines of text
+without coordinates.
+"""
+
+from itertools import groupby
+from pathlib import Path
+from typing import Dict, List, Optional, Type
+from xml.sax.saxutils import escape
+import json
+import re
+
+from pdftools.core.exceptions import OCRProcessingError
+from pdftools.ocr.models import OutputMode
+
+# Characters Tesseract may emit (e.g. form feeds) that XML does not allow
+_XML_INVALID = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+class PageWriter:
+    """
+    Base class of streaming page writers
+
+    Used as a context manager: the header is written on entry and the
+    footer on exit, also when OCR fails, so the file stays well-formed
+    up to the last finished page.
+    """
+
+    def __init__(self, output_path: Path, input_path: Path):
+        """
+        Initialize writer.
+
+        Args:
+            output_path: Output file path
+            input_path: Original input PDF path (recorded in the output)
+        """
+        self.output_path = Path(output_path)
+        self.input_path = Path(input_path)
+        self.pages_written = 0
+        self._file = None
+
+    def __enter__(self) -> 'PageWriter':
+        self._file = open(self.output_path, 'w', encoding='utf-8')
+        self._file.write(self.header())
+        self._file.flush()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            self._file.write(self.footer())
+        finally:
+            self._file.close()
+            self._file = None
+
+    def write_page(self, result: dict) -> None:
+        """
+        Write and flush a page.
+
+        Args:
+            result: Page result (page_number, text, confidence, and words
+                    and image_size if the engine reported word boxes)
+        """
+        self._file.write(self.format_page(result))
+        self._file.flush()
+        self.pages_written += 1
+
+    def header(self) -> str:
+        """Text written before the first page"""
+        return ''
+
+    def footer(self) -> str:
+        """Text written after the last page"""
+        return ''
+
+    def format_page(self, result: dict) -> str:
+        """Serialized page"""
+        raise NotImplementedError
+
+
+class JSONLinesWriter(PageWriter):
+    """JSON Lines: one JSON object per page, with the input file name"""
+
+    def format_page(self, result: dict) -> str:
+        return json.dumps({'file': str(self.input_path), **result}, ensure_ascii=False) + '\n'
+
+
+class HOCRWriter(PageWriter):
+    """hOCR 1.2: XHTML with ocr_page, ocr_carea, ocr_line and ocrx_word elements"""
+
+    def header(self) -> str:
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN"\n'
+            '    "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">\n'
+            '<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en" lang="en">\n'
+            ' <head>\n'
+            f'  <title>{_xml(self.input_path.name)}</title>\n'
+            '  <meta http-equiv="Content-Type" content="text/html;charset=utf-8"/>\n'
+            '  <meta name="ocr-system" content="pdftools"/>\n'
+            '  <meta name="ocr-capabilities" content="ocr_page ocr_carea ocr_line ocrx_word"/>\n'
+            ' </head>\n'
+            ' <body>\n'
+        )
+
+    def footer(self) -> str:
+        return ' </body>\n</html>\n'
+
+    def format_page(self, result: dict) -> str:
+        page = result['page_number']
+        properties = [f'image "{self.input_path.name}"']
+        if result.get('image_size'):
+            width, height = result['image_size']
+            properties.append(f'bbox 0 0 {width} {height}')
+        properties.append(f'ppageno {page - 1}')
+        if result.get('dpi'):
+            properties.append(f"scan_res {result['dpi']} {result['dpi']}")
+
+        parts = [f'  <div class="ocr_page" id="page_{page}" title="{_xml("; ".join(properties))}">\n']
+        word_id = 0
+        for block, lines in _blocks(result):
+            parts.append(f'   <div class="ocr_carea" id="block_{page}_{block}"{_hocr_title(lines)}>\n')
+            for line, words in lines:
+                parts.append(f'    <span class="ocr_line" id="line_{page}_{line}"{_hocr_title(words)}>')
+                for word in words:
+                    word_id += 1
+                    parts.append(
+                        f'<span class="ocrx_word" id="word_{page}_{word_id}"'
+                        f'{_hocr_title([word], word.get("confidence"))}>'
+                        f'{_xml(word["text"])}</span> '
+                    )
+                parts.append('</span>\n')
+            parts.append('   </div>\n')
+        parts.append('  </div>\n')
+        return ''.join(parts)
+
+
+class ALTOWriter(PageWriter):
+    """ALTO 4 XML with TextBlock, TextLine and String elements (pixel units)"""
+
+    def header(self) -> str:
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<alto xmlns="http://www.loc.gov/standards/alto/ns-v4#"\n'
+            '      xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"\n'
+            '      xsi:schemaLocation="http://www.loc.gov/standards/alto/ns-v4# '
+            'http://www.loc.gov/alto/v4/alto-4-2.xsd">\n'
+            '  <Description>\n'
+            '    <MeasurementUnit>pixel</MeasurementUnit>\n'
+            '    <sourceImageInformation>\n'
+            f'      <fileName>{_xml(self.input_path.name)}</fileName>\n'
+            '    </sourceImageInformation>\n'
+            '  </Description>\n'
+            '  <Layout>\n'
+        )
+
+    def footer(self) -> str:
+        return '  </Layout>\n</alto>\n'
+
+    def format_page(self, result: dict) -> str:
+        page = result['page_number']
+        size = ''
+        if result.get('image_size'):
+            width, height = result['image_size']
+            size = f' WIDTH="{width}" HEIGHT="{height}"'
+
+        parts = [
+            f'    <Page ID="page_{page}" PHYSICAL_IMG_NR="{page}"{size}>\n',
+            '      <PrintSpace>\n',
+        ]
+        string_id = 0
+        for block, lines in _blocks(result):
+            parts.append(f'        <TextBlock ID="block_{page}_{block}"{_alto_position(lines)}>\n')
+            for line, words in lines:
+                parts.append(f'          <TextLine ID="line_{page}_{line}"{_alto_position(words)}>\n')
+                for i, word in enumerate(words):
+                    string_id += 1
+                    if i:
+                        parts.append('            <SP/>\n')
+                    confidence = f' WC="{word["confidence"]:.3f}"' if word.get('confidence') is not None else ''
+                    parts.append(
+                        f'            <String ID="string_{page}_{string_id}" '
+                        f'CONTENT="{_xml(word["text"])}"{confidence}{_alto_position([word])}/>\n'
+                    )
+                parts.append('          </TextLine>\n')
+            parts.append('        </TextBlock>\n')
+        parts.extend(['      </PrintSpace>\n', '    </Page>\n'])
+        return ''.join(parts)
+
+
+# Writer classes by output mode
+_WRITERS: Dict[OutputMode, Type[PageWriter]] = {
+    OutputMode.HOCR: HOCRWriter,
+    OutputMode.ALTO: ALTOWriter,
+    OutputMode.JSONL: JSONLinesWriter,
+}
+
+
+def open_page_writer(output_mode: OutputMode, output_path: Path, input_path: Path) -> PageWriter:
+    """
+    Create the streaming writer of an output mode.
+
+    Args:
+        output_mode: Streaming output mode (HOCR, ALTO, JSONL)
+        output_path: Output file path
+        input_path: Original input PDF path
+
+    Returns:
+        PageWriter: Writer, to be used as a context manager
+
+    Raises:
+        OCRProcessingError: If the output mode is not a streaming mode
+    """
+    try:
+        writer_class = _WRITERS[output_mode]
+    except KeyError:
+        raise OCRProcessingError(f"Not a streaming output mode: {output_mode}") from None
+    return writer_class(output_path, input_path)
+
+
+def _page_words(result: dict) -> List[dict]:
+    """Words of a page result; pages without word boxes get one word per token (no bbox)"""
+    if result.get('words') is not None:
+        return result['words']
+
+    words = []
+    block = line = 0
+    for paragraph in re.split(r'\n\s*\n', result.get('text', '')):
+        if paragraph.strip():
+            block += 1
+        for text_line in paragraph.splitlines():
+            if not text_line.strip():
+                continue
+            line += 1
+            words.extend({'text': token, 'block': block, 'line': line} for token in text_line.split())
+    return words
+
+
+def _blocks(result: dict) -> list:
+    """Words of a page grouped as [(block, [(line, [word, ...]), ...]), ...]"""
+    return [
+        (block, [(line, list(words)) for line, words in groupby(block_words, key=lambda w: w['line'])])
+        for block, block_words in groupby(_page_words(result), key=lambda w: w['block'])
+    ]
+
+
+def _bbox(items: list) -> Optional[List[int]]:
+    """Union of the boxes of words or of (key, words) groups (None if any is unknown)"""
+    words = [word for item in items for word in (item[1] if isinstance(item, tuple) else [item])]
+    if not words or any(word.get('bbox') is None for word in words):
+        return None
+    return [
+        min(word['bbox'][0] for word in words),
+        min(word['bbox'][1] for word in words),
+        max(word['bbox'][2] for word in words),
+        max(word['bbox'][3] for word in words),
+    ]
+
+
+def _hocr_title(items: list, confidence: Optional[float] = None) -> str:
+    """hOCR title attribute with bbox and, for words, x_wconf"""
+    properties = []
+    box = _bbox(items)
+    if box is not None:
+        properties.append('bbox {} {} {} {}'.format(*box))
+    if confidence is not None:
+        properties.append(f"x_wconf {round(confidence * 100)}")
+    return f' title="{"; ".join(properties)}"' if properties else ''
+
+
+def _alto_position(items: list) -> str:
+    """ALTO HPOS, VPOS, WIDTH and HEIGHT attributes"""
+    box = _bbox(items)
+    if box is None:
+        return ''
+    left, top, right, bottom = box
+    return f' HPOS="{left}" VPOS="{top}" WIDTH="{right - left}" HEIGHT="{bottom - top}"'
+
+
+def _xml(text: str) -> str:
+    """Escape text for XML element content and double-quoted attributes"""
+    return escape(_XML_INVALID.sub('', str(text)), {'"': '&quot;'})
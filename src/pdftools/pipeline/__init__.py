@@ -0,0 +1,35 @@
+"""
+Multi-tool pipelines.
+
+Runs several tools (OCR, text extraction, renaming, protection,
+thumbnails) on a document in one pass: the PDF is parsed once, results are
+passed between steps in memory, and only the final artifacts are written.
+
+Public API:
+    - run_pipeline: Run a pipeline on one PDF
+    - load_pipeline / parse_pipeline: Read a JSON/YAML definition
+    - register_step: Add a custom step
+    - PipelineSpec, PipelineStep, PipelineResult, StepResult: Data models
+
+Example:
+    >>> from pdftools.pipeline import load_pipeline, run_pipeline
+    >>> spec = load_pipeline("invoice.yaml")
+    >>> result = run_pipeline("scan.pdf", spec, output_dir="processed/")
+"""
+
+from .core import run_pipeline
+from .loader import load_pipeline, parse_pipeline
+from .models import PipelineResult, PipelineSpec, PipelineStep, StepResult
+from .steps import PipelineContext, register_step
+
+__all__ = [
+    'run_pipeline',
+    'load_pipeline',
+    'parse_pipeline',
+    'register_step',
+    'PipelineContext',
+    'PipelineSpec',
+    'PipelineStep',
+    'PipelineResult',
+    'StepResult',
+]
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""CLI interface for multi-tool pipelines (pdfpipe)."""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from pdftools.core.exceptions import PDFToolsError
+from pdftools.core.metrics import merge_metrics
+from pdftools.cli.common import (
+    setup_logging,
+    add_stats_argument,
+    add_profile_argument,
+    print_stats,
+    profile_main,
+)
+
+from .core import run_pipeline
+from .loader import load_pipeline
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create argument parser for CLI."""
+    parser = argparse.ArgumentParser(
+        prog='pdfpipe',
+        description='Run several pdftools steps on each PDF, parsing it once '
+                    'and writing only the final files',
+        epilog='Examples:\n'
+               '  pdfpipe -c invoice.yaml -f scan.pdf\n'
+               '  pdfpipe -c invoice.json -f inbox/*.pdf -o processed/\n'
+               '\n'
+               'Pipeline file (YAML or JSON):\n'
+               '  steps:\n'
+               '    - ocr: {language: deu}\n'
+               '    - extract: {format: txt}\n'
+               '    - rename: {template: "{vendor}_{invoice_nr}_{date}.pdf"}\n'
+               '    - protect: {owner_password_env: PDF_OWNER_PASSWORD}\n'
+               '    - thumbnails: {size: small, pages: "1"}',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+
+    parser.add_argument(
+        '-c', '--config',
+        type=Path,
+        required=True,
+        help='Pipeline definition (.json, .yaml or .yml)'
+    )
+    parser.add_argument(
+        '-f', '--files',
+        type=Path,
+        nargs='+',
+        required=True,
+        help='Input PDF files'
+    )
+    parser.add_argument(
+        '-o', '--output-dir',
+        type=Path,
+        help='Directory for the final files (default: from the pipeline, else next to each input)'
+    )
+    parser.add_argument(
+        '--move',
+        action='store_true',
+        help='Remove each input once its final PDF is written under a new name'
+    )
+    add_stats_argument(parser)
+    add_profile_argument(parser)
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Enable verbose output'
+    )
+
+    return parser
+
+
+@profile_main
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main entry point for pdfpipe CLI.
+
+    Args:
+        argv: Optional arguments (for testing)
+
+    Returns:
+        Exit code (0 = all files succeeded, 1 = error)
+    """
+    parser = create_parser()
+    args = parser.parse_args(argv)
+
+    setup_logging(verbose=args.verbose)
+
+    try:
+        spec = load_pipeline(args.config)
+    except PDFToolsError as e:
+        print(f"✗ Error: {e}", file=sys.stderr)
+        return 1
+    if args.move:
+        spec.keep_input = False
+
+    results = []
+    try:
+        for path in args.files:
+            result = run_pipeline(path, spec, output_dir=args.output_dir)
+            results.append(result)
+
+            if result.success:
+                written = ', '.join(p.name for p in result.output_files) or 'no files'
+                print(f"✓ {path.name}: {written}")
+            else:
+                print(f"✗ {path.name}: {result.message}", file=sys.stderr)
+
+            if args.verbose:
+                for step in result.steps:
+                    print(f"    {step.name:<12} {step.status:<8} {step.seconds:.3f}s")
+
+    except KeyboardInterrupt:
+        print("\n✗ Operation cancelled by user", file=sys.stderr)
+        return 1
+
+    if args.stats:
+        print_stats(merge_metrics(r.metadata.get('metrics') for r in results))
+
+    return 0 if all(r.success for r in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
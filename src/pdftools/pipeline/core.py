@@ -0,0 +1,192 @@
+"""
+Pipeline runner: several tools on one document, parsed once
+
+Running OCR, text extraction, renaming, protection and thumbnails as
+separate tools parses the PDF five times and writes (and re-reads) an
+intermediate PDF after every tool. The runner instead keeps one shared
+document handle open for all steps, passes text, invoice data and the
+in-memory modified document from step to step, and writes only the final
+artifacts - once, under the final name, after every step succeeded.
+"""
+
+from pathlib import Path
+from typing import List, Optional, Union
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+from ..core.document import open_document
+from ..core.metrics import record_error, record_metrics, record_output, record_pages, stage
+from ..core.probe import probe_page_count
+from ..core.validators import validate_pdf_path
+from ..renaming.core import _resolve_duplicate
+from .loader import parse_pipeline
+from .models import PipelineResult, PipelineSpec, StepResult
+from .steps import STEPS, PipelineContext
+
+logger = logging.getLogger(__name__)
+
+
+@record_metrics
+def run_pipeline(
+    input_path: Union[str, Path],
+    pipeline: Union[PipelineSpec, list, dict],
+    output_dir: Union[str, Path, None] = None
+) -> PipelineResult:
+    """
+    Run a pipeline on one PDF.
+
+    Args:
+        input_path: Path to input PDF file
+        pipeline: PipelineSpec, or a definition as accepted by parse_pipeline
+        output_dir: Directory for the final artifacts (overrides the
+                    pipeline's output_dir; default: next to the input)
+
+    Returns:
+        PipelineResult: Status, written files and per-step outcomes.
+                        Nothing is written if a step fails.
+
+    Raises:
+        InvalidParameterError: If the pipeline definition is invalid
+
+    Example:
+        >>> result = run_pipeline(
+        ...     "scan.pdf",
+        ...     [{'ocr': {'language': 'deu'}}, 'rename',
+        ...      {'protect': {'owner_password': 'admin'}}],
+        ...     output_dir="processed/"
+        ... )
+        >>> print(result.output_files)
+    """
+    spec = pipeline if isinstance(pipeline, PipelineSpec) else parse_pipeline(pipeline)
+    steps: List[StepResult] = []
+
+    try:
+        with stage('validate'):
+            source = validate_pdf_path(input_path)
+        target_dir = Path(output_dir or spec.output_dir or source.parent)
+
+        with open_document(source) as document:
+            context = PipelineContext(source, document)
+
+            for step in spec.steps:
+                start = time.perf_counter()
+                try:
+                    with stage(step.name):
+                        STEPS[step.name](context, **step.options)
+                except Exception as e:
+                    logger.error(f"Step '{step.name}' failed for {source}: {e}")
+                    record_error(e)
+                    steps.append(StepResult(step.name, 'error', time.perf_counter() - start, str(e)))
+                    return PipelineResult(
+                        status='error',
+                        input_path=source,
+                        steps=steps,
+                        message=f"Step '{step.name}' failed: {e}"
+                    )
+                steps.append(StepResult(step.name, 'success', time.perf_counter() - start))
+
+            pdf_path = _final_pdf_path(context, target_dir)
+            output_files = _write_outputs(context, target_dir, pdf_path, spec.keep_input)
+            record_pages(probe_page_count(source))
+
+        # Done with the input only once its handle is released
+        if pdf_path is not None and not spec.keep_input and pdf_path.resolve() != source.resolve():
+            with stage('write'):
+                if context.writer is None:
+                    os.replace(source, pdf_path)
+                else:
+                    source.unlink()
+
+    except Exception as e:
+        logger.error(f"Pipeline failed for {input_path}: {e}")
+        record_error(e)
+        return PipelineResult(
+            status='error',
+            input_path=Path(input_path),
+            steps=steps,
+            message=str(e)
+        )
+
+    metadata = {}
+    if context.invoice is not None:
+        metadata['invoice'] = {
+            'invoice_number': context.invoice.invoice_number,
+            'date': context.invoice.date,
+            'vendor': context.invoice.vendor,
+        }
+
+    return PipelineResult(
+        status='success',
+        input_path=source,
+        output_files=output_files,
+        steps=steps,
+        message=f"Pipeline completed: {len(output_files)} files written",
+        metadata=metadata
+    )
+
+
+def _final_pdf_path(context: PipelineContext, output_dir: Path) -> Optional[Path]:
+    """Where the PDF goes (None if it was neither modified nor renamed)"""
+    if context.writer is None and not context.renamed:
+        return None
+    path = output_dir / context.name
+    if path.exists() and path.resolve() != context.source.resolve():
+        path = _resolve_duplicate(path)
+    return path
+
+
+def _write_outputs(
+    context: PipelineContext,
+    output_dir: Path,
+    pdf_path: Optional[Path],
+    keep_input: bool
+) -> List[Path]:
+    """
+    Write the final artifacts: the modified PDF (or a copy under the new
+    name), then the registered artifacts under the PDF's final stem. An
+    unmodified PDF that is not kept is moved afterwards instead of copied.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    files: List[Path] = []
+
+    if pdf_path is not None:
+        is_source = pdf_path.resolve() == context.source.resolve()
+        with stage('write'):
+            if context.writer is not None:
+                _write_atomic(context.writer, pdf_path)
+            elif keep_input and not is_source:
+                shutil.copyfile(context.source, pdf_path)
+        if context.writer is not None or (keep_input and not is_source):
+            record_output(pdf_path)
+        files.append(pdf_path)
+
+    stem = Path(pdf_path.name if pdf_path else context.name).stem
+    for write in context.outputs:
+        for path in write(output_dir, stem):
+            record_output(path)
+            files.append(path)
+
+    return files
+
+
+def _write_atomic(writer, path: Path) -> None:
+    """
+    Write a PdfWriter through a temporary file in the target directory.
+
+    The writer still reads page content from the input, which may be the
+    target itself, so the target is only replaced once writing finished.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            writer.write(f)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,127 @@
+"""
+Loading and validating pipeline definitions (JSON or YAML)
+
+A definition is either a list of steps or a mapping with 'steps' and the
+optional keys 'output_dir' and 'keep_input'. A step is a step name or a
+mapping of one step name to its options:
+
+    steps:
+      - ocr: {language: deu}
+      - extract
+      - rename: {template: "{vendor}_{date}.pdf"}
+      - protect: {owner_password_env: PDF_OWNER_PASSWORD}
+      - thumbnails: {size: small, pages: "1"}
+"""
+
+from pathlib import Path
+from typing import Any, Union
+import inspect
+import json
+
+from ..core.exceptions import InvalidParameterError, InvalidPathError
+from .models import PipelineSpec, PipelineStep
+from .steps import STEPS
+
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+
+def load_pipeline(path: Union[str, Path]) -> PipelineSpec:
+    """
+    Load a pipeline definition file.
+
+    Args:
+        path: .json, .yaml or .yml file
+
+    Returns:
+        PipelineSpec: Validated pipeline
+
+    Raises:
+        InvalidPathError: If the file cannot be read
+        InvalidParameterError: If the definition is invalid or YAML is
+                               used without PyYAML installed
+    """
+    path = Path(path)
+    try:
+        content = path.read_text(encoding='utf-8')
+    except OSError as e:
+        raise InvalidPathError(str(path), f"Cannot read pipeline: {e}")
+
+    if path.suffix.lower() in ('.yaml', '.yml'):
+        if not YAML_AVAILABLE:
+            raise InvalidParameterError(
+                'pipeline', str(path),
+                "YAML pipelines require PyYAML. Install with: pip install pdftools[yaml]"
+            )
+        try:
+            data = yaml.safe_load(content)
+        except yaml.YAMLError as e:
+            raise InvalidParameterError('pipeline', str(path), f"Invalid YAML: {e}")
+    else:
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise InvalidParameterError('pipeline', str(path), f"Invalid JSON: {e}")
+
+    return parse_pipeline(data)
+
+
+def parse_pipeline(data: Any) -> PipelineSpec:
+    """
+    Build a PipelineSpec from a parsed definition.
+
+    Args:
+        data: List of steps, or mapping with 'steps', 'output_dir', 'keep_input'
+
+    Returns:
+        PipelineSpec: Validated pipeline
+
+    Raises:
+        InvalidParameterError: If a step is unknown or has unknown options
+    """
+    if isinstance(data, list):
+        data = {'steps': data}
+    if not isinstance(data, dict):
+        raise InvalidParameterError('pipeline', type(data).__name__, "must be a list or mapping")
+
+    unknown = set(data) - {'steps', 'output_dir', 'keep_input'}
+    if unknown:
+        raise InvalidParameterError('pipeline', ', '.join(sorted(unknown)), "unknown keys")
+
+    raw_steps = data.get('steps')
+    if not isinstance(raw_steps, list) or not raw_steps:
+        raise InvalidParameterError('steps', raw_steps, "must be a non-empty list")
+
+    output_dir = data.get('output_dir')
+    return PipelineSpec(
+        steps=[_parse_step(raw) for raw in raw_steps],
+        output_dir=Path(output_dir) if output_dir else None,
+        keep_input=bool(data.get('keep_input', True))
+    )
+
+
+def _parse_step(raw: Any) -> PipelineStep:
+    if isinstance(raw, str):
+        name, options = raw, {}
+    elif isinstance(raw, dict) and len(raw) == 1:
+        name, options = next(iter(raw.items()))
+        options = options or {}
+    else:
+        raise InvalidParameterError('step', raw, "must be a name or a mapping of one name to options")
+
+    if name not in STEPS:
+        raise InvalidParameterError('step', name, f"unknown step (available: {', '.join(STEPS)})")
+    if not isinstance(options, dict):
+        raise InvalidParameterError(name, options, "options must be a mapping")
+
+    accepted = list(inspect.signature(STEPS[name]).parameters)[1:]
+    unknown = [key for key in options if key not in accepted]
+    if unknown:
+        raise InvalidParameterError(
+            name, ', '.join(unknown), f"unknown options (accepted: {', '.join(accepted)})"
+        )
+
+    return PipelineStep(name=name, options=dict(options))
@@ -0,0 +1,84 @@
+"""
+Data models for multi-tool pipelines
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class PipelineStep:
+    """
+    One step of a pipeline.
+
+    Attributes:
+        name: Registered step name ('ocr', 'extract', 'rename', 'protect', 'thumbnails')
+        options: Keyword options of the step
+    """
+    name: str
+    options: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class PipelineSpec:
+    """
+    Declarative pipeline definition.
+
+    Attributes:
+        steps: Steps in execution order
+        output_dir: Directory for the final artifacts (None = next to the input)
+        keep_input: Keep the input file when the final PDF is written under
+                    another name (False = move it, like pdfrename)
+    """
+    steps: List[PipelineStep]
+    output_dir: Optional[Path] = None
+    keep_input: bool = True
+
+
+@dataclass
+class StepResult:
+    """
+    Outcome of one pipeline step.
+
+    Attributes:
+        name: Step name
+        status: 'success' or 'error'
+        seconds: Time spent in the step
+        message: Error description
+    """
+    name: str
+    status: str
+    seconds: float = 0.0
+    message: Optional[str] = None
+
+
+@dataclass
+class PipelineResult:
+    """
+    Result of running a pipeline on one document.
+
+    Attributes:
+        status: 'success' or 'error'
+        input_path: Processed document
+        output_files: Final artifacts written (PDF first, if any)
+        steps: Per-step outcomes, up to the failing step
+        message: Status message or error description
+        metadata: Additional data (e.g. extracted invoice fields, metrics)
+    """
+    status: str
+    input_path: Optional[Path] = None
+    output_files: List[Path] = field(default_factory=list)
+    steps: List[StepResult] = field(default_factory=list)
+    message: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def success(self) -> bool:
+        """Check if the pipeline succeeded"""
+        return self.status == 'success'
+
+    def __str__(self) -> str:
+        if self.success:
+            return f"Pipeline successful: {len(self.output_files)} files written"
+        return f"Pipeline failed: {self.message}"
@@ -0,0 +1,308 @@
+"""
+Pipeline steps
+
+Each step is a function ``step(context, **options)`` registered under a
+name. Steps share one PipelineContext per document: the parsed document
+(a shared handle, so every step reuses the same parse), the text found so
+far, extracted invoice data, the modified document (if any) and the final
+name. Steps never write intermediate files; artifacts are registered on
+the context and written once, under the final name, when all steps
+succeeded.
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+import logging
+import os
+
+from ..core.document import DocumentHandle
+from ..core.exceptions import InvalidParameterError, PDFProcessingError
+from ..core.metrics import stage
+
+logger = logging.getLogger(__name__)
+
+# Writes artifacts into (output_dir, final file stem), returns the files
+OutputWriter = Callable[[Path, str], List[Path]]
+
+
+class PipelineContext:
+    """
+    State passed between the steps of one document.
+
+    Attributes:
+        source: Input PDF
+        document: Shared handle of the input (one parse for all steps)
+        name: Final file name of the PDF (changed by 'rename')
+        renamed: Whether a step chose a new name
+        text: Document text from 'ocr' or 'extract' (None = not extracted yet)
+        ocr_results: Per-page OCR results
+        invoice: Invoice data found by 'rename'
+        writer: Modified document to write instead of the input (e.g. encrypted)
+        outputs: Artifact writers, run after the last step
+    """
+
+    def __init__(self, source: Path, document: DocumentHandle):
+        self.source = source
+        self.document = document
+        self.name = source.name
+        self.renamed = False
+        self.text: Optional[str] = None
+        self.ocr_results: Optional[List[dict]] = None
+        self.invoice = None
+        self.writer = None
+        self.outputs: List[OutputWriter] = []
+
+    def add_text_output(self, suffix: str, render: Callable[[], str]) -> None:
+        """Register a text artifact '<final stem><suffix>'"""
+        def write(output_dir: Path, stem: str) -> List[Path]:
+            path = output_dir / f"{stem}{suffix}"
+            path.write_text(render(), encoding='utf-8')
+            return [path]
+
+        self.outputs.append(write)
+
+
+Step = Callable[..., None]
+STEPS: Dict[str, Step] = {}
+
+
+def register_step(name: str) -> Callable[[Step], Step]:
+    """
+    Decorator registering a pipeline step under a name.
+
+    Example:
+        >>> @register_step('stamp')
+        ... def stamp_step(context, text='DRAFT'):
+        ...     ...
+    """
+    def decorator(func: Step) -> Step:
+        STEPS[name] = func
+        return func
+
+    return decorator
+
+
+def _choice(param: str, value: Any, enum_type):
+    try:
+        return enum_type(value)
+    except ValueError:
+        choices = ', '.join(member.value for member in enum_type)
+        raise InvalidParameterError(param, value, f"must be one of: {choices}")
+
+
+@register_step('ocr')
+def ocr_step(
+    context: PipelineContext,
+    language: Any = 'deu',
+    dpi: int = 300,
+    pages: Optional[List[int]] = None,
+    engine: str = 'auto',
+    backend: Optional[str] = None,
+    output: Optional[str] = None,
+    skip_text: bool = False,
+    adaptive_dpi: Optional[int] = None,
+    min_confidence: float = 0.7,
+    skip_blank: bool = False
+) -> None:
+    """
+    Recognize the pages in memory; the text feeds later steps.
+
+    Options:
+        language, dpi, pages, engine, backend, skip_text, adaptive_dpi,
+        min_confidence, skip_blank: As for ocrutil
+        output: Also write the recognized text ('txt' or 'json')
+    """
+    from ..ocr.core import ocr_pages, _write_json_output
+    from ..ocr.models import OCRConfig
+
+    if output not in (None, 'txt', 'json'):
+        raise InvalidParameterError('output', output, "must be 'txt' or 'json'")
+
+    config = OCRConfig(
+        pages=pages, dpi=dpi, engine=engine, backend=backend, skip_text=skip_text,
+        adaptive_dpi=adaptive_dpi, min_confidence=min_confidence, skip_blank=skip_blank
+    )
+    results = ocr_pages(context.source, language, config)
+    context.ocr_results = results
+    context.text = '\n'.join(result['text'] for result in results)
+
+    if output == 'txt':
+        context.add_text_output(
+            '.ocr.txt', lambda: '\n\f\n'.join(result['text'] for result in results)
+        )
+    elif output == 'json':
+        def write_json(output_dir: Path, stem: str) -> List[Path]:
+            path = output_dir / f"{stem}.ocr.json"
+            _write_json_output(results, path, context.source)
+            return [path]
+
+        context.outputs.append(write_json)
+
+
+@register_step('extract')
+def extract_step(
+    context: PipelineContext,
+    mode: str = 'simple',
+    format: Optional[str] = None,
+    pages: Optional[List[int]] = None,
+    backend: Optional[str] = None
+) -> None:
+    """
+    Extract the text layer (keeps earlier OCR text if there is none).
+
+    Options:
+        mode: 'simple', 'layout' or 'structured'
+        format: Also write the text ('txt', 'json' or 'markdown')
+        pages, backend: As for pdfgettxt
+    """
+    from ..text_extraction import extract_text, ExtractionMode, OutputFormat
+    from ..text_extraction.formatters import get_formatter
+
+    mode = _choice('mode', mode, ExtractionMode)
+    if mode == ExtractionMode.PER_PAGE:
+        raise InvalidParameterError('mode', mode.value, "per_page is not supported in pipelines")
+    output_format = _choice('format', format, OutputFormat) if format is not None else None
+
+    result = extract_text(context.source, mode=mode, pages=pages, backend=backend)
+    if result.status != 'success':
+        raise PDFProcessingError(result.message or "Text extraction failed")
+
+    text = result.text if result.text is not None else '\n'.join(page.text for page in result.pages)
+    if text.strip() or context.text is None:
+        context.text = text
+    else:
+        logger.info(f"No text layer in {context.source.name}, keeping OCR text")
+
+    if output_format is not None:
+        suffix = {OutputFormat.TXT: '.txt', OutputFormat.JSON: '.json',
+                  OutputFormat.MARKDOWN: '.md'}[output_format]
+        context.add_text_output(suffix, lambda: get_formatter(output_format).format(result))
+
+
+@register_step('rename')
+def rename_step(
+    context: PipelineContext,
+    template: str = "{vendor}_{invoice_nr}_{date}.pdf",
+    patterns: Optional[Dict[str, str]] = None,
+    fallback_name: str = 'renamed',
+    max_filename_length: int = 255
+) -> None:
+    """
+    Choose the final name from invoice data in the text (no file is moved yet).
+
+    Options:
+        template, patterns: As for pdfrename
+        fallback_name: Prefix used when the template cannot be rendered
+        max_filename_length: Maximum file name length
+    """
+    from ..renaming.core import NamingTemplate
+    from ..renaming.extractors import InvoiceDataExtractor
+    from ..renaming.validators import validate_patterns
+
+    if patterns:
+        validate_patterns(patterns)
+    naming_template = NamingTemplate(template)
+    extractor = InvoiceDataExtractor(custom_patterns=patterns)
+
+    if context.text is not None:
+        with stage('match'):
+            context.invoice = extractor.extract_from_text(context.text)
+    else:
+        context.invoice = extractor.extract_from_pdf(context.source)
+
+    try:
+        name = naming_template.render(context.invoice, max_filename_length)
+        if not name.lower().endswith('.pdf'):
+            name += '.pdf'
+    except Exception as e:
+        logger.error(f"Failed to render template: {e}")
+        name = f"{fallback_name}_{context.source.name}"
+
+    context.name = name
+    context.renamed = True
+
+
+@register_step('protect')
+def protect_step(
+    context: PipelineContext,
+    user_password: Optional[str] = None,
+    owner_password: Optional[str] = None,
+    user_password_env: Optional[str] = None,
+    owner_password_env: Optional[str] = None,
+    permissions: Optional[List[str]] = None
+) -> None:
+    """
+    Encrypt the document in memory; it is written once, at the end.
+
+    Options:
+        user_password, owner_password: As for pdfprotect
+        user_password_env, owner_password_env: Read a password from this
+            environment variable instead (keeps secrets out of the file)
+        permissions: Allowed actions ('print', 'copy', 'modify', 'annotate')
+    """
+    from ..protection.models import PermissionLevel
+    from ..protection.processors import PDFProtector
+    from ..protection.validators import validate_passwords, validate_permissions
+
+    if user_password_env:
+        user_password = os.environ.get(user_password_env) or user_password
+    if owner_password_env:
+        owner_password = os.environ.get(owner_password_env) or owner_password
+
+    try:
+        user_password, owner_password = validate_passwords(user_password, owner_password)
+        levels = validate_permissions(
+            [PermissionLevel.from_string(p) for p in permissions] if permissions else None
+        )
+    except ValueError as e:
+        # Never include the passwords themselves
+        raise InvalidParameterError('protect', '***', str(e))
+
+    protector = PDFProtector()
+    if context.writer is None:
+        protector.load_reader(context.document.reader)
+    else:
+        protector.writer = context.writer
+    with stage('encrypt'):
+        protector.apply_protection(user_password, owner_password, levels)
+    context.writer = protector.writer
+
+
+@register_step('thumbnails')
+def thumbnails_step(
+    context: PipelineContext,
+    size: Any = 'medium',
+    format: str = 'png',
+    pages: Any = None,
+    quality: int = 85,
+    backend: Optional[str] = None,
+    skip_blank: bool = False
+) -> None:
+    """
+    Render page thumbnails named after the final document name.
+
+    Options:
+        size, format, pages, quality, backend, skip_blank: As for pdfthumbnails
+    """
+    from ..thumbnails.core import generate_thumbnails
+    from ..thumbnails.models import ThumbnailSize
+    from ..thumbnails.validators import validate_format, validate_quality, validate_size
+
+    if isinstance(size, str) and size.upper() in ThumbnailSize.__members__:
+        size = ThumbnailSize[size.upper()]
+
+    # Fail before any artifact is written
+    validate_size(size)
+    validate_format(format)
+    validate_quality(quality)
+
+    def write(output_dir: Path, stem: str) -> List[Path]:
+        result = generate_thumbnails(
+            context.source, output_dir, size=size, format=format, pages=pages,
+            quality=quality, backend=backend, name=stem, skip_blank=skip_blank
+        )
+        if result.status == 'error':
+            raise PDFProcessingError(result.message or "Thumbnail generation failed")
+        return list(result.thumbnail_paths)
+
+    context.outputs.append(write)
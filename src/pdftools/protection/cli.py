@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import List, Optional
 
 from .core import protect_pdf
+from ..cli.common import add_profile_argument, add_stats_argument, print_stats, profile_main
 from .models import PermissionLevel
 
 
@@ -124,6 +125,9 @@ Valid permissions: print, copy, modify, annotate
         help='Comma-separated list of allowed permissions: print,copy,modify,annotate'
     )
 
+    add_stats_argument(parser)
+    add_profile_argument(parser)
+
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -139,6 +143,7 @@ Valid permissions: print, copy, modify, annotate
     return parser
 
 
+@profile_main
 def main() -> int:
     """
     Main CLI entry point.
@@ -181,6 +186,9 @@ def main() -> int:
             permissions=permissions
         )
 
+        if args.stats:
+            print_stats(result.metadata.get('metrics'))
+
         # Display result
         if result.success:
             logger.info(f"Success: {result.message}")
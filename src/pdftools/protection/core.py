@@ -18,10 +18,13 @@ from .validators import (
     generate_output_path
 )
 from .processors import PDFProtector
+from ..core.metrics import add_bytes_read, record_error, record_metrics, record_output, record_pages, stage
+from ..core.probe import probe_pdf
 
 logger = logging.getLogger(__name__)
 
 
+@record_metrics
 def protect_pdf(
     input_path: Path,
     output_path: Optional[Path] = None,
@@ -71,37 +74,48 @@ def protect_pdf(
     try:
         logger.info(f"Starting PDF protection: {input_path}")
 
-        # Step 1: Validate input file
-        validated_input = validate_input_file(input_path)
-
-        # Step 2: Generate/validate output path
-        output = generate_output_path(validated_input, output_path)
-        validated_output = validate_output_path(output)
-
-        # Step 3: Validate passwords
-        valid_user_pwd, valid_owner_pwd = validate_passwords(
-            user_password,
-            owner_password
-        )
-
-        # Step 4: Validate permissions
-        valid_permissions = validate_permissions(permissions)
-
-        # Step 5: Create protector and load PDF
-        protector = PDFProtector()
-        protector.load_pdf(validated_input)
-
-        # Step 6: Apply protection
-        protector.apply_protection(
-            user_password=valid_user_pwd,
-            owner_password=valid_owner_pwd,
-            permissions=valid_permissions
-        )
-
-        # Step 7: Write protected PDF
-        protector.write(validated_output)
-
-        # Step 8: Create success result
+        with stage('validate'):
+            # Step 1: Validate input file
+            validated_input = validate_input_file(input_path)
+
+            # Step 2: Generate/validate output path
+            output = generate_output_path(validated_input, output_path)
+            validated_output = validate_output_path(output)
+
+            # Step 3: Validate passwords
+            valid_user_pwd, valid_owner_pwd = validate_passwords(
+                user_password,
+                owner_password
+            )
+
+            # Step 4: Validate permissions
+            valid_permissions = validate_permissions(permissions)
+
+            # Step 5: Check the input is a PDF (reads only the file tail)
+            if probe_pdf(validated_input).encrypted:
+                logger.warning(f"Input is already encrypted, replacing its protection: {validated_input}")
+
+        # Step 6: Create protector and load PDF
+        with stage('parse'):
+            protector = PDFProtector()
+            protector.load_pdf(validated_input)
+        add_bytes_read(validated_input.stat().st_size)
+
+        # Step 7: Apply protection
+        with stage('encrypt'):
+            protector.apply_protection(
+                user_password=valid_user_pwd,
+                owner_password=valid_owner_pwd,
+                permissions=valid_permissions
+            )
+
+        # Step 8: Write protected PDF
+        with stage('write'):
+            protector.write(validated_output)
+        record_output(validated_output)
+        record_pages(len(protector.reader.pages))
+
+        # Step 9: Create success result
         logger.info(f"PDF protection completed successfully: {validated_output}")
         return ProtectionResult.create_success(
             output_path=validated_output,
@@ -109,16 +123,19 @@ def protect_pdf(
         )
 
     except FileNotFoundError as e:
+        record_error(e)
         error_msg = f"PDF file not found: {input_path}"
         logger.error(error_msg)
         return ProtectionResult.create_error(error_msg)
 
     except ValueError as e:
+        record_error(e)
         error_msg = str(e)
         logger.error(f"Validation error: {error_msg}")
         return ProtectionResult.create_error(error_msg)
 
     except Exception as e:
+        record_error(e)
         error_msg = f"Failed to protect PDF: {str(e)}"
         logger.error(error_msg, exc_info=True)
         return ProtectionResult.create_error(error_msg)
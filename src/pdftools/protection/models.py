@@ -7,7 +7,7 @@ including configuration, results, and permission levels.
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from enum import Enum
 
 
@@ -84,12 +84,14 @@ class ProtectionResult:
         message: Human-readable message describing the result
         encryption_applied: Whether encryption was successfully applied
         permissions_set: List of permissions that were set
+        metadata: Additional metadata about the operation (e.g. metrics)
     """
     status: str
     output_path: Optional[Path] = None
     message: str = ""
     encryption_applied: bool = False
     permissions_set: List[str] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
     @property
     def success(self) -> bool:
@@ -11,6 +11,8 @@ from typing import Optional, List
 
 from PyPDF2 import PdfReader, PdfWriter
 
+from pdftools.core.pdf_input import open_pdf_input
+
 from .models import PermissionLevel
 
 logger = logging.getLogger(__name__)
@@ -53,15 +55,8 @@ class PDFProtector:
             Exception: If PDF cannot be read
         """
         try:
-            self.reader = PdfReader(str(path))
             logger.debug(f"Loading PDF from: {path}")
-
-            # Copy all pages to writer
-            for page_num, page in enumerate(self.reader.pages, 1):
-                self.writer.add_page(page)
-                logger.debug(f"Added page {page_num}")
-
-            logger.info(f"Loaded {len(self.reader.pages)} pages from PDF")
+            self.load_reader(PdfReader(open_pdf_input(path)))
 
         except FileNotFoundError:
             logger.error(f"PDF file not found: {path}")
@@ -70,6 +65,22 @@ class PDFProtector:
             logger.error(f"Failed to load PDF: {e}")
             raise Exception(f"Failed to load PDF: {e}") from e
 
+    def load_reader(self, reader: PdfReader) -> None:
+        """
+        Load an already parsed PDF for protection.
+
+        Args:
+            reader: Parsed document (e.g. a shared DocumentHandle.reader)
+        """
+        self.reader = reader
+
+        # Copy all pages to writer
+        for page_num, page in enumerate(self.reader.pages, 1):
+            self.writer.add_page(page)
+            logger.debug(f"Added page {page_num}")
+
+        logger.info(f"Loaded {len(self.reader.pages)} pages from PDF")
+
     def apply_protection(
         self,
         user_password: Optional[str] = None,
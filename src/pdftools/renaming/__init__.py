@@ -36,7 +36,9 @@ from .core import (
 from .models import (
     InvoiceData,
     RenameConfig,
-    RenameResult
+    RenameResult,
+    OCRRegion,
+    DEFAULT_OCR_REGIONS
 )
 
 # Extractors
@@ -44,6 +46,12 @@ from .extractors import (
     InvoiceDataExtractor
 )
 
+# Region OCR fallback
+from .regions import (
+    ocr_regions,
+    parse_region
+)
+
 # Patterns
 from .patterns import (
     DEFAULT_PATTERNS,
@@ -74,10 +82,16 @@ __all__ = [
     'InvoiceData',
     'RenameConfig',
     'RenameResult',
+    'OCRRegion',
+    'DEFAULT_OCR_REGIONS',
 
     # Extractors
     'InvoiceDataExtractor',
 
+    # Region OCR fallback
+    'ocr_regions',
+    'parse_region',
+
     # Patterns
     'DEFAULT_PATTERNS',
     'VENDOR_SPECIFIC_PATTERNS',
@@ -14,7 +14,11 @@ from typing import List, Optional
 import json
 
 from .core import rename_invoice, batch_rename
-from .models import RenameConfig
+from ..cli.common import add_profile_argument, add_stats_argument, print_stats, profile_main
+from ..core.exceptions import InvalidParameterError
+from ..core.metrics import merge_metrics
+from .models import DEFAULT_OCR_REGIONS, RenameConfig
+from .regions import parse_region
 from .validators import InvalidTemplateError, InvalidPatternError
 
 
@@ -48,6 +52,12 @@ Examples:
   # Verbose output
   pdfrename -f invoice.pdf --verbose
 
+  # Scanned invoices: OCR the top third of page 1
+  pdfrename -f scans/*.pdf --ocr-fallback
+
+  # OCR the top right quarter of page 1 and the footer of page 2
+  pdfrename -f scans/*.pdf --ocr-fallback --ocr-region 0.5,0,1,0.25 --ocr-region 2:0,0.85,1,1
+
 Template placeholders:
   {vendor}      - Vendor/supplier name
   {invoice_nr}  - Invoice number
@@ -92,12 +102,48 @@ Template placeholders:
         help='Enable verbose output'
     )
 
+    add_stats_argument(parser)
+    add_profile_argument(parser)
+
     parser.add_argument(
         '--no-duplicates',
         action='store_true',
         help='Error on duplicate filenames instead of adding suffix'
     )
 
+    parser.add_argument(
+        '--ocr-fallback',
+        action='store_true',
+        help='OCR page regions of PDFs without a text layer (scanned invoices)'
+    )
+
+    parser.add_argument(
+        '--ocr-region',
+        action='append',
+        metavar='[PAGE:]L,T,R,B',
+        help='Region for --ocr-fallback as page fractions, repeatable '
+             '(default: 1:0,0,1,0.33 - top third of page 1)'
+    )
+
+    parser.add_argument(
+        '--ocr-dpi',
+        type=int,
+        default=150,
+        help='Rendering DPI for --ocr-fallback (default: 150)'
+    )
+
+    parser.add_argument(
+        '--ocr-language',
+        default='deu+eng',
+        help='OCR language(s) for --ocr-fallback, joined with + (default: deu+eng)'
+    )
+
+    parser.add_argument(
+        '--no-ocr-cache',
+        action='store_true',
+        help='Do not cache --ocr-fallback results by file hash'
+    )
+
     return parser.parse_args(args)
 
 
@@ -172,6 +218,7 @@ def print_summary(results: List) -> None:
                 print(f"  {result.old_name}: {result.message}")
 
 
+@profile_main
 def main(argv: Optional[List[str]] = None) -> int:
     """
     Main entry point for CLI.
@@ -216,9 +263,20 @@ def main(argv: Optional[List[str]] = None) -> int:
             return 1
 
     # Prepare config
+    try:
+        ocr_regions = [parse_region(spec) for spec in args.ocr_region or []]
+    except InvalidParameterError as e:
+        print(f"Error: {e}")
+        return 1
+
     config = RenameConfig(
         handle_duplicates=not args.no_duplicates,
-        verbose=args.verbose
+        verbose=args.verbose,
+        ocr_fallback=args.ocr_fallback,
+        ocr_regions=ocr_regions or list(DEFAULT_OCR_REGIONS),
+        ocr_dpi=args.ocr_dpi,
+        ocr_languages=args.ocr_language.split('+'),
+        ocr_cache=not args.no_ocr_cache
     )
 
     # Prepare output directory
@@ -267,6 +325,9 @@ def main(argv: Optional[List[str]] = None) -> int:
 
             print_summary(results)
 
+        if args.stats:
+            print_stats(merge_metrics(r.metadata.get('metrics') for r in results))
+
         # Determine exit code
         failed = sum(1 for r in results if not r.success)
         return 1 if failed > 0 else 0
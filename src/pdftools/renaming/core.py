@@ -13,6 +13,7 @@ from .models import InvoiceData, RenameConfig, RenameResult
 from .extractors import InvoiceDataExtractor
 from .validators import validate_template, validate_patterns, sanitize_filename
 from .patterns import DEFAULT_PATTERNS
+from ..core.metrics import record_error, record_metrics, stage
 
 
 logger = logging.getLogger(__name__)
@@ -73,6 +74,7 @@ class NamingTemplate:
         return sanitize_filename(rendered, max_length=max_length)
 
 
+@record_metrics
 def rename_invoice(
     input_path: Path,
     template: str = "{vendor}_{invoice_nr}_{date}.pdf",
@@ -131,7 +133,7 @@ def rename_invoice(
 
     # Extract invoice data
     try:
-        extractor = InvoiceDataExtractor(custom_patterns=patterns)
+        extractor = InvoiceDataExtractor(custom_patterns=patterns, config=config)
         invoice_data = extractor.extract_from_pdf(input_path)
 
         if config.verbose:
@@ -141,6 +143,7 @@ def rename_invoice(
             print(f"  Vendor: {invoice_data.vendor or 'Not found'}")
 
     except Exception as e:
+        record_error(e)
         logger.error(f"Failed to extract data from {input_path}: {e}")
         return RenameResult(
             status='error',
@@ -203,7 +206,8 @@ def rename_invoice(
 
     # Actual rename
     try:
-        input_path.rename(new_path)
+        with stage('write'):
+            input_path.rename(new_path)
 
         if config.verbose:
             print(f"  Renamed to: {new_name}")
@@ -220,6 +224,7 @@ def rename_invoice(
         )
 
     except Exception as e:
+        record_error(e)
         logger.error(f"Failed to rename {input_path}: {e}")
         return RenameResult(
             status='error',
@@ -10,7 +10,7 @@ import logging
 from pathlib import Path
 from typing import Dict, Optional
 
-from .models import InvoiceData
+from .models import InvoiceData, RenameConfig
 from .patterns import DEFAULT_PATTERNS, normalize_date
 
 
@@ -25,14 +25,21 @@ class InvoiceDataExtractor:
     data like invoice numbers, dates, and vendor names from invoice PDFs.
     """
 
-    def __init__(self, custom_patterns: Optional[Dict[str, str]] = None):
+    def __init__(
+        self,
+        custom_patterns: Optional[Dict[str, str]] = None,
+        config: Optional[RenameConfig] = None
+    ):
         """
         Initialize extractor with patterns.
 
         Args:
             custom_patterns: Optional custom patterns to override defaults.
                            Keys: 'invoice_nr', 'date', 'vendor'
+            config: Optional configuration (enables the OCR fallback for
+                    PDFs without a text layer if config.ocr_fallback is set)
         """
+        self.config = config
         self.patterns = {**DEFAULT_PATTERNS}
         if custom_patterns:
             self.patterns.update(custom_patterns)
@@ -82,16 +89,29 @@ class InvoiceDataExtractor:
         Raises:
             FileNotFoundError: If PDF file doesn't exist
             PDFProcessingError: If PDF cannot be read
+            TesseractNotFoundError: If the OCR fallback is enabled but no
+                                    OCR engine is available
         """
         if not pdf_path.exists():
             from pdftools.core.exceptions import PDFNotFoundError
             raise PDFNotFoundError(str(pdf_path))
 
+        from pdftools.core.metrics import stage
+
         # Extract text from PDF
-        text = self._extract_text_from_pdf(pdf_path)
+        with stage('extract'):
+            text = self._extract_text_from_pdf(pdf_path)
+
+        # Scanned invoice: recognize the header regions instead
+        if not text.strip() and self.config is not None and self.config.ocr_fallback:
+            from .regions import ocr_regions
+
+            logger.debug(f"No text layer in {pdf_path}, using region OCR")
+            text = ocr_regions(pdf_path, self.config)
 
         # Extract invoice data from text
-        return self.extract_from_text(text)
+        with stage('match'):
+            return self.extract_from_text(text)
 
     def _extract_text_from_pdf(self, pdf_path: Path) -> str:
         """
@@ -107,13 +127,12 @@ class InvoiceDataExtractor:
             PDFProcessingError: If PDF cannot be read
         """
         try:
-            from PyPDF2 import PdfReader
+            from pdftools.core.document import open_document
 
-            reader = PdfReader(str(pdf_path))
             text_parts = []
-
-            for page in reader.pages:
-                text_parts.append(page.extract_text())
+            with open_document(pdf_path) as document:
+                for page in document.reader.pages:
+                    text_parts.append(page.extract_text())
 
             return '\n'.join(text_parts)
 
@@ -7,7 +7,7 @@ configuration, and results of rename operations.
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
 
 @dataclass
@@ -87,6 +87,51 @@ class InvoiceData:
         }
 
 
+@dataclass(frozen=True)
+class OCRRegion:
+    """
+    Page region recognized by the OCR fallback.
+
+    Edges are fractions of the page width/height, measured from the
+    top-left corner, so a region fits every page size.
+
+    Attributes:
+        page: Page number (1-indexed)
+        left: Left edge (0.0-1.0)
+        top: Top edge (0.0-1.0)
+        right: Right edge (0.0-1.0)
+        bottom: Bottom edge (0.0-1.0)
+    """
+
+    page: int = 1
+    left: float = 0.0
+    top: float = 0.0
+    right: float = 1.0
+    bottom: float = 1.0
+
+    def box(self, size: Tuple[int, int]) -> Tuple[int, int, int, int]:
+        """
+        Pixel box of the region in an image of the page.
+
+        Args:
+            size: (width, height) of the page image
+
+        Returns:
+            Tuple[int, int, int, int]: (left, upper, right, lower) for Image.crop
+        """
+        width, height = size
+        return (
+            round(self.left * width),
+            round(self.top * height),
+            round(self.right * width),
+            round(self.bottom * height)
+        )
+
+
+# Invoice header: vendor, number and date are usually in the top third of page 1
+DEFAULT_OCR_REGIONS = (OCRRegion(page=1, bottom=1 / 3),)
+
+
 @dataclass
 class RenameConfig:
     """
@@ -97,12 +142,24 @@ class RenameConfig:
         handle_duplicates: Add numeric suffix if target file exists
         verbose: Enable verbose output
         max_filename_length: Maximum length for generated filenames
+        ocr_fallback: OCR page regions of PDFs without a text layer (scans)
+        ocr_regions: Regions recognized by the OCR fallback
+        ocr_dpi: Rendering DPI of the OCR fallback
+        ocr_languages: OCR language codes (e.g., ['deu', 'eng'])
+        ocr_engine: OCR engine name
+        ocr_cache: Cache OCR results by file hash, so re-runs skip OCR
     """
 
     fallback_name: str = "renamed"
     handle_duplicates: bool = True
     verbose: bool = False
     max_filename_length: int = 255
+    ocr_fallback: bool = False
+    ocr_regions: List[OCRRegion] = field(default_factory=lambda: list(DEFAULT_OCR_REGIONS))
+    ocr_dpi: int = 150
+    ocr_languages: List[str] = field(default_factory=lambda: ['deu', 'eng'])
+    ocr_engine: str = 'auto'
+    ocr_cache: bool = True
 
 
 @dataclass
@@ -0,0 +1,184 @@
+"""
+Region-of-interest OCR fallback for scanned invoices.
+
+Scanned invoices have no text layer, so regex extraction finds nothing.
+Instead of recognizing whole documents, only the regions that hold the
+invoice header (by default the top third of page 1) are rendered at a
+modest DPI and recognized.
+
+Results are cached on disk by file content hash (and every setting that
+affects recognition) in ``rename-ocr/`` below the pdftools cache directory
+(``$PDFTOOLS_CACHE_DIR``, default ``~/.cache/pdftools``), so re-running a
+rename on the same scans skips OCR entirely.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+from pdftools.core.exceptions import InvalidParameterError
+from pdftools.core.metrics import stage
+from pdftools.core.probe import probe_page_count
+from pdftools.ocr.capabilities import cache_dir
+
+from .models import OCRRegion, RenameConfig
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_SUBDIR = 'rename-ocr'
+
+# Bump when the cached format or region handling changes
+_CACHE_VERSION = 1
+
+
+def ocr_regions(pdf_path: Path, config: RenameConfig) -> str:
+    """
+    Recognize the configured regions of a PDF.
+
+    Args:
+        pdf_path: Path to PDF file
+        config: Rename configuration (regions, DPI, languages, engine, cache)
+
+    Returns:
+        str: Recognized text of all regions, in configuration order
+
+    Raises:
+        PDFCorruptedError: If the PDF cannot be read
+        InvalidParameterError: If a language or the engine is invalid
+        TesseractNotFoundError: If the OCR engine is not available
+        LanguageNotAvailableError: If language data not found
+    """
+    key = None
+    if config.ocr_cache:
+        with stage('validate'):
+            key = _cache_key(pdf_path, config)
+        text = _load_cached(key)
+        if text is not None:
+            logger.debug(f"Using cached region OCR of {pdf_path}")
+            return text
+
+    text = _recognize_regions(pdf_path, config)
+
+    if key is not None:
+        _store_cached(key, text)
+    return text
+
+
+def parse_region(spec: str) -> OCRRegion:
+    """
+    Parse a region specification.
+
+    Format: ``[PAGE:]LEFT,TOP,RIGHT,BOTTOM`` with edges as fractions of the
+    page size, e.g. ``0,0,1,0.33`` (top third of page 1) or
+    ``2:0.5,0,1,0.25`` (top right quarter of page 2).
+
+    Args:
+        spec: Region specification
+
+    Returns:
+        OCRRegion: Parsed region
+
+    Raises:
+        InvalidParameterError: If the specification is invalid
+    """
+    page_part, _, edges_part = spec.rpartition(':')
+    try:
+        page = int(page_part) if page_part else 1
+        left, top, right, bottom = (float(edge) for edge in edges_part.split(','))
+    except ValueError:
+        raise InvalidParameterError(
+            "ocr_region", spec, "Expected [PAGE:]LEFT,TOP,RIGHT,BOTTOM, e.g. 1:0,0,1,0.33"
+        )
+
+    if page < 1:
+        raise InvalidParameterError("ocr_region", spec, "Page numbers start at 1")
+    if not (0 <= left < right <= 1 and 0 <= top < bottom <= 1):
+        raise InvalidParameterError(
+            "ocr_region", spec, "Edges must be fractions with LEFT < RIGHT and TOP < BOTTOM"
+        )
+    return OCRRegion(page, left, top, right, bottom)
+
+
+def _recognize_regions(pdf_path: Path, config: RenameConfig) -> str:
+    """Render the region pages once and recognize every region"""
+    from pdftools.ocr.registry import get_engine
+    from pdftools.ocr.validators import check_engine_languages, validate_language
+
+    languages = validate_language(config.ocr_languages)
+    page_count = probe_page_count(pdf_path)
+    pages = sorted({region.page for region in config.ocr_regions if region.page <= page_count})
+    if not pages:
+        logger.debug(f"{pdf_path} has none of the region pages")
+        return ''
+
+    engine = get_engine(config.ocr_engine)
+    try:
+        check_engine_languages(engine, languages)
+
+        with stage('render'):
+            images = dict(zip(pages, engine.pdf_to_images(pdf_path, dpi=config.ocr_dpi, pages=pages)))
+
+        texts = []
+        with stage('recognize'):
+            for region in config.ocr_regions:
+                image = images.get(region.page)
+                if image is None:
+                    continue
+                crop = image.crop(region.box(image.size))
+                result = engine.process_image(crop, '+'.join(languages))
+                texts.append(result['text'])
+        for image in images.values():
+            image.close()
+    finally:
+        engine.close()
+
+    logger.debug(f"Recognized {len(texts)} region(s) of {pdf_path}")
+    return '\n'.join(texts)
+
+
+def _cache_key(pdf_path: Path, config: RenameConfig) -> str:
+    """Hash of the file content and the recognition settings"""
+    digest = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+
+    settings = json.dumps([
+        _CACHE_VERSION,
+        [[r.page, r.left, r.top, r.right, r.bottom] for r in config.ocr_regions],
+        config.ocr_dpi,
+        list(config.ocr_languages),
+        config.ocr_engine,
+    ])
+    digest.update(settings.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _cache_path(key: str) -> Path:
+    """Cache file of a key"""
+    return cache_dir() / CACHE_SUBDIR / f"{key}.json"
+
+
+def _load_cached(key: str) -> Optional[str]:
+    """Load cached region text, if any"""
+    try:
+        entry: Dict[str, str] = json.loads(_cache_path(key).read_text(encoding='utf-8'))
+        return entry['text']
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _store_cached(key: str, text: str) -> None:
+    """Persist region text (best effort)"""
+    path = _cache_path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_path.write_text(json.dumps({'text': text}), encoding='utf-8')
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Could not write region OCR cache: {e}")
@@ -11,9 +11,14 @@ from pdftools.cli.common import (
     print_success,
     print_error,
     print_warning,
-    setup_logging
+    print_stats,
+    setup_logging,
+    add_stats_argument,
+    add_profile_argument,
+    profile_main
 )
 from pdftools.split import split_pdf, SplitMode, parse_ranges
+from pdftools.core.backends import list_backends
 from pdftools.core.exceptions import PDFToolsError
 
 
@@ -50,9 +55,9 @@ def create_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         '-m', '--mode',
         type=str,
-        choices=['pages', 'ranges', 'parts', 'specific'],
+        choices=['pages', 'ranges', 'parts', 'specific', 'blank'],
         default='pages',
-        help='Split mode: pages (default), ranges, parts, or specific'
+        help='Split mode: pages (default), ranges, parts, specific, or blank'
     )
 
     # Mode-specific arguments
@@ -80,6 +85,15 @@ def create_parser() -> argparse.ArgumentParser:
         help='Prefix for output files (default: input filename)'
     )
 
+    parser.add_argument(
+        '--backend',
+        choices=list_backends(),
+        help='PDF backend (default: $PDFTOOLS_BACKEND or auto)'
+    )
+
+    add_stats_argument(parser)
+    add_profile_argument(parser)
+
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -95,6 +109,7 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@profile_main
 def main():
     """Main entry point for pdfsplit CLI."""
     parser = create_parser()
@@ -108,7 +123,8 @@ def main():
         'pages': SplitMode.PAGES,
         'ranges': SplitMode.RANGES,
         'parts': SplitMode.PARTS,
-        'specific': SplitMode.SPECIFIC_PAGES
+        'specific': SplitMode.SPECIFIC_PAGES,
+        'blank': SplitMode.BLANK
     }
     mode = mode_map[args.mode]
 
@@ -155,9 +171,13 @@ def main():
             pages=pages,
             num_parts=num_parts,
             prefix=args.prefix,
-            verbose=args.verbose
+            verbose=args.verbose,
+            backend=args.backend
         )
 
+        if args.stats:
+            print_stats(result.metadata.get('metrics'))
+
         if result.success:
             print_success(result.message or f"Split successful: {result.num_files} files created")
 
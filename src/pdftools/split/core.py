@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Optional
 
 from pdftools.core.exceptions import PDFNotFoundError, PDFProcessingError, ValidationError
+from pdftools.core.metrics import record_error, record_metrics, stage
 from pdftools.core.utils import ensure_directory_exists
 from pdftools.split.models import SplitMode, SplitConfig, SplitResult
 from pdftools.split.validators import validate_pdf_path, validate_output_dir
@@ -14,13 +15,15 @@ from pdftools.split.processors import (
     PagesSplitter,
     RangesSplitter,
     PartsSplitter,
-    SpecificPagesSplitter
+    SpecificPagesSplitter,
+    BlankSeparatorSplitter
 )
 
 
 logger = logging.getLogger('pdftools.split.core')
 
 
+@record_metrics
 def split_pdf(
     input_path: str | Path,
     output_dir: str | Path | None = None,
@@ -30,6 +33,7 @@ def split_pdf(
     num_parts: int | None = None,
     prefix: str | None = None,
     verbose: bool = False,
+    backend: str | None = None,
     config: SplitConfig | None = None
 ) -> SplitResult:
     """
@@ -44,6 +48,7 @@ def split_pdf(
         num_parts: Number of parts for PARTS mode
         prefix: Prefix for output files (default: input filename without extension)
         verbose: Enable verbose logging
+        backend: PDF backend ('pypdf', 'mupdf', default: auto)
         config: SplitConfig object (overrides individual parameters)
 
     Returns:
@@ -92,11 +97,13 @@ def split_pdf(
                 mode=mode,
                 prefix=prefix,
                 verbose=verbose,
+                backend=backend,
                 ranges=ranges,
                 pages=pages,
                 num_parts=num_parts
             )
         except ValidationError as e:
+            record_error(e)
             logger.error(f"Invalid configuration: {e}")
             return SplitResult(
                 status='error',
@@ -105,8 +112,10 @@ def split_pdf(
 
     # Validate input PDF
     try:
-        validate_pdf_path(config.input_path)
+        with stage('validate'):
+            validate_pdf_path(config.input_path)
     except (PDFNotFoundError, ValidationError) as e:
+        record_error(e)
         logger.error(f"Input validation failed: {e}")
         return SplitResult(
             status='error',
@@ -115,8 +124,10 @@ def split_pdf(
 
     # Validate/create output directory
     try:
-        validate_output_dir(config.output_dir, create=True)
+        with stage('validate'):
+            validate_output_dir(config.output_dir, create=True)
     except (ValidationError, PermissionError) as e:
+        record_error(e)
         logger.error(f"Output directory validation failed: {e}")
         return SplitResult(
             status='error',
@@ -130,18 +141,21 @@ def split_pdf(
         return result
 
     except PDFProcessingError as e:
+        record_error(e)
         logger.error(f"PDF processing failed: {e}")
         return SplitResult(
             status='error',
             message=str(e)
         )
     except ValidationError as e:
+        record_error(e)
         logger.error(f"Validation failed: {e}")
         return SplitResult(
             status='error',
             message=str(e)
         )
     except Exception as e:
+        record_error(e)
         logger.critical(f"Unexpected error: {e}", exc_info=True)
         return SplitResult(
             status='error',
@@ -167,7 +181,8 @@ def _create_splitter(config: SplitConfig):
             config.input_path,
             config.output_dir,
             config.prefix,
-            config.verbose
+            config.verbose,
+            backend=config.backend
         )
 
     elif config.mode == SplitMode.RANGES:
@@ -178,7 +193,8 @@ def _create_splitter(config: SplitConfig):
             config.output_dir,
             config.prefix,
             config.ranges,
-            config.verbose
+            config.verbose,
+            backend=config.backend
         )
 
     elif config.mode == SplitMode.PARTS:
@@ -189,7 +205,8 @@ def _create_splitter(config: SplitConfig):
             config.output_dir,
             config.prefix,
             config.num_parts,
-            config.verbose
+            config.verbose,
+            backend=config.backend
         )
 
     elif config.mode == SplitMode.SPECIFIC_PAGES:
@@ -200,7 +217,17 @@ def _create_splitter(config: SplitConfig):
             config.output_dir,
             config.prefix,
             config.pages,
-            config.verbose
+            config.verbose,
+            backend=config.backend
+        )
+
+    elif config.mode == SplitMode.BLANK:
+        return BlankSeparatorSplitter(
+            config.input_path,
+            config.output_dir,
+            config.prefix,
+            config.verbose,
+            backend=config.backend
         )
 
     else:
@@ -17,6 +17,7 @@ class SplitMode(str, Enum):
     RANGES = "ranges"            # User-defined page ranges
     PARTS = "parts"              # N equal parts
     SPECIFIC_PAGES = "specific"  # Specific page numbers
+    BLANK = "blank"              # Documents separated by blank sheets
 
 
 @dataclass
@@ -31,6 +32,7 @@ class SplitConfig:
     mode: SplitMode = SplitMode.PAGES
     prefix: Optional[str] = None
     verbose: bool = False
+    backend: Optional[str] = None  # 'pypdf', 'mupdf' or None/'auto'
 
     # Mode-specific parameters
     ranges: Optional[list[tuple[int, int]]] = None
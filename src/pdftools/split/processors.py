@@ -7,9 +7,12 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Optional
 
-from PyPDF2 import PdfReader, PdfWriter
-
+from pdftools.core.backends import get_backend
+from pdftools.core.blank import find_blank_pages
+from pdftools.core.document import open_document
+from pdftools.core.probe import probe_page_count
 from pdftools.core.exceptions import PDFProcessingError, ValidationError
+from pdftools.core.metrics import record_output, record_pages, stage
 from pdftools.split.models import SplitMode, SplitResult
 from pdftools.split.validators import validate_ranges, validate_pages
 
@@ -64,6 +67,37 @@ def generate_output_filename(
         raise ValueError(f"Unknown split mode: {mode}")
 
 
+def ranges_between_separators(
+    total_pages: int,
+    separators: list[int]
+) -> list[tuple[int, int]]:
+    """
+    Calculate the page ranges between separator pages.
+
+    Separator pages are dropped; consecutive separators (e.g. both sides of
+    a separator sheet) and separators at the start or end yield no empty
+    ranges.
+
+    Args:
+        total_pages: Total number of pages in PDF
+        separators: Separator page numbers (1-indexed)
+
+    Returns:
+        List of (start, end) tuples (1-indexed, inclusive)
+
+    Example:
+        >>> ranges_between_separators(10, [4, 5, 10])
+        [(1, 3), (6, 9)]
+    """
+    ranges = []
+    start = 1
+    for separator in sorted(set(separators)) + [total_pages + 1]:
+        if separator > start:
+            ranges.append((start, separator - 1))
+        start = max(start, separator + 1)
+    return ranges
+
+
 def calculate_parts_ranges(
     total_pages: int,
     num_parts: int
@@ -124,7 +158,8 @@ class BaseSplitter(ABC):
         input_path: Path,
         output_dir: Path,
         prefix: str,
-        verbose: bool = False
+        verbose: bool = False,
+        backend: Optional[str] = None
     ):
         """
         Initialize splitter.
@@ -134,11 +169,14 @@ class BaseSplitter(ABC):
             output_dir: Directory for output files
             prefix: Prefix for output filenames
             verbose: Enable verbose logging
+            backend: PDF backend name ('pypdf', 'mupdf', None = auto)
         """
         self.input_path = input_path
         self.output_dir = output_dir
         self.prefix = prefix
         self.verbose = verbose
+        self.backend_name = backend
+        self.backend = get_backend(backend)
         self.logger = logging.getLogger(f'pdftools.split.{self.__class__.__name__}')
 
     @abstractmethod
@@ -156,7 +194,6 @@ class BaseSplitter(ABC):
 
     def _create_single_page_pdf(
         self,
-        pdf_reader: PdfReader,
         page_num: int,
         output_path: Path
     ) -> None:
@@ -164,19 +201,16 @@ class BaseSplitter(ABC):
         Helper: Extract single page to new PDF.
 
         Args:
-            pdf_reader: PyPDF PdfReader object
             page_num: Page number to extract (0-indexed)
             output_path: Path for output PDF
         """
-        pdf_writer = PdfWriter()
-        pdf_writer.add_page(pdf_reader.pages[page_num])
-
-        with open(output_path, 'wb') as output_file:
-            pdf_writer.write(output_file)
+        with stage('write'):
+            self.backend.write_pages(self.input_path, [page_num + 1], output_path)
+        record_output(output_path)
+        record_pages(1)
 
     def _create_multi_page_pdf(
         self,
-        pdf_reader: PdfReader,
         start_page: int,
         end_page: int,
         output_path: Path
@@ -185,18 +219,18 @@ class BaseSplitter(ABC):
         Helper: Extract page range to new PDF.
 
         Args:
-            pdf_reader: PyPDF PdfReader object
             start_page: Start page (0-indexed, inclusive)
             end_page: End page (0-indexed, inclusive)
             output_path: Path for output PDF
         """
-        pdf_writer = PdfWriter()
-
-        for page_num in range(start_page, end_page + 1):
-            pdf_writer.add_page(pdf_reader.pages[page_num])
-
-        with open(output_path, 'wb') as output_file:
-            pdf_writer.write(output_file)
+        with stage('write'):
+            self.backend.write_pages(
+                self.input_path,
+                list(range(start_page + 1, end_page + 2)),
+                output_path
+            )
+        record_output(output_path)
+        record_pages(end_page - start_page + 1)
 
     def _show_progress(self, current: int, total: int, message: str = "Splitting") -> None:
         """
@@ -236,9 +270,8 @@ class PagesSplitter(BaseSplitter):
         output_files = []
 
         try:
-            with open(self.input_path, 'rb') as pdf_file:
-                pdf_reader = PdfReader(pdf_file)
-                total_pages = len(pdf_reader.pages)
+            with open_document(self.input_path):
+                total_pages = probe_page_count(self.input_path, self.backend.name)
 
                 for page_num in range(total_pages):
                     output_filename = generate_output_filename(
@@ -248,7 +281,7 @@ class PagesSplitter(BaseSplitter):
                     )
                     output_path = self.output_dir / output_filename
 
-                    self._create_single_page_pdf(pdf_reader, page_num, output_path)
+                    self._create_single_page_pdf(page_num, output_path)
                     output_files.append(output_path)
 
                     # Progress
@@ -279,9 +312,10 @@ class RangesSplitter(BaseSplitter):
         output_dir: Path,
         prefix: str,
         ranges: list[tuple[int, int]],
-        verbose: bool = False
+        verbose: bool = False,
+        backend: Optional[str] = None
     ):
-        super().__init__(input_path, output_dir, prefix, verbose)
+        super().__init__(input_path, output_dir, prefix, verbose, backend)
         self.ranges = ranges
 
     def split(self) -> SplitResult:
@@ -298,9 +332,8 @@ class RangesSplitter(BaseSplitter):
         output_files = []
 
         try:
-            with open(self.input_path, 'rb') as pdf_file:
-                pdf_reader = PdfReader(pdf_file)
-                total_pages = len(pdf_reader.pages)
+            with open_document(self.input_path):
+                total_pages = probe_page_count(self.input_path, self.backend.name)
 
                 # Validate ranges
                 validate_ranges(self.ranges, total_pages, allow_overlap=True)
@@ -317,7 +350,6 @@ class RangesSplitter(BaseSplitter):
 
                     # Create PDF with pages in range (convert to 0-indexed)
                     self._create_multi_page_pdf(
-                        pdf_reader,
                         start - 1,  # Convert to 0-indexed
                         end - 1,    # Convert to 0-indexed
                         output_path
@@ -359,9 +391,10 @@ class PartsSplitter(BaseSplitter):
         output_dir: Path,
         prefix: str,
         num_parts: int,
-        verbose: bool = False
+        verbose: bool = False,
+        backend: Optional[str] = None
     ):
-        super().__init__(input_path, output_dir, prefix, verbose)
+        super().__init__(input_path, output_dir, prefix, verbose, backend)
         self.num_parts = num_parts
 
     def split(self) -> SplitResult:
@@ -376,9 +409,8 @@ class PartsSplitter(BaseSplitter):
             PDFProcessingError: If PDF cannot be read
         """
         try:
-            with open(self.input_path, 'rb') as pdf_file:
-                pdf_reader = PdfReader(pdf_file)
-                total_pages = len(pdf_reader.pages)
+            with open_document(self.input_path):
+                total_pages = probe_page_count(self.input_path, self.backend.name)
 
                 # Calculate ranges automatically
                 ranges = calculate_parts_ranges(total_pages, self.num_parts)
@@ -394,7 +426,8 @@ class PartsSplitter(BaseSplitter):
                     self.output_dir,
                     self.prefix,
                     ranges,
-                    self.verbose
+                    self.verbose,
+                    self.backend_name
                 )
 
                 result = ranges_splitter.split()
@@ -422,9 +455,10 @@ class SpecificPagesSplitter(BaseSplitter):
         output_dir: Path,
         prefix: str,
         pages: list[int],
-        verbose: bool = False
+        verbose: bool = False,
+        backend: Optional[str] = None
     ):
-        super().__init__(input_path, output_dir, prefix, verbose)
+        super().__init__(input_path, output_dir, prefix, verbose, backend)
         self.pages = pages
 
     def split(self) -> SplitResult:
@@ -441,9 +475,8 @@ class SpecificPagesSplitter(BaseSplitter):
         output_files = []
 
         try:
-            with open(self.input_path, 'rb') as pdf_file:
-                pdf_reader = PdfReader(pdf_file)
-                total_pages = len(pdf_reader.pages)
+            with open_document(self.input_path):
+                total_pages = probe_page_count(self.input_path, self.backend.name)
 
                 # Validate pages
                 validate_pages(self.pages, total_pages)
@@ -459,7 +492,6 @@ class SpecificPagesSplitter(BaseSplitter):
 
                     # Create PDF with single page (convert to 0-indexed)
                     self._create_single_page_pdf(
-                        pdf_reader,
                         page_num - 1,
                         output_path
                     )
@@ -489,3 +521,60 @@ class SpecificPagesSplitter(BaseSplitter):
         except Exception as e:
             self.logger.error(f"Failed to extract pages: {e}")
             raise PDFProcessingError(f"Failed to extract pages: {e}") from e
+
+
+class BlankSeparatorSplitter(BaseSplitter):
+    """Splits PDF into documents separated by blank pages (separator sheets)."""
+
+    def split(self) -> SplitResult:
+        """
+        Split PDF at blank pages, dropping the blank pages.
+
+        Returns:
+            SplitResult with one file per document between blank pages
+
+        Raises:
+            ValidationError: If the PDF has no non-blank pages
+            PDFProcessingError: If PDF cannot be read
+        """
+        try:
+            with open_document(self.input_path):
+                total_pages = probe_page_count(self.input_path, self.backend.name)
+                separators = find_blank_pages(self.input_path, backend=self.backend.name)
+                ranges = ranges_between_separators(total_pages, separators)
+
+                if not ranges:
+                    raise ValidationError("PDF has no non-blank pages")
+
+                if self.verbose:
+                    self.logger.info(
+                        f"Blank pages {separators} separate {len(ranges)} documents: {ranges}"
+                    )
+
+                # Delegate to RangesSplitter with the documents' ranges
+                ranges_splitter = RangesSplitter(
+                    self.input_path,
+                    self.output_dir,
+                    self.prefix,
+                    ranges,
+                    self.verbose,
+                    self.backend_name
+                )
+
+                result = ranges_splitter.split()
+
+                # Update metadata for blank mode
+                result.metadata['mode'] = 'blank'
+                result.metadata['blank_pages'] = separators
+                result.message = (
+                    f"Successfully split into {len(ranges)} documents "
+                    f"at {len(separators)} blank pages"
+                )
+
+                return result
+
+        except ValidationError:
+            raise  # Re-raise validation errors
+        except Exception as e:
+            self.logger.error(f"Failed to split PDF at blank pages: {e}")
+            raise PDFProcessingError(f"Failed to split PDF at blank pages: {e}") from e
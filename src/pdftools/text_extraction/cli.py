@@ -6,8 +6,9 @@ import sys
 from pathlib import Path
 from typing import Optional
 
+from pdftools.core.backends import list_backends
 from pdftools.core.exceptions import PDFToolsError
-from pdftools.cli.common import setup_logging
+from pdftools.cli.common import setup_logging, add_stats_argument, add_profile_argument, print_stats, profile_main
 
 from .core import extract_text
 from .models import ExtractionMode, OutputFormat
@@ -108,6 +109,15 @@ def create_parser() -> argparse.ArgumentParser:
         help='Include PDF metadata in output'
     )
 
+    parser.add_argument(
+        '--backend',
+        choices=list_backends(),
+        help='PDF backend (default: $PDFTOOLS_BACKEND or auto)'
+    )
+
+    add_stats_argument(parser)
+    add_profile_argument(parser)
+
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -117,6 +127,7 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@profile_main
 def main() -> int:
     """
     Main entry point for pdfgettxt CLI.
@@ -153,9 +164,13 @@ def main() -> int:
             pages=pages,
             encoding=args.encoding,
             include_metadata=args.include_metadata,
-            verbose=args.verbose
+            verbose=args.verbose,
+            backend=args.backend
         )
 
+        if args.stats:
+            print_stats(result.metadata.get('metrics'))
+
         # Output results
         if result.status == "success":
             if result.message:
@@ -5,6 +5,9 @@ from typing import Optional, Union
 
 from pdftools.core.validators import validate_pdf_path, validate_directory
 from pdftools.core.exceptions import ValidationError
+from pdftools.core.document import open_document
+from pdftools.core.metrics import record_metrics, record_output, record_pages, stage
+from pdftools.core.probe import probe_page_count
 
 from .models import (
     ExtractionConfig,
@@ -12,7 +15,7 @@ from .models import (
     ExtractionMode,
     OutputFormat
 )
-from .validators import validate_pages, validate_encoding, check_text_layer
+from .validators import validate_pages, validate_encoding, find_pages_without_text
 from .extractors import (
     SimpleExtractor,
     LayoutExtractor,
@@ -22,6 +25,7 @@ from .extractors import (
 from .formatters import get_formatter
 
 
+@record_metrics
 def extract_text(
     input_path: Union[str, Path],
     output_path: Optional[Union[str, Path]] = None,
@@ -31,6 +35,7 @@ def extract_text(
     encoding: str = "utf-8",
     include_metadata: bool = False,
     verbose: bool = False,
+    backend: Optional[str] = None,
     config: Optional[ExtractionConfig] = None
 ) -> ExtractionResult:
     """
@@ -45,6 +50,7 @@ def extract_text(
         encoding: Output encoding (default: utf-8)
         include_metadata: Include PDF metadata in output
         verbose: Show progress indicator
+        backend: PDF backend ('pypdf', 'mupdf', default: auto)
         config: Pre-configured ExtractionConfig (overrides other params)
 
     Returns:
@@ -68,46 +74,67 @@ def extract_text(
             pages=pages,
             encoding=encoding,
             include_metadata=include_metadata,
-            verbose=verbose
+            verbose=verbose,
+            backend=backend
         )
 
     # Validate input
-    validate_pdf_path(config.input_path)
-    validate_encoding(config.encoding)
-
-    # Check for text layer
-    has_text, num_pages = check_text_layer(config.input_path)
-    if not has_text:
-        if verbose:
-            print(f"⚠ Warning: No text layer found. PDF may be scanned. Consider using OCR.")
-
-    # Validate pages if specified
-    if config.pages:
-        validate_pages(config.pages, num_pages)
-
-    # Validate output path
-    if config.output_path:
-        if mode == ExtractionMode.PER_PAGE:
-            # Output should be directory
-            if config.output_path.exists() and config.output_path.is_file():
-                raise ValidationError(
-                    "PER_PAGE mode requires output_path to be a directory"
-                )
-        else:
-            # Validate output directory can be created
-            validate_directory(config.output_path.parent, create_if_missing=True)
-
-    # Create appropriate extractor
-    extractor = _create_extractor(config)
-
-    # Extract text
-    result = extractor.extract()
+    with stage('validate'):
+        validate_pdf_path(config.input_path)
+        validate_encoding(config.encoding)
+
+    # Share one parsed document between validation and extraction
+    with open_document(config.input_path):
+        with stage('validate'):
+            try:
+                num_pages = probe_page_count(config.input_path, config.backend)
+            except Exception as e:
+                raise ValidationError(f"Cannot read PDF: {e}")
+
+            # Validate pages if specified
+            if config.pages:
+                validate_pages(config.pages, num_pages)
+
+            # Check for text layer on every requested page
+            without_text = find_pages_without_text(config.input_path, config.pages)
+            checked = len(set(config.pages)) if config.pages else num_pages
+            if without_text and verbose:
+                if len(without_text) == checked:
+                    print(f"⚠ Warning: No text layer found. PDF may be scanned. Consider using OCR.")
+                else:
+                    listed = ', '.join(str(page) for page in without_text[:10])
+                    if len(without_text) > 10:
+                        listed += f", ... ({len(without_text)} pages)"
+                    print(f"⚠ Warning: No text layer on pages {listed}. Consider using OCR for these pages.")
+
+            # Validate output path
+            if config.output_path:
+                if mode == ExtractionMode.PER_PAGE:
+                    # Output should be directory
+                    if config.output_path.exists() and config.output_path.is_file():
+                        raise ValidationError(
+                            "PER_PAGE mode requires output_path to be a directory"
+                        )
+                else:
+                    # Validate output directory can be created
+                    validate_directory(config.output_path.parent, create_if_missing=True)
+
+        # Create appropriate extractor
+        extractor = _create_extractor(config)
+
+        # Extract text
+        with stage('extract'):
+            result = extractor.extract()
+        record_pages(len(config.pages) if config.pages else num_pages)
 
     # Write output if path specified
     if config.output_path and mode != ExtractionMode.PER_PAGE:
-        formatter = get_formatter(config.format)
-        output_text = formatter.format(result)
-        config.output_path.write_text(output_text, encoding=config.encoding)
+        with stage('encode'):
+            formatter = get_formatter(config.format)
+            output_text = formatter.format(result)
+        with stage('write'):
+            config.output_path.write_text(output_text, encoding=config.encoding)
+        record_output(config.output_path)
         result.message = f"Text extracted to {config.output_path}"
 
     return result
@@ -2,8 +2,10 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
-from PyPDF2 import PdfReader
+from typing import List
+
+from pdftools.core.backends import PDFBackend, get_backend
+from pdftools.core.metrics import record_output, stage
 
 from .models import ExtractionConfig, ExtractionResult, PageText
 
@@ -14,7 +16,7 @@ class BaseExtractor(ABC):
     def __init__(self, config: ExtractionConfig):
         """Initialize extractor with configuration."""
         self.config = config
-        self.reader: Optional[PdfReader] = None
+        self.backend: PDFBackend = get_backend(config.backend)
 
     @abstractmethod
     def extract(self) -> ExtractionResult:
@@ -26,29 +28,29 @@ class BaseExtractor(ABC):
         """
         pass
 
-    def _open_pdf(self) -> PdfReader:
-        """Open PDF file for reading."""
-        return PdfReader(self.config.input_path)
+    def _page_numbers(self) -> List[int]:
+        """Pages to extract (1-based), all pages if none are configured."""
+        if self.config.pages:
+            return list(self.config.pages)
+        return list(range(1, self.backend.page_count(self.config.input_path) + 1))
 
-    def _extract_page_text(self, page, page_num: int) -> PageText:
+    def _extract_page_text(self, page_num: int) -> PageText:
         """
         Extract text from a single page.
 
         Args:
-            page: PyPDF2 page object
             page_num: Page number (1-based)
 
         Returns:
             PageText object
         """
-        text = page.extract_text()
+        text = self.backend.extract_text(self.config.input_path, page_num)
 
         metadata = {}
         if self.config.include_metadata:
-            # Extract page-level metadata if available
-            if hasattr(page, 'mediabox'):
-                metadata['width'] = float(page.mediabox.width)
-                metadata['height'] = float(page.mediabox.height)
+            width, height = self.backend.page_size(self.config.input_path, page_num)
+            metadata['width'] = width
+            metadata['height'] = height
 
         return PageText(
             page_num=page_num,
@@ -68,15 +70,11 @@ class BaseExtractor(ABC):
             if current == total:
                 print()  # New line when done
 
-    def _extract_pdf_metadata(self, reader: PdfReader) -> dict:
+    def _extract_pdf_metadata(self) -> dict:
         """Extract PDF document metadata."""
-        metadata = {}
-        if self.config.include_metadata and reader.metadata:
-            for key, value in reader.metadata.items():
-                # Remove leading '/' from keys
-                clean_key = key.lstrip('/')
-                metadata[clean_key] = str(value)
-        return metadata
+        if not self.config.include_metadata:
+            return {}
+        return self.backend.metadata(self.config.input_path)
 
 
 class SimpleExtractor(BaseExtractor):
@@ -84,31 +82,21 @@ class SimpleExtractor(BaseExtractor):
 
     def extract(self) -> ExtractionResult:
         """Extract all text as single string."""
-        reader = self._open_pdf()
         pages_data = []
         all_text = []
 
-        # Determine which pages to extract
-        if self.config.pages:
-            page_nums = self.config.pages
-            total = len(page_nums)
-        else:
-            total = len(reader.pages)
-            page_nums = range(1, total + 1)
+        page_nums = self._page_numbers()
+        total = len(page_nums)
 
         for idx, page_num in enumerate(page_nums, 1):
-            # Convert to 0-based for PyPDF2
-            page_idx = page_num - 1
-            page = reader.pages[page_idx]
-
-            page_text = self._extract_page_text(page, page_num)
+            page_text = self._extract_page_text(page_num)
             pages_data.append(page_text)
             all_text.append(page_text.text)
 
             self._show_progress(idx, total, "Extracting text")
 
         combined_text = "\n\n".join(all_text)
-        metadata = self._extract_pdf_metadata(reader)
+        metadata = self._extract_pdf_metadata()
 
         return ExtractionResult(
             status="success",
@@ -124,23 +112,15 @@ class LayoutExtractor(BaseExtractor):
 
     def extract(self) -> ExtractionResult:
         """Extract text while preserving layout."""
-        reader = self._open_pdf()
         pages_data = []
         all_text = []
 
-        if self.config.pages:
-            page_nums = self.config.pages
-            total = len(page_nums)
-        else:
-            total = len(reader.pages)
-            page_nums = range(1, total + 1)
+        page_nums = self._page_numbers()
+        total = len(page_nums)
 
         for idx, page_num in enumerate(page_nums, 1):
-            page_idx = page_num - 1
-            page = reader.pages[page_idx]
-
-            # Use layout mode for extraction (PyPDF2 default preserves layout better)
-            page_text = self._extract_page_text(page, page_num)
+            # Backend text keeps line breaks; pages are separated below
+            page_text = self._extract_page_text(page_num)
             pages_data.append(page_text)
             all_text.append(page_text.text)
 
@@ -148,7 +128,7 @@ class LayoutExtractor(BaseExtractor):
 
         # Preserve page breaks with form feed
         combined_text = "\f\n".join(all_text)
-        metadata = self._extract_pdf_metadata(reader)
+        metadata = self._extract_pdf_metadata()
 
         return ExtractionResult(
             status="success",
@@ -164,15 +144,10 @@ class PerPageExtractor(BaseExtractor):
 
     def extract(self) -> ExtractionResult:
         """Extract text with one file per page."""
-        reader = self._open_pdf()
         pages_data = []
 
-        if self.config.pages:
-            page_nums = self.config.pages
-            total = len(page_nums)
-        else:
-            total = len(reader.pages)
-            page_nums = range(1, total + 1)
+        page_nums = self._page_numbers()
+        total = len(page_nums)
 
         # Ensure output directory exists
         output_dir = self.config.output_path or Path(".")
@@ -182,19 +157,18 @@ class PerPageExtractor(BaseExtractor):
         base_name = self.config.input_path.stem
 
         for idx, page_num in enumerate(page_nums, 1):
-            page_idx = page_num - 1
-            page = reader.pages[page_idx]
-
-            page_text = self._extract_page_text(page, page_num)
+            page_text = self._extract_page_text(page_num)
             pages_data.append(page_text)
 
             # Write individual file
             output_file = output_dir / f"{base_name}_page_{page_num:03d}.txt"
-            output_file.write_text(page_text.text, encoding=self.config.encoding)
+            with stage('write'):
+                output_file.write_text(page_text.text, encoding=self.config.encoding)
+            record_output(output_file)
 
             self._show_progress(idx, total, "Extracting pages")
 
-        metadata = self._extract_pdf_metadata(reader)
+        metadata = self._extract_pdf_metadata()
 
         return ExtractionResult(
             status="success",
@@ -209,27 +183,19 @@ class StructuredExtractor(BaseExtractor):
 
     def extract(self) -> ExtractionResult:
         """Extract text as structured data."""
-        reader = self._open_pdf()
         pages_data = []
 
-        if self.config.pages:
-            page_nums = self.config.pages
-            total = len(page_nums)
-        else:
-            total = len(reader.pages)
-            page_nums = range(1, total + 1)
+        page_nums = self._page_numbers()
+        total = len(page_nums)
 
         for idx, page_num in enumerate(page_nums, 1):
-            page_idx = page_num - 1
-            page = reader.pages[page_idx]
-
-            page_text = self._extract_page_text(page, page_num)
+            page_text = self._extract_page_text(page_num)
             pages_data.append(page_text)
 
             self._show_progress(idx, total, "Extracting structured data")
 
-        metadata = self._extract_pdf_metadata(reader)
-        metadata['total_pages'] = len(reader.pages)
+        metadata = self._extract_pdf_metadata()
+        metadata['total_pages'] = self.backend.page_count(self.config.input_path)
         metadata['extracted_pages'] = len(pages_data)
 
         return ExtractionResult(
@@ -15,6 +15,11 @@ class BaseFormatter(ABC):
         """Format extraction result to string."""
         pass
 
+    @staticmethod
+    def _document_metadata(result: ExtractionResult) -> dict:
+        """PDF metadata of the result, without the operation's run metrics."""
+        return {k: v for k, v in result.metadata.items() if k != 'metrics'}
+
 
 class TxtFormatter(BaseFormatter):
     """Plain text formatter."""
@@ -35,7 +40,7 @@ class JsonFormatter(BaseFormatter):
         """Format as JSON."""
         data = {
             "status": result.status,
-            "metadata": result.metadata,
+            "metadata": self._document_metadata(result),
             "char_count": result.char_count,
             "pages": [
                 {
@@ -62,9 +67,10 @@ class MarkdownFormatter(BaseFormatter):
         lines = []
 
         # Add metadata section if available
-        if result.metadata:
+        metadata = self._document_metadata(result)
+        if metadata:
             lines.append("# PDF Metadata\n")
-            for key, value in result.metadata.items():
+            for key, value in metadata.items():
                 lines.append(f"**{key}**: {value}  ")
             lines.append("\n---\n")
 
@@ -41,6 +41,7 @@ class ExtractionConfig:
     encoding: str = "utf-8"
     include_metadata: bool = False
     verbose: bool = False
+    backend: Optional[str] = None  # 'pypdf', 'mupdf' or None/'auto'
 
     def __post_init__(self):
         """Validate configuration."""
@@ -2,9 +2,10 @@
 
 from pathlib import Path
 from typing import Optional
-from PyPDF2 import PdfReader
 
+from pdftools.core.content import classify_pages
 from pdftools.core.exceptions import ValidationError
+from pdftools.core.probe import probe_page_count
 from pdftools.core.validators import validate_pdf_path
 
 
@@ -57,31 +58,51 @@ def validate_encoding(encoding: str) -> None:
         raise ValidationError(f"Unsupported encoding: {encoding}")
 
 
-def check_text_layer(pdf_path: Path) -> tuple[bool, int]:
+def find_pages_without_text(
+    pdf_path: Path,
+    pages: Optional[list[int]] = None
+) -> list[int]:
+    """
+    Find pages without a text layer (e.g. scanned pages).
+
+    Scans the content streams for text operators; no text is extracted.
+
+    Args:
+        pdf_path: Path to PDF file
+        pages: Pages to check (1-indexed, None = all pages)
+
+    Returns:
+        Page numbers without text, in page order
+
+    Raises:
+        ValidationError: If PDF cannot be read
+    """
+    try:
+        return [page.page_number for page in classify_pages(pdf_path, pages) if page.needs_ocr]
+    except Exception as e:
+        raise ValidationError(f"Cannot read PDF: {e}")
+
+
+def check_text_layer(
+    pdf_path: Path,
+    backend: Optional[str] = None
+) -> tuple[bool, int]:
     """
     Check if PDF has a text layer and count pages.
 
     Args:
         pdf_path: Path to PDF file
+        backend: PDF backend name for the page count fallback (default: auto)
 
     Returns:
-        Tuple of (has_text, num_pages)
+        Tuple of (has_text, num_pages); has_text is True if any page has text
 
     Raises:
         ValidationError: If PDF cannot be read
     """
     try:
-        reader = PdfReader(pdf_path)
-        num_pages = len(reader.pages)
-
-        # Check first 3 pages for text
-        has_text = False
-        for i in range(min(3, num_pages)):
-            text = reader.pages[i].extract_text()
-            if text and text.strip():
-                has_text = True
-                break
-
-        return has_text, num_pages
+        num_pages = probe_page_count(pdf_path, backend)
     except Exception as e:
         raise ValidationError(f"Cannot read PDF: {e}")
+
+    return len(find_pages_without_text(pdf_path)) < num_pages, num_pages
@@ -10,6 +10,9 @@ import argparse
 import logging
 from pathlib import Path
 
+from pdftools.cli.common import add_profile_argument, add_stats_argument, print_stats, profile_main
+from pdftools.core.backends import list_backends
+
 from .core import generate_thumbnails
 from .models import ThumbnailSize, ThumbnailFormat
 
@@ -112,6 +115,22 @@ Note: Aspect ratio is always preserved. Images are scaled to fit within
         help='JPEG quality 1-100 (default: 85, ignored for PNG)'
     )
 
+    parser.add_argument(
+        '--backend',
+        choices=list_backends(),
+        default=None,
+        help='PDF rendering backend (default: $PDFTOOLS_BACKEND or auto)'
+    )
+
+    parser.add_argument(
+        '--skip-blank',
+        action='store_true',
+        help='Do not create thumbnails of blank pages'
+    )
+
+    add_stats_argument(parser)
+    add_profile_argument(parser)
+
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -127,6 +146,7 @@ Note: Aspect ratio is always preserved. Images are scaled to fit within
     return parser.parse_args(args)
 
 
+@profile_main
 def main(args=None):
     """
     Main entry point for CLI.
@@ -196,15 +216,22 @@ def main(args=None):
             format=format_enum,
             pages=parsed_args.pages,
             quality=parsed_args.quality,
-            verbose=parsed_args.verbose
+            verbose=parsed_args.verbose,
+            backend=parsed_args.backend,
+            skip_blank=parsed_args.skip_blank
         )
 
+        if parsed_args.stats:
+            print_stats(result.metadata.get('metrics'))
+
         # Display results
         if result.success:
             print(f"✓ Success: {result.message}")
             print(f"\nCreated {result.thumbnails_created} thumbnails:")
             for path in result.thumbnail_paths:
                 print(f"  - {path}")
+            if result.metadata.get('blank_pages'):
+                print(f"\nSkipped blank pages: {', '.join(map(str, result.metadata['blank_pages']))}")
             print()
             return 0
 
@@ -6,16 +6,11 @@ import logging
 from pathlib import Path
 from typing import Union, Optional
 
-try:
-    from pdf2image import pdfinfo_from_path
-    from pdf2image.exceptions import PDFInfoNotInstalledError
-    PDF2IMAGE_AVAILABLE = True
-except ImportError:
-    PDF2IMAGE_AVAILABLE = False
-    pdfinfo_from_path = None
-    PDFInfoNotInstalledError = Exception
-
+from pdftools.core.blank import find_blank_pages
+from pdftools.core.document import acquire_document, release_document
 from pdftools.core.exceptions import PDFProcessingError, ValidationError
+from pdftools.core.metrics import record_error, record_metrics, record_pages, stage
+from pdftools.core.probe import probe_page_count
 from .models import ThumbnailConfig, ThumbnailResult, ThumbnailSize, ThumbnailFormat
 from .validators import (
     validate_pdf_path,
@@ -30,12 +25,16 @@ from .generators import PDFThumbnailGenerator
 logger = logging.getLogger('pdftools.thumbnails')
 
 
-def get_pdf_page_count(pdf_path: Path) -> int:
+def get_pdf_page_count(pdf_path: Path, backend: Optional[str] = None) -> int:
     """
     Get the number of pages in a PDF file.
 
+    Reads the page tree root from the file tail; the document is only
+    parsed if that fails.
+
     Args:
         pdf_path: Path to PDF file
+        backend: PDF backend name for the fallback (default: auto)
 
     Returns:
         int: Number of pages in PDF
@@ -43,25 +42,13 @@ def get_pdf_page_count(pdf_path: Path) -> int:
     Raises:
         PDFProcessingError: If page count cannot be determined
     """
-    if not PDF2IMAGE_AVAILABLE:
-        raise ImportError(
-            "pdf2image is not installed. Install it with: pip install pdf2image"
-        )
-
     try:
-        info = pdfinfo_from_path(str(pdf_path))
-        return info.get('Pages', 0)
-    except PDFInfoNotInstalledError:
-        raise PDFProcessingError(
-            "poppler-utils is not installed. Please install it:\n"
-            "  Ubuntu/Debian: sudo apt-get install poppler-utils\n"
-            "  macOS: brew install poppler\n"
-            "  Windows: Download from https://github.com/oschwartz10612/poppler-windows/releases"
-        )
+        return probe_page_count(pdf_path, backend)
     except Exception as e:
         raise PDFProcessingError(f"Failed to get PDF page count: {e}")
 
 
+@record_metrics
 def generate_thumbnails(
     input_path: Union[str, Path],
     output_dir: Union[str, Path, None] = None,
@@ -69,7 +56,10 @@ def generate_thumbnails(
     format: Union[ThumbnailFormat, str] = ThumbnailFormat.PNG,
     pages: Union[list[int], str, None] = None,
     quality: int = 85,
-    verbose: bool = False
+    verbose: bool = False,
+    backend: Optional[str] = None,
+    name: Optional[str] = None,
+    skip_blank: bool = False
 ) -> ThumbnailResult:
     """
     Generate thumbnail images from PDF pages.
@@ -91,6 +81,10 @@ def generate_thumbnails(
             - None for all pages
         quality: JPEG quality 1-100 (ignored for PNG)
         verbose: Enable detailed logging
+        backend: PDF backend for rendering ('pypdf', 'mupdf', None = auto)
+        name: Base name of the thumbnail files (default: input file stem)
+        skip_blank: Create no thumbnails for blank pages (listed in
+                    metadata['blank_pages'])
 
     Returns:
         ThumbnailResult: Object containing:
@@ -139,32 +133,37 @@ def generate_thumbnails(
         logging.basicConfig(level=logging.INFO)
         logger.setLevel(logging.DEBUG)
 
+    document = None
     try:
-        # Validate input PDF
-        logger.info(f"Validating input PDF: {input_path}")
-        pdf_path = validate_pdf_path(input_path)
+        with stage('validate'):
+            # Validate input PDF
+            logger.info(f"Validating input PDF: {input_path}")
+            pdf_path = validate_pdf_path(input_path)
 
-        # Validate output directory
-        if output_dir is None:
-            output_dir = Path.cwd() / "thumbnails"
-        logger.info(f"Validating output directory: {output_dir}")
-        output_path = validate_output_dir(output_dir)
+            # Keep the document open so counting and rendering share one parse
+            document = acquire_document(pdf_path)
 
-        # Validate and parse size
-        logger.info(f"Validating size: {size}")
-        size_tuple = validate_size(size)
+            # Validate output directory
+            if output_dir is None:
+                output_dir = Path.cwd() / "thumbnails"
+            logger.info(f"Validating output directory: {output_dir}")
+            output_path = validate_output_dir(output_dir)
 
-        # Validate and parse format
-        logger.info(f"Validating format: {format}")
-        format_enum = validate_format(format)
+            # Validate and parse size
+            logger.info(f"Validating size: {size}")
+            size_tuple = validate_size(size)
 
-        # Validate quality
-        logger.info(f"Validating quality: {quality}")
-        quality_value = validate_quality(quality)
+            # Validate and parse format
+            logger.info(f"Validating format: {format}")
+            format_enum = validate_format(format)
+
+            # Validate quality
+            logger.info(f"Validating quality: {quality}")
+            quality_value = validate_quality(quality)
 
         # Get total page count
         logger.info("Getting PDF page count")
-        total_pages = get_pdf_page_count(pdf_path)
+        total_pages = get_pdf_page_count(pdf_path, backend)
 
         if total_pages == 0:
             return ThumbnailResult(
@@ -177,7 +176,15 @@ def generate_thumbnails(
 
         # Validate and parse pages
         logger.info(f"Validating pages: {pages}")
-        pages_list = validate_pages(pages, total_pages)
+        with stage('validate'):
+            pages_list = validate_pages(pages, total_pages)
+
+        metadata = {}
+        if skip_blank:
+            blank_pages = find_blank_pages(pdf_path, pages_list, backend)
+            pages_list = [page for page in pages_list if page not in blank_pages]
+            metadata['blank_pages'] = blank_pages
+            logger.info(f"Skipping {len(blank_pages)} blank pages")
 
         logger.info(f"Will process {len(pages_list)} pages: {pages_list}")
 
@@ -186,7 +193,8 @@ def generate_thumbnails(
             size=size_tuple,
             format=format_enum,
             quality=quality_value,
-            verbose=verbose
+            verbose=verbose,
+            backend=backend
         )
 
         # Create generator
@@ -199,13 +207,16 @@ def generate_thumbnails(
         skipped_pages = []
 
         try:
-            thumbnail_paths = generator.generate_and_save(
-                pdf_path=pdf_path,
-                output_dir=output_path,
-                pages=pages_list
-            )
+            if pages_list:
+                thumbnail_paths = generator.generate_and_save(
+                    pdf_path=pdf_path,
+                    output_dir=output_path,
+                    pages=pages_list,
+                    base_name=name
+                )
 
         except PDFProcessingError as e:
+            record_error(e)
             # If generation failed completely
             logger.error(f"Thumbnail generation failed: {e}")
             return ThumbnailResult(
@@ -215,6 +226,8 @@ def generate_thumbnails(
                 thumbnails_created=0
             )
 
+        record_pages(len(thumbnail_paths))
+
         # Determine status
         if len(thumbnail_paths) == len(pages_list):
             status = 'success'
@@ -234,10 +247,12 @@ def generate_thumbnails(
             thumbnail_paths=thumbnail_paths,
             message=message,
             skipped_pages=skipped_pages,
-            total_pages=total_pages
+            total_pages=total_pages,
+            metadata=metadata
         )
 
     except ValidationError as e:
+        record_error(e)
         logger.error(f"Validation error: {e}")
         return ThumbnailResult(
             status='error',
@@ -246,6 +261,7 @@ def generate_thumbnails(
         )
 
     except PDFProcessingError as e:
+        record_error(e)
         logger.error(f"Processing error: {e}")
         return ThumbnailResult(
             status='error',
@@ -254,9 +270,14 @@ def generate_thumbnails(
         )
 
     except Exception as e:
+        record_error(e)
         logger.error(f"Unexpected error: {e}")
         return ThumbnailResult(
             status='error',
             message=f"Unexpected error: {e}",
             thumbnails_created=0
         )
+
+    finally:
+        if document is not None:
+            release_document(document)
@@ -1,10 +1,10 @@
 """
-PDF thumbnail generation using pdf2image and Pillow
+PDF thumbnail generation using a PDF backend (MuPDF or poppler) and Pillow
 """
 
 import logging
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Iterator, Tuple
 
 try:
     from pdf2image import convert_from_path
@@ -28,7 +28,10 @@ except ImportError:
     PIL_AVAILABLE = False
     Image = None
 
+from pdftools.core.backends import get_backend
 from pdftools.core.exceptions import PDFProcessingError
+from pdftools.core.images import iter_page_images
+from pdftools.core.metrics import record_output, stage, timed_iter
 from .models import ThumbnailConfig
 
 logger = logging.getLogger('pdftools.thumbnails')
@@ -38,7 +41,8 @@ class PDFThumbnailGenerator:
     """
     Generator for creating thumbnails from PDF pages.
 
-    Uses pdf2image for PDF→Image conversion and Pillow (PIL) for resizing.
+    Uses the configured PDF backend (MuPDF in-process or poppler through a
+    pipe) for PDF→Image conversion and Pillow (PIL) for resizing.
 
     Attributes:
         config: Thumbnail generation configuration
@@ -54,16 +58,14 @@ class PDFThumbnailGenerator:
 
         Args:
             config: ThumbnailConfig object
-            pdf_converter: Optional custom PDF converter (for testing)
+            pdf_converter: Optional custom pdf2image-style converter
+                           (for testing; bypasses the backend)
 
         Raises:
-            ImportError: If pdf2image or Pillow is not installed
+            ImportError: If Pillow is not installed
+            PDFProcessingError: If the configured backend is not available
         """
-        if not PDF2IMAGE_AVAILABLE:
-            raise ImportError(
-                "pdf2image is not installed. Install it with: pip install pdf2image\n"
-                "Also ensure poppler-utils is installed on your system."
-            )
+        self.backend = None if pdf_converter else get_backend(config.backend)
 
         if not PIL_AVAILABLE:
             raise ImportError(
@@ -71,7 +73,7 @@ class PDFThumbnailGenerator:
             )
 
         self.config = config
-        self._pdf_converter = pdf_converter or convert_from_path
+        self._pdf_converter = pdf_converter
 
     def generate(
         self,
@@ -95,6 +97,12 @@ class PDFThumbnailGenerator:
             if self.config.verbose:
                 logger.info(f"Converting PDF pages: {pdf_path}")
 
+            if self.backend is not None:
+                images = [image for _, image in self._iter_backend_images(pdf_path, pages)]
+                if self.config.verbose:
+                    logger.info(f"Converted {len(images)} pages with {self.backend.name}")
+                return images
+
             # Convert specified pages or all pages
             images = self._pdf_converter(
                 pdf_path=str(pdf_path),
@@ -126,6 +134,8 @@ class PDFThumbnailGenerator:
             )
         except (PDFPageCountError, PDFSyntaxError) as e:
             raise PDFProcessingError(f"PDF file is corrupted or invalid: {e}")
+        except PDFProcessingError:
+            raise
         except Exception as e:
             raise PDFProcessingError(f"Failed to convert PDF to images: {e}")
 
@@ -229,7 +239,8 @@ class PDFThumbnailGenerator:
         self,
         pdf_path: Path,
         output_dir: Path,
-        pages: Optional[list[int]] = None
+        pages: Optional[list[int]] = None,
+        base_name: Optional[str] = None
     ) -> list[Path]:
         """
         Generate thumbnails and save them to output directory.
@@ -241,6 +252,7 @@ class PDFThumbnailGenerator:
             pdf_path: Path to PDF file
             output_dir: Directory where thumbnails will be saved
             pages: Page numbers to process (1-indexed), None = all pages
+            base_name: File name prefix (default: PDF file stem)
 
         Returns:
             list[Path]: Paths to created thumbnail files
@@ -248,30 +260,77 @@ class PDFThumbnailGenerator:
         Raises:
             PDFProcessingError: If generation or saving fails
         """
-        # Generate images from PDF
-        images = self.generate(pdf_path, pages)
-
         # Prepare output paths
         thumbnail_paths = []
-        base_name = pdf_path.stem
+        base_name = base_name or pdf_path.stem
         extension = self.config.format.value
 
-        # Process each image
-        for idx, image in enumerate(images):
-            # Determine page number
-            if pages:
-                page_num = pages[idx] if idx < len(pages) else idx + 1
-            else:
-                page_num = idx + 1
-
+        # Process each page as soon as it is rendered
+        for page_num, image in timed_iter(self._iter_images(pdf_path, pages), 'render'):
             # Create output filename
             output_filename = f"{base_name}_page_{page_num:03d}.{extension}"
             output_path = output_dir / output_filename
 
             # Resize and save
-            resized_image = self.resize_image(image)
-            self.save_thumbnail(resized_image, output_path)
+            with stage('resize'):
+                resized_image = self.resize_image(image)
+            with stage('encode'):
+                self.save_thumbnail(resized_image, output_path)
+            record_output(output_path)
+            image.close()
 
             thumbnail_paths.append(output_path)
 
         return thumbnail_paths
+
+    def _iter_images(
+        self,
+        pdf_path: Path,
+        pages: Optional[list[int]]
+    ) -> Iterator[Tuple[int, Image.Image]]:
+        """
+        Yield (page number, image) pairs, one page in memory at a time.
+
+        Backends stream pages; a custom converter returns all pages at once.
+
+        Raises:
+            PDFProcessingError: If PDF conversion fails
+        """
+        if self.backend is None:
+            images = self.generate(pdf_path, pages)
+            for idx, image in enumerate(images):
+                if pages:
+                    page_num = pages[idx] if idx < len(pages) else idx + 1
+                else:
+                    page_num = idx + 1
+                yield page_num, image
+            return
+
+        if self.config.verbose:
+            logger.info(f"Converting PDF pages with {self.backend.name}: {pdf_path}")
+
+        try:
+            yield from self._iter_backend_images(pdf_path, pages)
+        except PDFProcessingError:
+            raise
+        except Exception as e:
+            raise PDFProcessingError(f"Failed to convert PDF to images: {e}")
+
+    def _iter_backend_images(
+        self,
+        pdf_path: Path,
+        pages: Optional[list[int]]
+    ) -> Iterator[Tuple[int, Image.Image]]:
+        """
+        Yield page images from the backend.
+
+        Embedded JPEG and CCITT scans are decoded directly (JPEGs in draft
+        mode, just large enough for the thumbnail); other pages are rendered.
+        """
+        return iter_page_images(
+            pdf_path,
+            pages,
+            dpi=self.config.dpi,
+            backend=self.backend,
+            size_hint=self.config.size
+        )
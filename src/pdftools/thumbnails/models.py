@@ -5,7 +5,7 @@ Data models for PDF thumbnail generation
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 
 class ThumbnailSize(Enum):
@@ -46,12 +46,14 @@ class ThumbnailConfig:
         quality: JPEG quality factor 1-100 (ignored for PNG)
         dpi: DPI for PDF rendering (higher = better quality, slower)
         verbose: Enable verbose logging
+        backend: PDF backend ('pypdf', 'mupdf', None = auto)
     """
     size: tuple[int, int]
     format: ThumbnailFormat
     quality: int = 85
     dpi: int = 200
     verbose: bool = False
+    backend: Optional[str] = None
 
     def __post_init__(self):
         """Validate configuration after initialization"""
@@ -84,6 +86,7 @@ class ThumbnailResult:
         message: Status message or error description
         skipped_pages: List of page numbers that were skipped due to errors
         total_pages: Total number of pages in the PDF
+        metadata: Additional metadata about the operation (e.g. metrics)
     """
     status: str  # 'success' | 'error' | 'partial'
     thumbnails_created: int = 0
@@ -91,6 +94,7 @@ class ThumbnailResult:
     message: str = ""
     skipped_pages: list[int] = field(default_factory=list)
     total_pages: int = 0
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
     @property
     def success(self) -> bool:
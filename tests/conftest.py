@@ -5,13 +5,17 @@ Pytest configuration and shared fixtures for MCP PDF Tools
 import os
 import shutil
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator
 import pytest
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter, A4
 from PIL import Image
+from PyPDF2 import PdfWriter
 import io
 
+from pdftools.ocr import registry
+from pdftools.ocr.models import OCRConfig
+
 
 # ============================================================================
 # PYTEST CONFIGURATION
@@ -197,6 +201,53 @@ def pdf_empty(ensure_fixtures_dir: Path) -> Path:
     return pdf_path
 
 
+# ============================================================================
+# OCR FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def blank_pdf(temp_dir: Path) -> Callable[..., Path]:
+    """
+    Factory for PDFs of blank pages (scans without a text layer)
+
+    Returns:
+        Function creating temp_dir / name with the given number of pages,
+        e.g. blank_pdf(3) or blank_pdf(2, "sub/scan.pdf", width=595, height=842)
+    """
+    def make(pages: int, name: str = "scan.pdf", width: float = 200, height: float = 200) -> Path:
+        writer = PdfWriter()
+        for _ in range(pages):
+            writer.add_blank_page(width=width, height=height)
+        pdf_path = temp_dir / name
+        pdf_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(pdf_path, 'wb') as f:
+            writer.write(f)
+        return pdf_path
+
+    return make
+
+
+@pytest.fixture
+def fake_engine(monkeypatch) -> Callable[[str, type], OCRConfig]:
+    """
+    Register fake OCR engines for one test
+
+    The registry is restored after the test; batch workers forked during
+    the test inherit the registered engines.
+
+    Returns:
+        Function registering an engine class under a name and returning
+        an OCRConfig that uses it
+    """
+    monkeypatch.setattr(registry, '_ENGINES', dict(registry._ENGINES))
+
+    def register(name: str, engine_class: type) -> OCRConfig:
+        registry.register_engine(name, engine_class)
+        return OCRConfig(engine=name)
+
+    return register
+
+
 # ============================================================================
 # CORRUPTED/INVALID FILE FIXTURES
 # ============================================================================
@@ -0,0 +1,110 @@
+"""
+Tests for adaptive-DPI OCR
+"""
+
+import json
+
+import pytest
+from PIL import Image
+
+from pdftools.ocr.batch import perform_batch_ocr
+from pdftools.ocr.core import ocr_pages, perform_ocr
+from pdftools.ocr.models import OCRConfig, OutputMode
+
+
+class DpiEngine:
+    """Fake engine: even pages are only recognized confidently at 300 DPI"""
+
+    renders = []
+
+    def pdf_to_images(self, pdf_path, dpi=300, pages=None):
+        pages = pages or [1, 2, 3, 4]
+        DpiEngine.renders.append((dpi, list(pages)))
+        return [Image.new('L', (dpi, page)) for page in pages]
+
+    def process_image(self, image, language, config=None):
+        dpi, page = image.size
+        confident = page % 2 or dpi >= 300
+        return {'text': f"page {page}", 'confidence': 0.95 if confident else 0.4}
+
+    def get_available_languages(self):
+        return ['deu']
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def dpi_engine(fake_engine):
+    """Register the fake engine (inherited by forked workers)"""
+    fake_engine('dpi', DpiEngine)
+    DpiEngine.renders = []
+
+
+class TestInitialDpi:
+    """Test OCRConfig.initial_dpi"""
+
+    @pytest.mark.parametrize('adaptive_dpi, expected', [(None, 300), (150, 150), (300, 300), (600, 300), (0, 300)])
+    def test_initial_dpi(self, adaptive_dpi, expected):
+        """Test that only a lower positive adaptive DPI is used first"""
+        assert OCRConfig(dpi=300, adaptive_dpi=adaptive_dpi).initial_dpi == expected
+
+
+class TestAdaptiveOCR:
+    """Test confidence-driven re-rendering"""
+
+    def test_low_confidence_pages_rerendered(self, blank_pdf, dpi_engine, tmp_path):
+        """Test that only low-confidence pages are rendered again, with per-page DPI in JSON"""
+        pdf = blank_pdf(4)
+        output = tmp_path / "out.json"
+        config = OCRConfig(engine='dpi', adaptive_dpi=150)
+
+        result = perform_ocr(pdf, output, 'deu', OutputMode.JSON, config)
+
+        assert result.success
+        assert DpiEngine.renders == [(150, [1, 2, 3, 4]), (300, [2]), (300, [4])]
+        pages = json.loads(output.read_text(encoding='utf-8'))['pages']
+        assert [page['dpi'] for page in pages] == [150, 300, 150, 300]
+        assert [page['confidence'] for page in pages] == [0.95] * 4
+        assert result.metadata['escalated_pages'] == [2, 4]
+        assert result.metadata['adaptive_dpi'] == 150
+
+    def test_rerendered_page_kept_at_low_dpi(self, blank_pdf, dpi_engine, monkeypatch):
+        """Test that a re-rendered page counts as escalated even if its first result is kept"""
+        pdf = blank_pdf(4)
+        process_image = DpiEngine.process_image
+
+        def worse_at_high_dpi(self, image, language, config=None):
+            result = process_image(self, image, language, config)
+            if image.size == (300, 4):
+                result['confidence'] = 0.2
+            return result
+
+        monkeypatch.setattr(DpiEngine, 'process_image', worse_at_high_dpi)
+
+        results = ocr_pages(pdf, 'deu', OCRConfig(engine='dpi', adaptive_dpi=150))
+
+        assert [r['dpi'] for r in results] == [150, 300, 150, 150]
+        assert [r['page_number'] for r in results if r.get('escalated')] == [2, 4]
+
+    def test_fixed_dpi(self, blank_pdf, dpi_engine):
+        """Test that without adaptive mode every page is rendered once at dpi"""
+        pdf = blank_pdf(4)
+        results = ocr_pages(pdf, 'deu', OCRConfig(engine='dpi', pages=[1, 2]))
+
+        assert DpiEngine.renders == [(300, [1, 2])]
+        assert [r['dpi'] for r in results] == [300, 300]
+
+    def test_batch(self, blank_pdf, dpi_engine, tmp_path):
+        """Test adaptive mode in batch workers (the progress callback stays local)"""
+        pdf = blank_pdf(4)
+        progress = []
+        config = OCRConfig(engine='dpi', adaptive_dpi=200,
+                           progress_callback=lambda done, total: progress.append(done))
+
+        result, = perform_batch_ocr([pdf], tmp_path, 'deu', OutputMode.JSON,
+                                    config, workers=2)
+
+        assert result.success
+        assert result.metadata['escalated_pages'] == [2, 4]
+        assert progress == [1, 2, 3, 4]
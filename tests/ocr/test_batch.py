@@ -0,0 +1,133 @@
+"""
+Tests for batch OCR scheduling
+"""
+
+import pytest
+from PIL import Image
+
+from pdftools.ocr.batch import perform_batch_ocr, find_pdfs
+from pdftools.ocr.models import OutputMode
+from pdftools.core.exceptions import InvalidParameterError
+
+
+class PageNumberEngine:
+    """Fake engine that 'recognizes' the page number of each page"""
+
+    def pdf_to_images(self, pdf_path, dpi=300, pages=None):
+        return [Image.new('L', (page, 1)) for page in pages]
+
+    def process_image(self, image, language, config=None):
+        return {'text': f"page {image.width}", 'confidence': 0.9}
+
+    def get_available_languages(self):
+        return ['deu', 'eng']
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def pagenumber_engine(fake_engine):
+    """Register the fake engine (inherited by forked workers)"""
+    return fake_engine('pagenumber', PageNumberEngine)
+
+
+class TestFindPdfs:
+    """Test find_pdfs function"""
+
+    def test_finds_sorted_pdfs(self, tmp_path, blank_pdf):
+        """Test that only PDF files are returned, sorted"""
+        blank_pdf(1, "b.pdf")
+        blank_pdf(1, "a.PDF")
+        (tmp_path / "notes.txt").write_text("x")
+
+        assert [p.name for p in find_pdfs(tmp_path)] == ["a.PDF", "b.pdf"]
+
+    def test_not_a_directory(self, blank_pdf):
+        """Test that a file path is rejected"""
+        with pytest.raises(InvalidParameterError):
+            find_pdfs(blank_pdf(1, "a.pdf"))
+
+
+class TestPerformBatchOCR:
+    """Test perform_batch_ocr function"""
+
+    def test_pages_reassembled_in_order(self, tmp_path, blank_pdf, pagenumber_engine):
+        """Test that each document's pages are written in page order"""
+        blank_pdf(7, "long.pdf")
+        blank_pdf(2, "short.pdf")
+        out_dir = tmp_path / "out"
+
+        results = perform_batch_ocr(tmp_path, output_dir=out_dir, config=pagenumber_engine, workers=3)
+
+        assert [r.status for r in results] == ['success', 'success']
+        assert [r.pages_processed for r in results] == [7, 2]
+
+        text = (out_dir / "long_ocr.txt").read_text(encoding='utf-8')
+        positions = [text.index(f"page {i}\n") for i in range(1, 8)]
+        assert positions == sorted(positions)
+
+    def test_recursive_inputs_keep_directories(self, tmp_path, blank_pdf, pagenumber_engine):
+        """Test that same-named files in different subdirectories get separate outputs"""
+        scans = tmp_path / "scans"
+        for name, pages in (("a", 1), ("b", 2)):
+            (scans / name).mkdir(parents=True)
+            blank_pdf(pages, f"scans/{name}/scan.pdf")
+        out_dir = tmp_path / "out"
+
+        results = perform_batch_ocr(scans, output_dir=out_dir, config=pagenumber_engine, recursive=True)
+
+        assert [r.output_path for r in results] == [out_dir / "a" / "scan_ocr.txt", out_dir / "b" / "scan_ocr.txt"]
+        assert "page 2" not in (out_dir / "a" / "scan_ocr.txt").read_text(encoding='utf-8')
+        assert "page 2" in (out_dir / "b" / "scan_ocr.txt").read_text(encoding='utf-8')
+
+    def test_json_output_uses_page_numbers(self, blank_pdf, pagenumber_engine):
+        """Test JSON output with a page selection"""
+        import json
+
+        pdf = blank_pdf(5, "doc.pdf")
+        pagenumber_engine.pages = [2, 4]
+
+        results = perform_batch_ocr([pdf], output_mode=OutputMode.JSON, config=pagenumber_engine, workers=2)
+
+        data = json.loads(results[0].output_path.read_text(encoding='utf-8'))
+        assert [p['page_number'] for p in data['pages']] == [2, 4]
+
+    def test_invalid_document_does_not_stop_batch(self, tmp_path, blank_pdf, pagenumber_engine):
+        """Test that a broken file yields an error result only for itself"""
+        broken = tmp_path / "broken.pdf"
+        broken.write_bytes(b"not a pdf")
+        good = blank_pdf(1, "good.pdf")
+
+        results = perform_batch_ocr([broken, good], config=pagenumber_engine, workers=1)
+
+        assert results[0].status == 'error'
+        assert results[1].success
+
+    def test_progress_covers_whole_batch(self, tmp_path, blank_pdf, pagenumber_engine):
+        """Test that progress is reported across all documents"""
+        blank_pdf(2, "a.pdf")
+        blank_pdf(3, "b.pdf")
+        progress = []
+        pagenumber_engine.progress_callback = lambda done, total: progress.append((done, total))
+
+        perform_batch_ocr(tmp_path, config=pagenumber_engine, workers=2)
+
+        assert progress[-1] == (5, 5)
+
+    def test_resume_uses_checkpoints(self, tmp_path, blank_pdf, pagenumber_engine):
+        """Test that checkpointed pages are not processed again"""
+        from pdftools.ocr.checkpoint import PageCheckpoint
+
+        pdf = blank_pdf(2, "doc.pdf")
+        PageCheckpoint(pdf, 'deu', 300, 'pagenumber').save(
+            {'page_number': 1, 'text': "from checkpoint", 'confidence': 1.0, 'word_count': 2}
+        )
+        pagenumber_engine.resume = True
+
+        results = perform_batch_ocr([pdf], config=pagenumber_engine, workers=1)
+
+        text = results[0].output_path.read_text(encoding='utf-8')
+        assert "from checkpoint" in text
+        assert "page 2" in text
+        assert not (tmp_path / ".doc.pdf.ocr-checkpoint").exists()
@@ -0,0 +1,96 @@
+"""
+Tests for cached Tesseract capability probing
+"""
+
+import pytest
+import pytesseract
+from pdftools.ocr import capabilities
+from pdftools.ocr.capabilities import (
+    get_tesseract_capabilities,
+    clear_capabilities_cache,
+)
+from pdftools.core.exceptions import TesseractNotFoundError
+
+
+@pytest.fixture
+def fake_tesseract(monkeypatch):
+    """Replace Tesseract subprocess calls and count them"""
+    calls = {'version': 0, 'languages': 0}
+
+    def get_version():
+        calls['version'] += 1
+        return "5.3.0"
+
+    def get_languages(config=''):
+        calls['languages'] += 1
+        return ['deu', 'eng', 'osd']
+
+    monkeypatch.setattr(pytesseract, 'get_tesseract_version', get_version)
+    monkeypatch.setattr(pytesseract, 'get_languages', get_languages)
+    monkeypatch.delenv(capabilities.CACHE_TTL_ENV, raising=False)
+    clear_capabilities_cache()
+    yield calls
+    clear_capabilities_cache()
+
+
+class TestTesseractCapabilities:
+    """Test get_tesseract_capabilities function"""
+
+    def test_probe_is_memoized(self, fake_tesseract):
+        """Test that Tesseract is only probed once per process"""
+        first = get_tesseract_capabilities()
+        second = get_tesseract_capabilities()
+
+        assert first is second
+        assert first.version == "5.3.0"
+        assert first.has_language('deu')
+        assert not first.has_language('fra')
+        assert fake_tesseract == {'version': 1, 'languages': 1}
+
+    def test_refresh(self, fake_tesseract):
+        """Test forcing a new probe"""
+        get_tesseract_capabilities()
+        get_tesseract_capabilities(refresh=True)
+
+        assert fake_tesseract['version'] == 2
+
+    def test_probe_failure(self, monkeypatch):
+        """Test that a missing binary raises and is not memoized"""
+        def fail():
+            raise pytesseract.TesseractNotFoundError()
+
+        monkeypatch.setattr(pytesseract, 'get_tesseract_version', fail)
+        clear_capabilities_cache()
+
+        with pytest.raises(TesseractNotFoundError):
+            get_tesseract_capabilities()
+        assert not capabilities._cache
+
+    def test_disk_cache(self, fake_tesseract, monkeypatch, tmp_path):
+        """Test that the on-disk cache is reused across processes"""
+        monkeypatch.setenv(capabilities.CACHE_TTL_ENV, "3600")
+        monkeypatch.setenv(capabilities.CACHE_DIR_ENV, str(tmp_path))
+        monkeypatch.setattr(capabilities, '_binary_fingerprint', lambda cmd: "fp")
+
+        get_tesseract_capabilities()
+        assert (tmp_path / capabilities.CACHE_FILENAME).exists()
+
+        # Simulate a new process
+        clear_capabilities_cache()
+        cached = get_tesseract_capabilities()
+
+        assert fake_tesseract['version'] == 1
+        assert cached.languages == ('deu', 'eng', 'osd')
+
+    def test_disk_cache_invalidated_by_binary_change(self, fake_tesseract, monkeypatch, tmp_path):
+        """Test that a changed binary triggers a new probe"""
+        monkeypatch.setenv(capabilities.CACHE_TTL_ENV, "3600")
+        monkeypatch.setenv(capabilities.CACHE_DIR_ENV, str(tmp_path))
+        monkeypatch.setattr(capabilities, '_binary_fingerprint', lambda cmd: "v1")
+        get_tesseract_capabilities()
+
+        clear_capabilities_cache()
+        monkeypatch.setattr(capabilities, '_binary_fingerprint', lambda cmd: "v2")
+        get_tesseract_capabilities()
+
+        assert fake_tesseract['version'] == 2
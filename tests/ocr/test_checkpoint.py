@@ -0,0 +1,117 @@
+"""
+Tests for resumable OCR with per-page checkpoints
+"""
+
+import pytest
+from PIL import Image
+
+from pdftools.ocr.core import perform_ocr, _contiguous_chunks
+from pdftools.ocr.checkpoint import PageCheckpoint
+from pdftools.ocr.models import OCRConfig
+from pdftools.core.exceptions import OCRProcessingError
+
+
+class FlakyEngine:
+    """Fake engine that records processed pages and can fail on one page"""
+
+    processed = []
+    fail_on = None
+
+    def pdf_to_images(self, pdf_path, dpi=300, pages=None):
+        return [Image.new('L', (page, 1)) for page in pages]
+
+    def process_image(self, image, language, config=None):
+        page = image.width
+        if page == FlakyEngine.fail_on:
+            raise RuntimeError("simulated crash")
+        FlakyEngine.processed.append(page)
+        return {'text': f"page {page}", 'confidence': 0.9}
+
+    def get_available_languages(self):
+        return ['deu']
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def flaky_engine(fake_engine):
+    """Register the fake engine for one test"""
+    fake_engine('flaky', FlakyEngine)
+    FlakyEngine.processed = []
+    FlakyEngine.fail_on = None
+    return FlakyEngine
+
+
+class TestPageCheckpoint:
+    """Test PageCheckpoint class"""
+
+    def test_save_and_load(self, blank_pdf):
+        """Test round trip of page results"""
+        pdf = blank_pdf(5)
+        checkpoint = PageCheckpoint(pdf, "deu", 300, "auto")
+        checkpoint.save({'page_number': 2, 'text': "zwei", 'confidence': 0.8, 'word_count': 1})
+
+        loaded = PageCheckpoint(pdf, "deu", 300, "auto").load()
+        assert loaded[2]['text'] == "zwei"
+
+    def test_settings_change_key(self, blank_pdf):
+        """Test that other recognition settings do not reuse pages"""
+        pdf = blank_pdf(5)
+        PageCheckpoint(pdf, "deu", 300, "auto").save({'page_number': 1})
+
+        assert PageCheckpoint(pdf, "deu", 200, "auto").load() == {}
+        assert PageCheckpoint(pdf, "eng", 300, "auto").load() == {}
+
+    def test_damaged_file_ignored(self, blank_pdf):
+        """Test that a partially written page is processed again"""
+        pdf = blank_pdf(5)
+        checkpoint = PageCheckpoint(pdf, "deu", 300, "auto")
+        checkpoint.save({'page_number': 1})
+        (checkpoint.path / "page-00002.json").write_text("{trunc", encoding='utf-8')
+
+        assert list(checkpoint.load()) == [1]
+
+    def test_clear_removes_sidecar(self, blank_pdf):
+        """Test that clearing removes the sidecar directory"""
+        pdf = blank_pdf(5)
+        checkpoint = PageCheckpoint(pdf, "deu", 300, "auto")
+        checkpoint.save({'page_number': 1})
+        checkpoint.clear()
+
+        assert not checkpoint.base_dir.exists()
+
+
+class TestResumableOCR:
+    """Test perform_ocr with resume enabled"""
+
+    def test_resume_after_crash(self, blank_pdf, flaky_engine, tmp_path):
+        """Test that a re-run only processes missing pages"""
+        pdf = blank_pdf(5)
+        output = tmp_path / "out.txt"
+        config = OCRConfig(engine='flaky', resume=True)
+
+        flaky_engine.fail_on = 4
+        with pytest.raises(OCRProcessingError):
+            perform_ocr(pdf, output_path=output, config=config)
+        assert flaky_engine.processed == [1, 2, 3]
+
+        flaky_engine.fail_on = None
+        flaky_engine.processed = []
+        result = perform_ocr(pdf, output_path=output, config=config)
+
+        assert result.success
+        assert result.pages_processed == 5
+        assert flaky_engine.processed == [4, 5]
+        text = output.read_text(encoding='utf-8')
+        assert "page 1\n" in text and "page 5\n" in text
+        assert not (tmp_path / ".scan.pdf.ocr-checkpoint").exists()
+
+
+class TestContiguousChunks:
+    """Test _contiguous_chunks function"""
+
+    def test_splits_gaps_and_size(self):
+        """Test splitting at gaps and at the chunk size"""
+        chunks = list(_contiguous_chunks([1, 2, 3, 4, 7, 9, 10], 3))
+        assert chunks == [[1, 2, 3], [4], [7], [9, 10]]
@@ -0,0 +1,129 @@
+"""
+Tests for automatic OCR language detection
+"""
+
+import pytest
+from PIL import Image
+
+from pdftools.ocr.batch import perform_batch_ocr
+from pdftools.ocr.core import ocr_pages, perform_ocr
+from pdftools.ocr.langdetect import (
+    detect_from_text,
+    is_auto_language,
+    sample_pages,
+)
+from pdftools.ocr.models import OCRConfig, OCRLanguage, OutputMode
+
+FRENCH = "Nous vous remercions pour votre commande et vous prions de régler la facture avec le virement."
+GERMAN = "Wir danken für Ihren Auftrag und bitten um Zahlung der Rechnung mit dem Überweisungsträger."
+
+
+class FrenchEngine:
+    """Fake engine reading French text, recording the languages it is asked for"""
+
+    calls = []
+
+    def pdf_to_images(self, pdf_path, dpi=300, pages=None):
+        pages = pages or [1, 2, 3, 4, 5, 6]
+        FrenchEngine.calls.append(('render', dpi, list(pages)))
+        return [Image.new('L', (dpi, dpi)) for _ in pages]
+
+    def process_image(self, image, language, config=None):
+        FrenchEngine.calls.append(('recognize', language))
+        return {'text': FRENCH, 'confidence': 0.9}
+
+    def get_available_languages(self):
+        return ['eng', 'fra', 'deu', 'osd']
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def french_engine(fake_engine):
+    """Register the fake engine (inherited by forked workers)"""
+    FrenchEngine.calls = []
+    return fake_engine('french', FrenchEngine)
+
+
+class TestDetectFromText:
+    """Test scoring of sample text"""
+
+    @pytest.mark.parametrize('text, expected', [
+        (GERMAN, ['deu']),
+        (FRENCH, ['fra']),
+        ("Thank you for your order. Please pay the invoice by bank transfer.", ['eng']),
+        ("Gracias por su pedido y por la confianza en nuestros servicios para este año.", ['spa']),
+        (GERMAN + " Thank you for your order and the payment of the invoice.", ['deu', 'eng']),
+    ])
+    def test_languages(self, text, expected):
+        """Test single and mixed-language samples"""
+        candidates = ['deu', 'eng', 'fra', 'ita', 'spa']
+        assert detect_from_text(text, candidates).languages == expected
+
+    def test_only_candidates(self):
+        """Test that languages that are not installed are never detected"""
+        detection = detect_from_text(FRENCH, ['deu', 'eng'])
+
+        assert set(detection.scores) == {'deu', 'eng'}
+        assert detection.languages[0] in ('deu', 'eng')
+
+    def test_no_evidence_falls_back_to_german(self):
+        """Test numeric samples"""
+        assert detect_from_text("12.03.2024 4711 EUR 99,90", ['eng', 'deu']).languages == ['deu']
+        assert detect_from_text("", ['eng', 'fra']).languages == ['eng']
+
+
+class TestHelpers:
+    """Test language argument and sampling helpers"""
+
+    @pytest.mark.parametrize('language, expected', [
+        ('auto', True), ('AUTO', True), (['auto'], True),
+        ('deu', False), (OCRLanguage.GERMAN, False), (['deu', 'eng'], False),
+    ])
+    def test_is_auto_language(self, language, expected):
+        assert is_auto_language(language) == expected
+
+    def test_sample_pages(self):
+        """Test that samples are spread over the document"""
+        assert sample_pages([1, 2]) == [1, 2]
+        assert sample_pages(list(range(1, 101))) == [17, 51, 84]
+
+
+class TestAutoLanguageOCR:
+    """Test OCR with language 'auto'"""
+
+    def test_full_pass_uses_detected_language(self, blank_pdf, french_engine, tmp_path):
+        """Test that a low-resolution sample is recognized with all candidates, then only French"""
+        pdf = blank_pdf(6, "lettre.pdf")
+        result = perform_ocr(pdf, tmp_path / "out.txt", 'auto', OutputMode.TXT, french_engine)
+
+        assert result.success
+        assert FrenchEngine.calls[:4] == [
+            ('render', 100, [2, 4, 6]),
+            ('recognize', 'deu+eng+fra'),
+            ('recognize', 'deu+eng+fra'),
+            ('recognize', 'deu+eng+fra'),
+        ]
+        assert FrenchEngine.calls[5:] == [('recognize', 'fra')] * 6
+        assert result.metadata['language'] == 'fra'
+        assert result.metadata['detected_languages'] == ['fra']
+        assert result.metadata['language_sample_pages'] == [2, 4, 6]
+        assert result.metadata['language_scores']['fra'] == 1.0
+
+    def test_ocr_pages(self, blank_pdf, french_engine):
+        """Test that in-memory OCR also accepts 'auto'"""
+        pdf = blank_pdf(6, "lettre.pdf")
+        results = ocr_pages(pdf, 'auto', OCRConfig(engine='french', pages=[5]))
+
+        assert [r['page_number'] for r in results] == [5]
+        assert FrenchEngine.calls[-1] == ('recognize', 'fra')
+
+    def test_batch(self, blank_pdf, french_engine, tmp_path):
+        """Test per-document detection in batch mode"""
+        pdf = blank_pdf(6, "lettre.pdf")
+        result, = perform_batch_ocr([pdf], tmp_path, 'auto', config=french_engine, workers=2)
+
+        assert result.success
+        assert result.metadata['language'] == 'fra'
+        assert result.metadata['detected_languages'] == ['fra']
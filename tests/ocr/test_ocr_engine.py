@@ -0,0 +1,72 @@
+"""
+Tests for OCR engines
+"""
+
+import pytest
+from pdftools.ocr import ocr_engine
+from pdftools.ocr.ocr_engine import (
+    TesseractEngine,
+    TesserocrEngine,
+    create_engine,
+    _parse_tesseract_config,
+)
+from pdftools.core.exceptions import TesseractNotFoundError
+
+
+class TestParseTesseractConfig:
+    """Test _parse_tesseract_config function"""
+
+    def test_parse_empty_config(self):
+        """Test parsing empty config"""
+        assert _parse_tesseract_config(None) == (None, None, {})
+        assert _parse_tesseract_config("") == (None, None, {})
+
+    def test_parse_psm_and_oem(self):
+        """Test parsing page segmentation and engine mode"""
+        psm, oem, variables = _parse_tesseract_config("--psm 6 --oem 1")
+        assert psm == 6
+        assert oem == 1
+        assert variables == {}
+
+    def test_parse_variables(self):
+        """Test parsing -c variables"""
+        _, _, variables = _parse_tesseract_config(
+            "-c preserve_interword_spaces=1 -c tessedit_char_whitelist=0123"
+        )
+        assert variables == {
+            'preserve_interword_spaces': '1',
+            'tessedit_char_whitelist': '0123',
+        }
+
+    def test_parse_unsupported_option(self):
+        """Test that unsupported options are rejected"""
+        with pytest.raises(ValueError):
+            _parse_tesseract_config("--dpi 300")
+
+
+class TestCreateEngine:
+    """Test create_engine factory"""
+
+    def test_falls_back_without_binding(self, monkeypatch):
+        """Test fallback to subprocess engine when tesserocr is missing"""
+        monkeypatch.setattr(ocr_engine, 'TESSEROCR_AVAILABLE', False)
+        monkeypatch.setattr(TesseractEngine, '_verify_tesseract', lambda self: None)
+
+        engine = create_engine()
+        assert type(engine) is TesseractEngine
+
+    def test_custom_binary_uses_subprocess(self, monkeypatch):
+        """Test that a custom tesseract binary selects the subprocess engine"""
+        monkeypatch.setattr(ocr_engine, 'TESSEROCR_AVAILABLE', True)
+        monkeypatch.setattr(TesseractEngine, '_configure_tesseract', lambda self: None)
+        monkeypatch.setattr(TesseractEngine, '_verify_tesseract', lambda self: None)
+
+        engine = create_engine(tesseract_cmd="/opt/tesseract")
+        assert type(engine) is TesseractEngine
+
+    def test_tesserocr_engine_requires_binding(self, monkeypatch):
+        """Test that TesserocrEngine raises without the binding"""
+        monkeypatch.setattr(ocr_engine, 'TESSEROCR_AVAILABLE', False)
+
+        with pytest.raises(TesseractNotFoundError):
+            TesserocrEngine()
@@ -0,0 +1,96 @@
+"""
+Tests for OCR engine registry
+"""
+
+import pytest
+from pdftools.ocr import registry
+from pdftools.ocr.registry import get_engine, register_engine, list_engines
+from pdftools.ocr.ocrmypdf_engine import parse_tesseract_tsv
+from pdftools.core.exceptions import InvalidParameterError
+
+
+class DummyEngine:
+    """Minimal engine implementing the OCREngine interface"""
+
+    def __init__(self, prefix="dummy"):
+        self.prefix = prefix
+
+    def pdf_to_images(self, pdf_path, dpi=300, pages=None):
+        return []
+
+    def process_image(self, image, language, config=None):
+        return {'text': self.prefix, 'confidence': 1.0}
+
+    def get_available_languages(self):
+        return ['deu']
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def clean_registry(monkeypatch):
+    """Isolate registry changes made by a test"""
+    monkeypatch.setattr(registry, '_ENGINES', dict(registry._ENGINES))
+
+
+class TestRegistry:
+    """Test engine registration and lookup"""
+
+    def test_builtin_engines_registered(self):
+        """Test that built-in engines are available"""
+        engines = list_engines()
+        for name in ('auto', 'tesseract', 'tesserocr', 'ocrmypdf'):
+            assert name in engines
+
+    def test_unknown_engine(self):
+        """Test that unknown engine names are rejected"""
+        with pytest.raises(InvalidParameterError):
+            get_engine('does-not-exist')
+
+    def test_register_custom_engine(self, clean_registry):
+        """Test registering and creating a custom engine"""
+        register_engine('dummy', DummyEngine)
+
+        engine = get_engine('dummy', prefix="hello")
+        assert isinstance(engine, DummyEngine)
+        assert engine.process_image(None, 'deu')['text'] == "hello"
+
+    def test_register_duplicate_name(self, clean_registry):
+        """Test that duplicate registrations need overwrite=True"""
+        register_engine('dummy', DummyEngine)
+
+        with pytest.raises(InvalidParameterError):
+            register_engine('dummy', DummyEngine)
+
+        register_engine('dummy', DummyEngine, overwrite=True)
+
+
+class TestParseTesseractTSV:
+    """Test parse_tesseract_tsv function"""
+
+    HEADER = "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\tleft\ttop\twidth\theight\tconf\ttext"
+
+    def _row(self, block, par, line, word, conf, text):
+        return f"5\t1\t{block}\t{par}\t{line}\t{word}\t0\t0\t10\t10\t{conf}\t{text}"
+
+    def test_rebuilds_lines_and_paragraphs(self):
+        """Test text reconstruction from word rows"""
+        tsv = "\n".join([
+            self.HEADER,
+            "1\t1\t0\t0\t0\t0\t0\t0\t100\t100\t-1\t",
+            self._row(1, 1, 1, 1, 90, "Hello"),
+            self._row(1, 1, 1, 2, 80, "World"),
+            self._row(1, 1, 2, 1, 70, "Line2"),
+            self._row(2, 1, 1, 1, 60, "Para2"),
+        ])
+
+        text, confidence = parse_tesseract_tsv(tsv)
+        assert text == "Hello World\nLine2\n\nPara2"
+        assert confidence == pytest.approx(0.75)
+
+    def test_empty_output(self):
+        """Test TSV without words"""
+        text, confidence = parse_tesseract_tsv(self.HEADER)
+        assert text == ""
+        assert confidence == 0.0
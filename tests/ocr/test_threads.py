@@ -0,0 +1,94 @@
+"""
+Tests for worker/thread scheduling of parallel OCR
+"""
+
+import json
+import os
+
+import pytest
+from PIL import Image
+
+from pdftools.core.exceptions import InvalidParameterError
+from pdftools.ocr.batch import perform_batch_ocr
+from pdftools.ocr.benchmark import thread_policies
+from pdftools.ocr.models import OutputMode
+from pdftools.ocr.threads import OMP_THREAD_LIMIT_ENV, ThreadPolicy, choose_thread_policy
+
+
+class ThreadLimitEngine:
+    """Fake engine 'recognizing' the OMP_THREAD_LIMIT of its worker"""
+
+    def pdf_to_images(self, pdf_path, dpi=300, pages=None):
+        return [Image.new('L', (1, 1)) for _ in pages]
+
+    def process_image(self, image, language, config=None):
+        return {'text': os.environ.get(OMP_THREAD_LIMIT_ENV, 'unset'), 'confidence': 0.9}
+
+    def get_available_languages(self):
+        return ['deu']
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def no_thread_limit(monkeypatch):
+    """Run without a user-set OMP_THREAD_LIMIT"""
+    monkeypatch.delenv(OMP_THREAD_LIMIT_ENV, raising=False)
+
+
+class TestChooseThreadPolicy:
+    """Test choose_thread_policy"""
+
+    @pytest.mark.parametrize('pages, cpus, expected', [
+        (200, 16, ThreadPolicy(16, 1)),
+        (16, 16, ThreadPolicy(16, 1)),
+        (8, 16, ThreadPolicy(8, 2)),
+        (3, 16, ThreadPolicy(3, 4)),
+        (1, 64, ThreadPolicy(1, 4)),
+        (5, 1, ThreadPolicy(1, 1)),
+    ])
+    def test_automatic(self, no_thread_limit, pages, cpus, expected):
+        """Test that workers x threads stays within the CPUs"""
+        assert choose_thread_policy(pages, cpus=cpus) == expected
+
+    def test_explicit_values_kept(self, no_thread_limit):
+        """Test explicit workers and threads (workers capped at the page count)"""
+        assert choose_thread_policy(100, workers=4, cpus=16) == ThreadPolicy(4, 4)
+        assert choose_thread_policy(100, threads=2, cpus=16) == ThreadPolicy(8, 2)
+        assert choose_thread_policy(3, workers=8, threads=8, cpus=16) == ThreadPolicy(3, 8)
+
+    def test_environment_limit(self, monkeypatch):
+        """Test that a user-set OMP_THREAD_LIMIT counts as explicit threads"""
+        monkeypatch.setenv(OMP_THREAD_LIMIT_ENV, '4')
+        assert choose_thread_policy(100, cpus=16) == ThreadPolicy(4, 4)
+
+        monkeypatch.setenv(OMP_THREAD_LIMIT_ENV, 'many')
+        assert choose_thread_policy(100, cpus=16) == ThreadPolicy(16, 1)
+
+    @pytest.mark.parametrize('workers, threads', [(0, None), (None, 0)])
+    def test_invalid(self, workers, threads):
+        """Test that workers and threads must be positive"""
+        with pytest.raises(InvalidParameterError):
+            choose_thread_policy(10, workers, threads)
+
+    def test_benchmark_policies(self, no_thread_limit):
+        """Test the policies compared by the benchmark, automatic choice first"""
+        assert thread_policies(100, cpus=8) == [ThreadPolicy(8, 1), ThreadPolicy(4, 2), ThreadPolicy(2, 4)]
+        assert thread_policies(2, cpus=8) == [ThreadPolicy(2, 4), ThreadPolicy(2, 1), ThreadPolicy(2, 2)]
+
+
+class TestBatchThreadLimit:
+    """Test that batch workers run with the chosen OMP_THREAD_LIMIT"""
+
+    def test_workers_limited(self, tmp_path, blank_pdf, fake_engine, no_thread_limit):
+        """Test the thread limit inside workers, without changing this process"""
+        config = fake_engine('threadlimit', ThreadLimitEngine)
+        pdf = blank_pdf(3)
+
+        result, = perform_batch_ocr([pdf], tmp_path, 'deu', OutputMode.JSON, config, workers=2, threads=3)
+
+        assert result.success
+        pages = json.loads((tmp_path / "scan_ocr.json").read_text(encoding='utf-8'))['pages']
+        assert [page['text'] for page in pages] == ['3', '3', '3']
+        assert OMP_THREAD_LIMIT_ENV not in os.environ
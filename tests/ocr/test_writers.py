@@ -0,0 +1,182 @@
+"""
+Tests for streaming hOCR, ALTO and JSON Lines output
+"""
+
+import json
+import xml.etree.ElementTree as ET
+
+import pytest
+from PIL import Image
+
+from pdftools.core.exceptions import OCRProcessingError
+from pdftools.ocr.core import perform_ocr
+from pdftools.ocr.models import OutputMode
+from pdftools.ocr.ocr_engine import tesseract_words
+from pdftools.ocr.ocrmypdf_engine import tsv_columns
+from pdftools.ocr.writers import open_page_writer
+
+ALTO = '{http://www.loc.gov/standards/alto/ns-v4#}'
+XHTML = '{http://www.w3.org/1999/xhtml}'
+
+TSV = "\n".join([
+    "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\tleft\ttop\twidth\theight\tconf\ttext",
+    "1\t1\t0\t0\t0\t0\t0\t0\t800\t1100\t-1\t",
+    "5\t1\t1\t1\t1\t1\t100\t50\t120\t30\t96.5\tRechnung",
+    "5\t1\t1\t1\t1\t2\t230\t52\t60\t28\t91\tNr.",
+    "5\t1\t1\t1\t2\t1\t100\t90\t80\t30\t88\t<4711>",
+    "5\t1\t2\t1\t1\t1\t100\t400\t90\t30\t75\tSumme",
+])
+
+
+class BoxEngine:
+    """Fake engine reporting word boxes; records the output file when recognizing"""
+
+    output_path = None
+    seen = []
+
+    def pdf_to_images(self, pdf_path, dpi=300, pages=None):
+        return [Image.new('L', (800, 1100)) for _ in pages or [1, 2, 3]]
+
+    def process_image(self, image, language, config=None):
+        path = BoxEngine.output_path
+        BoxEngine.seen.append(path.read_text(encoding='utf-8') if path.exists() else None)
+        words = tesseract_words(tsv_columns(TSV))
+        return {
+            'text': "Rechnung Nr.\n<4711>\n\nSumme",
+            'confidence': 0.9,
+            'words': words,
+        }
+
+    def get_available_languages(self):
+        return ['deu']
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def box_engine(fake_engine):
+    BoxEngine.seen = []
+    return fake_engine('boxes', BoxEngine)
+
+
+class TestTesseractWords:
+    """Test word boxes from Tesseract TSV data"""
+
+    def test_words(self):
+        """Test boxes, normalized confidences and block/line numbering"""
+        words = tesseract_words(tsv_columns(TSV))
+
+        assert [w['text'] for w in words] == ['Rechnung', 'Nr.', '<4711>', 'Summe']
+        assert words[0] == {
+            'text': 'Rechnung', 'confidence': 0.965, 'bbox': [100, 50, 220, 80], 'block': 1, 'line': 1
+        }
+        assert [(w['block'], w['line']) for w in words] == [(1, 1), (1, 1), (1, 2), (2, 3)]
+
+    def test_empty(self):
+        assert tesseract_words(tsv_columns('')) == []
+
+
+class TestStreamingOutput:
+    """Test page-by-page output of perform_ocr"""
+
+    def test_jsonl_streamed_per_page(self, blank_pdf, box_engine, tmp_path):
+        """Test that every page is on disk before the next one is recognized"""
+        pdf = blank_pdf(3)
+        output = tmp_path / "scan.jsonl"
+        BoxEngine.output_path = output
+
+        result = perform_ocr(pdf, output, 'deu', OutputMode.JSONL, box_engine)
+
+        assert result.success
+        assert [text.count('\n') for text in BoxEngine.seen] == [0, 1, 2]
+        pages = [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines()]
+        assert [page['page_number'] for page in pages] == [1, 2, 3]
+        assert pages[0]['file'] == str(pdf)
+        assert pages[0]['image_size'] == [800, 1100]
+        assert pages[0]['words'][2]['bbox'] == [100, 90, 180, 120]
+
+    def test_hocr(self, blank_pdf, box_engine, tmp_path):
+        """Test hOCR structure, boxes and escaping"""
+        pdf = blank_pdf(3)
+        output = tmp_path / "scan.hocr"
+        BoxEngine.output_path = output
+
+        perform_ocr(pdf, output, 'deu', OutputMode.HOCR, box_engine)
+
+        root = ET.parse(output).getroot()
+        pages = root.findall(f'.//{XHTML}div[@class="ocr_page"]')
+        assert len(pages) == 3
+        assert pages[0].get('title') == 'image "scan.pdf"; bbox 0 0 800 1100; ppageno 0; scan_res 300 300'
+        lines = pages[0].findall(f'.//{XHTML}span[@class="ocr_line"]')
+        assert lines[0].get('title') == 'bbox 100 50 290 80'
+        words = pages[0].findall(f'.//{XHTML}span[@class="ocrx_word"]')
+        assert words[2].text == '<4711>'
+        assert words[2].get('title') == 'bbox 100 90 180 120; x_wconf 88'
+
+    def test_alto(self, blank_pdf, box_engine, tmp_path):
+        """Test ALTO structure, positions and word confidences"""
+        pdf = blank_pdf(3)
+        output = tmp_path / "scan.xml"
+        BoxEngine.output_path = output
+
+        perform_ocr(pdf, output, 'deu', OutputMode.ALTO, box_engine)
+
+        root = ET.parse(output).getroot()
+        page = root.find(f'.//{ALTO}Page')
+        assert (page.get('WIDTH'), page.get('HEIGHT')) == ('800', '1100')
+        assert len(root.findall(f'.//{ALTO}Page')) == 3
+        assert len(page.findall(f'.//{ALTO}TextBlock')) == 2
+        string = page.findall(f'.//{ALTO}String')[1]
+        assert string.attrib == {
+            'ID': 'string_1_2', 'CONTENT': 'Nr.', 'WC': '0.910',
+            'HPOS': '230', 'VPOS': '52', 'WIDTH': '60', 'HEIGHT': '28',
+        }
+
+    def test_default_output_path(self, blank_pdf, box_engine):
+        """Test that ALTO output defaults to .xml"""
+        pdf = blank_pdf(3)
+        BoxEngine.output_path = pdf.with_name("scan_ocr.xml")
+
+        result = perform_ocr(pdf, None, 'deu', OutputMode.ALTO, box_engine)
+
+        assert result.output_path == pdf.with_name("scan_ocr.xml")
+        assert result.output_path.exists()
+
+    def test_failure_leaves_well_formed_file(self, blank_pdf, box_engine, tmp_path, monkeypatch):
+        """Test that pages finished before an error stay readable"""
+        pdf = blank_pdf(3)
+        output = tmp_path / "scan.hocr"
+        BoxEngine.output_path = output
+        process_image = BoxEngine.process_image
+
+        def fail_on_third(self, image, language, config=None):
+            if len(BoxEngine.seen) == 2:
+                raise RuntimeError("engine crashed")
+            return process_image(self, image, language, config)
+
+        monkeypatch.setattr(BoxEngine, 'process_image', fail_on_third)
+
+        with pytest.raises(OCRProcessingError):
+            perform_ocr(pdf, output, 'deu', OutputMode.HOCR, box_engine)
+
+        root = ET.parse(output).getroot()
+        assert len(root.findall(f'.//{XHTML}div[@class="ocr_page"]')) == 2
+
+
+class TestPagesWithoutWords:
+    """Test pages without word boxes (text-layer pages, other engines)"""
+
+    def test_text_lines(self, tmp_path):
+        """Test that text is written as blocks and lines without positions"""
+        output = tmp_path / "doc.xml"
+        with open_page_writer(OutputMode.ALTO, output, tmp_path / "doc.pdf") as writer:
+            writer.write_page({'page_number': 1, 'text': "Sehr geehrte\nDamen & Herren\n\nGruß", 'confidence': 1.0})
+
+        root = ET.parse(output).getroot()
+        lines = root.findall(f'.//{ALTO}TextLine')
+        assert [[s.get('CONTENT') for s in line.findall(f'{ALTO}String')] for line in lines] == [
+            ['Sehr', 'geehrte'], ['Damen', '&', 'Herren'], ['Gruß']
+        ]
+        assert len(root.findall(f'.//{ALTO}TextBlock')) == 2
+        assert 'HPOS' not in lines[0].attrib
@@ -0,0 +1,219 @@
+"""
+Unit tests for the asyncio API
+"""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+from PIL import Image
+from reportlab.pdfgen import canvas
+
+from pdftools import aio
+from pdftools.core.exceptions import InvalidParameterError
+from pdftools.merge import merge_pdfs
+from pdftools.ocr.models import OutputMode
+from pdftools.text_extraction import extract_text
+
+
+class SlowEngine:
+    """Fake engine whose first page waits until released"""
+
+    release = threading.Event()
+    recognized = []
+
+    def pdf_to_images(self, pdf_path, dpi=300, pages=None):
+        return [Image.new('L', (10, 10)) for _ in pages or [1, 2, 3]]
+
+    def process_image(self, image, language, config=None):
+        if not SlowEngine.recognized:
+            SlowEngine.release.wait(5)
+        SlowEngine.recognized.append(image.size)
+        return {'text': "Seite", 'confidence': 0.9}
+
+    def get_available_languages(self):
+        return ['deu']
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def executor():
+    """Fresh default executor for every test"""
+    aio.configure()
+    yield
+    aio.shutdown()
+
+
+@pytest.fixture
+def slow_engine(fake_engine):
+    SlowEngine.release = threading.Event()
+    SlowEngine.recognized = []
+    return fake_engine('slow', SlowEngine)
+
+
+class TestAwaitables:
+    """Tests for the awaitable tool functions"""
+
+    def test_merge(self, multiple_pdfs, temp_dir):
+        """Test that the awaitable returns the tool's result"""
+        output = temp_dir / "merged.pdf"
+
+        result = asyncio.run(aio.merge_pdfs(multiple_pdfs, output))
+
+        assert result.status == 'success'
+        assert output.exists()
+        assert aio.merge_pdfs.__wrapped__ is merge_pdfs
+
+    def test_concurrency_bounded_and_loop_free(self):
+        """Test that at most max_concurrency calls run while the loop keeps running"""
+        aio.configure(max_workers=4, max_concurrency=2)
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def blocking_call():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.pop()
+
+        async def main():
+            ticks = 0
+
+            async def heartbeat():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            beat = asyncio.ensure_future(heartbeat())
+            await asyncio.gather(*(aio.run(blocking_call) for _ in range(6)))
+            beat.cancel()
+            return ticks
+
+        ticks = asyncio.run(main())
+
+        assert max(peak) == 2
+        assert ticks >= 10
+
+    def test_cancel_queued_call(self):
+        """Test that a call waiting for a slot never runs when cancelled"""
+        aio.configure(max_workers=1)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def first():
+            started.set()
+            release.wait(5)
+
+        async def main():
+            running = asyncio.ensure_future(aio.run(first))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait)
+            queued = asyncio.ensure_future(aio.run(calls.append, 'second'))
+            await asyncio.sleep(0.01)
+            queued.cancel()
+            release.set()
+            await running
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+
+        asyncio.run(main())
+        assert calls == []
+
+    def test_processes(self):
+        """Test running calls in worker processes"""
+        aio.configure(max_workers=1, processes=True)
+
+        assert asyncio.run(aio.run(os.getpid)) != os.getpid()
+
+    def test_concurrent_calls_on_one_document(self, temp_dir):
+        """Test that concurrent threads reading the same PDF get the same text"""
+        pdf = temp_dir / "long.pdf"
+        c = canvas.Canvas(str(pdf))
+        for page_num in range(1, 61):
+            c.drawString(100, 700, f"Page {page_num} line {page_num * 7}")
+            c.showPage()
+        c.save()
+        extract_text(pdf, temp_dir / "expected.txt", backend='pypdf')
+        expected = (temp_dir / "expected.txt").read_text(encoding='utf-8')
+        aio.configure(max_workers=8)
+
+        async def main():
+            return await asyncio.gather(*(
+                aio.extract_text(pdf, temp_dir / f"out{i}.txt", backend='pypdf') for i in range(16)
+            ))
+
+        results = asyncio.run(main())
+
+        assert [r.status for r in results] == ['success'] * 16
+        for i in range(16):
+            assert (temp_dir / f"out{i}.txt").read_text(encoding='utf-8') == expected
+
+    @pytest.mark.parametrize('kwargs', [{'max_workers': 0}, {'max_concurrency': 0}])
+    def test_configure_invalid(self, kwargs):
+        with pytest.raises(InvalidParameterError):
+            aio.configure(**kwargs)
+
+
+class TestTrack:
+    """Tests for tracked operations"""
+
+    def test_ocr_progress(self, blank_pdf, slow_engine, temp_dir):
+        """Test per-page progress and result of a tracked OCR run"""
+        pdf = blank_pdf(3)
+        SlowEngine.release.set()
+
+        async def main():
+            operation = aio.track(
+                aio.perform_ocr, pdf, temp_dir / "out.txt", 'deu', OutputMode.TXT, slow_engine
+            )
+            progress = [(p.current, p.total) async for p in operation]
+            return progress, await operation
+
+        progress, result = asyncio.run(main())
+
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+        assert result.success
+
+    def test_cancel_stops_at_next_page(self, blank_pdf, slow_engine, temp_dir):
+        """Test that a cancelled OCR run stops after the page in progress"""
+        pdf = blank_pdf(3)
+        async def main():
+            operation = aio.track(aio.perform_ocr, pdf, temp_dir / "out.txt", config=slow_engine)
+            async for progress in operation:
+                operation.cancel()
+                SlowEngine.release.set()
+            with pytest.raises(asyncio.CancelledError):
+                await operation
+
+        asyncio.run(main())
+        aio.shutdown(wait=True)
+
+        assert len(SlowEngine.recognized) == 1
+
+    def test_merge_progress_in_processes(self, multiple_pdfs, temp_dir):
+        """Test that progress crosses process boundaries"""
+        aio.configure(max_workers=1, processes=True)
+
+        async def main():
+            operation = aio.track(merge_pdfs, multiple_pdfs, temp_dir / "merged.pdf")
+            progress = [(p.current, p.total) async for p in operation]
+            return progress, await operation
+
+        progress, result = asyncio.run(main())
+
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+        assert result.status == 'success'
+
+    def test_untracked_tool(self, blank_pdf):
+        """Test that tools without progress reports are rejected"""
+        pdf = blank_pdf(3)
+        with pytest.raises(InvalidParameterError):
+            aio.track(aio.split_pdf, pdf)
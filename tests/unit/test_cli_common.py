@@ -2,8 +2,11 @@
 Unit tests for CLI common utilities
 """
 
+import argparse
+import pstats
 import pytest
 import sys
+import tracemalloc
 from io import StringIO
 from unittest.mock import patch
 
@@ -17,6 +20,8 @@ from pdftools.cli.common import (
     print_warning,
     create_stub_message,
     setup_logging,
+    add_profile_argument,
+    profile_main,
 )
 
 
@@ -110,3 +115,59 @@ class TestSetupLogging:
         logger = logging.getLogger()
 
         assert logger.level == logging.WARNING
+
+
+class TestProfileMain:
+    """Tests for the --profile decorator"""
+
+    @staticmethod
+    def _make_main():
+        parser = argparse.ArgumentParser()
+        parser.add_argument('-o', '--output')
+        add_profile_argument(parser)
+
+        @profile_main
+        def main(argv=None):
+            args = parser.parse_args(argv)
+            sum(i * i for i in range(1000))
+            sys.exit(0 if args.output else 1)
+
+        return main
+
+    def test_without_profile(self, tmp_path):
+        """Test that main runs unchanged without --profile"""
+        main = self._make_main()
+        with pytest.raises(SystemExit) as exc:
+            main(['-o', str(tmp_path / 'out.pdf')])
+        assert exc.value.code == 0
+        assert list(tmp_path.iterdir()) == []
+
+    def test_cprofile_next_to_output(self, tmp_path, capsys):
+        """Test that a .prof is written beside the output file"""
+        main = self._make_main()
+        with pytest.raises(SystemExit):
+            main(['-o', str(tmp_path / 'out.pdf'), '--profile', '--profile-top', '3'])
+
+        profiles = list(tmp_path.glob('*.prof'))
+        assert len(profiles) == 1
+        pstats.Stats(str(profiles[0]))
+        assert 'Profile written to' in capsys.readouterr().err
+
+    def test_tracemalloc_snapshot(self, tmp_path, capsys):
+        """Test that an allocation snapshot is written and summarized"""
+        main = self._make_main()
+        with pytest.raises(SystemExit):
+            main(['-o', str(tmp_path / 'out.pdf'), '--profile=tracemalloc'])
+
+        snapshots = list(tmp_path.glob('*.tracemalloc'))
+        assert len(snapshots) == 1
+        tracemalloc.Snapshot.load(str(snapshots[0]))
+        assert 'Peak traced memory' in capsys.readouterr().err
+
+    def test_invalid_profiler_left_to_tool_parser(self, capsys):
+        """Test that bad --profile values are reported once, by the tool"""
+        main = self._make_main()
+        with pytest.raises(SystemExit) as exc:
+            main(['--profile=perf'])
+        assert exc.value.code == 2
+        assert capsys.readouterr().err.count('invalid choice') == 1
@@ -0,0 +1,93 @@
+"""
+Unit tests for PDF backends
+"""
+
+import pytest
+from PyPDF2 import PdfReader
+
+from pdftools.core.backends import (
+    MUPDF_AVAILABLE,
+    MuPDFBackend,
+    PyPDFBackend,
+    get_backend,
+    list_backends,
+)
+from pdftools.core.exceptions import InvalidParameterError
+from pdftools.split import split_pdf, SplitMode
+from pdftools.text_extraction import extract_text
+
+requires_mupdf = pytest.mark.skipif(not MUPDF_AVAILABLE, reason="PyMuPDF not installed")
+
+BACKEND_NAMES = [
+    'pypdf',
+    pytest.param('mupdf', marks=requires_mupdf),
+]
+
+
+class TestGetBackend:
+    """Tests for backend selection"""
+
+    def test_explicit_names(self):
+        """Test that backends are selected by name"""
+        assert isinstance(get_backend('pypdf'), PyPDFBackend)
+        assert 'auto' in list_backends()
+
+    def test_auto_prefers_mupdf(self, monkeypatch):
+        """Test that auto selects MuPDF when it is installed"""
+        monkeypatch.delenv('PDFTOOLS_BACKEND', raising=False)
+        expected = MuPDFBackend if MUPDF_AVAILABLE else PyPDFBackend
+        assert isinstance(get_backend(), expected)
+
+    def test_environment_variable(self, monkeypatch):
+        """Test that PDFTOOLS_BACKEND selects the default backend"""
+        monkeypatch.setenv('PDFTOOLS_BACKEND', 'pypdf')
+        assert isinstance(get_backend(), PyPDFBackend)
+
+    def test_unknown_name(self):
+        """Test that unknown backends are rejected"""
+        with pytest.raises(InvalidParameterError):
+            get_backend('ghostscript')
+
+
+@pytest.mark.parametrize('name', BACKEND_NAMES)
+class TestBackendOperations:
+    """Tests run against every installed backend"""
+
+    def test_page_count_and_text(self, name, pdf_multipage):
+        """Test page counting and per-page text"""
+        backend = get_backend(name)
+        assert backend.page_count(pdf_multipage) == 10
+        assert 'Page 2 of 10' in backend.extract_text(pdf_multipage, 2)
+
+    def test_page_size(self, name, pdf_simple_text):
+        """Test page size in points"""
+        width, height = get_backend(name).page_size(pdf_simple_text, 1)
+        assert (round(width), round(height)) == (612, 792)
+
+    def test_write_pages(self, name, pdf_multipage, temp_dir):
+        """Test that pages are written in the requested order"""
+        output = temp_dir / 'subset.pdf'
+        get_backend(name).write_pages(pdf_multipage, [4, 5, 1], output)
+
+        reader = PdfReader(str(output))
+        assert len(reader.pages) == 3
+        assert 'Page 4 of' in reader.pages[0].extract_text()
+        assert 'Page 1 of' in reader.pages[2].extract_text()
+
+    def test_extract_text_and_split_use_backend(self, name, pdf_multipage, temp_dir):
+        """Test the tool entry points with an explicit backend"""
+        result = extract_text(pdf_multipage, backend=name)
+        assert 'Page 10 of 10' in result.text
+
+        split = split_pdf(pdf_multipage, temp_dir, mode=SplitMode.PARTS, num_parts=2, backend=name)
+        assert split.num_files == 2
+
+
+@requires_mupdf
+def test_mupdf_renders_without_poppler(pdf_multipage):
+    """Test in-process rendering of selected pages"""
+    images = MuPDFBackend().render_pages(pdf_multipage, [3, 1], dpi=72)
+
+    assert len(images) == 2
+    assert images[0].mode == 'RGB'
+    assert images[0].width in (595, 596) and images[0].height == 842
@@ -0,0 +1,92 @@
+"""
+Unit tests for blank page detection
+"""
+
+import random
+
+import pytest
+from PIL import Image, ImageDraw
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+from pdftools.core.blank import find_blank_pages, is_blank_image
+from pdftools.split.core import split_pdf
+from pdftools.split.models import SplitMode
+
+
+@pytest.fixture
+def batch_pdf(temp_dir):
+    """Pages: blank scan, text scan, empty, text, white rectangle, black bar"""
+    rng = random.Random(0)
+    blank = Image.new('L', (620, 877), 250)
+    blank.putdata([250 + rng.randint(-8, 4) for _ in range(620 * 877)])
+    # Dark scanner edge inside the ignored margin
+    ImageDraw.Draw(blank).rectangle((0, 0, 619, 10), fill=30)
+    blank_jpeg = temp_dir / "blank.jpg"
+    blank.save(blank_jpeg, quality=75)
+
+    text = Image.new('L', (620, 877), 255)
+    draw = ImageDraw.Draw(text)
+    for y in range(100, 800, 20):
+        draw.rectangle((60, y, 560, y + 6), fill=0)
+    text_jpeg = temp_dir / "text.jpg"
+    text.save(text_jpeg, quality=75)
+
+    path = temp_dir / "batch.pdf"
+    c = canvas.Canvas(str(path), pagesize=A4)
+    c.drawImage(str(blank_jpeg), 0, 0, *A4)
+    c.showPage()
+    c.drawImage(str(text_jpeg), 0, 0, *A4)
+    c.showPage()
+    c.showPage()
+    c.drawString(72, 720, "Invoice")
+    c.showPage()
+    c.setFillColorRGB(1, 1, 1)
+    c.rect(0, 0, *A4, fill=1, stroke=0)
+    c.showPage()
+    c.rect(72, 400, 400, 40, fill=1, stroke=0)
+    c.showPage()
+    c.save()
+    return path
+
+
+class TestFindBlankPages:
+    """Tests for find_blank_pages"""
+
+    def test_blank_pages(self, batch_pdf):
+        """Test scans with noise and edges, empty and white-only pages"""
+        assert find_blank_pages(batch_pdf) == [1, 3, 5]
+
+    def test_page_selection(self, batch_pdf):
+        """Test that only requested pages are checked"""
+        assert find_blank_pages(batch_pdf, [2, 3, 4]) == [3]
+
+
+class TestIsBlankImage:
+    """Tests for is_blank_image"""
+
+    def test_colored_paper(self):
+        """Test that a uniformly colored sheet is blank"""
+        assert is_blank_image(Image.new('RGB', (300, 400), (255, 230, 150)))
+
+    def test_ink(self):
+        """Test that a short line of ink is enough"""
+        image = Image.new('RGB', (300, 400), 'white')
+        ImageDraw.Draw(image).line((100, 200, 200, 200), fill='black', width=2)
+
+        assert not is_blank_image(image)
+
+
+class TestBlankSplit:
+    """Tests for splitting at blank separator pages"""
+
+    def test_split_at_blank_pages(self, batch_pdf, output_dir):
+        """Test that blank pages separate documents and are dropped"""
+        result = split_pdf(batch_pdf, output_dir, mode=SplitMode.BLANK, prefix='batch')
+
+        assert result.success
+        assert [path.name for path in result.output_files] == [
+            'batch_pages_002-002.pdf', 'batch_pages_004-004.pdf', 'batch_pages_006-006.pdf'
+        ]
+        assert result.metadata['mode'] == 'blank'
+        assert result.metadata['blank_pages'] == [1, 3, 5]
@@ -0,0 +1,90 @@
+"""
+Unit tests for per-page content classification
+"""
+
+import pytest
+from PIL import Image
+from PyPDF2 import PdfReader, PdfWriter
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+from pdftools.core import document as document_module
+from pdftools.core.content import classify_pages
+from pdftools.core.exceptions import PDFCorruptedError
+
+
+@pytest.fixture
+def mixed_pdf(temp_dir):
+    """Pages: full-page scan, text, small image, two images, form with text"""
+    image = temp_dir / "scan.png"
+    Image.new('RGB', (60, 80), 'white').save(image)
+    path = temp_dir / "mixed.pdf"
+
+    c = canvas.Canvas(str(path), pagesize=A4, pageCompression=1)
+    c.drawImage(str(image), 0, 0, *A4)
+    c.showPage()
+    c.setFont('Helvetica', 12)
+    c.drawString(72, 720, "Invoice 2024-001")
+    c.showPage()
+    c.drawImage(str(image), 100, 100, 100, 100)
+    c.showPage()
+    c.drawImage(str(image), 0, 0, A4[0], A4[1] / 2)
+    c.drawImage(str(image), 0, A4[1] / 2, A4[0], A4[1] / 2)
+    c.showPage()
+    c.beginForm('stamp')
+    c.setFont('Helvetica', 12)
+    c.drawString(72, 72, "PAID")
+    c.endForm()
+    c.doForm('stamp')
+    c.showPage()
+    c.save()
+    return path
+
+
+@pytest.fixture
+def no_parse(monkeypatch):
+    """Fail if the document pool parses a document"""
+    def fail(*args, **kwargs):
+        raise AssertionError("document was parsed")
+
+    monkeypatch.setattr(document_module, 'PdfReader', fail)
+
+
+class TestClassifyPages:
+    """Tests for classify_pages"""
+
+    def test_classification(self, mixed_pdf, no_parse):
+        """Test text, full-page image and other pages without parsing"""
+        pages = classify_pages(mixed_pdf)
+
+        assert [page.page_number for page in pages] == [1, 2, 3, 4, 5]
+        assert [page.has_text for page in pages] == [False, True, False, False, True]
+        assert [page.image_only for page in pages] == [True, False, False, False, False]
+        assert pages[1].text_operators == 1
+        assert 'F1' in pages[1].fonts
+
+    def test_page_selection(self, mixed_pdf):
+        """Test that only requested pages are classified"""
+        pages = classify_pages(mixed_pdf, [5, 2, 2, 99])
+
+        assert [page.page_number for page in pages] == [2, 5]
+
+    def test_encrypted_uses_parsed_document(self, mixed_pdf, temp_dir):
+        """Test encrypted documents (encrypted streams) via PyPDF2"""
+        writer = PdfWriter()
+        for page in PdfReader(str(mixed_pdf)).pages:
+            writer.add_page(page)
+        writer.encrypt('', 'owner')
+        path = temp_dir / "encrypted.pdf"
+        with open(path, 'wb') as f:
+            writer.write(f)
+
+        pages = classify_pages(path)
+
+        assert [page.has_text for page in pages] == [False, True, False, False, True]
+        assert pages[0].image_only
+
+    def test_invalid_pdf(self, invalid_pdf):
+        """Test that unreadable files raise PDFCorruptedError"""
+        with pytest.raises(PDFCorruptedError):
+            classify_pages(invalid_pdf)
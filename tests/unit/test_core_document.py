@@ -0,0 +1,101 @@
+"""
+Unit tests for shared PDF document handles
+"""
+
+import os
+import threading
+
+import pytest
+
+from pdftools.core import document as document_module
+from pdftools.core.document import (
+    open_document,
+    acquire_document,
+    release_document,
+    open_documents_count,
+)
+
+
+@pytest.fixture
+def count_parses(monkeypatch):
+    """Count PdfReader constructions in the document pool"""
+    calls = []
+    real_reader = document_module.PdfReader
+
+    def counting_reader(path):
+        calls.append(path)
+        return real_reader(path)
+
+    monkeypatch.setattr(document_module, 'PdfReader', counting_reader)
+    return calls
+
+
+class TestOpenDocument:
+    """Tests for open_document"""
+
+    def test_nested_users_share_one_parse(self, pdf_multipage, count_parses):
+        """Test that nested handles reuse the parsed reader"""
+        with open_document(pdf_multipage) as outer:
+            with open_document(pdf_multipage) as inner:
+                assert inner is outer
+                assert inner.page_count == len(outer.reader.pages)
+
+        assert len(count_parses) == 1
+
+    def test_released_handle_is_evicted(self, pdf_simple_text):
+        """Test that the cache is emptied when the last holder releases"""
+        before = open_documents_count()
+
+        with open_document(pdf_simple_text) as handle:
+            assert open_documents_count() == before + 1
+            assert handle.refcount == 1
+
+        assert open_documents_count() == before
+        assert handle.refcount == 0
+
+    def test_reader_usable_after_release(self, pdf_multipage):
+        """Test that readers outlive their handle"""
+        with open_document(pdf_multipage) as handle:
+            reader = handle.reader
+
+        assert len(reader.pages) > 1
+
+    def test_modified_file_gets_new_handle(self, pdf_simple_text, tmp_path):
+        """Test that a file changed on disk is not served from cache"""
+        copy = tmp_path / "copy.pdf"
+        copy.write_bytes(pdf_simple_text.read_bytes())
+
+        first = acquire_document(copy)
+        try:
+            stat = copy.stat()
+            os.utime(copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            with open_document(copy) as second:
+                assert second is not first
+        finally:
+            release_document(first)
+
+    def test_threads_get_own_handles(self, pdf_multipage, count_parses):
+        """Test that readers are never shared between threads"""
+        handles = []
+
+        def use_document():
+            with open_document(pdf_multipage) as handle:
+                handles.append((handle, handle.reader))
+
+        with open_document(pdf_multipage) as own:
+            own_reader = own.reader
+            thread = threading.Thread(target=use_document)
+            thread.start()
+            thread.join()
+
+        (other, other_reader), = handles
+        assert other is not own
+        assert other_reader is not own_reader
+        assert len(count_parses) == 2
+
+    def test_missing_file(self, non_existent_pdf):
+        """Test that missing files raise FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            with open_document(non_existent_pdf):
+                pass
@@ -0,0 +1,139 @@
+"""
+Unit tests for direct decoding of embedded scan images
+"""
+
+import io
+
+import pytest
+from PIL import Image, ImageDraw
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+from pdftools.core.backends import PyPDFBackend
+from pdftools.core.images import iter_page_images
+
+
+class RecordingBackend(PyPDFBackend):
+    """Backend 'rendering' blank pages and recording what it was asked for"""
+
+    def __init__(self):
+        self.calls = []
+
+    def iter_pages(self, path, pages=None, dpi=200):
+        self.calls.append(pages)
+        for page_num in pages or [1]:
+            yield page_num, Image.new('RGB', (10, 10), 'white')
+
+
+@pytest.fixture
+def scan_pdf(temp_dir):
+    """Pages: JPEG scan, text, JPEG scan"""
+    image = Image.new('RGB', (1240, 1754), 'white')
+    ImageDraw.Draw(image).rectangle((0, 0, 619, 876), fill='black')
+    jpeg = temp_dir / "scan.jpg"
+    image.save(jpeg, quality=90)
+
+    path = temp_dir / "scan.pdf"
+    c = canvas.Canvas(str(path), pagesize=A4)
+    c.drawImage(str(jpeg), 0, 0, *A4)
+    c.showPage()
+    c.drawString(72, 720, "Invoice")
+    c.showPage()
+    c.drawImage(str(jpeg), 0, 0, *A4)
+    c.showPage()
+    c.save()
+    return path
+
+
+def _fax_pdf(black_is_1: bool) -> bytes:
+    """One 400x200 pt page showing a Group 4 image, left half black"""
+    image = Image.new('1', (800, 400), 1)
+    ImageDraw.Draw(image).rectangle((0, 0, 399, 399), fill=0)
+    buffer = io.BytesIO()
+    image.save(buffer, 'TIFF', compression='group4')
+    tiff = Image.open(buffer)
+    offset, = tiff.tag_v2[273]
+    length, = tiff.tag_v2[279]
+    data = buffer.getvalue()[offset:offset + length]
+
+    content = b'q 400 0 0 200 0 0 cm /Im0 Do Q'
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 400 200] '
+        b'/Resources << /XObject << /Im0 5 0 R >> >> /Contents 4 0 R >>',
+        b'<< /Length %d >>\nstream\n%s\nendstream' % (len(content), content),
+        b'<< /Type /XObject /Subtype /Image /Width 800 /Height 400 /ColorSpace /DeviceGray '
+        b'/BitsPerComponent 1 /Filter /CCITTFaxDecode /DecodeParms << /K -1 /Columns 800 '
+        b'/Rows 400 /BlackIs1 %s >> /Length %d >>\nstream\n%s\nendstream'
+        % (b'true' if black_is_1 else b'false', len(data), data),
+    ]
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for num, obj in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b'%d 0 obj\n%s\nendobj\n' % (num, obj)
+    xref = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    out += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    out += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+class TestIterPageImages:
+    """Tests for iter_page_images"""
+
+    def test_jpeg_pages_decoded_directly(self, scan_pdf):
+        """Test that only the text page is rendered, in page order"""
+        backend = RecordingBackend()
+
+        images = list(iter_page_images(scan_pdf, dpi=72, backend=backend))
+
+        assert [page_num for page_num, _ in images] == [1, 2, 3]
+        assert backend.calls == [[2]]
+        assert images[0][1].mode == 'RGB'
+        assert images[0][1].size == (round(A4[0]), round(A4[1]))
+        # Top-left quarter of the scan is black
+        assert images[0][1].getpixel((50, 50))[0] < 30
+        assert images[0][1].getpixel((500, 800))[0] > 225
+
+    def test_requested_order(self, scan_pdf):
+        """Test that pages are yielded in the requested order"""
+        backend = RecordingBackend()
+
+        images = list(iter_page_images(scan_pdf, [3, 2, 1], backend=backend))
+
+        assert [page_num for page_num, _ in images] == [3, 2, 1]
+        assert backend.calls == [[2]]
+
+    def test_size_hint_uses_draft_mode(self, scan_pdf):
+        """Test JPEG downscaled decoding for a small output box"""
+        images = list(iter_page_images(scan_pdf, [1], dpi=300, backend=RecordingBackend(),
+                                       size_hint=(200, 200)))
+
+        # 1/8 of 1240x1754 still covers the 200x200 box
+        assert images[0][1].size == (155, 220)
+
+    @pytest.mark.parametrize('black_is_1', [False, True])
+    def test_ccitt(self, temp_dir, black_is_1):
+        """Test Group 4 fax images, including BlackIs1"""
+        path = temp_dir / "fax.pdf"
+        path.write_bytes(_fax_pdf(black_is_1))
+        backend = RecordingBackend()
+
+        (page_num, image), = iter_page_images(path, dpi=144, backend=backend)
+
+        assert backend.calls == []
+        assert image.size == (800, 400)
+        left, right = image.getpixel((100, 200)), image.getpixel((700, 200))
+        # The encoder writes the black half as 1 samples, black only with BlackIs1
+        assert {left, right} == {(0, 0, 0), (255, 255, 255)}
+        assert (left == (0, 0, 0)) == black_is_1
+
+    def test_invalid_pdf_uses_renderer(self, invalid_pdf):
+        """Test that unreadable files are left to the renderer"""
+        backend = RecordingBackend()
+
+        list(iter_page_images(invalid_pdf, [1], backend=backend))
+
+        assert backend.calls == [[1]]
@@ -0,0 +1,151 @@
+"""
+Unit tests for per-stage metrics collection
+"""
+
+import io
+import time
+from dataclasses import dataclass, field
+
+import pytest
+
+from pdftools.cli.common import print_stats
+from pdftools.core.metrics import (
+    Metrics,
+    collect_metrics,
+    current_metrics,
+    merge_metrics,
+    record_metrics,
+    record_output,
+    stage,
+    timed_iter,
+)
+
+
+@dataclass
+class _Result:
+    metadata: dict = field(default_factory=dict)
+
+
+class TestMetrics:
+    """Tests for the Metrics collector"""
+
+    def test_nested_stages_are_exclusive(self):
+        """Test that a nested stage is not counted for its parent"""
+        metrics = Metrics()
+        with metrics.stage('write'):
+            with metrics.stage('parse'):
+                time.sleep(0.02)
+
+        assert metrics.stages['parse'] >= 0.02
+        assert metrics.stages['write'] < 0.01
+
+    def test_repeated_stage_accumulates(self):
+        """Test that using a stage twice adds up"""
+        metrics = Metrics()
+        metrics.add_time('render', 0.5)
+        metrics.add_time('render', 0.25)
+        assert metrics.stages == {'render': 0.75}
+
+    def test_timed_iter_excludes_consumer(self):
+        """Test that only producing items counts for the stage"""
+        def produce():
+            for i in range(2):
+                time.sleep(0.01)
+                yield i
+
+        metrics = Metrics()
+        for _ in metrics.timed_iter(produce(), 'render'):
+            time.sleep(0.02)
+
+        assert 0.02 <= metrics.stages['render'] < 0.05
+
+    def test_to_dict(self):
+        """Test the serializable summary"""
+        metrics = Metrics()
+        metrics.add_bytes_read(100)
+        metrics.add_bytes_written(40)
+        data = metrics.to_dict()
+
+        assert data['bytes_read'] == 100
+        assert data['bytes_written'] == 40
+        assert data['total_seconds'] >= 0
+        assert 'peak_rss_mb' in data
+
+
+class TestActiveCollector:
+    """Tests for the module-level helpers"""
+
+    def test_helpers_are_noops_without_collector(self, tmp_path):
+        """Test that instrumentation works outside of any collection"""
+        assert current_metrics() is None
+        with stage('parse'):
+            pass
+        record_output(tmp_path / 'missing.pdf')
+        assert list(timed_iter([1, 2], 'render')) == [1, 2]
+
+    def test_collect_metrics_binds_helpers(self, tmp_path):
+        """Test that helpers record into the active collector"""
+        output = tmp_path / 'out.bin'
+        output.write_bytes(b'x' * 10)
+
+        with collect_metrics() as metrics:
+            with stage('write'):
+                pass
+            record_output(output)
+
+        assert 'write' in metrics.stages
+        assert metrics.bytes_written == 10
+        assert current_metrics() is None
+
+    def test_record_metrics_decorator(self):
+        """Test that the decorator stores metrics in the result metadata"""
+        @record_metrics
+        def operation():
+            with stage('validate'):
+                pass
+            return _Result(metadata={'mode': 'pages'})
+
+        result = operation()
+        assert result.metadata['mode'] == 'pages'
+        assert 'validate' in result.metadata['metrics']['stages']
+
+    def test_split_result_has_metrics(self, pdf_multipage, temp_dir):
+        """Test that a tool entry point reports its stages"""
+        from pdftools.split import split_pdf
+
+        result = split_pdf(pdf_multipage, temp_dir)
+        metrics = result.metadata['metrics']
+
+        assert {'validate', 'write'} <= set(metrics['stages'])
+        assert metrics['bytes_written'] > 0
+
+
+class TestMergeAndPrint:
+    """Tests for merge_metrics and the --stats output"""
+
+    def test_merge_metrics(self):
+        """Test that metrics of several results are summed"""
+        combined = merge_metrics([
+            {'total_seconds': 1.0, 'stages': {'parse': 0.5}, 'bytes_read': 10,
+             'bytes_written': 0, 'peak_rss_mb': 40.0},
+            None,
+            {'total_seconds': 2.0, 'stages': {'parse': 0.5, 'write': 1.0}, 'bytes_read': 5,
+             'bytes_written': 7, 'peak_rss_mb': 50.0},
+        ])
+
+        assert combined['total_seconds'] == pytest.approx(3.0)
+        assert combined['stages'] == {'parse': 1.0, 'write': 1.0}
+        assert combined['bytes_read'] == 15
+        assert combined['peak_rss_mb'] == 50.0
+        assert merge_metrics([None]) is None
+
+    def test_print_stats(self):
+        """Test the human-readable stats block"""
+        out = io.StringIO()
+        print_stats({'total_seconds': 2.0, 'stages': {'render': 1.5}, 'bytes_read': 0,
+                     'bytes_written': 0, 'peak_rss_mb': None}, file=out)
+
+        text = out.getvalue()
+        assert 'render' in text
+        assert '75%' in text
+        assert 'peak RSS' not in text
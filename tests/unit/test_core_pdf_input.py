@@ -0,0 +1,107 @@
+"""
+Unit tests for memory-mapped PDF input
+"""
+
+import io
+import mmap
+import sys
+from pathlib import Path
+
+import pytest
+from PyPDF2 import PdfReader
+
+from pdftools.core import pdf_input
+from pdftools.core.pdf_input import (
+    MappedPDF,
+    open_pdf_input,
+    should_mmap,
+    is_network_path,
+)
+
+
+class TestMappedPDF:
+    """Tests for MappedPDF"""
+
+    def test_reader_on_mapping(self, pdf_multipage):
+        """Test that PdfReader reads a mapped document"""
+        reader = PdfReader(MappedPDF(pdf_multipage).open())
+        expected = PdfReader(str(pdf_multipage))
+
+        assert len(reader.pages) == len(expected.pages)
+        assert reader.pages[0].extract_text() == expected.pages[0].extract_text()
+
+    def test_streams_have_independent_positions(self, pdf_simple_text):
+        """Test that streams over one file do not share a position"""
+        mapped = MappedPDF(pdf_simple_text)
+        first, second = mapped.open(), mapped.open()
+
+        first.seek(100)
+        assert second.tell() == 0
+        assert second.read(5) == b'%PDF-'
+
+    def test_buffer_is_zero_copy_view(self, pdf_simple_text):
+        """Test the read-only buffer view"""
+        view = MappedPDF(pdf_simple_text).buffer()
+
+        assert bytes(view[:5]) == b'%PDF-'
+        assert view.readonly
+
+    def test_empty_file(self, tmp_path):
+        """Test that empty files cannot be mapped"""
+        empty = tmp_path / "empty.pdf"
+        empty.touch()
+
+        with pytest.raises(ValueError):
+            MappedPDF(empty)
+
+
+class TestOpenPdfInput:
+    """Tests for open_pdf_input"""
+
+    def test_small_file_read_into_memory(self, pdf_simple_text):
+        """Test that small files are not mapped"""
+        assert isinstance(open_pdf_input(pdf_simple_text), io.BytesIO)
+
+    def test_forced_mmap(self, pdf_simple_text):
+        """Test forcing memory mapping"""
+        assert isinstance(open_pdf_input(pdf_simple_text, use_mmap=True), mmap.mmap)
+
+    def test_mmap_failure_falls_back(self, tmp_path):
+        """Test fallback when mapping is not possible"""
+        empty = tmp_path / "empty.pdf"
+        empty.touch()
+
+        stream = open_pdf_input(empty, use_mmap=True)
+        assert isinstance(stream, io.BytesIO)
+
+
+class TestShouldMmap:
+    """Tests for should_mmap and is_network_path"""
+
+    def test_large_local_file(self, pdf_simple_text, monkeypatch):
+        """Test that large local files are mapped"""
+        monkeypatch.setattr(pdf_input, 'MMAP_MIN_SIZE', 0)
+        monkeypatch.setattr(pdf_input, 'is_network_path', lambda path: False)
+
+        assert should_mmap(pdf_simple_text)
+
+    def test_disabled_by_env(self, pdf_simple_text, monkeypatch):
+        """Test PDFTOOLS_MMAP=0"""
+        monkeypatch.setattr(pdf_input, 'MMAP_MIN_SIZE', 0)
+        monkeypatch.setenv(pdf_input.MMAP_ENV, '0')
+
+        assert not should_mmap(pdf_simple_text)
+
+    def test_network_path_not_mapped(self, pdf_simple_text, monkeypatch):
+        """Test that network paths are read instead of mapped"""
+        monkeypatch.setattr(pdf_input, 'MMAP_MIN_SIZE', 0)
+        monkeypatch.setattr(pdf_input, 'is_network_path', lambda path: True)
+
+        assert not should_mmap(pdf_simple_text)
+
+    def test_unc_path(self, monkeypatch):
+        """Test UNC path detection on Windows"""
+        monkeypatch.setattr(sys, 'platform', 'win32')
+
+        assert is_network_path(Path('\\\\server\\share\\scan.pdf'))
+        assert not is_network_path(Path('C:\\scans\\scan.pdf'))
@@ -0,0 +1,149 @@
+"""
+Unit tests for the fast PDF probe
+"""
+
+import zlib
+
+import pytest
+from PyPDF2 import PdfReader, PdfWriter
+
+from pdftools.core import document as document_module
+from pdftools.core.exceptions import PDFCorruptedError
+from pdftools.core.probe import clear_probe_cache, probe_page_count, probe_pdf
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_probe_cache()
+    yield
+    clear_probe_cache()
+
+
+@pytest.fixture
+def no_parse(monkeypatch):
+    """Fail if the document pool parses a document"""
+    def fail(*args, **kwargs):
+        raise AssertionError("document was parsed")
+
+    monkeypatch.setattr(document_module, 'PdfReader', fail)
+
+
+def _object_stream_pdf() -> bytes:
+    """PDF 1.5 with catalog, pages and info in an object stream and a predicted xref stream"""
+    objects = {
+        1: b'<< /Type /Catalog /Pages 2 0 R >>',
+        2: b'<< /Type /Pages /Kids [3 0 R 6 0 R] /Count 2 >>',
+        3: b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] >>',
+        6: b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] >>',
+        7: b'<< /Title (Objekt\\(stream\\)) /Producer <FEFF0054006500730074> >>',
+    }
+    body, offsets = b'', {}
+    for num, obj in objects.items():
+        offsets[num] = len(body)
+        body += obj + b'\n'
+    header = b' '.join(b'%d %d' % (num, offsets[num]) for num in objects) + b'\n'
+    compressed = zlib.compress(header + body)
+
+    out = bytearray(b'%PDF-1.5\n')
+    stream_offset = len(out)
+    out += (b'4 0 obj\n<< /Type /ObjStm /N %d /First %d /Filter /FlateDecode /Length %d >>\nstream\n'
+            % (len(objects), len(header), len(compressed)) + compressed + b'\nendstream\nendobj\n')
+    xref_offset = len(out)
+
+    entries = {0: (0, 0, 65535), 4: (1, stream_offset, 0), 5: (1, xref_offset, 0)}
+    for index, num in enumerate(objects):
+        entries[num] = (2, 4, index)
+    rows, previous = b'', bytes(7)
+    for num in range(8):
+        kind, field2, field3 = entries[num]
+        row = bytes([kind]) + field2.to_bytes(4, 'big') + field3.to_bytes(2, 'big')
+        rows += b'\x02' + bytes((a - b) & 0xFF for a, b in zip(row, previous))
+        previous = row
+    data = zlib.compress(rows)
+    out += (b'5 0 obj\n<< /Type /XRef /Size 8 /W [1 4 2] /Root 1 0 R /Info 7 0 R /Filter /FlateDecode '
+            b'/DecodeParms << /Columns 7 /Predictor 12 >> /Length %d >>\nstream\n' % len(data)
+            + data + b'\nendstream\nendobj\nstartxref\n%d\n%%%%EOF\n' % xref_offset)
+    return bytes(out)
+
+
+class TestProbePDF:
+    """Tests for probe_pdf"""
+
+    def test_classic_xref_without_parsing(self, pdf_multipage, no_parse):
+        """Test page count and info from a classic xref table"""
+        probe = probe_pdf(pdf_multipage)
+
+        assert probe.method == 'xref'
+        assert probe.page_count == len(PdfReader(str(pdf_multipage)).pages)
+        assert probe.version.startswith('1.')
+        assert not probe.encrypted
+        assert 'Producer' in probe.info
+
+    def test_xref_stream_and_object_stream(self, temp_dir, no_parse):
+        """Test objects resolved through an xref stream and an object stream"""
+        path = temp_dir / "objstm.pdf"
+        path.write_bytes(_object_stream_pdf())
+
+        probe = probe_pdf(path)
+
+        assert probe.page_count == 2
+        assert probe.version == '1.5'
+        assert probe.info == {'Title': 'Objekt(stream)', 'Producer': 'Test'}
+
+    def test_incremental_update(self, pdf_multipage, temp_dir):
+        """Test that the newest xref section wins after an incremental update"""
+        fitz = pytest.importorskip('fitz')
+        path = temp_dir / "updated.pdf"
+        path.write_bytes(pdf_multipage.read_bytes())
+        with fitz.open(path) as document:
+            document.new_page()
+            document.saveIncr()
+
+        assert path.read_bytes().count(b'startxref') == 2
+        assert probe_pdf(path).page_count == len(PdfReader(str(path)).pages)
+
+    def test_encrypted(self, pdf_multipage, temp_dir, no_parse):
+        """Test encrypted documents: page count known, info withheld"""
+        writer = PdfWriter()
+        for page in PdfReader(str(pdf_multipage)).pages:
+            writer.add_page(page)
+        writer.encrypt('user', 'owner')
+        path = temp_dir / "encrypted.pdf"
+        with open(path, 'wb') as f:
+            writer.write(f)
+
+        probe = probe_pdf(path)
+
+        assert probe.encrypted
+        assert probe.page_count == len(writer.pages)
+        assert probe.info == {}
+
+    def test_broken_xref_falls_back_to_parse(self, pdf_multipage, temp_dir):
+        """Test the full-parse fallback for a wrong startxref offset"""
+        data = pdf_multipage.read_bytes()
+        start = data.rindex(b'startxref')
+        path = temp_dir / "broken.pdf"
+        path.write_bytes(data[:start] + b'startxref\n7\n%%EOF\n')
+
+        probe = probe_pdf(path)
+
+        assert probe.method == 'parse'
+        assert probe.page_count == len(PdfReader(str(pdf_multipage)).pages)
+        with pytest.raises(PDFCorruptedError):
+            clear_probe_cache()
+            probe_pdf(path, fallback=False)
+
+    def test_not_a_pdf(self, temp_dir):
+        """Test that non-PDF content is rejected"""
+        path = temp_dir / "fake.pdf"
+        path.write_bytes(b"just some text")
+
+        with pytest.raises(PDFCorruptedError):
+            probe_pdf(path)
+        with pytest.raises(PDFCorruptedError):
+            probe_page_count(path)
+
+    def test_missing_file(self, temp_dir):
+        """Test that a missing file raises FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            probe_pdf(temp_dir / "missing.pdf")
@@ -0,0 +1,89 @@
+"""
+Unit tests for in-memory rasterization
+"""
+
+import io
+import stat
+import sys
+
+import pytest
+
+from pdftools.core.exceptions import PDFProcessingError
+from pdftools.core.raster import iter_poppler_pages, page_runs, read_pnm
+
+# Stand-in for pdftoppm: writes one PPM per page to stdout, width = page number
+FAKE_PDFTOPPM = f"""#!{sys.executable}
+import sys
+args = sys.argv[1:]
+first = int(args[args.index('-f') + 1])
+last = int(args[args.index('-l') + 1]) if '-l' in args else 4
+if args[-1].endswith('broken.pdf'):
+    sys.stderr.write('Syntax Error: broken')
+    sys.exit(1)
+for page in range(first, last + 1):
+    sys.stdout.buffer.write(b'P6\\n%d 2\\n255\\n' % page + bytes([page]) * (page * 2 * 3))
+"""
+
+
+@pytest.fixture
+def fake_poppler(tmp_path):
+    """Directory containing a fake pdftoppm executable"""
+    script = tmp_path / 'pdftoppm'
+    script.write_text(FAKE_PDFTOPPM)
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return tmp_path
+
+
+class TestReadPnm:
+    """Tests for read_pnm"""
+
+    def test_reads_concatenated_images(self):
+        """Test decoding a stream of PPM and PGM images"""
+        stream = io.BytesIO(
+            b'P6\n2 1\n255\n' + bytes([255, 0, 0, 0, 0, 255])
+            + b'P5 # gray\n1 1 255\n' + bytes([7])
+        )
+
+        first = read_pnm(stream)
+        second = read_pnm(stream)
+
+        assert first.mode == 'RGB' and first.getpixel((1, 0)) == (0, 0, 255)
+        assert second.mode == 'L' and second.getpixel((0, 0)) == 7
+        assert read_pnm(stream) is None
+
+    def test_truncated_data(self):
+        """Test that truncated output is reported"""
+        with pytest.raises(PDFProcessingError):
+            read_pnm(io.BytesIO(b'P6\n2 2\n255\n' + bytes(3)))
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="shebang script")
+class TestIterPopplerPages:
+    """Tests for iter_poppler_pages with a fake pdftoppm"""
+
+    def test_pages_in_requested_order(self, fake_poppler, tmp_path):
+        """Test that page runs are rendered and numbered correctly"""
+        pages = list(iter_poppler_pages(tmp_path / 'doc.pdf', [3, 4, 1], poppler_path=fake_poppler))
+
+        assert [number for number, _ in pages] == [3, 4, 1]
+        assert [image.width for _, image in pages] == [3, 4, 1]
+
+    def test_all_pages(self, fake_poppler, tmp_path):
+        """Test rendering without a page selection"""
+        pages = list(iter_poppler_pages(tmp_path / 'doc.pdf', poppler_path=fake_poppler))
+        assert [number for number, _ in pages] == [1, 2, 3, 4]
+
+    def test_failure_reports_stderr(self, fake_poppler, tmp_path):
+        """Test that a failing pdftoppm raises with its message"""
+        with pytest.raises(PDFProcessingError, match='Syntax Error'):
+            list(iter_poppler_pages(tmp_path / 'broken.pdf', [1], poppler_path=fake_poppler))
+
+    def test_missing_poppler(self, tmp_path):
+        """Test the error when pdftoppm is not installed"""
+        with pytest.raises(PDFProcessingError, match='poppler-utils'):
+            list(iter_poppler_pages(tmp_path / 'doc.pdf', poppler_path=tmp_path / 'missing'))
+
+
+def test_page_runs():
+    """Test grouping of consecutive pages"""
+    assert page_runs([1, 2, 3, 7, 8, 5]) == [(1, 3), (7, 8), (5, 5)]
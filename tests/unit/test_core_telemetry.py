@@ -0,0 +1,150 @@
+"""
+Unit tests for the Prometheus telemetry registry
+"""
+
+import urllib.request
+from dataclasses import dataclass, field
+
+import pytest
+
+from pdftools.core import metrics as metrics_module
+from pdftools.core.exceptions import PDFCorruptedError
+from pdftools.core.metrics import record_error, record_metrics, record_pages, stage
+from pdftools.core.telemetry import (
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    disable_telemetry,
+    enable_telemetry,
+    start_http_server,
+    write_textfile,
+)
+
+
+@dataclass
+class _Result:
+    status: str = 'success'
+    metadata: dict = field(default_factory=dict)
+
+
+@pytest.fixture
+def registry():
+    registry = enable_telemetry(MetricsRegistry())
+    yield registry
+    disable_telemetry()
+
+
+class TestFamilies:
+    """Tests for Counter and Histogram"""
+
+    def test_counter_rejects_wrong_labels(self):
+        """Test that label names must match the family"""
+        counter = Counter('x_total', 'X', ('tool',))
+        with pytest.raises(ValueError):
+            counter.inc(stage='render')
+        with pytest.raises(ValueError):
+            counter.inc(-1, tool='merge')
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test bucket, sum and count samples"""
+        histogram = Histogram('t_seconds', 'T', ('tool',), buckets=(0.1, 1.0))
+        histogram.observe(0.05, tool='ocr')
+        histogram.observe(0.5, tool='ocr')
+        histogram.observe(5.0, tool='ocr')
+
+        samples = {(name, labels.get('le')): value for name, labels, value in histogram.samples()}
+        assert samples[('t_seconds_bucket', '0.1')] == 1
+        assert samples[('t_seconds_bucket', '1')] == 2
+        assert samples[('t_seconds_bucket', '+Inf')] == 3
+        assert samples[('t_seconds_count', None)] == 3
+        assert samples[('t_seconds_sum', None)] == pytest.approx(5.55)
+
+
+class TestObserver:
+    """Tests for recording operations through record_metrics"""
+
+    def test_disabled_records_nothing(self):
+        """Test that no observer is installed by default"""
+        assert metrics_module._observer is None
+
+    def test_success_is_recorded(self, registry):
+        """Test documents, pages and stage latencies"""
+        @record_metrics
+        def operation():
+            with stage('render'):
+                record_pages(3)
+            return _Result()
+
+        operation()
+        operation()
+
+        assert registry.documents.get(tool='operation', status='success') == 2
+        assert registry.pages.get(tool='operation') == 6
+        assert registry.stage_duration.count(tool='operation', stage='render') == 2
+
+    def test_error_classes(self, registry):
+        """Test that raised and recorded errors are counted by class"""
+        @record_metrics
+        def failing():
+            raise PDFCorruptedError("broken")
+
+        @record_metrics
+        def error_result():
+            try:
+                raise PDFCorruptedError("broken")
+            except PDFCorruptedError as e:
+                record_error(e)
+            return _Result(status='error')
+
+        with pytest.raises(PDFCorruptedError):
+            failing()
+        error_result()
+
+        assert registry.errors.get(tool='failing', error='PDFCorruptedError') == 1
+        assert registry.errors.get(tool='error_result', error='PDFCorruptedError') == 1
+        assert registry.documents.get(tool='failing', status='error') == 1
+
+    def test_tool_name_from_package(self, registry, pdf_multipage, temp_dir):
+        """Test that tool entry points are labelled by their package"""
+        from pdftools.split import split_pdf
+
+        split_pdf(pdf_multipage, temp_dir)
+
+        assert registry.documents.get(tool='split', status='success') == 1
+        assert registry.pages.get(tool='split') > 0
+
+
+class TestExposition:
+    """Tests for the text format, HTTP endpoint and textfile"""
+
+    def test_render(self, registry):
+        """Test the exposition format"""
+        registry.errors.inc(tool='merge', error='Bad"Name')
+        text = registry.render()
+
+        assert '# TYPE pdftools_errors_total counter' in text
+        assert 'pdftools_errors_total{tool="merge",error="Bad\\"Name"} 1' in text
+        assert text.endswith('\n')
+
+    def test_http_endpoint(self, registry):
+        """Test that the local endpoint serves the registry"""
+        registry.pages.inc(4, tool='ocr')
+        server = start_http_server(0)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                body = response.read().decode('utf-8')
+                assert response.headers['Content-Type'].startswith('text/plain')
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert 'pdftools_pages_total{tool="ocr"} 4' in body
+
+    def test_write_textfile(self, registry, tmp_path):
+        """Test that the textfile is written without leftovers"""
+        target = tmp_path / 'pdftools.prom'
+        write_textfile(target)
+
+        assert '# TYPE pdftools_pages_total counter' in target.read_text()
+        assert [p.name for p in tmp_path.iterdir()] == ['pdftools.prom']
@@ -0,0 +1,85 @@
+"""
+Unit tests for the seeded corpus generation in scripts/generate_test_pdfs.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from PyPDF2 import PdfReader
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+import generate_test_pdfs
+from generate_test_pdfs import generate_corpus
+
+
+class TestCorpus:
+    """Tests for generate_corpus"""
+
+    def test_same_seed_gives_identical_corpus(self, tmp_path):
+        """Test that a seed fully determines files and manifest"""
+        first = generate_corpus(tmp_path / "a", 'invoices', 5, seed=3, workers=1)
+        second = generate_corpus(tmp_path / "b", 'invoices', 5, seed=3, workers=2)
+
+        assert first == second
+        for entry in first:
+            assert (tmp_path / "a" / entry['file']).read_bytes() == \
+                (tmp_path / "b" / entry['file']).read_bytes()
+
+    def test_invoice_manifest_matches_content(self, tmp_path):
+        """Test that invoices contain the values recorded in the manifest"""
+        generate_corpus(tmp_path, 'invoices', 3, seed=1, workers=1)
+        manifest = json.loads((tmp_path / 'manifest.json').read_text())
+
+        assert manifest['count'] == 3
+        for entry in manifest['files']:
+            text = PdfReader(str(tmp_path / entry['file'])).pages[0].extract_text()
+            assert entry['vendor'] in text
+            assert entry['invoice_nr'] in text
+            assert entry['date_text'] in text
+
+    def test_scans_have_ground_truth_and_no_text_layer(self, tmp_path):
+        """Test that scans are image-only with a ground-truth sidecar"""
+        entries = generate_corpus(tmp_path, 'scans', 1, seed=1, workers=1, dpi=72)
+
+        path = tmp_path / entries[0]['file']
+        assert PdfReader(str(path)).pages[0].extract_text().strip() == ""
+        assert path.with_suffix('.gt.txt').read_text() == entries[0]['ground_truth']
+
+    @pytest.mark.parametrize('breadth', [1, 3])
+    def test_outline_manifest_page_count(self, tmp_path, breadth):
+        """Test that the manifest reports the pages actually generated"""
+        entry, = generate_corpus(tmp_path, 'outlines', 1, seed=1, workers=1, depth=3, breadth=breadth)
+
+        assert entry['pages'] == len(PdfReader(tmp_path / entry['file']).pages)
+
+    def test_unknown_kind(self, tmp_path):
+        """Test that an unknown corpus kind is rejected"""
+        with pytest.raises(ValueError):
+            generate_corpus(tmp_path, 'poems', 1)
+
+
+class TestLargeDocuments:
+    """Tests for outline and huge documents"""
+
+    def test_outline_depth(self, tmp_path):
+        """Test that the outline is nested to the requested depth"""
+        path = generate_test_pdfs.TestPDFGenerator(tmp_path).generate_outlined_pdf(depth=3, breadth=2)
+        reader = PdfReader(str(path))
+
+        def depth(items):
+            return max((1 + depth(item) if isinstance(item, list) else 1) for item in items)
+
+        assert len(reader.pages) == 14
+        assert depth(reader.outline) == 3
+
+    def test_huge_pdf_size_and_structure(self, tmp_path):
+        """Test that the streamed document reaches its size and is readable"""
+        path = generate_test_pdfs.TestPDFGenerator(tmp_path).generate_huge_pdf(size_mb=3)
+        reader = PdfReader(str(path))
+
+        assert path.stat().st_size >= 3 * 1024 * 1024
+        assert "Page 2 of" in reader.pages[1].extract_text()
@@ -0,0 +1,123 @@
+"""
+Unit tests for the multi-tool pipeline runner
+"""
+
+import json
+
+import pytest
+from PyPDF2 import PdfReader
+
+from pdftools.core.document import open_documents_count
+from pdftools.core.exceptions import InvalidParameterError
+from pdftools.pipeline import load_pipeline, parse_pipeline, run_pipeline
+
+
+@pytest.fixture
+def invoice_pdf(tmp_path):
+    """Single-page invoice with vendor, number and date"""
+    from reportlab.pdfgen import canvas
+
+    path = tmp_path / "scan.pdf"
+    c = canvas.Canvas(str(path))
+    c.drawString(72, 750, "ACME Corp")
+    c.drawString(72, 730, "Invoice Number: INV-2024-001")
+    c.drawString(72, 710, "Date: 15.03.2024")
+    c.save()
+    return path
+
+
+class TestParsePipeline:
+    """Tests for pipeline definitions"""
+
+    def test_step_forms(self):
+        """Test bare names, option mappings and top-level keys"""
+        spec = parse_pipeline({
+            'steps': ['extract', {'rename': {'template': '{vendor}.pdf'}}, {'protect': None}],
+            'output_dir': 'out',
+            'keep_input': False,
+        })
+
+        assert [step.name for step in spec.steps] == ['extract', 'rename', 'protect']
+        assert spec.steps[1].options == {'template': '{vendor}.pdf'}
+        assert spec.steps[2].options == {}
+        assert spec.keep_input is False
+
+    @pytest.mark.parametrize('definition', [
+        [],
+        ['stamp'],
+        [{'extract': {'colour': 'red'}}],
+        {'steps': ['extract'], 'dry_run': True},
+    ])
+    def test_invalid_definitions(self, definition):
+        """Test that unknown steps, options and keys are rejected"""
+        with pytest.raises(InvalidParameterError):
+            parse_pipeline(definition)
+
+    def test_load_yaml_and_json(self, tmp_path):
+        """Test loading both file formats"""
+        (tmp_path / 'p.json').write_text(json.dumps(['extract']))
+        (tmp_path / 'p.yaml').write_text("steps:\n  - extract\n  - rename: {template: '{date}.pdf'}\n")
+
+        assert load_pipeline(tmp_path / 'p.json').steps[0].name == 'extract'
+        assert load_pipeline(tmp_path / 'p.yaml').steps[1].options['template'] == '{date}.pdf'
+
+
+class TestRunPipeline:
+    """Tests for run_pipeline"""
+
+    def test_chain_writes_only_final_artifacts(self, invoice_pdf, tmp_path):
+        """Test extract -> rename -> protect -> thumbnails in one pass"""
+        out = tmp_path / 'out'
+        result = run_pipeline(invoice_pdf, [
+            {'extract': {'format': 'txt'}},
+            {'rename': {'template': '{invoice_nr}_{date}.pdf'}},
+            {'protect': {'owner_password': 'admin', 'permissions': ['print']}},
+            {'thumbnails': {'size': 'small'}},
+        ], output_dir=out)
+
+        assert result.success, result.message
+        assert sorted(p.name for p in out.iterdir()) == [
+            'INV-2024-001_2024-03-15.pdf',
+            'INV-2024-001_2024-03-15.txt',
+            'INV-2024-001_2024-03-15_page_001.png',
+        ]
+        assert PdfReader(str(out / 'INV-2024-001_2024-03-15.pdf')).is_encrypted
+        assert 'ACME Corp' in (out / 'INV-2024-001_2024-03-15.txt').read_text()
+        assert result.metadata['invoice']['invoice_number'] == 'INV-2024-001'
+        assert invoice_pdf.exists()
+        assert open_documents_count() == 0
+
+    def test_failed_step_writes_nothing(self, invoice_pdf, tmp_path):
+        """Test that no artifact is written when a step fails"""
+        out = tmp_path / 'out'
+        result = run_pipeline(invoice_pdf, [
+            {'extract': {'format': 'txt'}},
+            {'protect': {}},
+        ], output_dir=out)
+
+        assert result.status == 'error'
+        assert [step.status for step in result.steps] == ['success', 'error']
+        assert not out.exists()
+
+    def test_move_renamed_input(self, invoice_pdf, tmp_path):
+        """Test that keep_input=False moves an unmodified document"""
+        original = invoice_pdf.read_bytes()
+        result = run_pipeline(invoice_pdf, {
+            'steps': [{'rename': {'template': '{vendor}.pdf'}}],
+            'keep_input': False,
+        })
+
+        assert result.success, result.message
+        assert not invoice_pdf.exists()
+        assert result.output_files[0].read_bytes() == original
+
+    def test_protect_in_place(self, invoice_pdf):
+        """Test overwriting the input with its protected version"""
+        result = run_pipeline(invoice_pdf, [{'protect': {'user_password': 'secret'}}])
+
+        assert result.success, result.message
+        assert result.output_files == [invoice_pdf]
+        reader = PdfReader(str(invoice_pdf))
+        assert reader.is_encrypted
+        assert reader.decrypt('secret')
+        assert len(reader.pages) == 1
@@ -0,0 +1,95 @@
+"""
+Unit tests for the region OCR fallback of invoice renaming
+"""
+
+import pytest
+from PIL import Image
+
+from pdftools.core.exceptions import InvalidParameterError
+from pdftools.ocr.capabilities import CACHE_DIR_ENV
+from pdftools.renaming import OCRRegion, RenameConfig, parse_region, rename_invoice
+
+
+class HeaderEngine:
+    """Fake engine 'reading' an invoice header from the top third of a page"""
+
+    calls = []
+
+    def pdf_to_images(self, pdf_path, dpi=300, pages=None):
+        HeaderEngine.calls.append(('render', dpi, list(pages)))
+        return [Image.new('L', (dpi * 8, dpi * 11), 255) for _ in pages]
+
+    def process_image(self, image, language, config=None):
+        HeaderEngine.calls.append(('recognize', image.size, language))
+        return {'text': "Rechnung Nr. RE-2024-001\nDatum: 15.03.2024\nVon: ACME GmbH", 'confidence': 0.9}
+
+    def get_available_languages(self):
+        return ['deu', 'eng']
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def header_engine(fake_engine, monkeypatch, tmp_path):
+    """Register the fake engine and isolate the cache directory"""
+    fake_engine('header', HeaderEngine)
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "cache"))
+    HeaderEngine.calls = []
+
+
+class TestParseRegion:
+    """Tests for parse_region"""
+
+    @pytest.mark.parametrize('spec, expected', [
+        ('0,0,1,0.5', OCRRegion(1, 0.0, 0.0, 1.0, 0.5)),
+        ('2:0.5,0,1,0.25', OCRRegion(2, 0.5, 0.0, 1.0, 0.25)),
+    ])
+    def test_valid(self, spec, expected):
+        """Test region specifications with and without page"""
+        assert parse_region(spec) == expected
+
+    @pytest.mark.parametrize('spec', ['0,0,1', 'a:0,0,1,1', '0:0,0,1,1', '0,0.5,1,0.5', '0,0,1.5,1'])
+    def test_invalid(self, spec):
+        """Test malformed, empty and out-of-page regions"""
+        with pytest.raises(InvalidParameterError):
+            parse_region(spec)
+
+
+class TestOCRFallback:
+    """Tests for renaming scanned invoices"""
+
+    def test_header_region_recognized_and_cached(self, blank_pdf, header_engine):
+        """Test that only the top third of page 1 is recognized, once per file"""
+        pdf = blank_pdf(2, "scan_0001.pdf", width=595, height=842)
+        config = RenameConfig(ocr_fallback=True, ocr_engine='header')
+
+        first = rename_invoice(pdf, dry_run=True, config=config)
+        second = rename_invoice(pdf, dry_run=True, config=config)
+
+        assert first.new_name == "ACME_GmbH_RE-2024-001_2024-03-15.pdf"
+        assert second.new_name == first.new_name
+        assert HeaderEngine.calls == [
+            ('render', 150, [1]),
+            ('recognize', (1200, 550), 'deu+eng'),
+        ]
+
+    def test_regions_beyond_last_page(self, blank_pdf, header_engine):
+        """Test that regions on missing pages are skipped"""
+        pdf = blank_pdf(2, "scan_0001.pdf", width=595, height=842)
+        config = RenameConfig(
+            ocr_fallback=True, ocr_engine='header', ocr_cache=False,
+            ocr_regions=[OCRRegion(2, bottom=0.5), OCRRegion(5)]
+        )
+
+        rename_invoice(pdf, dry_run=True, config=config)
+
+        assert HeaderEngine.calls == [('render', 150, [2]), ('recognize', (1200, 825), 'deu+eng')]
+
+    def test_disabled_by_default(self, blank_pdf, header_engine):
+        """Test that without the fallback no OCR runs"""
+        pdf = blank_pdf(2, "scan_0001.pdf", width=595, height=842)
+        result = rename_invoice(pdf, dry_run=True, config=RenameConfig(ocr_engine='header'))
+
+        assert result.success
+        assert HeaderEngine.calls == []
@@ -18,6 +18,7 @@ class TestSplitMode:
         assert SplitMode.RANGES == "ranges"
         assert SplitMode.PARTS == "parts"
         assert SplitMode.SPECIFIC_PAGES == "specific"
+        assert SplitMode.BLANK == "blank"
 
 
 class TestSplitConfig: